@@ -125,7 +125,9 @@ async def post_feedback(req: FeedbackRequest,
         # Ownership: mirror GET /sessions/{session_id} in app/api/main.py
         from app.api.main import get_session_store
 
-        session = get_session_store().get_session(req.session_id)
+        session = get_session_store().get_session(
+            req.session_id, include_messages=False
+        )
         if not session:
             raise HTTPException(
                 status_code=404,
@@ -10,6 +10,7 @@ This module provides the HTTP API layer that:
 import json
 import os
 from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -30,6 +31,7 @@ from app.api.metadata_corrections import router as corrections_router
 from app.api.metadata_enrichment import router as enrichment_router
 from app.api.metadata_publishers import router as publishers_router
 from app.api.network import router as network_router
+from app.api.offload import offload_stats, run_blocking, shutdown_offload
 from app.api.compare import run_comparison
 from app.api.models import (
     ChatRequest,
@@ -56,6 +58,20 @@ from scripts.chat.models import (
 from scripts.chat.session_store import SessionStore
 # Scholar pipeline (3-stage: interpret -> execute -> narrate)
 from scripts.chat.interpreter import interpret
+from scripts.chat.interpretation_cache import disable_interpretation_cache, enable_interpretation_cache
+from scripts.chat.execution_cache import disable_execution_cache, enable_execution_cache
+from scripts.chat.single_flight import (
+    context_fingerprint,
+    disable_single_flight,
+    enable_single_flight,
+    flight_key,
+    get_single_flight,
+)
+from scripts.chat.cross_reference import (
+    disable_agent_graph_snapshot,
+    enable_agent_graph_snapshot,
+    warm_agent_graph,
+)
 from scripts.chat.executor import execute_plan as execute_scholar_plan
 from scripts.chat.narrator import narrate, narrate_streaming, describe_filters, low_confidence_notice
 from scripts.chat.plan_models import (
@@ -66,7 +82,15 @@ from scripts.chat.plan_models import (
 from scripts.schemas.candidate_set import CandidateSet, Candidate, Evidence
 
 from scripts.utils.logger import LoggerManager
-from scripts.utils.llm_logger import token_accumulator
+from scripts.utils.llm_logger import close_llm_logger, token_accumulator
+from scripts.models.llm_governor import (
+    ModelLimits,
+    disable_llm_governor,
+    enable_llm_governor,
+    get_llm_governor,
+)
+from scripts.utils.db_generation import db_generation
+from scripts.utils.sqlite_pool import close_read_pools
 from scripts.enrichment import EnrichmentService
 from scripts.metadata.interaction_logger import interaction_logger
 
@@ -163,13 +187,70 @@ async def lifespan(app):
     sessions_db.parent.mkdir(parents=True, exist_ok=True)
     enrichment_db.parent.mkdir(parents=True, exist_ok=True)
 
-    # Initialize session store
+    # Initialize session store; message writes are committed in groups by
+    # a background thread (SESSION_WRITE_BEHIND=0 writes them inline)
     session_store = SessionStore(sessions_db)
+    if os.getenv("SESSION_WRITE_BEHIND", "1") != "0":
+        session_store.enable_write_behind()
     db_path = bib_db
 
     # Initialize enrichment service
     enrichment_service = EnrichmentService(cache_db_path=enrichment_db)
 
+    # Cache interpreter plans for context-free turns
+    # (INTERPRETATION_CACHE_SIZE=0 disables; INTERPRETATION_CACHE_SIMILARITY
+    # enables near-duplicate matching at the given trigram similarity)
+    interp_cache_size = int(os.getenv("INTERPRETATION_CACHE_SIZE", "2048"))
+    if interp_cache_size > 0:
+        similarity = os.getenv("INTERPRETATION_CACHE_SIMILARITY")
+        enable_interpretation_cache(
+            max_entries=interp_cache_size,
+            similarity_threshold=float(similarity) if similarity else None,
+        )
+
+    # Cache executor step results per DB generation
+    # (EXECUTION_CACHE_SIZE=0 disables; EXECUTION_CACHE_PATH adds a SQLite
+    # store shared by all workers)
+    exec_cache_size = int(os.getenv("EXECUTION_CACHE_SIZE", "1024"))
+    if exec_cache_size > 0:
+        exec_cache_path = os.getenv("EXECUTION_CACHE_PATH")
+        enable_execution_cache(
+            max_entries=exec_cache_size,
+            disk_path=Path(exec_cache_path) if exec_cache_path else None,
+        )
+
+    # Admit LLM calls through the per-model governor (LLM_GOVERNOR=0
+    # disables; LLM_MAX_CONCURRENT / LLM_TOKENS_PER_MINUTE set the default
+    # limits, LLM_MODEL_LIMITS is a JSON object of per-model overrides,
+    # e.g. {"gpt-4.1": {"max_concurrent": 4, "tokens_per_minute": 30000}})
+    if os.getenv("LLM_GOVERNOR", "1") != "0":
+        enable_llm_governor(
+            ModelLimits(
+                max_concurrent=int(os.getenv("LLM_MAX_CONCURRENT", "8")),
+                tokens_per_minute=int(os.getenv("LLM_TOKENS_PER_MINUTE", "0")),
+            ),
+            {
+                model: ModelLimits(**limits)
+                for model, limits in json.loads(os.getenv("LLM_MODEL_LIMITS", "{}")).items()
+            },
+            interactive_max_wait_s=float(os.getenv("LLM_INTERACTIVE_MAX_WAIT_S", "30")),
+        )
+
+    # Coalesce identical in-flight chat turns (interpret/execute/narrate)
+    # into one computation (CHAT_SINGLE_FLIGHT=0 disables)
+    if os.getenv("CHAT_SINGLE_FLIGHT", "1") != "0":
+        enable_single_flight()
+
+    # Build the agent graph before the first cross-reference query
+    # (AGENT_GRAPH_SNAPSHOT_PATH shares it across workers via a JSON file)
+    graph_snapshot = os.getenv("AGENT_GRAPH_SNAPSHOT_PATH")
+    if graph_snapshot:
+        enable_agent_graph_snapshot(Path(graph_snapshot))
+    try:
+        warm_agent_graph(bib_db)
+    except Exception as e:
+        logger.warning("Agent graph warm-up failed: %s", e)
+
     logger.info(
         "API started",
         extra={
@@ -186,6 +267,14 @@ async def lifespan(app):
         session_store.close()
     if enrichment_service is not None:
         enrichment_service.close()
+    disable_interpretation_cache()
+    disable_execution_cache()
+    disable_single_flight()
+    disable_llm_governor()
+    disable_agent_graph_snapshot()
+    close_read_pools()
+    shutdown_offload()
+    close_llm_logger()
     logger.info("API shutdown")
 
 
@@ -448,7 +537,8 @@ def health_extended(_user=Depends(require_role("full"))):
     """Extended health check with database file details.
 
     Returns file sizes and modification times for the bibliographic
-    and QA databases.
+    and QA databases, plus queue depth per offload lane and the LLM
+    governor's per-model admission metrics.
     """
     from datetime import datetime, timezone
 
@@ -470,6 +560,8 @@ def health_extended(_user=Depends(require_role("full"))):
         db_last_modified=db_last_modified,
         qa_db_exists=qa_db_exists,
         qa_db_size_bytes=qa_db_size_bytes,
+        offload_lanes=offload_stats(),
+        llm_governor=governor.stats() if (governor := get_llm_governor()) else {},
     )
 
 
@@ -575,7 +667,7 @@ async def chat(request: Request, chat_request: ChatRequest, _user=Depends(requir
     try:
         # Get or create session
         if chat_request.session_id:
-            session = store.get_session(chat_request.session_id)
+            session = store.get_session(chat_request.session_id, include_messages=False)
             if not session:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -593,16 +685,18 @@ async def chat(request: Request, chat_request: ChatRequest, _user=Depends(requir
         if chat_request.context:
             store.update_context(session.session_id, chat_request.context)
 
-        # Add user message to session
+        # Add user message to session (committed in the background; the
+        # pipeline reads history from before its timestamp)
         user_message = Message(role="user", content=chat_request.message)
-        store.add_message(session.session_id, user_message)
+        store.queue_message(session.session_id, user_message)
 
         # Reset token accumulator before pipeline
         token_accumulator.reset()
 
         # All queries go through the scholar pipeline
         result = await _run_scholar_pipeline(
-            chat_request, session, store, bib_db
+            chat_request, session, store, bib_db,
+            history_before=user_message.timestamp,
         )
 
         # --- Post-response security checks ---
@@ -647,11 +741,43 @@ async def chat(request: Request, chat_request: ChatRequest, _user=Depends(requir
         )
 
 
+async def _execute_plan(
+    plan,
+    bib_db: Path,
+    session_context: SessionContext,
+    query: str,
+) -> ExecutionResult:
+    """Stage 2 on the pipeline lane; identical concurrent turns share one run.
+
+    A shared result is copied and given the caller's own session context.
+    """
+    flight = get_single_flight()
+    if flight is None:
+        return await run_blocking(
+            "pipeline", execute_scholar_plan,
+            plan, bib_db, session_context, original_query=query,
+        )
+    key = flight_key(
+        "execute", query,
+        plan.model_dump(mode="json"),
+        str(Path(bib_db).resolve()), db_generation(bib_db),
+        context_fingerprint(query, session_context),
+    )
+    result, shared = await flight.run(key, lambda: run_blocking(
+        "pipeline", execute_scholar_plan,
+        plan, bib_db, session_context, original_query=query,
+    ))
+    if shared:
+        result = result.model_copy(deep=True, update={"session_context": session_context})
+    return result
+
+
 async def _run_scholar_pipeline(
     chat_request: ChatRequest,
     session,
     store: SessionStore,
-    bib_db: Path
+    bib_db: Path,
+    history_before: Optional[datetime] = None,
 ) -> ChatResponseAPI:
     """Run the three-stage scholar pipeline.
 
@@ -668,6 +794,8 @@ async def _run_scholar_pipeline(
         session: Current session
         store: Session store
         bib_db: Path to bibliographic database
+        history_before: Timestamp of this turn's user message; the
+            conversation history is the messages before it
 
     Returns:
         ChatResponseAPI with response
@@ -680,7 +808,9 @@ async def _run_scholar_pipeline(
 
     session_context = SessionContext(
         session_id=session.session_id,
-        previous_messages=session.get_recent_messages(5),
+        previous_messages=store.get_recent_messages(
+            session.session_id, 5, before=history_before
+        ),
         previous_record_ids=previous_record_ids,
     )
 
@@ -713,7 +843,7 @@ async def _run_scholar_pipeline(
             confidence=plan.confidence,
             metadata={"intents": plan.intents, "reasoning": plan.reasoning},
         )
-        msg_db_id = store.add_message(
+        msg_db_id = await store.add_message_async(
             session.session_id,
             Message(role="assistant", content=plan.clarification),
         )
@@ -729,8 +859,8 @@ async def _run_scholar_pipeline(
         "Scholar pipeline: executing plan",
         extra={"session_id": session.session_id, "steps": len(plan.execution_steps)},
     )
-    execution_result = execute_scholar_plan(
-        plan, bib_db, session_context, original_query=chat_request.message
+    execution_result = await _execute_plan(
+        plan, bib_db, session_context, chat_request.message
     )
 
     logger.info(
@@ -781,7 +911,7 @@ async def _run_scholar_pipeline(
     )
 
     # Store assistant message in session
-    msg_db_id = store.add_message(
+    msg_db_id = await store.add_message_async(
         session.session_id,
         Message(role="assistant", content=scholar_response.narrative),
     )
@@ -981,7 +1111,7 @@ async def websocket_chat(websocket: WebSocket):
 
         # Get or create session
         if session_id:
-            session = store.get_session(session_id)
+            session = store.get_session(session_id, include_messages=False)
             if not session:
                 await websocket.send_json({
                     "type": "error",
@@ -1001,9 +1131,9 @@ async def websocket_chat(websocket: WebSocket):
                 "session_id": session_id
             })
 
-        # Add user message
+        # Add user message (committed in the background)
         user_message = Message(role="user", content=message)
-        store.add_message(session_id, user_message)
+        store.queue_message(session_id, user_message)
 
         # Build session context for follow-ups
         previous_record_ids: list[str] = []
@@ -1013,7 +1143,9 @@ async def websocket_chat(websocket: WebSocket):
 
         ws_session_context = SessionContext(
             session_id=session_id,
-            previous_messages=session.get_recent_messages(5),
+            previous_messages=store.get_recent_messages(
+                session_id, 5, before=user_message.timestamp
+            ),
             previous_record_ids=previous_record_ids,
         )
 
@@ -1040,7 +1172,7 @@ async def websocket_chat(websocket: WebSocket):
                 confidence=plan.confidence,
                 metadata={"intents": plan.intents, "reasoning": plan.reasoning},
             )
-            msg_db_id = store.add_message(
+            msg_db_id = await store.add_message_async(
                 session_id,
                 Message(role="assistant", content=plan.clarification),
             )
@@ -1059,8 +1191,8 @@ async def websocket_chat(websocket: WebSocket):
             "stage": "execute",
         })
 
-        execution_result = execute_scholar_plan(
-            plan, _bib_db, ws_session_context, original_query=message
+        execution_result = await _execute_plan(
+            plan, _bib_db, ws_session_context, message
         )
 
         records_found = len(execution_result.grounding.records)
@@ -1124,7 +1256,7 @@ async def websocket_chat(websocket: WebSocket):
         # a session-store failure prevent the client from receiving results.
         msg_db_id = None
         try:
-            msg_db_id = store.add_message(
+            msg_db_id = await store.add_message_async(
                 session_id,
                 Message(role="assistant", content=narrative),
             )
@@ -19,6 +19,7 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, status
 
 from app.api.metadata_common import _get_db_path
+from app.api.offload import offloaded
 from app.api.metadata_models import (
     AgentChatRequest,
     AgentChatResponse,
@@ -176,7 +177,8 @@ _FIELD_COLUMN_MAP = {
     response_model=CoverageResponse,
     summary="Overall coverage stats per field",
 )
-async def get_coverage() -> CoverageResponse:
+@offloaded("aggregate")
+def get_coverage() -> CoverageResponse:
     """Return overall normalization coverage statistics per field."""
     db = _get_db_path()
     try:
@@ -205,7 +207,8 @@ async def get_coverage() -> CoverageResponse:
     response_model=IssuesResponse,
     summary="Records with low-confidence normalizations",
 )
-async def get_issues(
+@offloaded("lookup")
+def get_issues(
     field: MetadataField = Query(..., description="Metadata field to inspect"),
     max_confidence: float = Query(
         0.8, ge=0.0, le=1.0, description="Maximum confidence threshold"
@@ -292,7 +295,8 @@ async def get_issues(
     response_model=List[UnmappedValue],
     summary="Raw values without canonical mappings",
 )
-async def get_unmapped(
+@offloaded("aggregate")
+def get_unmapped(
     field: MetadataField = Query(..., description="Metadata field to inspect"),
     sort: str = Query("frequency", description="Sort order (frequency)"),
 ) -> List[UnmappedValue]:
@@ -355,7 +359,8 @@ async def get_unmapped(
     response_model=List[MethodDistribution],
     summary="Distribution of normalization methods",
 )
-async def get_methods(
+@offloaded("aggregate")
+def get_methods(
     field: MetadataField = Query(..., description="Metadata field to inspect"),
 ) -> List[MethodDistribution]:
     """Return the distribution of normalization methods for a field.
@@ -412,7 +417,8 @@ async def get_methods(
     response_model=List[ClusterResponse],
     summary="Gap clusters for review",
 )
-async def get_clusters(
+@offloaded("aggregate")
+def get_clusters(
     field: Optional[MetadataField] = Query(
         None, description="Metadata field (omit for all fields)"
     ),
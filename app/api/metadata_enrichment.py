@@ -10,6 +10,7 @@ import sqlite3
 from fastapi import APIRouter, HTTPException, Query
 
 from app.api.metadata_common import _get_db_path
+from app.api.offload import offloaded
 from scripts.utils.primo import generate_primo_url as _generate_primo_url
 
 router = APIRouter(prefix="/metadata/enrichment", tags=["metadata-enrichment"])
@@ -89,7 +90,8 @@ def _build_enrichment_where(
 
 
 @router.get("/stats", summary="Enrichment statistics")
-async def get_enrichment_stats():
+@offloaded("aggregate")
+def get_enrichment_stats():
     """Return summary statistics about entity enrichment coverage."""
     db_path = _get_db_path()
     conn = sqlite3.connect(str(db_path))
@@ -127,7 +129,8 @@ async def get_enrichment_stats():
 
 
 @router.get("/facets", summary="Enrichment facets for filtering")
-async def get_enrichment_facets(
+@offloaded("aggregate")
+def get_enrichment_facets(
     search: str = "",
     occupation: str = "",
     century: str = "",
@@ -214,7 +217,8 @@ async def get_enrichment_facets(
 
 
 @router.get("/agents", summary="Enriched agents list")
-async def get_enriched_agents(
+@offloaded("lookup")
+def get_enriched_agents(
     limit: int = 50,
     offset: int = 0,
     search: str = "",
@@ -305,7 +309,8 @@ async def get_enriched_agents(
     "/agent/{agent_norm}",
     summary="Get enrichment for a specific agent",
 )
-async def get_agent_enrichment(agent_norm: str):
+@offloaded("lookup")
+def get_agent_enrichment(agent_norm: str):
     """Get full enrichment data for a specific agent by normalized name."""
     db_path = _get_db_path()
     conn = sqlite3.connect(str(db_path))
@@ -356,7 +361,8 @@ async def get_agent_enrichment(agent_norm: str):
 
 
 @router.get("/agent-records", summary="Records for an enriched agent")
-async def get_agent_records(
+@offloaded("lookup")
+def get_agent_records(
     wikidata_id: str = Query("", description="Wikidata ID (e.g., Q319902)"),
     agent_norm: str = Query("", description="Agent norm (fallback if no wikidata_id)"),
 ):
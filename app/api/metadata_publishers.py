@@ -26,6 +26,8 @@ from app.api.metadata_models import (
     PublisherVariantResponse,
     UpdatePublisherRequest,
 )
+from scripts.marc.m3_contract import M3Tables
+from scripts.query.db_adapter import trigram_searchable, trigram_tables
 
 router = APIRouter(prefix="/metadata/publishers", tags=["metadata-publishers"])
 
@@ -414,11 +416,17 @@ def match_preview(
             if not table_check:
                 return MatchPreviewResponse(variant_form=variant_form, matching_imprints=0)
 
-            # Use LIKE for flexible matching (case-insensitive by default in SQLite)
-            row = conn.execute(
-                "SELECT COUNT(*) FROM imprints WHERE publisher_norm LIKE ?",
-                (f"%{variant_form.lower()}%",),
-            ).fetchone()
+            # Use LIKE for flexible matching (case-insensitive by default in SQLite),
+            # answered from the trigram index when the database has one
+            pattern = f"%{variant_form.lower()}%"
+            if trigram_searchable(pattern) and M3Tables.IMPRINTS_FTS in trigram_tables(conn):
+                sql = (
+                    f"SELECT COUNT(*) FROM {M3Tables.IMPRINTS_FTS} "
+                    f"WHERE {M3Tables.IMPRINTS_FTS}.publisher_norm LIKE ?"
+                )
+            else:
+                sql = "SELECT COUNT(*) FROM imprints WHERE publisher_norm LIKE ?"
+            row = conn.execute(sql, (pattern,)).fetchone()
             count = row[0] if row else 0
         finally:
             conn.close()
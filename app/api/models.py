@@ -73,12 +73,20 @@ class HealthExtendedResponse(BaseModel):
         db_last_modified: ISO-8601 timestamp of last database modification
         qa_db_exists: Whether the QA database file exists
         qa_db_size_bytes: Size of the QA database in bytes (0 if not present)
+        offload_lanes: Queue depth and throughput per blocking-work lane
+        llm_governor: Per-model LLM admission limits, queue waits and 429s
     """
 
     db_file_size_bytes: int = Field(..., description="Bibliographic DB file size in bytes")
     db_last_modified: Optional[str] = Field(None, description="ISO-8601 timestamp of last DB modification")
     qa_db_exists: bool = Field(..., description="Whether QA database exists")
     qa_db_size_bytes: int = Field(0, description="QA database file size in bytes")
+    offload_lanes: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict, description="Per-lane offload queue depth and counters"
+    )
+    llm_governor: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict, description="Per-model LLM governor limits and wait metrics"
+    )
 
 
 class ModelPair(BaseModel):
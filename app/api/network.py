@@ -2,14 +2,19 @@
 import json
 import logging
 import sqlite3
-from collections import defaultdict, deque
+from collections import defaultdict
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from app.api.auth_deps import require_role
+from app.api.offload import offloaded, run_blocking
+from scripts.marc.m3_facets import TIDY_SUBJECT_SQL, facet_summary_current
 from scripts.models.config import get_model, load_config
 from scripts.models.llm_client import structured_completion
+from scripts.network.build_network_tables import ACTIVE_SPAN_SQL, MAP_CONFIDENCE_STEPS
+from scripts.network.edge_index import edge_index_for
+from scripts.utils.sqlite_pool import read_connection
 
 from app.api.network_models import (
     AgentConnection,
@@ -45,25 +50,6 @@ router = APIRouter(
 
 DB_PATH = Path("data/index/bibliographic.db")
 
-# Per-node imprint-year span for the time slider (issue #32). One subquery
-# covers both node kinds: people via agents→imprints, publishers via
-# imprints.publisher_norm (the `pub:` agent_norm minus its 4-char prefix).
-_ACTIVE_SPAN_SELECT = """,
-    (SELECT MIN(d) FROM (
-        SELECT i.date_start d FROM agents a JOIN imprints i ON i.record_id = a.record_id
-        WHERE a.agent_norm = na.agent_norm AND i.date_start IS NOT NULL
-        UNION ALL
-        SELECT i.date_start d FROM imprints i
-        WHERE i.publisher_norm = substr(na.agent_norm, 5) AND i.date_start IS NOT NULL
-    )) AS active_start,
-    (SELECT MAX(d) FROM (
-        SELECT i.date_start d FROM agents a JOIN imprints i ON i.record_id = a.record_id
-        WHERE a.agent_norm = na.agent_norm AND i.date_start IS NOT NULL
-        UNION ALL
-        SELECT i.date_start d FROM imprints i
-        WHERE i.publisher_norm = substr(na.agent_norm, 5) AND i.date_start IS NOT NULL
-    )) AS active_end"""
-
 # 'category' is intentionally absent: issue #28 retired category from the arc
 # layer (76% maintenance noise) into a node-coloring facet (network_agents.community).
 VALID_CONNECTION_TYPES = {
@@ -73,9 +59,7 @@ VALID_CONNECTION_TYPES = {
 
 
 def _get_db() -> sqlite3.Connection:
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    return conn
+    return read_connection(DB_PATH, row_factory=sqlite3.Row)
 
 
 def _primo_url(mms_id: str) -> str | None:
@@ -175,11 +159,13 @@ def _works_for_agent(conn: sqlite3.Connection, agent_norm: str, limit: int = 25)
 
 def _map_node_from_row(r: sqlite3.Row, filtered_count: int = 0) -> MapNode:
     """Build a MapNode from a network_agents row (shared by /map and /ego)."""
+    # One dict per row: sqlite3.Row looks names up by a linear scan, which
+    # adds up over the map's thousands of nodes
+    r = dict(zip(r.keys(), r))
     try:
         occupations = json.loads(r["occupations"]) if r["occupations"] else []
     except (json.JSONDecodeError, TypeError):
         occupations = []
-    keys = r.keys()
     return MapNode(
         agent_norm=r["agent_norm"],
         display_name=r["display_name"],
@@ -190,19 +176,41 @@ def _map_node_from_row(r: sqlite3.Row, filtered_count: int = 0) -> MapNode:
         death_year=r["death_year"],
         occupations=occupations,
         connection_count=r["connection_count"],
-        filtered_count=(r["filtered_count"] if "filtered_count" in keys else filtered_count),
+        filtered_count=r.get("filtered_count", filtered_count),
         record_count=r["record_count"],
         has_wikipedia=bool(r["has_wikipedia"]),
         primary_role=r["primary_role"],
-        node_type=(r["node_type"] if "node_type" in keys else "person") or "person",
-        community=(r["community"] if "community" in keys else None),
-        active_start=(r["active_start"] if "active_start" in keys else None),
-        active_end=(r["active_end"] if "active_end" in keys else None),
+        node_type=r.get("node_type", "person") or "person",
+        community=r.get("community"),
+        active_start=r.get("active_start"),
+        active_end=r.get("active_end"),
+    )
+
+
+def _map_stats_current(conn: sqlite3.Connection) -> bool:
+    """True if build_network_map_stats ran at this DB generation and no
+    edge/node (or imprint/agent norm the spans depend on) changed since."""
+    try:
+        row = conn.execute(
+            "SELECT generation, dirty FROM network_map_stats WHERE id = 1"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return False
+    return (
+        row is not None and not row[1]
+        and row[0] == conn.execute("PRAGMA user_version").fetchone()[0]
     )
 
 
+def _confidence_step(min_confidence: float) -> int | None:
+    """The precomputed degree step equal to *min_confidence*, if there is one."""
+    step = round(min_confidence * MAP_CONFIDENCE_STEPS)
+    return step if step / MAP_CONFIDENCE_STEPS == min_confidence else None
+
+
 @router.get("/map", response_model=MapResponse)
-async def get_network_map(
+@offloaded("aggregate")
+def get_network_map(
     connection_types: str = Query("teacher_student", description="Comma-separated connection types"),
     min_confidence: float = Query(0.5, ge=0.0, le=1.0),
     century: int | None = Query(None, description="Filter by century (e.g., 16 for 1500s)"),
@@ -250,22 +258,44 @@ async def get_network_map(
             params.append(role)
 
         where_sql = " AND ".join(where_clauses)
+        # Precomputed spans/degrees (build_network_map_stats) while current;
+        # otherwise live subqueries. The live span columns come first so they
+        # shadow any stale stored ones in na.*.
+        stats_current = _map_stats_current(conn)
+        span_select = "" if stats_current else f"{ACTIVE_SPAN_SQL},"
+        confidence_step = _confidence_step(min_confidence) if stats_current else None
 
         if empty_types:
             # No connection types selected — return agents sorted by record_count, no edges
             agents_sql = f"""
-                SELECT na.*, 0 as filtered_count{_ACTIVE_SPAN_SELECT}
+                SELECT {span_select} na.*, 0 as filtered_count
                 FROM network_agents na
                 WHERE {where_sql}
                 ORDER BY na.record_count DESC
                 LIMIT ?
             """
             agent_params = [*params, limit]
+        elif confidence_step is not None:
+            # Precomputed per-type degrees (build_network_map_stats), looked
+            # up by primary key per node
+            type_placeholders = ",".join("?" for _ in types)
+            agents_sql = f"""
+                SELECT na.*, COALESCE((
+                    SELECT SUM(d.degree) FROM network_agent_degrees d
+                    WHERE d.connection_type IN ({type_placeholders})
+                      AND d.confidence_step = ? AND d.agent_norm = na.agent_norm
+                ), 0) as filtered_count
+                FROM network_agents na
+                WHERE {where_sql}
+                ORDER BY filtered_count DESC
+                LIMIT ?
+            """
+            agent_params = [*types, confidence_step, *params, limit]
         else:
             # Get top agents by connection count within selected types
             type_placeholders = ",".join("?" for _ in types)
             agents_sql = f"""
-                SELECT na.*, COALESCE(ec.edge_count, 0) as filtered_count{_ACTIVE_SPAN_SELECT}
+                SELECT {span_select} na.*, COALESCE(ec.edge_count, 0) as filtered_count
                 FROM network_agents na
                 LEFT JOIN (
                     SELECT agent_norm, count(*) as edge_count FROM (
@@ -292,18 +322,21 @@ async def get_network_map(
         if empty_types or len(agent_norms) < 2:
             edges = []
         else:
-            norm_list = list(agent_norms)
-            norm_placeholders = ",".join("?" for _ in norm_list)
+            # Range scan of idx_network_edges_type_confidence (built by
+            # build_network_map_stats), the node set bound once as JSON. The
+            # unary + keeps SQLite off the (source, target, type) unique
+            # index, which it would otherwise probe once per node pair.
             type_placeholders = ",".join("?" for _ in types)
+            norms_json = json.dumps(sorted(agent_norms))
             edge_rows = conn.execute(
                 f"""SELECT source_agent_norm, target_agent_norm, connection_type,
                            confidence, relationship, evidence, bidirectional
                     FROM network_edges
                     WHERE connection_type IN ({type_placeholders})
                       AND confidence >= ?
-                      AND source_agent_norm IN ({norm_placeholders})
-                      AND target_agent_norm IN ({norm_placeholders})""",
-                [*types, min_confidence, *norm_list, *norm_list],
+                      AND +source_agent_norm IN (SELECT value FROM json_each(?))
+                      AND +target_agent_norm IN (SELECT value FROM json_each(?))""",
+                [*types, min_confidence, norms_json, norms_json],
             ).fetchall()
 
             edges = [
@@ -333,9 +366,10 @@ async def get_network_map(
             ).fetchall()
         ]
 
-        # Imprint-date domain for the time slider (issue #32)
+        # Imprint-date domain for the time slider (issue #32); as two
+        # subqueries each is a single date_start index lookup
         year_min, year_max = conn.execute(
-            "SELECT MIN(date_start), MAX(date_start) FROM imprints WHERE date_start IS NOT NULL"
+            "SELECT (SELECT MIN(date_start) FROM imprints), (SELECT MAX(date_start) FROM imprints)"
         ).fetchone()
 
         return MapResponse(
@@ -355,7 +389,8 @@ async def get_network_map(
 
 
 @router.get("/search")
-async def search_agents(q: str = Query(""), limit: int = Query(10, ge=1, le=20)) -> dict:
+@offloaded("lookup")
+def search_agents(q: str = Query(""), limit: int = Query(10, ge=1, le=20)) -> dict:
     """Search network agents across scripts (issue #30).
 
     Matches the display name / normalized name directly AND fans out through
@@ -414,7 +449,8 @@ async def search_agents(q: str = Query(""), limit: int = Query(10, ge=1, le=20))
 
 
 @router.get("/ego/{agent_norm:path}", response_model=EgoResponse)
-async def get_ego_network(
+@offloaded("lookup")
+def get_ego_network(
     agent_norm: str,
     connection_types: str = Query("same_record,printed_by,teacher_student"),
     min_confidence: float = Query(0.5, ge=0.0, le=1.0),
@@ -521,7 +557,8 @@ async def get_ego_network(
 
 
 @router.get("/path", response_model=PathResponse)
-async def find_path(
+@offloaded("lookup")
+def find_path(
     source: str = Query(...),
     target: str = Query(...),
     connection_types: str = Query("same_record,printed_by,teacher_student"),
@@ -530,10 +567,11 @@ async def find_path(
 ) -> PathResponse:
     """Shortest path between two agents, each hop evidenced (issue #33).
 
-    Breadth-first over the (non-category) edges of the active types — BFS yields
-    the fewest-hops route. Each consecutive pair is annotated with its strongest
-    edge's relationship + evidence, oriented along the path. ``found`` is false
-    when the two agents are in different components within ``max_hops``.
+    Bidirectional breadth-first search over the (non-category) edges of the
+    active types (scripts/network/edge_index.py) — BFS yields the fewest-hops
+    route. Each consecutive pair is annotated with its strongest edge's
+    relationship + evidence, oriented along the path. ``found`` is false when
+    the two agents are in different components within ``max_hops``.
     """
     types = [t.strip() for t in connection_types.split(",") if t.strip()]
     invalid = set(types) - VALID_CONNECTION_TYPES
@@ -544,75 +582,36 @@ async def find_path(
 
     conn = _get_db()
     try:
+        rows = _network_agent_rows(conn, [source, target])
         for norm in (source, target):
-            exists = conn.execute(
-                "SELECT 1 FROM network_agents WHERE agent_norm = ?", (norm,)
-            ).fetchone()
-            if not exists:
+            if norm not in rows:
                 raise HTTPException(404, f"Agent not found: {norm}")
 
-        def node_for(norm: str) -> MapNode:
-            row = conn.execute(
-                "SELECT * FROM network_agents WHERE agent_norm = ?", (norm,)
-            ).fetchone()
-            return _map_node_from_row(row)
-
         if source == target:
             return PathResponse(
                 source=source, target=target, found=True, hops=0,
-                nodes=[node_for(source)], edges=[],
+                nodes=[_map_node_from_row(rows[source])], edges=[],
             )
 
-        # Adjacency over the active edge types
-        tph = ",".join("?" for _ in types)
-        adj: dict[str, set[str]] = defaultdict(set)
-        for s, t in conn.execute(
-            f"""SELECT source_agent_norm, target_agent_norm FROM network_edges
-                WHERE connection_type IN ({tph}) AND confidence >= ?""",
-            (*types, min_confidence),
-        ).fetchall():
-            adj[s].add(t)
-            adj[t].add(s)
-
-        # BFS with a depth bound
-        parent: dict[str, str | None] = {source: None}
-        depth = {source: 0}
-        q = deque([source])
-        while q:
-            cur = q.popleft()
-            if cur == target:
-                break
-            if depth[cur] >= max_hops:
-                continue
-            for nb in adj.get(cur, ()):  # noqa: E501
-                if nb not in parent:
-                    parent[nb] = cur
-                    depth[nb] = depth[cur] + 1
-                    q.append(nb)
-
-        if target not in parent:
+        # Bidirectional BFS over the process-wide CSR adjacency
+        index = edge_index_for(DB_PATH)
+        chain = index.shortest_path(source, target, types, min_confidence, max_hops)
+        if chain is None:
             return PathResponse(source=source, target=target, found=False)
 
-        # Reconstruct source -> target
-        chain: list[str] = []
-        cur: str | None = target
-        while cur is not None:
-            chain.append(cur)
-            cur = parent[cur]
-        chain.reverse()
-
-        # Best edge for each hop, oriented along the path
+        # Strongest edge of each hop from the CSR arrays, evidence in one query
+        rowids = index.best_edges(chain, types, min_confidence)
+        evidence = {
+            er["rowid"]: er
+            for er in conn.execute(
+                """SELECT rowid, connection_type, confidence, relationship, evidence, bidirectional
+                   FROM network_edges WHERE rowid IN (SELECT value FROM json_each(?))""",
+                (json.dumps([r for r in rowids if r is not None]),),
+            ).fetchall()
+        }
         edges: list[MapEdge] = []
-        for a, b in zip(chain, chain[1:]):
-            er = conn.execute(
-                f"""SELECT connection_type, confidence, relationship, evidence, bidirectional
-                    FROM network_edges
-                    WHERE ((source_agent_norm = ? AND target_agent_norm = ?)
-                        OR (source_agent_norm = ? AND target_agent_norm = ?))
-                      AND connection_type IN ({tph}) AND confidence >= ?
-                    ORDER BY confidence DESC LIMIT 1""",
-                (a, b, b, a, *types, min_confidence),
-            ).fetchone()
+        for (a, b), rowid in zip(zip(chain, chain[1:]), rowids):
+            er = evidence.get(rowid)
             edges.append(MapEdge(
                 source=a, target=b,
                 type=er["connection_type"] if er else "",
@@ -622,14 +621,26 @@ async def find_path(
                 bidirectional=bool(er["bidirectional"]) if er else True,
             ))
 
+        rows.update(_network_agent_rows(conn, chain[1:-1]))
         return PathResponse(
             source=source, target=target, found=True, hops=len(chain) - 1,
-            nodes=[node_for(n) for n in chain], edges=edges,
+            nodes=[_map_node_from_row(rows[n]) for n in chain], edges=edges,
         )
     finally:
         conn.close()
 
 
+def _network_agent_rows(conn: sqlite3.Connection, norms: list[str]) -> dict[str, sqlite3.Row]:
+    """network_agents rows of *norms*, keyed by agent_norm (missing ones absent)."""
+    return {
+        row["agent_norm"]: row
+        for row in conn.execute(
+            "SELECT * FROM network_agents WHERE agent_norm IN (SELECT value FROM json_each(?))",
+            (json.dumps(norms),),
+        ).fetchall()
+    }
+
+
 # Portraits are deterministic per (figure, edge-type set) — generate once, ever.
 _portrait_cache: dict[tuple[str, str], NetworkPortrait] = {}
 
@@ -650,32 +661,15 @@ Return:
 Match the user's language conventions; names may be Hebrew — keep them verbatim."""
 
 
-@router.post(
-    "/interpret",
-    response_model=NetworkPortrait,
-    dependencies=[Depends(require_role("limited"))],  # LLM spend: same bar as /chat
-)
-async def interpret_ego(req: InterpretRequest) -> NetworkPortrait:
-    """AI portrait of a figure's ego network (creative layer over /ego).
-
-    Builds a compact, server-side context (never trusts client data), asks a
-    cheap model for an epithet + grounded reading + one next thread, and caches
-    the result per (agent, edge-type set) so each figure costs at most one call.
-    """
-    types = sorted({t for t in req.connection_types if t in VALID_CONNECTION_TYPES})
-    if not types:
-        types = sorted(VALID_CONNECTION_TYPES)
-    key = (req.agent_norm, ",".join(types))
-    if key in _portrait_cache:
-        return _portrait_cache[key].model_copy(update={"cached": True})
-
+def _portrait_context(agent_norm: str, types: list[str]):
+    """Focal row, node type, ego edges, neighbour lines and sample works for /interpret."""
     conn = _get_db()
     try:
         focal = conn.execute(
-            "SELECT * FROM network_agents WHERE agent_norm = ?", (req.agent_norm,)
+            "SELECT * FROM network_agents WHERE agent_norm = ?", (agent_norm,)
         ).fetchone()
         if not focal:
-            raise HTTPException(404, f"Agent not found: {req.agent_norm}")
+            raise HTTPException(404, f"Agent not found: {agent_norm}")
 
         tph = ",".join("?" for _ in types)
         edge_rows = conn.execute(
@@ -684,12 +678,12 @@ async def interpret_ego(req: InterpretRequest) -> NetworkPortrait:
                 FROM network_edges
                 WHERE (source_agent_norm = ? OR target_agent_norm = ?)
                   AND connection_type IN ({tph})""",
-            (req.agent_norm, req.agent_norm, *types),
+            (agent_norm, agent_norm, *types),
         ).fetchall()
 
         neighbour_lines: list[str] = []
         for er in edge_rows[:30]:
-            other = er["target_agent_norm"] if er["source_agent_norm"] == req.agent_norm else er["source_agent_norm"]
+            other = er["target_agent_norm"] if er["source_agent_norm"] == agent_norm else er["source_agent_norm"]
             n = conn.execute(
                 "SELECT display_name, birth_year, death_year, node_type FROM network_agents WHERE agent_norm = ?",
                 (other,),
@@ -705,13 +699,39 @@ async def interpret_ego(req: InterpretRequest) -> NetworkPortrait:
             )
 
         node_type = (focal["node_type"] if "node_type" in focal.keys() else "person") or "person"
-        if node_type == "publisher" and req.agent_norm.startswith("pub:"):
-            works = _works_for_publisher(conn, req.agent_norm[len("pub:"):], limit=8)
+        if node_type == "publisher" and agent_norm.startswith("pub:"):
+            works = _works_for_publisher(conn, agent_norm[len("pub:"):], limit=8)
         else:
-            works = _works_for_agent(conn, req.agent_norm, limit=8)
+            works = _works_for_agent(conn, agent_norm, limit=8)
     finally:
         conn.close()
 
+    return focal, node_type, edge_rows, neighbour_lines, works
+
+
+@router.post(
+    "/interpret",
+    response_model=NetworkPortrait,
+    dependencies=[Depends(require_role("limited"))],  # LLM spend: same bar as /chat
+)
+async def interpret_ego(req: InterpretRequest) -> NetworkPortrait:
+    """AI portrait of a figure's ego network (creative layer over /ego).
+
+    Builds a compact, server-side context (never trusts client data), asks a
+    cheap model for an epithet + grounded reading + one next thread, and caches
+    the result per (agent, edge-type set) so each figure costs at most one call.
+    """
+    types = sorted({t for t in req.connection_types if t in VALID_CONNECTION_TYPES})
+    if not types:
+        types = sorted(VALID_CONNECTION_TYPES)
+    key = (req.agent_norm, ",".join(types))
+    if key in _portrait_cache:
+        return _portrait_cache[key].model_copy(update={"cached": True})
+
+    focal, node_type, edge_rows, neighbour_lines, works = await run_blocking(
+        "lookup", _portrait_context, req.agent_norm, types
+    )
+
     try:
         occupations = json.loads(focal["occupations"]) if focal["occupations"] else []
     except (json.JSONDecodeError, TypeError):
@@ -752,8 +772,45 @@ async def interpret_ego(req: InterpretRequest) -> NetworkPortrait:
     return portrait
 
 
+# /places from the materialized facet summary (same columns as the live query)
+_PLACES_FROM_SUMMARY_SQL = """
+    SELECT * FROM (
+        SELECT f.value AS place_norm, f.record_count AS record_count,
+               (SELECT na.lat FROM network_agents na
+                WHERE na.place_norm = f.value AND na.lat IS NOT NULL LIMIT 1) AS lat,
+               (SELECT na.lon FROM network_agents na
+                WHERE na.place_norm = f.value AND na.lon IS NOT NULL LIMIT 1) AS lon,
+               f.display AS place_display,
+               (SELECT COUNT(*) FROM network_agents na2 WHERE na2.place_norm = f.value) AS agent_count,
+               f.year_min AS year_min, f.year_max AS year_max
+        FROM facet_counts f
+        WHERE f.facet = 'place' AND f.value != '[sine loco]' AND f.record_count >= ?
+    )
+    WHERE lat IS NOT NULL
+    ORDER BY record_count DESC"""
+
+
+def _place_markers(rows: list, decade_rows: list) -> list[PlaceMarker]:
+    decades_by_place: dict[str, list[DecadeCount]] = defaultdict(list)
+    for pn, dec, n in decade_rows:
+        decades_by_place[pn].append(DecadeCount(decade=dec, count=n))
+
+    return [
+        PlaceMarker(
+            place_norm=r["place_norm"],
+            place_display=r["place_display"],
+            lat=r["lat"], lon=r["lon"],
+            record_count=r["record_count"], agent_count=r["agent_count"],
+            year_min=r["year_min"], year_max=r["year_max"],
+            decades=decades_by_place.get(r["place_norm"], []),
+        )
+        for r in rows
+    ]
+
+
 @router.get("/places", response_model=list[PlaceMarker])
-async def get_places(min_books: int = Query(1, ge=1)) -> list[PlaceMarker]:
+@offloaded("aggregate")
+def get_places(min_books: int = Query(1, ge=1)) -> list[PlaceMarker]:
     """Aggregated printing cities for the place-first map.
 
     One marker per geocoded `imprints.place_norm`, sized by how many books were
@@ -762,6 +819,14 @@ async def get_places(min_books: int = Query(1, ge=1)) -> list[PlaceMarker]:
     """
     conn = _get_db()
     try:
+        if facet_summary_current(conn):
+            rows = conn.execute(_PLACES_FROM_SUMMARY_SQL, (min_books,)).fetchall()
+            decade_rows = conn.execute(
+                """SELECT value, decade, record_count FROM facet_decade_counts
+                   WHERE facet = 'place' ORDER BY decade"""
+            ).fetchall()
+            return _place_markers(rows, decade_rows)
+
         rows = conn.execute(
             """SELECT i.place_norm AS place_norm,
                       COUNT(DISTINCT i.record_id) AS record_count,
@@ -783,34 +848,20 @@ async def get_places(min_books: int = Query(1, ge=1)) -> list[PlaceMarker]:
 
         # Per-city decade histogram — lets the time slider size circles by books
         # printed *within the window* (cities genuinely swell and fade).
-        decades_by_place: dict[str, list[DecadeCount]] = defaultdict(list)
-        for pn, dec, n in conn.execute(
+        decade_rows = conn.execute(
             """SELECT place_norm, (date_start/10)*10 AS dec, COUNT(DISTINCT record_id)
                FROM imprints
                WHERE place_norm IS NOT NULL AND date_start IS NOT NULL
                GROUP BY place_norm, dec ORDER BY dec"""
-        ).fetchall():
-            decades_by_place[pn].append(DecadeCount(decade=dec, count=n))
-
-        return [
-            PlaceMarker(
-                place_norm=r["place_norm"],
-                place_display=r["place_display"],
-                lat=r["lat"], lon=r["lon"],
-                record_count=r["record_count"], agent_count=r["agent_count"],
-                year_min=r["year_min"], year_max=r["year_max"],
-                decades=decades_by_place.get(r["place_norm"], []),
-            )
-            for r in rows
-        ]
+        ).fetchall()
+        return _place_markers(rows, decade_rows)
     finally:
         conn.close()
 
 
-# Tidy subject form used consistently across both topic endpoints: strip
-# trailing periods/spaces (merging 'Bible.' with 'Bible') and render LCSH
-# ' -- ' subdivisions as ' — ' for display.
-_TIDY_SUBJECT_SQL = "replace(replace(rtrim(value, '. '), ' -- ', ' — '), '. — ', ' — ')"
+# Tidy subject form used consistently across both topic endpoints (shared
+# with the facet summary's 'topic' facet, see scripts/marc/m3_facets.py).
+_TIDY_SUBJECT_SQL = TIDY_SUBJECT_SQL
 
 # Form/genre roots: what the books ARE, vs. topical roots (what they're ABOUT).
 _FORM_ROOTS = {
@@ -826,7 +877,8 @@ def _topic_root(subject: str) -> str:
 
 
 @router.get("/topics", response_model=list[TopicMarker])
-async def get_topics(limit: int = Query(120, ge=10, le=400)) -> list[TopicMarker]:
+@offloaded("aggregate")
+def get_topics(limit: int = Query(120, ge=10, le=400)) -> list[TopicMarker]:
     """Aggregated subject headings for the topic constellation.
 
     One marker per tidy heading (top `limit` by holdings): book count, the
@@ -835,27 +887,41 @@ async def get_topics(limit: int = Query(120, ge=10, le=400)) -> list[TopicMarker
     """
     conn = _get_db()
     try:
-        rows = conn.execute(
-            f"""SELECT {_TIDY_SUBJECT_SQL} AS subj,
-                       COUNT(DISTINCT record_id) AS n,
-                       MAX(value_he) AS he
-                FROM subjects
-                WHERE value IS NOT NULL AND TRIM(value) != ''
-                GROUP BY subj
-                ORDER BY n DESC
-                LIMIT ?""",
-            (limit,),
-        ).fetchall()
+        if facet_summary_current(conn):
+            rows = conn.execute(
+                """SELECT value AS subj, record_count AS n, display AS he
+                   FROM facet_counts WHERE facet = 'topic'
+                   ORDER BY n DESC
+                   LIMIT ?""",
+                (limit,),
+            ).fetchall()
+            decade_rows = conn.execute(
+                """SELECT value, decade, record_count FROM facet_decade_counts
+                   WHERE facet = 'topic'"""
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                f"""SELECT {_TIDY_SUBJECT_SQL} AS subj,
+                           COUNT(DISTINCT record_id) AS n,
+                           MAX(value_he) AS he
+                    FROM subjects
+                    WHERE value IS NOT NULL AND TRIM(value) != ''
+                    GROUP BY subj
+                    ORDER BY n DESC
+                    LIMIT ?""",
+                (limit,),
+            ).fetchall()
+            decade_rows = conn.execute(
+                f"""SELECT {_TIDY_SUBJECT_SQL} AS subj, (i.date_start/10)*10 AS dec,
+                           COUNT(DISTINCT s.record_id) AS n
+                    FROM subjects s JOIN imprints i ON i.record_id = s.record_id
+                    WHERE i.date_start IS NOT NULL
+                    GROUP BY subj, dec"""
+            ).fetchall()
 
         # Peak decade per heading (mode of imprint decades)
         peaks: dict[str, tuple[int, int]] = {}
-        for subj, dec, n in conn.execute(
-            f"""SELECT {_TIDY_SUBJECT_SQL} AS subj, (i.date_start/10)*10 AS dec,
-                       COUNT(DISTINCT s.record_id) AS n
-                FROM subjects s JOIN imprints i ON i.record_id = s.record_id
-                WHERE i.date_start IS NOT NULL
-                GROUP BY subj, dec"""
-        ).fetchall():
+        for subj, dec, n in decade_rows:
             if subj not in peaks or n > peaks[subj][1]:
                 peaks[subj] = (dec, n)
 
@@ -874,7 +940,8 @@ async def get_topics(limit: int = Query(120, ge=10, le=400)) -> list[TopicMarker
 
 
 @router.get("/topic/{subject:path}", response_model=TopicDetail)
-async def get_topic_detail(subject: str, limit: int = Query(50, ge=1, le=200)) -> TopicDetail:
+@offloaded("lookup")
+def get_topic_detail(subject: str, limit: int = Query(50, ge=1, le=200)) -> TopicDetail:
     """Topic profile — when/where/who/books for one subject heading."""
     conn = _get_db()
     try:
@@ -949,7 +1016,8 @@ async def get_topic_detail(subject: str, limit: int = Query(50, ge=1, le=200)) -
 
 
 @router.get("/place/{place_norm:path}", response_model=PlaceDetail)
-async def get_place_detail(place_norm: str, limit: int = Query(50, ge=1, le=200)) -> PlaceDetail:
+@offloaded("lookup")
+def get_place_detail(place_norm: str, limit: int = Query(50, ge=1, le=200)) -> PlaceDetail:
     """Books in the collection printed in a given place (issue #29)."""
     conn = _get_db()
     try:
@@ -1063,7 +1131,8 @@ async def get_place_detail(place_norm: str, limit: int = Query(50, ge=1, le=200)
 
 
 @router.get("/agent/{agent_norm:path}", response_model=AgentDetail)
-async def get_agent_detail(agent_norm: str) -> AgentDetail:
+@offloaded("lookup")
+def get_agent_detail(agent_norm: str) -> AgentDetail:
     """Return full detail for a single agent."""
     conn = _get_db()
     try:
@@ -0,0 +1,182 @@
+"""Bounded thread-pool offload for blocking work in async handlers.
+
+The API serves websocket token streams from the same event loop as its
+HTTP handlers, so a handler that runs sqlite or CPU-heavy code inline
+stalls every stream in the worker until it returns. Handlers instead hand
+that work to a named *lane*: a small thread pool with its own concurrency
+limit, so a burst of slow aggregations queues behind its own lane rather
+than starving quick lookups or the scholar executor.
+
+Lanes:
+- ``pipeline``:  deterministic scholar-plan execution (chat, websocket)
+- ``aggregate``: full-collection scans (network map/places/topics,
+  coverage, clusters, enrichment facets/stats)
+- ``lookup``:    short indexed reads (search, ego, path, detail pages)
+
+Limits default to ``OFFLOAD_<LANE>_WORKERS`` from the environment. Queue
+depth (submitted but not yet running), in-flight count, peak queue depth
+and cumulative wait time are kept per lane and reported by
+``/health/extended``.
+
+Usage:
+    result = await run_blocking("pipeline", execute_plan, plan, db_path)
+
+    @router.get("/places")
+    @offloaded("aggregate")
+    def get_places(...): ...
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from scripts.utils.logger import LoggerManager
+
+logger = LoggerManager.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Default worker count per lane (overridable via OFFLOAD_<LANE>_WORKERS)
+LANE_DEFAULTS: Dict[str, int] = {
+    "pipeline": 4,
+    "aggregate": 2,
+    "lookup": 8,
+}
+
+
+class _Lane:
+    """One bounded pool plus its queue-depth counters."""
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"offload-{name}"
+        )
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.peak_queued = 0
+        self.wait_seconds = 0.0
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any):
+        """Schedule *fn* on the lane; returns a concurrent Future."""
+        ctx = contextvars.copy_context()
+        enqueued = time.monotonic()
+        with self._lock:
+            self.queued += 1
+            self.peak_queued = max(self.peak_queued, self.queued)
+
+        def _call() -> T:
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.wait_seconds += time.monotonic() - enqueued
+            try:
+                result = ctx.run(fn, *args, **kwargs)
+            except BaseException:
+                with self._lock:
+                    self.failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+            return result
+
+        return self._executor.submit(_call)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            started = self.completed + self.running
+            return {
+                "max_workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,  # includes failed
+                "failed": self.failed,
+                "peak_queued": self.peak_queued,
+                "avg_wait_ms": round(1000 * self.wait_seconds / started, 2) if started else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_lanes: Dict[str, _Lane] = {}
+_lanes_lock = threading.Lock()
+
+
+def _lane_limit(name: str) -> int:
+    raw = os.getenv(f"OFFLOAD_{name.upper()}_WORKERS")
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            logger.warning("Ignoring invalid OFFLOAD_%s_WORKERS=%r", name.upper(), raw)
+    return LANE_DEFAULTS[name]
+
+
+def _get_lane(name: str) -> _Lane:
+    lane = _lanes.get(name)
+    if lane is not None:
+        return lane
+    if name not in LANE_DEFAULTS:
+        raise ValueError(f"Unknown offload lane {name!r} (expected one of {sorted(LANE_DEFAULTS)})")
+    with _lanes_lock:
+        lane = _lanes.get(name)
+        if lane is None:
+            lane = _Lane(name, _lane_limit(name))
+            _lanes[name] = lane
+        return lane
+
+
+async def run_blocking(lane: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run blocking *fn* on *lane* without blocking the event loop.
+
+    Context variables are copied into the worker thread, and exceptions
+    (including ``HTTPException``) propagate to the awaiting handler.
+    """
+    future = _get_lane(lane).submit(fn, *args, **kwargs)
+    return await asyncio.wrap_future(future)
+
+
+def offloaded(lane: str) -> Callable[[Callable[..., T]], Callable[..., Any]]:
+    """Decorator turning a sync route handler into an async one on *lane*.
+
+    ``functools.wraps`` keeps the signature FastAPI inspects for
+    parameters and dependencies.
+    """
+    if lane not in LANE_DEFAULTS:
+        raise ValueError(f"Unknown offload lane {lane!r} (expected one of {sorted(LANE_DEFAULTS)})")
+
+    def decorator(fn: Callable[..., T]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            return await run_blocking(lane, fn, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def offload_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-lane queue-depth and throughput counters."""
+    return {name: lane.stats() for name, lane in sorted(_lanes.items())}
+
+
+def shutdown_offload(lane: Optional[str] = None) -> None:
+    """Shut down one lane (or all); a later call recreates it lazily."""
+    with _lanes_lock:
+        names = [lane] if lane else list(_lanes)
+        for name in names:
+            existing = _lanes.pop(name, None)
+            if existing is not None:
+                existing.shutdown()
@@ -14,14 +14,17 @@ Supports aggregations over:
 - agent: Top agents (printers, authors, etc.)
 """
 
-import sqlite3
+import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
 from scripts.chat.models import ComparisonFacets, ComparisonResult
+from scripts.marc.m3_facets import read_facet
+from scripts.query.facets import century_label, compute_facets, decade_label
 from scripts.utils.logger import LoggerManager
+from scripts.utils.sqlite_pool import read_connection
 
 
 class AggregationResult(BaseModel):
@@ -152,6 +155,17 @@ AGGREGATION_QUERIES = {
 }
 
 
+# Aggregation fields answered by the facet engine (field -> facet name)
+_FACET_FIELDS = {
+    "publisher": "publisher",
+    "place": "place",
+    "country": "country",
+    "language": "language",
+    "date_decade": "decade",
+    "date_century": "century",
+}
+
+
 # =============================================================================
 # Metadata Question Queries
 # =============================================================================
@@ -246,30 +260,17 @@ def execute_aggregation(
             query_description=f"Aggregation on {field} (empty subgroup)"
         )
 
-    # Build query with placeholders
-    placeholders = ",".join("?" * len(record_ids))
-    query = AGGREGATION_QUERIES[field].format(placeholders=placeholders)
-
-    # Execute query
-    conn = sqlite3.connect(str(db_path))
+    conn = read_connection(db_path)
     try:
-        cursor = conn.execute(query, [*record_ids, limit])
-        rows = cursor.fetchall()
-
-        # Get column names
-        columns = [desc[0] for desc in cursor.description]
-
-        # Build results
-        results = []
-        for row in rows:
-            result = dict(zip(columns, row))
-            # Ensure we have 'value' and 'count' keys
-            if "value" not in result:
-                # For date queries, use the formatted value
-                result["value"] = str(row[1]) if len(row) > 1 else str(row[0])
-            if "count" not in result:
-                result["count"] = row[-1]
-            results.append({"value": result["value"], "count": result["count"]})
+        if field in _FACET_FIELDS:
+            results = _facet_aggregation(conn, record_ids, field, limit)
+        else:
+            # Non-imprint fields: bind the subgroup once through json_each
+            query = AGGREGATION_QUERIES[field].format(
+                placeholders="SELECT value FROM json_each(?)"
+            )
+            cursor = conn.execute(query, [json.dumps(list(record_ids)), limit])
+            results = [{"value": row[0], "count": row[1]} for row in cursor.fetchall()]
 
         logger.info(
             "Executed aggregation",
@@ -291,6 +292,19 @@ def execute_aggregation(
         conn.close()
 
 
+def _facet_aggregation(
+    conn, record_ids: List[str], field: str, limit: int
+) -> List[Dict[str, Any]]:
+    """Aggregate an imprint/language field through the single-pass facet engine."""
+    facet_field = _FACET_FIELDS[field]
+    facet = compute_facets(conn, record_ids, fields=(facet_field,))[facet_field]
+    if facet_field == "decade":
+        return [{"value": decade_label(d), "count": c} for d, c in facet.ordered(limit)]
+    if facet_field == "century":
+        return [{"value": century_label(c), "count": n} for c, n in facet.ordered(limit)]
+    return [{"value": v, "count": c} for v, c in facet.top(limit)]
+
+
 def execute_count_query(
     db_path: Path,
     record_ids: List[str],
@@ -317,7 +331,7 @@ def execute_count_query(
     placeholders = ",".join("?" * len(record_ids))
     query = METADATA_QUERIES[query_type].format(placeholders=placeholders)
 
-    conn = sqlite3.connect(str(db_path))
+    conn = read_connection(db_path)
     try:
         if filter_value:
             cursor = conn.execute(query, [*record_ids, filter_value.lower()])
@@ -490,7 +504,7 @@ def apply_refinement(
         return record_ids
 
     # Execute query
-    conn = sqlite3.connect(str(db_path))
+    conn = read_connection(db_path)
     try:
         cursor = conn.execute(query, params)
         return [row[0] for row in cursor.fetchall()]
@@ -508,6 +522,29 @@ def apply_refinement(
 # =============================================================================
 
 
+def _overview_from_summary(conn, top_n: int) -> Optional[Dict[str, Any]]:
+    """Overview sections read from the facet summary; None when it is stale.
+
+    Like the live queries, dates after 2100 (unconverted Hebrew calendar
+    years) are left out of the date range and century distribution.
+    """
+    years = read_facet(conn, "year")
+    if years is None:
+        return None
+    years = [year for year, _ in years if year <= 2100]
+    centuries = [(c, n) for c, n in read_facet(conn, "century") or [] if c <= 21]
+    return {
+        "date_range": (years[0], years[-1]) if years else (None, None),
+        "top_languages": read_facet(conn, "language", top_n) or [],
+        "top_places": read_facet(conn, "place", top_n) or [],
+        "top_publishers": read_facet(conn, "publisher", top_n) or [],
+        "top_subjects": read_facet(conn, "subject", top_n) or [],
+        "century_distribution": [
+            ("21st century" if c == 21 else century_label(c), n) for c, n in centuries
+        ],
+    }
+
+
 def get_collection_overview(db_path: Path, top_n: int = 5) -> Dict[str, Any]:
     """Get an overview of the entire collection.
 
@@ -528,7 +565,7 @@ def get_collection_overview(db_path: Path, top_n: int = 5) -> Dict[str, Any]:
         - top_subjects: List of (subject, count)
         - century_distribution: List of (century, count)
     """
-    conn = sqlite3.connect(str(db_path))
+    conn = read_connection(db_path)
     try:
         result = {}
 
@@ -536,6 +573,15 @@ def get_collection_overview(db_path: Path, top_n: int = 5) -> Dict[str, Any]:
         cursor = conn.execute("SELECT COUNT(*) FROM records")
         result["total_records"] = cursor.fetchone()[0]
 
+        summary = _overview_from_summary(conn, top_n)
+        if summary is not None:
+            result.update(summary)
+            logger.info(
+                "Generated collection overview from facet summary",
+                extra={"total_records": result["total_records"]}
+            )
+            return result
+
         # Date range (filter out Hebrew calendar dates > 2100)
         cursor = conn.execute("""
             SELECT MIN(date_start), MAX(date_start)
@@ -865,7 +911,7 @@ def execute_comparison_enhanced(
 
     table, column = field_column_map.get(field, ("imprints", "place_norm"))
 
-    conn = sqlite3.connect(str(db_path))
+    conn = read_connection(db_path)
     try:
         placeholders = ",".join("?" * len(record_ids))
 
@@ -1132,6 +1178,19 @@ _FULL_COLLECTION_QUERIES = {
 }
 
 
+# Full-collection fields answered from the facet summary (field -> facet)
+_SUMMARY_FACETS = {**_FACET_FIELDS, "subject": "subject", "agent": "agent"}
+
+
+def _summary_label(field: str, value: Any) -> Any:
+    """Display value of a summary row, labelled like the live queries."""
+    if field == "date_decade":
+        return decade_label(value)
+    if field == "date_century":
+        return century_label(value)
+    return value
+
+
 def execute_aggregation_full_collection(
     db_path: Path,
     field: str,
@@ -1171,28 +1230,40 @@ def execute_aggregation_full_collection(
 
     query = _FULL_COLLECTION_QUERIES[field]
 
-    conn = sqlite3.connect(str(db_path))
+    conn = read_connection(db_path)
     try:
         # Count total records
         total_cursor = conn.execute("SELECT COUNT(*) FROM records")
         total = total_cursor.fetchone()[0]
 
-        cursor = conn.execute(query, [limit])
-        rows = cursor.fetchall()
-
-        columns = [desc[0] for desc in cursor.description]
-        results = []
-        for row in rows:
-            result = dict(zip(columns, row))
-            if "value" not in result:
-                result["value"] = str(row[1]) if len(row) > 1 else str(row[0])
-            if "count" not in result:
-                result["count"] = row[-1]
-            results.append({"value": result["value"], "count": result["count"]})
+        # Materialized summary first; live GROUP BY when it is stale
+        summary = read_facet(conn, _SUMMARY_FACETS[field], limit)
+        if summary is not None:
+            results = [
+                {"value": _summary_label(field, value), "count": count}
+                for value, count in summary
+            ]
+        else:
+            cursor = conn.execute(query, [limit])
+            rows = cursor.fetchall()
+
+            columns = [desc[0] for desc in cursor.description]
+            results = []
+            for row in rows:
+                result = dict(zip(columns, row))
+                if "value" not in result:
+                    result["value"] = str(row[1]) if len(row) > 1 else str(row[0])
+                if "count" not in result:
+                    result["count"] = row[-1]
+                results.append({"value": result["value"], "count": result["count"]})
 
         logger.info(
             "Executed full-collection aggregation",
-            extra={"field": field, "results_count": len(results)},
+            extra={
+                "field": field,
+                "results_count": len(results),
+                "from_summary": summary is not None,
+            },
         )
 
         return AggregationResult(
@@ -1223,7 +1294,7 @@ def get_all_record_ids(
     Returns:
         List of MMS ID strings.
     """
-    conn = sqlite3.connect(str(db_path))
+    conn = read_connection(db_path)
     try:
         if not filters:
             cursor = conn.execute("SELECT mms_id FROM records")
@@ -4,7 +4,10 @@ Builds an in-memory graph from authority_enrichment data and discovers
 connections between agents: teacher/student, co-publication, same_place_period.
 
 Key functions:
-- build_agent_graph: Load enrichment data into AgentNode graph
+- build_agent_graph: Load enrichment data into AgentNode graph (cached per
+  database generation)
+- warm_agent_graph: Build the graph ahead of the first query (API startup)
+- enable_agent_graph_snapshot: Share built graphs across worker processes
 - find_connections: Discover pairwise relationships between agents
 - find_network_neighbors: Find agents 1-hop away via teacher/student links
 
@@ -13,33 +16,123 @@ Spec: reports/historian-enhancement-plan.md lines 400-565
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
 import sqlite3
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 from scripts.chat.models import AgentNode, Connection
+from scripts.utils.db_generation import db_generation
+from scripts.utils.sqlite_pool import read_connection
 
 logger = logging.getLogger(__name__)
 
-# Module-level lazy singleton for the agent graph
-_agent_graph_cache: Optional[Dict[str, AgentNode]] = None
-_agent_graph_db_id: Optional[int] = None
+# Agent graph cache: one entry per database file, keyed by the file's
+# generation stamp (scripts.utils.db_generation). A new generation re-runs
+# the graph query but keeps the parsed graph when the rows feeding it are
+# unchanged (same digest), so only enrichment/agent changes pay for the
+# person_info parsing. In-memory databases are never cached.
+@dataclass
+class _GraphEntry:
+    generation: str
+    digest: str
+    graph: Dict[str, AgentNode]
+
+
+_graph_entries: Dict[str, _GraphEntry] = {}
+_graph_lock = threading.Lock()
+
+# Optional on-disk snapshot shared by all API workers (see
+# enable_agent_graph_snapshot)
+_snapshot_path: Optional[Path] = None
+
+_GRAPH_SQL = """
+    SELECT
+        a.agent_norm,
+        ae.authority_uri,
+        ae.wikidata_id,
+        ae.label,
+        ae.person_info,
+        COUNT(DISTINCT a.record_id) as record_count
+    FROM authority_enrichment ae
+    JOIN agents a ON a.authority_uri = ae.authority_uri
+    WHERE ae.person_info IS NOT NULL
+    GROUP BY a.agent_norm, ae.authority_uri
+"""
 
 
 def _reset_graph_cache() -> None:
     """Reset the module-level graph cache (for testing)."""
-    global _agent_graph_cache, _agent_graph_db_id
-    _agent_graph_cache = None
-    _agent_graph_db_id = None
+    with _graph_lock:
+        _graph_entries.clear()
+
+
+def enable_agent_graph_snapshot(path: Path) -> None:
+    """Persist built graphs to *path* and load them from it when current.
+
+    Each worker process keeps its own in-memory graph; the snapshot lets a
+    freshly started worker skip the query and JSON parsing entirely when
+    another worker already built the graph for the same DB generation.
+    """
+    global _snapshot_path
+    _snapshot_path = Path(path)
+
+
+def disable_agent_graph_snapshot() -> None:
+    """Stop reading and writing the on-disk graph snapshot."""
+    global _snapshot_path
+    _snapshot_path = None
+
+
+def warm_agent_graph(db_path: Path) -> int:
+    """Build (or load) the agent graph for *db_path* ahead of the first query.
+
+    Returns:
+        Number of nodes in the graph (0 if the database is missing).
+    """
+    if not Path(db_path).exists():
+        return 0
+    started = time.perf_counter()
+    graph = build_agent_graph(Path(db_path))
+    logger.info(
+        "Agent graph warmed: %d nodes in %.1f ms",
+        len(graph), 1000 * (time.perf_counter() - started),
+    )
+    return len(graph)
 
 
 def _get_connection(db: sqlite3.Connection | Path) -> sqlite3.Connection:
-    """Get a sqlite3.Connection from a Path or pass through existing connection."""
+    """Get a pooled read connection for a Path or pass through existing connection."""
     if isinstance(db, sqlite3.Connection):
         return db
-    return sqlite3.connect(str(db))
+    return read_connection(db)
+
+
+def _release_connection(db: sqlite3.Connection | Path, conn: sqlite3.Connection) -> None:
+    """Return a connection opened by ``_get_connection`` to the pool."""
+    if conn is not db:
+        conn.close()
+
+
+def _db_file(db: sqlite3.Connection | Path) -> Optional[str]:
+    """Resolved database file behind *db*; None when it cannot be cached.
+
+    In-memory/temporary databases have no file, and a caller-owned
+    connection inside a transaction may see uncommitted rows that the
+    file's generation stamp does not reflect.
+    """
+    if not isinstance(db, sqlite3.Connection):
+        return str(Path(db).resolve())
+    if db.in_transaction:
+        return None
+    row = db.execute("PRAGMA database_list").fetchone()
+    return str(Path(row[2]).resolve()) if row and row[2] else None
 
 
 def build_agent_graph(db: sqlite3.Connection | Path) -> Dict[str, AgentNode]:
@@ -49,40 +142,129 @@ def build_agent_graph(db: sqlite3.Connection | Path) -> Dict[str, AgentNode]:
     objects keyed by agent_norm. Each node contains biographical data
     and teacher/student relationships from person_info JSON.
 
+    The graph of a database file is cached until the file's generation
+    stamp changes; callers must treat it as read-only.
+
     Args:
         db: SQLite connection or path to database file.
 
     Returns:
         Dict mapping agent_norm to AgentNode.
     """
-    global _agent_graph_cache, _agent_graph_db_id
+    db_file = _db_file(db)
+    if db_file is None:
+        conn = _get_connection(db)
+        try:
+            return _load_agent_graph(conn)
+        finally:
+            _release_connection(db, conn)
+
+    generation = db_generation(db_file)
+    entry = _graph_entries.get(db_file)
+    if entry is not None and entry.generation == generation:
+        return entry.graph
+
+    with _graph_lock:
+        entry = _graph_entries.get(db_file)
+        if entry is not None and entry.generation == generation:
+            return entry.graph
+        entry = _read_snapshot(db_file, generation)
+        if entry is None:
+            conn = _get_connection(db)
+            try:
+                entry = _refresh_entry(conn, db_file, generation, _graph_entries.get(db_file))
+            finally:
+                _release_connection(db, conn)
+        entry.graph.name_index()
+        _graph_entries[db_file] = entry
+        return entry.graph
+
+
+def _refresh_entry(
+    conn: sqlite3.Connection,
+    db_file: str,
+    generation: str,
+    previous: Optional[_GraphEntry],
+) -> _GraphEntry:
+    """Re-query the graph rows; re-parse only if they changed."""
+    rows = _query_graph_rows(conn)
+    digest = hashlib.sha1(
+        json.dumps(rows, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    if previous is not None and previous.digest == digest:
+        graph = previous.graph
+    else:
+        snapshot = _read_snapshot(db_file, None, digest)
+        graph = snapshot.graph if snapshot is not None else _graph_from_rows(rows)
+    entry = _GraphEntry(generation=generation, digest=digest, graph=graph)
+    _write_snapshot(db_file, entry)
+    return entry
+
+
+def _read_snapshot(
+    db_file: str, generation: Optional[str], digest: Optional[str] = None
+) -> Optional[_GraphEntry]:
+    """Load the on-disk snapshot if it matches *generation* (or *digest*)."""
+    if _snapshot_path is None or not _snapshot_path.exists():
+        return None
+    try:
+        with open(_snapshot_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("db_path") != db_file:
+            return None
+        if generation is not None and data.get("generation") != generation:
+            return None
+        if digest is not None and data.get("digest") != digest:
+            return None
+        graph = _AgentGraph(
+            (node["agent_norm"], AgentNode.model_construct(**node))
+            for node in data["nodes"]
+        )
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("Ignoring unreadable agent graph snapshot %s: %s", _snapshot_path, exc)
+        return None
+    return _GraphEntry(
+        generation=generation or data["generation"], digest=data["digest"], graph=graph
+    )
 
-    conn = _get_connection(db)
 
-    # Use the connection's id for cache invalidation
-    db_id = id(conn)
-    if _agent_graph_cache is not None and _agent_graph_db_id == db_id:
-        return _agent_graph_cache
+def _write_snapshot(db_file: str, entry: _GraphEntry) -> None:
+    """Atomically replace the on-disk snapshot with *entry*."""
+    if _snapshot_path is None:
+        return
+    payload = {
+        "db_path": db_file,
+        "generation": entry.generation,
+        "digest": entry.digest,
+        "nodes": [node.model_dump() for node in entry.graph.values()],
+    }
+    tmp = _snapshot_path.with_name(f"{_snapshot_path.name}.{os.getpid()}.tmp")
+    try:
+        _snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, _snapshot_path)
+    except OSError as exc:
+        logger.warning("Could not write agent graph snapshot %s: %s", _snapshot_path, exc)
 
-    graph: Dict[str, AgentNode] = {}
 
+def _query_graph_rows(conn: sqlite3.Connection) -> List[tuple]:
+    """Rows feeding the graph (empty if the enrichment tables are missing)."""
     try:
-        rows = conn.execute("""
-            SELECT
-                a.agent_norm,
-                ae.authority_uri,
-                ae.wikidata_id,
-                ae.label,
-                ae.person_info,
-                COUNT(DISTINCT a.record_id) as record_count
-            FROM authority_enrichment ae
-            JOIN agents a ON a.authority_uri = ae.authority_uri
-            WHERE ae.person_info IS NOT NULL
-            GROUP BY a.agent_norm, ae.authority_uri
-        """).fetchall()
+        return [tuple(row) for row in conn.execute(_GRAPH_SQL).fetchall()]
     except sqlite3.OperationalError:
         logger.warning("Could not query authority_enrichment; returning empty graph")
-        return graph
+        return []
+
+
+def _load_agent_graph(conn: sqlite3.Connection) -> Dict[str, AgentNode]:
+    """Query authority_enrichment and build the AgentNode graph."""
+    return _graph_from_rows(_query_graph_rows(conn))
+
+
+def _graph_from_rows(rows: List[tuple]) -> Dict[str, AgentNode]:
+    """Parse graph rows (person_info JSON) into AgentNodes."""
+    graph = _AgentGraph()
 
     for row in rows:
         agent_norm = row[0]
@@ -113,17 +295,117 @@ def build_agent_graph(db: sqlite3.Connection | Path) -> Dict[str, AgentNode]:
         )
         graph[agent_norm] = node
 
-    _agent_graph_cache = graph
-    _agent_graph_db_id = db_id
     return graph
 
 
+# Longest substring indexed by _NameIndex; longer name parts are looked up
+# by their substrings of this length
+_NAME_GRAM = 3
+
+
+class _NameIndex:
+    """Name lookup structures for one agent graph.
+
+    Answers ``_match_name_in_graph`` without scanning the graph. Every match
+    rule keeps its original precedence: among several matching agents the
+    one first in graph order wins, so each structure maps to graph
+    positions (ordinals).
+
+    - labels: lowercased label -> first agent_norm with that label
+    - grams: every substring of up to ``_NAME_GRAM`` characters of each
+      agent_norm -> ordinals of the agent_norms containing it; the
+      candidates for a name part are verified with the real substring test
+    - surnames: lowercased surname ("surname, firstname") -> first ordinal
+    """
+
+    def __init__(self, graph: Dict[str, AgentNode]) -> None:
+        self.graph = graph
+        self.order: List[str] = list(graph)
+        self.labels: Dict[str, str] = {}
+        self.grams: Dict[str, Set[int]] = {}
+        self.surnames: Dict[str, int] = {}
+        self._matches: Dict[str, Optional[str]] = {}
+
+        for ordinal, (agent_norm, node) in enumerate(graph.items()):
+            self.labels.setdefault(node.label.lower(), agent_norm)
+            for size in range(1, _NAME_GRAM + 1):
+                for start in range(len(agent_norm) - size + 1):
+                    self.grams.setdefault(agent_norm[start:start + size], set()).add(ordinal)
+            self.surnames.setdefault(agent_norm.split(", ")[0].lower(), ordinal)
+        self._surname_lengths = sorted({len(surname) for surname in self.surnames})
+
+    def match(self, name: str) -> Optional[str]:
+        """Matching agent_norm for a display name (memoized per name)."""
+        if name not in self._matches:
+            self._matches[name] = self._match(name.lower())
+        return self._matches[name]
+
+    def _match(self, name_lower: str) -> Optional[str]:
+        # Exact match on agent_norm
+        if name_lower in self.graph:
+            return name_lower
+
+        # Match by label
+        if name_lower in self.labels:
+            return self.labels[name_lower]
+
+        # Substring match: name parts appear in agent_norm
+        name_parts = name_lower.split()
+        if not name_parts:
+            return self.order[0] if self.order else None
+        # Intersect postings rarest first, so common grams never get copied
+        postings = sorted(
+            (self.grams.get(gram, set()) for part in name_parts for gram in self._grams_of(part)),
+            key=len,
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates &= posting
+        for ordinal in sorted(candidates):
+            agent_norm = self.order[ordinal]
+            if all(part in agent_norm for part in name_parts):
+                return agent_norm
+
+        # Substring match: the surname (first part of "surname, firstname")
+        # appears in the name
+        best: Optional[int] = None
+        for size in self._surname_lengths:
+            for start in range(len(name_lower) - size + 1):
+                ordinal = self.surnames.get(name_lower[start:start + size])
+                if ordinal is not None and (best is None or ordinal < best):
+                    best = ordinal
+        return self.order[best] if best is not None else None
+
+    @staticmethod
+    def _grams_of(part: str) -> Set[str]:
+        if len(part) <= _NAME_GRAM:
+            return {part}
+        return {part[i:i + _NAME_GRAM] for i in range(len(part) - _NAME_GRAM + 1)}
+
+
+class _AgentGraph(dict):
+    """Agent graph (agent_norm -> AgentNode) carrying its name index."""
+
+    _names: Optional[_NameIndex] = None
+
+    def name_index(self) -> _NameIndex:
+        """The graph's name index, built on first use (graphs are read-only)."""
+        if self._names is None:
+            self._names = _NameIndex(self)
+        return self._names
+
+
 def _match_name_in_graph(
     name: str, graph: Dict[str, AgentNode]
 ) -> Optional[str]:
     """Find an agent_norm in the graph that matches a display name.
 
-    Performs exact match first, then case-insensitive substring matching.
+    Performs exact match first, then case-insensitive substring matching:
+    agent_norm, then label, then all name parts within the agent_norm, then
+    the agent's surname within the name. Graphs from ``build_agent_graph``
+    answer from their prebuilt name index.
 
     Args:
         name: Display name to match (e.g., "Abraham Scultetus").
@@ -132,31 +414,9 @@ def _match_name_in_graph(
     Returns:
         Matching agent_norm or None.
     """
-    name_lower = name.lower()
-
-    # Exact match on agent_norm
-    if name_lower in graph:
-        return name_lower
-
-    # Match by label
-    for agent_norm, node in graph.items():
-        if node.label.lower() == name_lower:
-            return agent_norm
-
-    # Substring match: name parts appear in agent_norm
-    name_parts = name_lower.split()
-    for agent_norm in graph:
-        if all(part in agent_norm for part in name_parts):
-            return agent_norm
-
-    # Substring match: agent_norm parts appear in name
-    for agent_norm in graph:
-        norm_parts = agent_norm.split(", ")
-        # Check if the surname (first part of "surname, firstname") is in the name
-        if norm_parts and norm_parts[0].lower() in name_lower:
-            return agent_norm
-
-    return None
+    if isinstance(graph, _AgentGraph):
+        return graph.name_index().match(name)
+    return _NameIndex(graph).match(name)
 
 
 def _find_teacher_student_connections(
@@ -505,43 +765,42 @@ def find_connections(
         return []
 
     conn = _get_connection(db)
+    try:
+        graph = build_agent_graph(conn)
 
-    # Always rebuild graph for the given connection to avoid stale cache
-    # in test scenarios with different in-memory DBs
-    _reset_graph_cache()
-    graph = build_agent_graph(conn)
-
-    if not graph:
-        return []
+        if not graph:
+            return []
 
-    visited_pairs: Set[Tuple[str, str]] = set()
-    all_connections: List[Connection] = []
+        visited_pairs: Set[Tuple[str, str]] = set()
+        all_connections: List[Connection] = []
 
-    # 1. Teacher/student from graph
-    all_connections.extend(
-        _find_teacher_student_connections(agent_norms, graph, visited_pairs)
-    )
+        # 1. Teacher/student from graph
+        all_connections.extend(
+            _find_teacher_student_connections(agent_norms, graph, visited_pairs)
+        )
 
-    # 2. Co-publication from SQL
-    all_connections.extend(
-        _find_co_publication_connections(agent_norms, conn, graph, visited_pairs)
-    )
+        # 2. Co-publication from SQL
+        all_connections.extend(
+            _find_co_publication_connections(agent_norms, conn, graph, visited_pairs)
+        )
 
-    # 3. Same place and period from graph
-    all_connections.extend(
-        _find_same_place_period_connections(agent_norms, graph, visited_pairs)
-    )
+        # 3. Same place and period from graph
+        all_connections.extend(
+            _find_same_place_period_connections(agent_norms, graph, visited_pairs)
+        )
 
-    # 4. Wikipedia-derived connections
-    try:
-        wiki_conns = _find_wikipedia_connections(agent_norms, conn, visited_pairs)
-        all_connections.extend(wiki_conns)
-    except Exception:
-        pass  # Table may not exist
+        # 4. Wikipedia-derived connections
+        try:
+            wiki_conns = _find_wikipedia_connections(agent_norms, conn, visited_pairs)
+            all_connections.extend(wiki_conns)
+        except Exception:
+            pass  # Table may not exist
 
-    # Sort by confidence descending, cap at max_results
-    all_connections.sort(key=lambda c: c.confidence, reverse=True)
-    return all_connections[:max_results]
+        # Sort by confidence descending, cap at max_results
+        all_connections.sort(key=lambda c: c.confidence, reverse=True)
+        return all_connections[:max_results]
+    finally:
+        _release_connection(db, conn)
 
 
 def find_network_neighbors(
@@ -563,10 +822,7 @@ def find_network_neighbors(
     Returns:
         List of Connection objects for discovered neighbors.
     """
-    conn = _get_connection(db)
-
-    _reset_graph_cache()
-    graph = build_agent_graph(conn)
+    graph = build_agent_graph(db)
 
     if agent_norm not in graph:
         return []
@@ -0,0 +1,232 @@
+"""Result cache for the deterministic plan executor (Stage 2).
+
+``execute_plan`` is a pure function of the plan and the database, so the
+output of each step can be reused across requests. Step results are keyed
+by a canonical hash of the step's action and params, the keys of the
+steps it references, the previous-turn record ids (if the step uses
+``$previous_results``), the database path and its generation stamp (see
+``scripts.utils.db_generation``). The grounding collected from a set of
+step results is cached the same way.
+
+Entries live in an in-memory LRU. Optionally they are also written to a
+SQLite file shared by all worker processes; rows for an outdated
+generation of a database are pruned when a new generation is first seen.
+
+The cache is off until ``enable_execution_cache()`` is called (the API
+does this at startup).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+from scripts.chat.plan_models import (
+    AggregationResult,
+    ConnectionGraph,
+    EnrichmentBundle,
+    GroundingData,
+    RecordSet,
+    ResolvedEntity,
+    StepResult,
+)
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# Concrete StepOutputData types by name, for rebuilding from disk
+_DATA_TYPES = {
+    cls.__name__: cls
+    for cls in (ResolvedEntity, RecordSet, AggregationResult, ConnectionGraph, EnrichmentBundle)
+}
+
+GroundingEntry = Tuple[GroundingData, bool, int]
+
+_DISK_SCHEMA = """
+CREATE TABLE IF NOT EXISTS execution_cache (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    db_path TEXT NOT NULL,
+    generation TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_execution_cache_db ON execution_cache(db_path, generation);
+"""
+
+
+def hash_key(payload: Any) -> str:
+    """SHA256 of the canonical JSON form of *payload*."""
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _step_to_json(result: StepResult) -> str:
+    return json.dumps({
+        "type": type(result.data).__name__,
+        "result": result.model_dump(mode="json"),
+    }, ensure_ascii=False)
+
+
+def _step_from_json(payload: str) -> StepResult:
+    raw = json.loads(payload)
+    result = raw["result"]
+    result["data"] = _DATA_TYPES[raw["type"]].model_validate(result["data"])
+    return StepResult.model_validate(result)
+
+
+def _grounding_to_json(entry: GroundingEntry) -> str:
+    grounding, truncated, total = entry
+    return json.dumps({
+        "grounding": grounding.model_dump(mode="json"),
+        "truncated": truncated,
+        "total": total,
+    }, ensure_ascii=False)
+
+
+def _grounding_from_json(payload: str) -> GroundingEntry:
+    raw = json.loads(payload)
+    return GroundingData.model_validate(raw["grounding"]), raw["truncated"], raw["total"]
+
+
+class ExecutionCache:
+    """Thread-safe LRU of step results and grounding, optionally on disk.
+
+    Args:
+        max_entries: Maximum in-memory entries (steps and grounding).
+        disk_path: Optional SQLite file shared between processes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        disk_path: Optional[Path] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: Optional[sqlite3.Connection] = None
+        self._seen_generations: Set[Tuple[str, str]] = set()
+        if disk_path is not None:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            self._disk = sqlite3.connect(str(disk_path), check_same_thread=False)
+            self._disk.execute("PRAGMA journal_mode = WAL")
+            self._disk.executescript(_DISK_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current in-memory size."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    # -- step results --------------------------------------------------------
+
+    def get_step(self, key: str, step_index: int, label: str) -> Optional[StepResult]:
+        """Return a copy of a cached step result relabelled for this plan."""
+        result = self._get(key, "step", _step_from_json)
+        if result is None:
+            return None
+        return result.model_copy(update={"step_index": step_index, "label": label}, deep=True)
+
+    def put_step(self, key: str, result: StepResult, db_path: str, generation: str) -> None:
+        self._put(key, "step", result.model_copy(deep=True), _step_to_json, db_path, generation)
+
+    # -- grounding -----------------------------------------------------------
+
+    def get_grounding(self, key: str) -> Optional[GroundingEntry]:
+        entry = self._get(key, "grounding", _grounding_from_json)
+        if entry is None:
+            return None
+        grounding, truncated, total = entry
+        return grounding.model_copy(deep=True), truncated, total
+
+    def put_grounding(self, key: str, entry: GroundingEntry, db_path: str, generation: str) -> None:
+        grounding, truncated, total = entry
+        value = (grounding.model_copy(deep=True), truncated, total)
+        self._put(key, "grounding", value, _grounding_to_json, db_path, generation)
+
+    # -- internals -----------------------------------------------------------
+
+    def _get(self, key: str, kind: str, decode) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            if self._disk is not None:
+                row = self._disk.execute(
+                    "SELECT payload FROM execution_cache WHERE key = ? AND kind = ?",
+                    (key, kind),
+                ).fetchone()
+                if row is not None:
+                    value = decode(row[0])
+                    self._remember(key, value)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def _put(self, key: str, kind: str, value: Any, encode, db_path: str, generation: str) -> None:
+        with self._lock:
+            self._remember(key, value)
+            if self._disk is None:
+                return
+            if (db_path, generation) not in self._seen_generations:
+                self._seen_generations.add((db_path, generation))
+                self._disk.execute(
+                    "DELETE FROM execution_cache WHERE db_path = ? AND generation != ?",
+                    (db_path, generation),
+                )
+            self._disk.execute(
+                "INSERT OR REPLACE INTO execution_cache "
+                "(key, kind, payload, db_path, generation, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, kind, encode(value), db_path, generation,
+                 datetime.now(timezone.utc).isoformat()),
+            )
+            self._disk.commit()
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Module-level singleton, disabled until enable_execution_cache()
+_execution_cache: Optional[ExecutionCache] = None
+
+
+def enable_execution_cache(
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    disk_path: Optional[Path] = None,
+) -> ExecutionCache:
+    """Create (or replace) the process-wide execution cache."""
+    global _execution_cache
+    disable_execution_cache()
+    _execution_cache = ExecutionCache(max_entries, disk_path)
+    return _execution_cache
+
+
+def disable_execution_cache() -> None:
+    """Turn execution caching off and release the disk store."""
+    global _execution_cache
+    if _execution_cache is not None:
+        _execution_cache.close()
+    _execution_cache = None
+
+
+def get_execution_cache() -> Optional[ExecutionCache]:
+    """Return the active execution cache, or None if disabled."""
+    return _execution_cache
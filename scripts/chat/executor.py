@@ -14,7 +14,9 @@ import json
 import logging
 import re
 import sqlite3
+import threading
 from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
@@ -44,7 +46,11 @@ from scripts.chat.plan_models import (
     StepOutputData,
     StepResult,
 )
+from scripts.chat.execution_cache import get_execution_cache, hash_key
+from scripts.chat.record_bitmap import RecordBitmap, bitmap_for_mms_ids, scope_condition
 from scripts.schemas.query_plan import Filter, FilterField, FilterOp
+from scripts.utils.db_generation import db_generation
+from scripts.utils.sqlite_pool import read_connection
 
 logger = logging.getLogger(__name__)
 
@@ -54,8 +60,12 @@ CONFIDENCE_ALIAS_MATCH = 0.90
 CONFIDENCE_MEDIUM = 0.80
 CONFIDENCE_LOW = 0.70
 
+# Steps of one plan that may run at the same time (independent branches)
+MAX_PARALLEL_STEPS = 4
+
 # Regex for $step_N references
 _STEP_REF_RE = re.compile(r"^\$step_(\d+)$")
+_STEP_REF_ANY_RE = re.compile(r"\$step_(\d+)")
 
 
 # =============================================================================
@@ -79,14 +89,21 @@ def execute_plan(
     db_path: Path,
     session_context: Optional[SessionContext] = None,
     original_query: str = "",
+    max_parallel_steps: int = MAX_PARALLEL_STEPS,
 ) -> ExecutionResult:
     """Execute an InterpretationPlan and return verified results.
 
+    Steps whose prerequisites are complete run concurrently (each handler
+    takes its own pooled read connection); results are identical to a
+    sequential run in topological order.
+
     Args:
         plan: The interpretation plan produced by Stage 1 (Interpreter).
         db_path: Path to the bibliographic SQLite database.
         session_context: Optional follow-up context from a previous turn.
         original_query: The user's original query text (echoed in result).
+        max_parallel_steps: Upper bound on concurrently running steps
+            (1 runs the plan sequentially on the calling thread).
 
     Returns:
         ExecutionResult with step results, directives, and grounding data.
@@ -99,19 +116,77 @@ def execute_plan(
     else:
         execution_order = []
 
-    # Execute steps in order
-    step_results: Dict[int, StepResult] = {}
-    for step_idx in execution_order:
-        step = steps[step_idx]
-        step_result = _execute_step(step, step_idx, db_path, step_results, session_context)
-        step_results[step_idx] = step_result
+    # Results are cached per step when the execution cache is enabled
+    cache = get_execution_cache()
+    db_key = generation = None
+    if cache is not None:
+        db_key = str(Path(db_path).resolve())
+        generation = db_generation(db_path)
+
+    # Execute steps, independent branches concurrently
+    step_keys: Dict[int, str] = {}
+    if cache is not None:
+        for step_idx in execution_order:
+            step_keys[step_idx] = _step_cache_key(
+                steps[step_idx], step_keys, session_context, db_key, generation
+            )
+    step_results, any_error = _run_steps(
+        steps, execution_order, db_path, session_context,
+        cache, step_keys, db_key, generation, max_parallel_steps,
+    )
+    if any_error:
+        # Errors may be transient; keep the grounding out of the cache too
+        cache = None
+
+    has_connections_step = any(
+        s.action == StepAction.FIND_CONNECTIONS for s in plan.execution_steps
+    )
+    if cache is not None:
+        grounding_key = hash_key({
+            "db": db_key,
+            "generation": generation,
+            "steps": [step_keys[i] for i in execution_order],
+            "has_connections_step": has_connections_step,
+        })
+        cached_grounding = cache.get_grounding(grounding_key)
+        if cached_grounding is not None:
+            grounding, was_truncated, total_records = cached_grounding
+        else:
+            grounding, was_truncated, total_records = _build_grounding(
+                step_results, db_path, has_connections_step
+            )
+            cache.put_grounding(
+                grounding_key, (grounding, was_truncated, total_records), db_key, generation
+            )
+    else:
+        grounding, was_truncated, total_records = _build_grounding(
+            step_results, db_path, has_connections_step
+        )
+
+    # Build ordered list of step results
+    steps_completed = [step_results[i] for i in execution_order]
+
+    return ExecutionResult(
+        steps_completed=steps_completed,
+        directives=list(plan.directives),
+        grounding=grounding,
+        original_query=original_query,
+        session_context=session_context,
+        truncated=was_truncated,
+        total_record_count=total_records,
+    )
 
-    # Collect grounding data from all step results
+
+def _build_grounding(
+    step_results: Dict[int, StepResult],
+    db_path: Path,
+    has_connections_step: bool,
+) -> tuple[GroundingData, bool, int]:
+    """Collect grounding data, auto-discovering agent connections."""
     grounding, was_truncated, total_records = _collect_grounding(step_results, db_path)
 
     # Auto-discover agent connections if 2-10 agents and no explicit find_connections step
-    if (2 <= len(grounding.agents) <= 10
-            and not any(s.action == StepAction.FIND_CONNECTIONS for s in plan.execution_steps)):
+    if 2 <= len(grounding.agents) <= 10 and not has_connections_step:
         try:
             from scripts.chat.cross_reference import find_connections
             top_agents = sorted(grounding.agents, key=lambda a: a.record_count, reverse=True)[:5]
@@ -124,18 +199,145 @@ def execute_plan(
         except Exception:
             pass  # Auto-connections are best-effort
 
-    # Build ordered list of step results
-    steps_completed = [step_results[i] for i in execution_order]
+    return grounding, was_truncated, total_records
 
-    return ExecutionResult(
-        steps_completed=steps_completed,
-        directives=list(plan.directives),
-        grounding=grounding,
-        original_query=original_query,
-        session_context=session_context,
-        truncated=was_truncated,
-        total_record_count=total_records,
-    )
+
+def _step_cache_key(
+    step: ExecutionStep,
+    step_keys: Dict[int, str],
+    session_context: Optional[SessionContext],
+    db_key: str,
+    generation: str,
+) -> str:
+    """Canonical cache key for a step's output.
+
+    Chains the keys of referenced steps instead of their data, so a step's
+    key is determined by the plan prefix it depends on.
+    """
+    action = step.action.value if isinstance(step.action, StepAction) else step.action
+    params = step.params.model_dump(mode="json") if hasattr(step.params, "model_dump") else step.params
+    params_json = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    refs = {int(n) for n in _STEP_REF_ANY_RE.findall(params_json)}
+    refs.update(step.depends_on)
+    payload: Dict[str, Any] = {
+        "db": db_key,
+        "generation": generation,
+        "action": action,
+        "params": params,
+        "refs": {str(i): step_keys.get(i) for i in sorted(refs)},
+    }
+    if "$previous_results" in params_json:
+        previous = session_context.previous_record_ids if session_context else []
+        payload["previous_results"] = hash_key(list(previous))
+    return hash_key(payload)
+
+
+# Shared by all plans; steps are short DB-bound calls on pooled connections
+_step_pool: Optional[ThreadPoolExecutor] = None
+_step_pool_lock = threading.Lock()
+
+
+def _get_step_pool() -> ThreadPoolExecutor:
+    global _step_pool
+    if _step_pool is None:
+        with _step_pool_lock:
+            if _step_pool is None:
+                _step_pool = ThreadPoolExecutor(
+                    max_workers=MAX_PARALLEL_STEPS * 4, thread_name_prefix="plan-step"
+                )
+    return _step_pool
+
+
+def _step_prerequisites(
+    step: ExecutionStep,
+    step_idx: int,
+    position: Dict[int, int],
+) -> set:
+    """Steps that must finish before *step_idx* starts.
+
+    ``depends_on`` plus any ``$step_N`` referenced in the params that comes
+    earlier in the execution order. A reference to a later (or missing)
+    step is left unresolved, as in a sequential run.
+    """
+    params = step.params.model_dump(mode="json") if hasattr(step.params, "model_dump") else step.params
+    params_json = json.dumps(params, ensure_ascii=False, default=str)
+    refs = {int(n) for n in _STEP_REF_ANY_RE.findall(params_json)}
+    refs = {r for r in refs if r in position and position[r] < position[step_idx]}
+    return refs | set(step.depends_on)
+
+
+def _run_steps(
+    steps: List[ExecutionStep],
+    execution_order: List[int],
+    db_path: Path,
+    session_context: Optional[SessionContext],
+    cache,
+    step_keys: Dict[int, str],
+    db_key: Optional[str],
+    generation: Optional[str],
+    max_parallel_steps: int,
+) -> tuple[Dict[int, StepResult], bool]:
+    """Run the plan's steps, starting each as soon as its prerequisites finish.
+
+    A step sees the results of the steps before it in ``execution_order``
+    (never later ones), so ``$step_N`` resolution and fallbacks behave as
+    in a sequential run. Step errors stay isolated in their StepResult;
+    an errored step and everything depending on it bypass the cache.
+
+    Returns:
+        (step results by index, whether any step errored)
+    """
+    position = {idx: pos for pos, idx in enumerate(execution_order)}
+    prerequisites = {
+        idx: _step_prerequisites(steps[idx], idx, position) for idx in execution_order
+    }
+    step_results: Dict[int, StepResult] = {}
+    tainted: set = set()
+
+    def run_one(step_idx: int, visible: Dict[int, StepResult], use_cache: bool) -> StepResult:
+        step = steps[step_idx]
+        if use_cache:
+            cached = cache.get_step(step_keys[step_idx], step_idx, step.label)
+            if cached is not None:
+                return cached
+        result = _execute_step(step, step_idx, db_path, visible, session_context)
+        if use_cache and result.status != "error":
+            cache.put_step(step_keys[step_idx], result, db_key, generation)
+        return result
+
+    def start(step_idx: int, inline: bool):
+        visible = {i: r for i, r in step_results.items() if position[i] < position[step_idx]}
+        use_cache = cache is not None and not (prerequisites[step_idx] & tainted)
+        if inline:
+            return run_one(step_idx, visible, use_cache)
+        return _get_step_pool().submit(run_one, step_idx, visible, use_cache)
+
+    def finish(step_idx: int, result: StepResult) -> None:
+        step_results[step_idx] = result
+        if result.status == "error" or prerequisites[step_idx] & tainted:
+            tainted.add(step_idx)
+
+    pending = list(execution_order)
+    running: Dict[Future, int] = {}
+    while pending or running:
+        ready = [
+            idx for idx in pending
+            if prerequisites[idx].issubset(step_results)
+        ][:max(1, max_parallel_steps) - len(running)]
+        if len(ready) == 1 and not running:
+            # A lone ready step runs on the calling thread
+            pending.remove(ready[0])
+            finish(ready[0], start(ready[0], inline=True))
+            continue
+        for idx in ready:
+            pending.remove(idx)
+            running[start(idx, inline=False)] = idx
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            finish(running.pop(future), future.result())
+
+    # Completion order varies; grounding walks the results in plan order
+    return {idx: step_results[idx] for idx in execution_order}, bool(tainted)
 
 
 # =============================================================================
@@ -272,47 +474,64 @@ def _resolve_step_ref(
     return data
 
 
-def _resolve_scope(
+def _record_set_bitmap(conn: sqlite3.Connection, data: Any) -> RecordBitmap:
+    """Bitmap of a step output's records (empty for non-record outputs).
+
+    Built once per RecordSet and kept on it, so every later step scoped to
+    the same set reuses it.
+    """
+    if not isinstance(data, RecordSet):
+        return RecordBitmap()
+    if data._bitmap is None:
+        data._bitmap = bitmap_for_mms_ids(conn, data.mms_ids)
+    return data._bitmap
+
+
+def _scope_bitmap(
+    conn: sqlite3.Connection,
     scope: str,
     step_results: Dict[int, StepResult],
     session_context: Optional[SessionContext],
-) -> Optional[List[str]]:
-    """Resolve a scope reference to a list of mms_ids or None.
+) -> Optional[RecordBitmap]:
+    """Resolve a scope reference to a records.id bitmap, or None.
 
     Args:
-        scope: One of "full_collection", "$step_N", or "$previous_results".
+        conn: Connection used to map MMS IDs to records.id.
+        scope: One of "full_collection", "$step_N", "$step_N+$step_M" or
+            "$previous_results".
         step_results: Map of step index to completed StepResult.
         session_context: Optional session context for follow-up queries.
 
     Returns:
-        None for "full_collection" (query entire DB),
-        list of mms_ids for scoped queries.
+        None for "full_collection" (query entire DB), otherwise the bitmap
+        of the scoped records; unions of step references are computed on
+        the bitmaps.
     """
     if scope == "full_collection":
         return None
 
     if scope == "$previous_results":
-        if session_context and session_context.previous_record_ids:
-            return list(session_context.previous_record_ids)
-        return []
-
-    # Union of step references: "$step_0+$step_1" (deduplicated, order kept)
-    if "+" in scope:
-        parts = [p.strip() for p in scope.split("+")]
-        if parts and all(_STEP_REF_RE.match(p) for p in parts):
-            merged: List[str] = []
-            seen: set = set()
-            for part in parts:
-                for mms in _resolve_step_ref(part, step_results, context="scope"):
-                    if mms not in seen:
-                        seen.add(mms)
-                        merged.append(mms)
-            return merged
-
-    # Try to resolve as a step reference
-    match = _STEP_REF_RE.match(scope)
-    if match:
-        return _resolve_step_ref(scope, step_results, context="scope")
+        if not (session_context and session_context.previous_record_ids):
+            return RecordBitmap()
+        if session_context._previous_bitmap is None:
+            session_context._previous_bitmap = bitmap_for_mms_ids(
+                conn, session_context.previous_record_ids
+            )
+        return session_context._previous_bitmap
+
+    parts = [p.strip() for p in scope.split("+")]
+    if parts and all(_STEP_REF_RE.match(p) for p in parts):
+        bitmap: Optional[RecordBitmap] = None
+        for part in parts:
+            step_idx = int(_STEP_REF_RE.match(part).group(1))
+            if step_idx not in step_results:
+                raise PlanValidationError(
+                    f"Reference $step_{step_idx} not found in completed step results"
+                )
+            step_bitmap = _record_set_bitmap(conn, step_results[step_idx].data)
+            # A single reference keeps the step's own bitmap (and its memoized JSON)
+            bitmap = step_bitmap if bitmap is None else bitmap | step_bitmap
+        return bitmap
 
     # Unknown scope -- treat as full collection
     logger.warning("Unknown scope '%s', treating as full_collection", scope)
@@ -432,11 +651,8 @@ def _fix_wikipedia_url(url: str, wikidata_id: Optional[str] = None) -> str:
 
 
 def _get_conn(db_path: Path) -> sqlite3.Connection:
-    """Open a SQLite connection with row_factory."""
-    conn = sqlite3.connect(str(db_path))
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Get a pooled read-only SQLite connection with row_factory."""
+    return read_connection(db_path, row_factory=sqlite3.Row)
 
 
 # =============================================================================
@@ -905,10 +1121,14 @@ def _normalize_multivalue_filters(
 def _run_filter_query(
     conn: sqlite3.Connection,
     filters: List[Filter],
-    scope_ids: Optional[List[str]],
+    scope_bitmap: Optional[RecordBitmap],
     multi_value_map: Optional[Dict[int, List[str]]] = None,
 ) -> List[str]:
-    """Build and run one filter query; returns matching mms_ids (sorted)."""
+    """Build and run one filter query; returns matching mms_ids (sorted).
+
+    *scope_bitmap* (a records.id bitmap) is bound as a single ``json_each``
+    parameter, so scope size is not limited by SQLite's variable limit.
+    """
     from scripts.query.db_adapter import (
         build_where_clause, build_join_clauses, normalize_filter_value,
     )
@@ -968,12 +1188,9 @@ def _run_filter_query(
                     sql_params[k] = form
 
     scope_clause = ""
-    if scope_ids is not None:
-        scope_keys = [f"scope_{i}" for i in range(len(scope_ids))]
-        scope_placeholders = ",".join(f":{k}" for k in scope_keys)
-        scope_clause = f" AND r.mms_id IN ({scope_placeholders})"
-        for k, mms in zip(scope_keys, scope_ids):
-            sql_params[k] = mms
+    if scope_bitmap is not None:
+        scope_clause = f" AND {scope_condition('r.id', ':scope_bitmap')}"
+        sql_params["scope_bitmap"] = scope_bitmap.to_json()
 
     join_clauses = build_join_clauses(needed_joins)
     sql = "SELECT DISTINCT r.mms_id\nFROM records r"
@@ -988,7 +1205,7 @@ def _run_filter_query(
 def _relax_and_retry(
     conn: sqlite3.Connection,
     filters: List[Filter],
-    scope_ids: Optional[List[str]],
+    scope: Optional[RecordBitmap],
 ) -> tuple[List[str], List[str]]:
     """Relaxation ladder for 0-hit retrieves (issue #2 A2).
 
@@ -1008,7 +1225,7 @@ def _relax_and_retry(
         # must be re-applied with fresh indices.
         probe_mv: Dict[int, List[str]] = {}
         normalized = _normalize_multivalue_filters(probe_filters, probe_mv)
-        return _run_filter_query(conn, normalized, scope_ids, probe_mv or None)
+        return _run_filter_query(conn, normalized, scope, probe_mv or None)
 
     # Rung 0 (Soncino forensics): a bare `publisher EQUALS 'soncino'` plan
     # can never match norms like 'h. de soncino' — soften publisher EQUALS to
@@ -1098,8 +1315,8 @@ def _handle_retrieve(
 
     Converts RetrieveParams.filters to a QueryPlan, resolves $step_N
     references in filter values, and runs the query via
-    _run_filter_query(). If scope is set, adds WHERE r.mms_id IN (...)
-    constraint. On a 0-hit strict match, applies the relaxation ladder
+    _run_filter_query(). If scope is set, constrains r.id to the scope
+    bitmap. On a 0-hit strict match, applies the relaxation ladder
     (_relax_and_retry) and records each broadening step as evidence.
 
     Returns RecordSet with matched mms_ids.
@@ -1154,27 +1371,27 @@ def _handle_retrieve(
                 continue
         resolved_filters.append(f)
 
-    # Resolve scope
-    scope_ids = _resolve_scope(params.scope, step_results, session_context)
-
-    if scope_ids is not None and not scope_ids:
-        # Empty scope = no results
-        return RecordSet(
-            mms_ids=[],
-            total_count=0,
-            filters_applied=[f.model_dump() for f in resolved_filters],
-        )
-
-    # Repair malformed multi-value hard filters (comma-joined strings,
-    # unsupported op IN) before any querying.
-    resolved_filters = _normalize_multivalue_filters(resolved_filters, multi_value_map)
-
     conn = _get_conn(db_path)
     try:
-        mms_ids = _run_filter_query(conn, resolved_filters, scope_ids, multi_value_map)
+        # Resolve scope
+        scope = _scope_bitmap(conn, params.scope, step_results, session_context)
+
+        if scope is not None and not scope:
+            # Empty scope = no results
+            return RecordSet(
+                mms_ids=[],
+                total_count=0,
+                filters_applied=[f.model_dump() for f in resolved_filters],
+            )
+
+        # Repair malformed multi-value hard filters (comma-joined strings,
+        # unsupported op IN) before any querying.
+        resolved_filters = _normalize_multivalue_filters(resolved_filters, multi_value_map)
+
+        mms_ids = _run_filter_query(conn, resolved_filters, scope, multi_value_map)
         relaxations: List[str] = list(unresolved_notes)
         if not mms_ids and resolved_filters:
-            ladder_ids, ladder_notes = _relax_and_retry(conn, resolved_filters, scope_ids)
+            ladder_ids, ladder_notes = _relax_and_retry(conn, resolved_filters, scope)
             mms_ids = ladder_ids
             relaxations.extend(ladder_notes)
         if fallback_indices:
@@ -1192,7 +1409,7 @@ def _handle_retrieve(
             def _try(filters: List[Filter]) -> List[str]:
                 probe_mv: Dict[int, List[str]] = {}
                 normalized = _normalize_multivalue_filters(list(filters), probe_mv)
-                return _run_filter_query(conn, normalized, scope_ids, probe_mv or None)
+                return _run_filter_query(conn, normalized, scope, probe_mv or None)
 
             # Issue #45: a non-selective token (a common given name) matches
             # most of the collection and would flood the recovery set. Reject
@@ -1260,21 +1477,20 @@ def _handle_aggregate(
 ) -> AggregationResult:
     """Compute faceted aggregation on a field.
 
-    Resolves scope to record IDs, runs SQL GROUP BY on the
+    Resolves scope to a record bitmap, runs SQL GROUP BY on the
     appropriate column. Returns AggregationResult with facets.
     """
-    scope_ids = _resolve_scope(params.scope, step_results, session_context)
-
-    if scope_ids is not None and not scope_ids:
-        return AggregationResult(field=params.field, facets=[], total_records=0)
-
     conn = _get_conn(db_path)
     try:
+        scope = _scope_bitmap(conn, params.scope, step_results, session_context)
+
+        if scope is not None and not scope:
+            return AggregationResult(field=params.field, facets=[], total_records=0)
+
         # Build scope constraint
-        if scope_ids is not None:
-            placeholders = ",".join("?" for _ in scope_ids)
-            scope_where = f"r.mms_id IN ({placeholders})"
-            scope_params = list(scope_ids)
+        if scope is not None:
+            scope_where = scope_condition("r.id")
+            scope_params = [scope.to_json()]
         else:
             scope_where = "1=1"
             scope_params = []
@@ -1676,21 +1892,20 @@ def _handle_sample(
 
     Returns RecordSet with the sampled mms_ids.
     """
-    scope_ids = _resolve_scope(params.scope, step_results, session_context)
-
-    if scope_ids is not None and not scope_ids:
-        return RecordSet(
-            mms_ids=[],
-            total_count=0,
-            filters_applied=[{"strategy": params.strategy, "n": params.n}],
-        )
-
     conn = _get_conn(db_path)
     try:
-        if scope_ids is not None:
-            placeholders = ",".join("?" for _ in scope_ids)
-            scope_where = f"r.mms_id IN ({placeholders})"
-            scope_params: list = list(scope_ids)
+        scope = _scope_bitmap(conn, params.scope, step_results, session_context)
+
+        if scope is not None and not scope:
+            return RecordSet(
+                mms_ids=[],
+                total_count=0,
+                filters_applied=[{"strategy": params.strategy, "n": params.n}],
+            )
+
+        if scope is not None:
+            scope_where = scope_condition("r.id")
+            scope_params: list = [scope.to_json()]
         else:
             scope_where = "1=1"
             scope_params = []
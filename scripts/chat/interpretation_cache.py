@@ -0,0 +1,195 @@
+"""Interpretation cache for the scholar pipeline (Stage 1).
+
+Caches validated ``InterpretationPlan`` objects for context-free turns so
+that repeated or trivially different questions ("Books printed in Venice"
+vs "books printed in venice?") skip the interpreter LLM call.
+
+Keys are the canonical query form (see ``canonicalize_query``) plus a
+fingerprint of the interpreter system prompt and model. When either
+changes, old entries are never served and age out of the LRU. An optional
+character-trigram similarity lookup can also serve near-identical
+phrasings above a configurable threshold. It is off by default.
+
+The cache is process-local and in-memory. ``interpreter.interpret`` uses
+it only after ``enable_interpretation_cache()`` has been called (the API
+does this at startup).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from scripts.chat.plan_models import InterpretationPlan
+
+DEFAULT_MAX_ENTRIES = 2048
+
+# Hebrew points and cantillation marks (niqqud, te'amim), excluding the
+# maqaf/paseq/sof pasuq punctuation which is handled as punctuation.
+_HEBREW_POINTS_RE = re.compile(r"[\u0591-\u05BD\u05BF\u05C1\u05C2\u05C4\u05C5\u05C7]")
+
+_CacheKey = Tuple[str, str]
+
+
+def canonicalize_query(query: str) -> str:
+    """Return the canonical form of a query used as cache key.
+
+    Strips Hebrew niqqud, casefolds, replaces punctuation and symbols with
+    spaces and collapses whitespace.
+    """
+    text = unicodedata.normalize("NFC", query)
+    text = _HEBREW_POINTS_RE.sub("", text).casefold()
+    chars = [
+        " " if unicodedata.category(ch)[0] in ("P", "S") else ch
+        for ch in text
+    ]
+    return " ".join("".join(chars).split())
+
+
+def prompt_fingerprint(system_prompt: str, model: str) -> str:
+    """Fingerprint of the prompt/model pair a plan was produced with."""
+    digest = hashlib.sha256()
+    digest.update(system_prompt.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(model.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class InterpretationCache:
+    """Thread-safe LRU cache of interpretation plans.
+
+    Args:
+        max_entries: Maximum number of cached plans.
+        similarity_threshold: If set (0-1), a miss on the exact canonical
+            key falls back to the most similar cached query under the same
+            fingerprint whose trigram Dice coefficient reaches the threshold.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        similarity_threshold: Optional[float] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[_CacheKey, InterpretationPlan] = OrderedDict()
+        self._grams: Dict[_CacheKey, Set[str]] = {}
+        self._gram_index: Dict[str, Set[_CacheKey]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, query: str, fingerprint: str) -> Optional[InterpretationPlan]:
+        """Return a copy of the cached plan for *query*, or None."""
+        canonical = canonicalize_query(query)
+        key = (fingerprint, canonical)
+        with self._lock:
+            plan = self._entries.get(key)
+            if plan is None and self.similarity_threshold is not None:
+                key = self._most_similar(fingerprint, canonical)
+                plan = self._entries.get(key) if key else None
+                if plan is not None:
+                    self.similar_hits += 1
+            if plan is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return plan.model_copy(deep=True)
+
+    def put(self, query: str, fingerprint: str, plan: InterpretationPlan) -> None:
+        """Store a copy of *plan* under the canonical form of *query*."""
+        canonical = canonicalize_query(query)
+        if not canonical:
+            return
+        key = (fingerprint, canonical)
+        with self._lock:
+            if key not in self._entries:
+                grams = _trigrams(canonical)
+                self._grams[key] = grams
+                for gram in grams:
+                    self._gram_index.setdefault(gram, set()).add(key)
+            self._entries[key] = plan.model_copy(deep=True)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._forget_grams(old_key)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._grams.clear()
+            self._gram_index.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+        }
+
+    def _forget_grams(self, key: _CacheKey) -> None:
+        for gram in self._grams.pop(key, ()):
+            keys = self._gram_index.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._gram_index[gram]
+
+    def _most_similar(self, fingerprint: str, canonical: str) -> Optional[_CacheKey]:
+        grams = _trigrams(canonical)
+        shared: Dict[_CacheKey, int] = {}
+        for gram in grams:
+            for key in self._gram_index.get(gram, ()):
+                if key[0] == fingerprint:
+                    shared[key] = shared.get(key, 0) + 1
+        best_key: Optional[_CacheKey] = None
+        best_score = 0.0
+        for key, count in shared.items():
+            score = 2.0 * count / (len(grams) + len(self._grams[key]))
+            if score > best_score:
+                best_key, best_score = key, score
+        if best_key is not None and best_score >= self.similarity_threshold:
+            return best_key
+        return None
+
+
+# Module-level singleton, disabled until enable_interpretation_cache()
+_interpretation_cache: Optional[InterpretationCache] = None
+
+
+def enable_interpretation_cache(
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    similarity_threshold: Optional[float] = None,
+) -> InterpretationCache:
+    """Create (or replace) the process-wide interpretation cache."""
+    global _interpretation_cache
+    _interpretation_cache = InterpretationCache(max_entries, similarity_threshold)
+    return _interpretation_cache
+
+
+def disable_interpretation_cache() -> None:
+    """Turn interpretation caching off (for testing and evals)."""
+    global _interpretation_cache
+    _interpretation_cache = None
+
+
+def get_interpretation_cache() -> Optional[InterpretationCache]:
+    """Return the active interpretation cache, or None if disabled."""
+    return _interpretation_cache
@@ -37,6 +37,13 @@ from scripts.chat.plan_models import (
     InterpretationPlanLLM,
     ExecutionStepLLM,
 )
+from scripts.chat.interpretation_cache import get_interpretation_cache, prompt_fingerprint
+from scripts.chat.single_flight import (
+    context_fingerprint,
+    flight_key,
+    get_single_flight,
+    is_context_free,
+)
 from scripts.models.config import load_config, get_model
 from scripts.models.llm_client import structured_completion
 from scripts.schemas.query_plan import Filter, FilterField, FilterOp
@@ -1143,7 +1150,9 @@ async def interpret(
 
     This is the main entry point for Stage 1 of the scholar pipeline.
     It calls the LLM to produce a structured plan, then validates
-    all $step_N references before returning.
+    all $step_N references before returning. Context-free turns are served
+    from the interpretation cache when one is enabled, and identical
+    concurrent turns share one LLM call when single-flight is enabled.
 
     Args:
         query: User's natural language query.
@@ -1161,6 +1170,33 @@ async def interpret(
     if model is None:
         config = load_config()
         model = get_model(config, "interpreter")
-    plan = await _call_llm(query, session_context, model, api_key)
-    _validate_step_refs(plan)
+
+    cache = get_interpretation_cache()
+    fingerprint = None
+    if cache is not None and is_context_free(query, session_context):
+        fingerprint = prompt_fingerprint(INTERPRETER_SYSTEM_PROMPT, model)
+        cached = cache.get(query, fingerprint)
+        if cached is not None:
+            return cached
+
+    async def compute() -> InterpretationPlan:
+        plan = await _call_llm(query, session_context, model, api_key)
+        _validate_step_refs(plan)
+        return plan
+
+    flight = get_single_flight()
+    if flight is None:
+        plan = await compute()
+    else:
+        key = flight_key(
+            "interpret", query,
+            prompt_fingerprint(INTERPRETER_SYSTEM_PROMPT, model),
+            context_fingerprint(query, session_context),
+        )
+        plan, shared = await flight.run(key, compute)
+        if shared:
+            # The leader caches and returns the same plan object
+            return plan.model_copy(deep=True)
+    if fingerprint is not None:
+        cache.put(query, fingerprint, plan)
     return plan
@@ -10,12 +10,15 @@ Provides two modes:
 
 Replaces: formatter.py, narrative_agent.py, thematic_context.py
 """
+import asyncio
 import logging
 import re
 from typing import Awaitable, Callable, Optional
 
 from scripts.models.llm_client import structured_completion, streaming_completion
 from scripts.models.config import load_config, get_model
+from scripts.chat.execution_cache import hash_key
+from scripts.chat.single_flight import context_fingerprint, flight_key, get_single_flight
 
 from scripts.chat.plan_models import (
     ExecutionResult,
@@ -134,6 +137,11 @@ class StreamingMetaLLM(BaseModel):
     )
 
 
+# The post-stream meta call rates only the opening of the narrative, so it
+# can start as soon as this many characters have streamed.
+STREAMING_META_PREFIX_CHARS = 500
+
+
 # =============================================================================
 # Public API
 # =============================================================================
@@ -153,7 +161,8 @@ async def narrate(
     then passes through grounding from the executor.
 
     On LLM failure, falls back to a structured summary built from
-    the execution result data (no LLM needed).
+    the execution result data (no LLM needed). Identical concurrent
+    narrations share one LLM call when single-flight is enabled.
 
     Args:
         query: The original user query.
@@ -169,6 +178,26 @@ async def narrate(
     if model is None:
         config = load_config()
         model = get_model(config, "narrator")
+
+    async def compute() -> ScholarResponse:
+        return await _narrate_once(query, execution_result, model, api_key, token_saving)
+
+    flight = get_single_flight()
+    if flight is None:
+        return await compute()
+    key = _narration_key("narrate", query, execution_result, model, token_saving)
+    response, shared = await flight.run(key, compute)
+    return response.model_copy(deep=True) if shared else response
+
+
+async def _narrate_once(
+    query: str,
+    execution_result: ExecutionResult,
+    model: str,
+    api_key: Optional[str],
+    token_saving: bool,
+) -> ScholarResponse:
+    """One narrator LLM call (or the fallback) for ``narrate()``."""
     try:
         response = await _call_llm(
             query, execution_result, model, api_key,
@@ -196,6 +225,14 @@ async def narrate_streaming(
     narrative text can be forwarded to the client incrementally.  After
     streaming completes, assembles and returns the full ScholarResponse.
 
+    The confidence call (``_extract_streaming_meta``) starts as soon as
+    the first ``STREAMING_META_PREFIX_CHARS`` characters -- all it rates --
+    have streamed, so it overlaps the rest of the stream instead of adding
+    a model round-trip after it.
+
+    Identical concurrent narrations share one stream when single-flight is
+    enabled: every caller's callback receives all of its chunks.
+
     On LLM failure, falls back to the deterministic summary (same as
     ``narrate()``), sending it as a single chunk.
 
@@ -215,17 +252,57 @@ async def narrate_streaming(
     if model is None:
         config = load_config()
         model = get_model(config, "narrator")
+
+    async def compute(publish: Callable[[str], Awaitable[None]]) -> ScholarResponse:
+        return await _narrate_streaming_once(
+            query, execution_result, publish, model, api_key, token_saving
+        )
+
+    flight = get_single_flight()
+    if flight is None:
+        return await compute(chunk_callback)
+    key = _narration_key("narrate_streaming", query, execution_result, model, token_saving)
+    response, shared = await flight.stream(key, compute, chunk_callback)
+    return response.model_copy(deep=True) if shared else response
+
+
+async def _narrate_streaming_once(
+    query: str,
+    execution_result: ExecutionResult,
+    chunk_callback: Callable[[str], Awaitable[None]],
+    model: str,
+    api_key: Optional[str],
+    token_saving: bool,
+) -> ScholarResponse:
+    """One streamed narration (or the fallback) for ``narrate_streaming()``."""
+    streamed: list[str] = []
+    streamed_chars = 0
+    meta_task: Optional[asyncio.Task] = None
+
+    def start_meta(text: str) -> asyncio.Task:
+        return asyncio.create_task(_extract_streaming_meta(query, text, api_key))
+
+    async def forward_chunk(chunk: str) -> None:
+        nonlocal streamed_chars, meta_task
+        await chunk_callback(chunk)
+        if meta_task is None:
+            streamed.append(chunk)
+            streamed_chars += len(chunk)
+            if streamed_chars >= STREAMING_META_PREFIX_CHARS:
+                meta_task = start_meta("".join(streamed)[:STREAMING_META_PREFIX_CHARS])
+
     try:
         narrative = await _stream_llm(
-            query, execution_result, chunk_callback, model, api_key,
+            query, execution_result, forward_chunk, model, api_key,
             token_saving=token_saving,
         )
-        # Post-streaming: extract confidence via lightweight call.
-        # On failure confidence is None with an explicit reason — never
-        # a fabricated value (data-model rule: null + reason).
-        confidence, confidence_reason = await _extract_streaming_meta(
-            query, narrative, api_key
-        )
+        # Confidence via a lightweight call, started mid-stream (or now,
+        # for short narratives). On failure confidence is None with an
+        # explicit reason — never a fabricated value (data-model rule:
+        # null + reason).
+        if meta_task is None:
+            meta_task = start_meta(narrative)
+        confidence, confidence_reason = await meta_task
         metadata: dict = {"model": model, "streamed": True}
         if confidence_reason is not None:
             metadata["confidence_reason"] = confidence_reason
@@ -243,6 +320,31 @@ async def narrate_streaming(
         # Send the fallback narrative as a single chunk
         await chunk_callback(fallback.narrative)
         return fallback
+    finally:
+        # A failed or cancelled stream must not leave the meta call running
+        if meta_task is not None and not meta_task.done():
+            meta_task.cancel()
+
+
+def _narration_key(
+    stage: str,
+    query: str,
+    execution_result: ExecutionResult,
+    model: str,
+    token_saving: bool,
+) -> str:
+    """Single-flight key of a narration: everything its prompt is built from.
+
+    The session context enters through its fingerprint, the echoed query
+    through its canonical form.
+    """
+    return flight_key(
+        stage, query, model, token_saving,
+        context_fingerprint(query, execution_result.session_context),
+        hash_key(execution_result.model_dump(
+            mode="json", exclude={"session_context", "original_query"}
+        )),
+    )
 
 
 async def _extract_streaming_meta(
@@ -272,7 +374,11 @@ async def _extract_streaming_meta(
                 "Given a user query and the scholarly response that was generated, "
                 "rate the response quality from 0.0 to 1.0."
             ),
-            user=f"Query: {query}\n\nResponse (first 500 chars): {narrative[:500]}",
+            user=(
+                f"Query: {query}\n\n"
+                f"Response (first {STREAMING_META_PREFIX_CHARS} chars): "
+                f"{narrative[:STREAMING_META_PREFIX_CHARS]}"
+            ),
             response_schema=StreamingMetaLLM,
             call_type="narrator_meta",
         )
@@ -22,9 +22,9 @@ Models are organized into five groups:
 from __future__ import annotations
 
 from enum import Enum
-from typing import Union
+from typing import Any, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from scripts.chat.models import Message
 from scripts.schemas.query_plan import Filter
@@ -166,6 +166,10 @@ class RecordSet(BaseModel):
     filters_applied: list[dict]
     relaxations: list[str] = Field(default_factory=list)
 
+    # records.id bitmap of mms_ids, attached by the executor when the set
+    # is used as a scope (not serialized; rebuilt from mms_ids on demand)
+    _bitmap: Any = PrivateAttr(default=None)
+
 
 class AggregationResult(BaseModel):
     """Output of ``aggregate``.
@@ -399,6 +403,9 @@ class SessionContext(BaseModel):
     previous_messages: list[Message] = Field(default_factory=list)
     previous_record_ids: list[str] = Field(default_factory=list)
 
+    # records.id bitmap of previous_record_ids, built once per turn
+    _previous_bitmap: Any = PrivateAttr(default=None)
+
 
 class ExecutionResult(BaseModel):
     """Complete output of the Executor (Stage 2).
@@ -0,0 +1,131 @@
+"""Compact record-set bitmaps keyed by ``records.id``.
+
+Record sets travel through the executor as MMS ID lists (``RecordSet.mms_ids``,
+``SessionContext.previous_record_ids``). For scoping, the executor converts
+them once into a ``RecordBitmap``: a set of integer ``records.id`` values
+held in a single Python int, one bit per record. Union, intersection and
+difference are then single big-int operations, and a scoped query binds
+the whole set as ONE parameter through ``json_each`` instead of one
+``:scope_i`` variable per record (which also ran into SQLite's variable
+limit on large scopes). Pooled connections are ``query_only``, so TEMP
+tables are not an option; ``json_each`` needs no writes.
+
+Usage:
+    scope = bitmap_for_mms_ids(conn, mms_ids)
+    narrowed = scope & other_scope
+    sql = f"... WHERE {scope_condition('r.id')}"
+    conn.execute(sql, [narrowed.to_json()])
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from typing import Iterable, Iterator, List, Optional
+
+# Bit positions set in each byte value, for fast iteration
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)
+)
+
+
+class RecordBitmap:
+    """Immutable set of non-negative integer record ids."""
+
+    __slots__ = ("_bits", "_json")
+
+    def __init__(self, bits: int = 0) -> None:
+        if bits < 0:
+            raise ValueError("RecordBitmap bits must be non-negative")
+        self._bits = bits
+        self._json: Optional[str] = None
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> "RecordBitmap":
+        ids = list(ids)
+        if not ids:
+            return cls()
+        if min(ids) < 0:
+            raise ValueError("record ids must be non-negative")
+        buf = bytearray(max(ids) // 8 + 1)
+        for i in ids:
+            buf[i >> 3] |= 1 << (i & 7)
+        return cls(int.from_bytes(buf, "little"))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RecordBitmap":
+        return cls(int.from_bytes(data, "little"))
+
+    def to_bytes(self) -> bytes:
+        return self._bits.to_bytes((self._bits.bit_length() + 7) // 8, "little")
+
+    def to_json(self) -> str:
+        """JSON array of the ids (the ``json_each`` bind value); memoized."""
+        if self._json is None:
+            self._json = json.dumps(list(self))
+        return self._json
+
+    def __iter__(self) -> Iterator[int]:
+        for offset, byte in enumerate(self.to_bytes()):
+            if byte:
+                base = offset << 3
+                for bit in _BYTE_BITS[byte]:
+                    yield base + bit
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self._bits != 0
+
+    def __contains__(self, record_id: object) -> bool:
+        return isinstance(record_id, int) and record_id >= 0 and bool(self._bits >> record_id & 1)
+
+    def __and__(self, other: "RecordBitmap") -> "RecordBitmap":
+        return RecordBitmap(self._bits & other._bits)
+
+    def __or__(self, other: "RecordBitmap") -> "RecordBitmap":
+        return RecordBitmap(self._bits | other._bits)
+
+    def __sub__(self, other: "RecordBitmap") -> "RecordBitmap":
+        return RecordBitmap(self._bits & ~other._bits)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RecordBitmap) and self._bits == other._bits
+
+    def __hash__(self) -> int:
+        return hash(self._bits)
+
+    def __repr__(self) -> str:
+        return f"RecordBitmap(<{len(self)} records>)"
+
+
+def scope_condition(column: str, param: str = "?") -> str:
+    """SQL membership test of *column* in a bitmap bound at *param*.
+
+    *param* is ``?`` or a ``:name`` placeholder; bind ``bitmap.to_json()``.
+    """
+    return f"{column} IN (SELECT value FROM json_each({param}))"
+
+
+def bitmap_for_mms_ids(conn: sqlite3.Connection, mms_ids: Iterable[str]) -> RecordBitmap:
+    """Bitmap of the ``records.id`` values of *mms_ids* (unknown ids dropped)."""
+    mms_ids = list(mms_ids)
+    if not mms_ids:
+        return RecordBitmap()
+    rows = conn.execute(
+        f"SELECT id FROM records WHERE {scope_condition('mms_id')}",
+        (json.dumps(mms_ids),),
+    ).fetchall()
+    return RecordBitmap.from_ids(row[0] for row in rows)
+
+
+def mms_ids_for_bitmap(conn: sqlite3.Connection, bitmap: RecordBitmap) -> List[str]:
+    """MMS IDs of the records in *bitmap*, sorted."""
+    if not bitmap:
+        return []
+    rows = conn.execute(
+        f"SELECT mms_id FROM records WHERE {scope_condition('id')} ORDER BY mms_id",
+        (bitmap.to_json(),),
+    ).fetchall()
+    return [row[0] for row in rows]
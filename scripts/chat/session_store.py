@@ -10,13 +10,25 @@ Two-Phase Conversation Support:
 - Phase tracking (query_definition → corpus_exploration)
 - Active subgroup storage for corpus exploration
 - User goal tracking for need elicitation
+
+Per-turn cost does not grow with the session: existence checks and
+``get_session(..., include_messages=False)`` never load the message
+history, and ``get_recent_messages`` reads only the last N rows through the
+(session_id, timestamp) index. With ``enable_write_behind()`` (the API turns
+it on at startup), message inserts and ``updated_at`` bumps are queued to a
+writer thread and committed in groups, off the event loop.
 """
 
+import asyncio
 import json
+import queue
 import sqlite3
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from scripts.chat.models import (
     ChatSession,
@@ -28,6 +40,121 @@ from scripts.chat.models import (
 from scripts.schemas import CandidateSet
 from scripts.utils.logger import LoggerManager
 
+# Write-behind: messages per grouped commit and max delay before a commit
+WRITE_BATCH_SIZE = 100
+WRITE_INTERVAL_S = 0.05
+
+_INSERT_MESSAGE_SQL = """
+    INSERT INTO chat_messages
+    (session_id, role, content, query_plan, candidate_set, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _message_row(session_id: str, message: Message) -> Tuple:
+    return (
+        session_id,
+        message.role,
+        message.content,
+        json.dumps(message.query_plan.model_dump()) if message.query_plan else None,
+        json.dumps(message.candidate_set.model_dump()) if message.candidate_set else None,
+        message.timestamp.isoformat(),
+    )
+
+
+def _row_to_message(row: tuple) -> Message:
+    return Message(
+        role=row[0],
+        content=row[1],
+        query_plan=json.loads(row[2]) if row[2] else None,
+        candidate_set=json.loads(row[3]) if row[3] else None,
+        timestamp=datetime.fromisoformat(row[4]),
+        db_id=row[5],
+    )
+
+
+class _MessageWriter(threading.Thread):
+    """Writer thread that commits queued messages in groups.
+
+    Each batch (up to ``WRITE_BATCH_SIZE`` messages, or whatever arrived
+    within ``WRITE_INTERVAL_S``) is one transaction: the message inserts
+    plus one ``updated_at`` bump per session. Every queued message has a
+    Future that resolves to its chat_messages row id once committed.
+    """
+
+    def __init__(self, db_path: Path, logger: Any):
+        super().__init__(name="session-writer", daemon=True)
+        self.db_path = db_path
+        self.logger = logger
+        self.queue: "queue.Queue[Any]" = queue.Queue()
+
+    def run(self) -> None:
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        stop = False
+        try:
+            while not stop:
+                batch: List[Tuple[str, Message, Future]] = []
+                waiters: List[Future] = []
+                item = self.queue.get()
+                deadline = time.monotonic() + WRITE_INTERVAL_S
+                while True:
+                    if item is None:
+                        stop = True
+                    elif isinstance(item, Future):
+                        # flush() marker: commit what we have now
+                        waiters.append(item)
+                    else:
+                        batch.append(item)
+                    if stop or waiters or len(batch) >= WRITE_BATCH_SIZE:
+                        break
+                    try:
+                        item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                if batch:
+                    self._commit(conn, batch)
+                for waiter in waiters:
+                    waiter.set_result(None)
+        finally:
+            conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, batch: List[Tuple[str, Message, Future]]) -> None:
+        try:
+            with conn:
+                row_ids = self._write(conn, batch)
+        except sqlite3.Error:
+            # One bad message (e.g. its session was deleted meanwhile) must
+            # not fail the others: retry them one transaction each
+            for item in batch:
+                try:
+                    with conn:
+                        (row_id,) = self._write(conn, [item])
+                    item[2].set_result(row_id)
+                except sqlite3.Error as e:
+                    self.logger.warning(
+                        "Failed to store message",
+                        extra={"session_id": item[0], "error": str(e)},
+                    )
+                    item[2].set_exception(e)
+            return
+        for (_, _, future), row_id in zip(batch, row_ids):
+            future.set_result(row_id)
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, batch: List[Tuple[str, Message, Future]]) -> List[int]:
+        row_ids = [
+            conn.execute(_INSERT_MESSAGE_SQL, _message_row(session_id, message)).lastrowid
+            for session_id, message, _ in batch
+        ]
+        now = datetime.now(timezone.utc).isoformat()
+        conn.executemany(
+            "UPDATE chat_sessions SET updated_at = ? WHERE session_id = ?",
+            [(now, session_id) for session_id in dict.fromkeys(sid for sid, _, _ in batch)],
+        )
+        return row_ids
+
 
 class SessionStore:
     """SQLite-backed storage for chat sessions.
@@ -47,18 +174,24 @@ class SessionStore:
         """
         self.db_path = Path(db_path)
         self._conn: Optional[sqlite3.Connection] = None
+        self._writer: Optional[_MessageWriter] = None
         self.logger = LoggerManager.get_logger(__name__)
         self._ensure_schema()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create database connection with foreign keys enabled.
 
+        The database is put in WAL mode so reads are not blocked by the
+        write-behind thread's commits (and vice versa).
+
         Returns:
             SQLite connection with foreign keys enabled
         """
         if self._conn is None:
             self._conn = sqlite3.connect(str(self.db_path))
             self._conn.execute("PRAGMA foreign_keys = ON")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
         return self._conn
 
     def _ensure_schema(self) -> None:
@@ -110,11 +243,32 @@ class SessionStore:
         )
         return session
 
-    def get_session(self, session_id: str) -> Optional[ChatSession]:
+    def session_exists(self, session_id: str) -> bool:
+        """Check that an active session exists without loading it.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if the session exists and has not expired
+        """
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT 1 FROM chat_sessions WHERE session_id = ? AND expired_at IS NULL",
+            (session_id,),
+        ).fetchone()
+        return row is not None
+
+    def get_session(
+        self, session_id: str, include_messages: bool = True
+    ) -> Optional[ChatSession]:
         """Retrieve session by ID.
 
         Args:
             session_id: Session identifier
+            include_messages: Load the full message history. Pass False for
+                a slim load (ownership checks, context updates); use
+                ``get_recent_messages`` for conversation history.
 
         Returns:
             ChatSession if found, None otherwise
@@ -145,8 +299,8 @@ class SessionStore:
         )
 
         # Load messages
-        messages = self._get_messages(session_id)
-        session.messages = messages
+        if include_messages:
+            session.messages = self._get_messages(session_id)
 
         return session
 
@@ -170,19 +324,43 @@ class SessionStore:
             (session_id,),
         )
 
-        messages = []
-        for row in cursor.fetchall():
-            msg = Message(
-                role=row[0],
-                content=row[1],
-                query_plan=json.loads(row[2]) if row[2] else None,
-                candidate_set=json.loads(row[3]) if row[3] else None,
-                timestamp=datetime.fromisoformat(row[4]),
-                db_id=row[5],
-            )
-            messages.append(msg)
+        return [_row_to_message(row) for row in cursor.fetchall()]
+
+    def get_recent_messages(
+        self, session_id: str, n: int = 5, before: Optional[datetime] = None
+    ) -> List[Message]:
+        """Retrieve the last N messages of a session.
 
-        return messages
+        Reads only those rows (newest first through the session/timestamp
+        index), so the cost does not depend on the session length.
+
+        Args:
+            session_id: Session identifier
+            n: Number of recent messages to retrieve
+            before: Only messages with an earlier timestamp (e.g. the
+                history preceding the current turn's user message, whether
+                or not that message has been written yet)
+
+        Returns:
+            Up to n messages ordered by timestamp
+        """
+        conn = self._get_connection()
+        params: List[Any] = [session_id]
+        before_clause = ""
+        if before is not None:
+            before_clause = "AND timestamp < ?"
+            params.append(before.isoformat())
+        cursor = conn.execute(
+            f"""
+            SELECT role, content, query_plan, candidate_set, timestamp, id
+            FROM chat_messages
+            WHERE session_id = ? {before_clause}
+            ORDER BY timestamp DESC, id DESC
+            LIMIT ?
+            """,
+            (*params, n),
+        )
+        return [_row_to_message(row) for row in reversed(cursor.fetchall())]
 
     def add_message(self, session_id: str, message: Message) -> int:
         """Add message to session.
@@ -198,31 +376,13 @@ class SessionStore:
             ValueError: If session doesn't exist
         """
         # Verify session exists
-        if not self.get_session(session_id):
+        if not self.session_exists(session_id):
             raise ValueError(f"Session {session_id} not found")
 
         conn = self._get_connection()
 
         # Insert message
-        cursor = conn.execute(
-            """
-            INSERT INTO chat_messages
-            (session_id, role, content, query_plan, candidate_set, timestamp)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (
-                session_id,
-                message.role,
-                message.content,
-                json.dumps(message.query_plan.model_dump()) if message.query_plan else None,
-                (
-                    json.dumps(message.candidate_set.model_dump())
-                    if message.candidate_set
-                    else None
-                ),
-                message.timestamp.isoformat(),
-            ),
-        )
+        cursor = conn.execute(_INSERT_MESSAGE_SQL, _message_row(session_id, message))
 
         # Update session timestamp
         conn.execute(
@@ -243,6 +403,60 @@ class SessionStore:
 
         return cursor.lastrowid
 
+    def enable_write_behind(self) -> None:
+        """Queue message writes to a background thread with grouped commits."""
+        if self._writer is None:
+            self._writer = _MessageWriter(self.db_path, self.logger)
+            self._writer.start()
+
+    def queue_message(self, session_id: str, message: Message) -> "Future[int]":
+        """Add message to session through the write-behind queue.
+
+        Without write-behind the message is written immediately. Messages
+        queued for the same session are committed in order.
+
+        Args:
+            session_id: Session identifier
+            message: Message to add
+
+        Returns:
+            Future resolving to the chat_messages row id once committed
+
+        Raises:
+            ValueError: If session doesn't exist
+        """
+        future: Future = Future()
+        if self._writer is None:
+            future.set_result(self.add_message(session_id, message))
+            return future
+        if not self.session_exists(session_id):
+            raise ValueError(f"Session {session_id} not found")
+        self._writer.queue.put((session_id, message, future))
+        return future
+
+    async def add_message_async(self, session_id: str, message: Message) -> int:
+        """Add message to session and await its grouped commit.
+
+        Args:
+            session_id: Session identifier
+            message: Message to add
+
+        Returns:
+            The chat_messages row id of the inserted message
+
+        Raises:
+            ValueError: If session doesn't exist
+        """
+        return await asyncio.wrap_future(self.queue_message(session_id, message))
+
+    def flush(self, timeout: float = 10.0) -> None:
+        """Wait until every queued message has been committed."""
+        if self._writer is None:
+            return
+        marker: Future = Future()
+        self._writer.queue.put(marker)
+        marker.result(timeout)
+
     def update_context(self, session_id: str, context: Dict[str, Any]) -> None:
         """Update session context.
 
@@ -253,7 +467,7 @@ class SessionStore:
         Raises:
             ValueError: If session doesn't exist
         """
-        session = self.get_session(session_id)
+        session = self.get_session(session_id, include_messages=False)
         if not session:
             raise ValueError(f"Session {session_id} not found")
 
@@ -432,8 +646,7 @@ class SessionStore:
         Raises:
             ValueError: If session doesn't exist
         """
-        session = self.get_session(session_id)
-        if not session:
+        if not self.session_exists(session_id):
             raise ValueError(f"Session {session_id} not found")
 
         conn = self._get_connection()
@@ -469,8 +682,7 @@ class SessionStore:
         Raises:
             ValueError: If session doesn't exist
         """
-        session = self.get_session(session_id)
-        if not session:
+        if not self.session_exists(session_id):
             raise ValueError(f"Session {session_id} not found")
 
         conn = self._get_connection()
@@ -586,8 +798,7 @@ class SessionStore:
         Raises:
             ValueError: If session doesn't exist
         """
-        session = self.get_session(session_id)
-        if not session:
+        if not self.session_exists(session_id):
             raise ValueError(f"Session {session_id} not found")
 
         conn = self._get_connection()
@@ -643,7 +854,11 @@ class SessionStore:
         return goals
 
     def close(self) -> None:
-        """Close database connection."""
+        """Commit queued messages and close database connection."""
+        if self._writer is not None:
+            self._writer.queue.put(None)
+            self._writer.join()
+            self._writer = None
         if self._conn:
             self._conn.close()
             self._conn = None
@@ -0,0 +1,225 @@
+"""Single-flight coalescing of identical in-flight scholar pipeline work.
+
+When many users send the same question at the same moment (a class typing
+a suggested query), each request used to run its own interpret, execute
+and narrate stages. The caches only help once the first request has
+finished. A ``SingleFlight`` group runs one computation per key; requests
+that arrive while it is in flight wait for the same result:
+
+- ``run(key, fn)`` awaits ``fn()`` once for all concurrent callers
+- ``stream(key, fn, chunk_callback)`` does the same for a streaming
+  stage. Every chunk the computation publishes reaches every subscriber,
+  and late joiners get the chunks sent so far replayed first.
+
+The computation runs as its own task. A caller that goes away (a closed
+websocket) does not cancel it for the others. It is cancelled only when
+no caller is left. Keys are dropped as soon as the computation finishes:
+this is not a cache, and later requests start a new flight (and hit the
+stage caches instead).
+
+Stages build keys with ``flight_key`` from the canonical query (see
+``interpretation_cache.canonicalize_query``), ``context_fingerprint`` of
+the session context, and whatever else determines their output. Callers
+that receive a shared result (``shared`` is True) must copy it before
+changing it. Each session still stores its own messages.
+
+The group is process-local (one per worker, on the event loop) and off
+until ``enable_single_flight()`` is called (the API does this at startup).
+
+Usage:
+    flight = get_single_flight()
+    if flight is not None:
+        plan, shared = await flight.run(flight_key("interpret", ...), compute)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from scripts.chat.execution_cache import hash_key
+from scripts.chat.interpretation_cache import canonicalize_query
+from scripts.chat.plan_models import SessionContext
+
+T = TypeVar("T")
+
+ChunkCallback = Callable[[str], Awaitable[None]]
+
+# Queue marker: the computation finished, no more chunks
+_DONE = object()
+
+
+def is_context_free(query: str, session_context: Optional[SessionContext]) -> bool:
+    """True if the turn does not depend on earlier conversation state.
+
+    A context that only holds the current user message (the API records it
+    before interpreting) counts as context-free.
+    """
+    if session_context is None:
+        return True
+    if session_context.previous_record_ids:
+        return False
+    messages = session_context.previous_messages
+    if not messages:
+        return True
+    return (
+        len(messages) == 1
+        and messages[0].role == "user"
+        and messages[0].content == query
+    )
+
+
+def context_fingerprint(query: str, session_context: Optional[SessionContext]) -> str:
+    """Fingerprint of the conversation state a turn depends on.
+
+    Empty for context-free turns; otherwise a hash of the previous
+    messages and record ids (the session id itself is left out, so
+    sessions with the same history share work).
+    """
+    if is_context_free(query, session_context):
+        return ""
+    return hash_key({
+        "messages": [[m.role, m.content] for m in session_context.previous_messages],
+        "record_ids": session_context.previous_record_ids,
+    })
+
+
+def flight_key(stage: str, query: str, *parts: Any) -> str:
+    """Single-flight key of a pipeline stage for the canonical *query*."""
+    return hash_key([stage, canonicalize_query(query), *parts])
+
+
+class _Flight:
+    """One in-flight computation and its subscribers."""
+
+    def __init__(self) -> None:
+        self.task: Optional[asyncio.Future] = None
+        self.chunks: List[str] = []
+        self.queues: List[asyncio.Queue] = []
+        self.subscribers = 0
+
+    async def publish(self, chunk: str) -> None:
+        """Chunk callback handed to the computation: fan out to subscribers."""
+        self.chunks.append(chunk)
+        for queue in self.queues:
+            queue.put_nowait(chunk)
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one computation."""
+
+    def __init__(self) -> None:
+        self.leaders = 0
+        self.followers = 0
+        self._flights: Dict[str, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> Dict[str, int]:
+        """Return leader/follower counters and in-flight keys."""
+        return {
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "in_flight": len(self._flights),
+        }
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Await ``fn()`` once for every concurrent caller of *key*.
+
+        Returns:
+            ``(result, shared)``; shared is False for the caller that
+            started the computation. Its exception, if any, is raised in
+            every caller.
+        """
+        flight, shared = self._join(key, lambda _publish: fn())
+        try:
+            return await asyncio.shield(flight.task), shared
+        finally:
+            self._leave(key, flight)
+
+    async def stream(
+        self,
+        key: str,
+        fn: Callable[[ChunkCallback], Awaitable[T]],
+        chunk_callback: ChunkCallback,
+    ) -> Tuple[T, bool]:
+        """Like ``run`` for a computation that streams text chunks.
+
+        ``fn`` receives the chunk callback to publish through. Each caller's
+        *chunk_callback* gets every chunk in order, including those sent
+        before it joined. An exception from *chunk_callback* ends only
+        that caller's subscription.
+        """
+        flight, shared = self._join(key, fn)
+        queue: asyncio.Queue = asyncio.Queue()
+        for chunk in flight.chunks:
+            queue.put_nowait(chunk)
+        if flight.task.done():
+            queue.put_nowait(_DONE)
+        flight.queues.append(queue)
+        try:
+            while (chunk := await queue.get()) is not _DONE:
+                await chunk_callback(chunk)
+            return await asyncio.shield(flight.task), shared
+        finally:
+            flight.queues.remove(queue)
+            self._leave(key, flight)
+
+    def _join(self, key: str, fn: Callable[[ChunkCallback], Awaitable[Any]]) -> Tuple[_Flight, bool]:
+        flight = self._flights.get(key)
+        shared = flight is not None
+        if flight is None:
+            flight = _Flight()
+            flight.task = asyncio.ensure_future(fn(flight.publish))
+            flight.task.add_done_callback(lambda _task: self._finish(key, flight))
+            self._flights[key] = flight
+            self.leaders += 1
+        else:
+            self.followers += 1
+        flight.subscribers += 1
+        return flight, shared
+
+    def _leave(self, key: str, flight: _Flight) -> None:
+        flight.subscribers -= 1
+        if flight.subscribers == 0 and not flight.task.done():
+            # Nobody is waiting any more: stop the work and let the next
+            # request start afresh rather than join a cancelled flight
+            self._forget(key, flight)
+            flight.task.cancel()
+
+    def _finish(self, key: str, flight: _Flight) -> None:
+        self._forget(key, flight)
+        for queue in flight.queues:
+            queue.put_nowait(_DONE)
+        if flight.task.cancelled():
+            return
+        # Retrieve the exception so an abandoned flight does not log
+        # "exception was never retrieved"; subscribers re-raise it themselves
+        flight.task.exception()
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+# Module-level singleton, disabled until enable_single_flight()
+_single_flight: Optional[SingleFlight] = None
+
+
+def enable_single_flight() -> SingleFlight:
+    """Create (or replace) the process-wide single-flight group."""
+    global _single_flight
+    _single_flight = SingleFlight()
+    return _single_flight
+
+
+def disable_single_flight() -> None:
+    """Turn request coalescing off (for testing and evals)."""
+    global _single_flight
+    _single_flight = None
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """Return the active single-flight group, or None if disabled."""
+    return _single_flight
@@ -0,0 +1,120 @@
+"""Shared HTTP client and rate limiting for enrichment runs.
+
+The Wikidata and NLI clients open their connections through ``http_client()``.
+On its own that yields a short-lived ``httpx.AsyncClient``, the same as a
+one-off request. Inside ``shared_http_client()`` every call reuses one
+pooled client instead, so a bulk run keeps its TCP/TLS connections alive
+and does not pay a handshake per lookup.
+
+Usage:
+------
+from scripts.enrichment.http_pool import TokenBucket, shared_http_client
+
+bucket = TokenBucket(rate=2.0, capacity=4)
+async with shared_http_client():
+    await bucket.acquire()
+    result = await service.enrich_entity(...)
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
+
+import httpx
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_TIMEOUT = 30.0
+
+_shared_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar(
+    "enrichment_shared_http_client", default=None
+)
+
+
+# =============================================================================
+# Client Access
+# =============================================================================
+
+
+@asynccontextmanager
+async def shared_http_client(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Install one pooled client for all enrichment requests in this context.
+
+    Tasks started inside the block inherit the client. It is closed on exit.
+
+    Args:
+        max_connections: Connection pool size
+        timeout: Default request timeout in seconds
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+    )
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+        token = _shared_client.set(client)
+        try:
+            yield client
+        finally:
+            _shared_client.reset(token)
+
+
+@asynccontextmanager
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client if one is installed, else a temporary one."""
+    client = _shared_client.get()
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
+# =============================================================================
+# Rate Limiting
+# =============================================================================
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    Allows a burst of up to ``capacity`` acquisitions, then an average of
+    ``rate`` acquisitions per second. Waiters are served in FIFO order.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize the bucket (starts full).
+
+        Args:
+            rate: Tokens added per second (must be > 0)
+            capacity: Maximum tokens held (burst size)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
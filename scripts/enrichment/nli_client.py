@@ -41,6 +41,7 @@ from typing import Optional
 
 import httpx
 
+from scripts.enrichment.http_pool import http_client
 from scripts.enrichment.models import (
     NLIAuthorityIdentifiers,
 )
@@ -135,7 +136,7 @@ async def fetch_nli_jsonld(nli_id: str, timeout: float = 10.0) -> Optional[dict]
     """
     url = f"{NLI_JSONLD_BASE}/{nli_id}.jsonld"
 
-    async with httpx.AsyncClient() as client:
+    async with http_client() as client:
         try:
             response = await client.get(url, timeout=timeout)
             if response.status_code == 200:
@@ -214,7 +215,7 @@ async def get_wikidata_id_from_nli(nli_id: str) -> Optional[str]:
         "format": "json",
     }
 
-    async with httpx.AsyncClient() as client:
+    async with http_client() as client:
         try:
             response = await client.get(
                 WIKIDATA_SPARQL_ENDPOINT,
@@ -280,7 +281,7 @@ async def lookup_nli_via_wikidata(nli_id: str) -> Optional[NLIAuthorityIdentifie
     isni_id = None
     loc_id = None
 
-    async with httpx.AsyncClient() as client:
+    async with http_client() as client:
         try:
             response = await client.get(
                 WIKIDATA_SPARQL_ENDPOINT,
@@ -24,6 +24,7 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
+from scripts.enrichment.http_pool import http_client
 from scripts.enrichment.models import (
     EnrichmentResult,
     EnrichmentSource,
@@ -175,7 +176,7 @@ async def execute_sparql(
         "format": "json",
     }
 
-    async with httpx.AsyncClient() as client:
+    async with http_client() as client:
         try:
             response = await client.get(
                 WIKIDATA_SPARQL_ENDPOINT,
@@ -218,7 +219,7 @@ async def search_wikidata_api(
         "format": "json",
     }
 
-    async with httpx.AsyncClient() as client:
+    async with http_client() as client:
         try:
             response = await client.get(
                 WIKIDATA_API_ENDPOINT,
@@ -7,9 +7,10 @@ All normalization is deterministic, reversible, and confidence-scored.
 import json
 import sys
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Dict, List, Optional, Tuple
 
 from .normalize import enrich_m2
+from .parallel import chunked, ordered_chunk_map
 
 
 def load_alias_map(path: Optional[Path]) -> Optional[Dict[str, str]]:
@@ -28,39 +29,106 @@ def load_alias_map(path: Optional[Path]) -> Optional[Dict[str, str]]:
         return json.load(f)
 
 
+# Alias maps for the current process; set once per worker by
+# _init_alias_maps so they are not pickled with every chunk.
+_ALIAS_MAPS: Tuple[Optional[Dict[str, str]], ...] = (None, None, None)
+
+
+def _init_alias_maps(
+    place_alias_map: Optional[Dict[str, str]],
+    publisher_alias_map: Optional[Dict[str, str]],
+    agent_alias_map: Optional[Dict[str, str]],
+) -> None:
+    global _ALIAS_MAPS
+    _ALIAS_MAPS = (place_alias_map, publisher_alias_map, agent_alias_map)
+
+
+def _empty_stats() -> Dict[str, int]:
+    return {
+        'total_records': 0,
+        'enriched_records': 0,
+        'agents_normalized': 0,
+        'total_imprints': 0,
+        'dates_normalized': 0,
+        'places_normalized': 0,
+        'publishers_normalized': 0
+    }
+
+
+def normalize_line_chunk(lines: List[str]) -> Tuple[List[str], Dict[str, int]]:
+    """Enrich a chunk of M1 JSONL lines with M2, returning output lines and stats.
+
+    Uses the alias maps installed by ``_init_alias_maps`` in this process.
+    """
+    place_alias_map, publisher_alias_map, agent_alias_map = _ALIAS_MAPS
+    stats = _empty_stats()
+    out_lines: List[str] = []
+
+    for line in lines:
+        stats['total_records'] += 1
+
+        # Parse M1 record
+        m1_record = json.loads(line.strip())
+
+        # Enrich with M2
+        m2_enrichment = enrich_m2(m1_record, place_alias_map, publisher_alias_map, agent_alias_map)
+
+        # Append M2 to M1 record (non-destructive)
+        enriched_record = m1_record.copy()
+        enriched_record['m2'] = m2_enrichment.model_dump()
+
+        # Update stats
+        stats['enriched_records'] += 1
+        stats['total_imprints'] += len(m2_enrichment.imprints_norm)
+        stats['agents_normalized'] += len(m2_enrichment.agents_norm)
+
+        for imprint_norm in m2_enrichment.imprints_norm:
+            if imprint_norm.date_norm and imprint_norm.date_norm.start is not None:
+                stats['dates_normalized'] += 1
+            if imprint_norm.place_norm and imprint_norm.place_norm.value is not None:
+                stats['places_normalized'] += 1
+            if imprint_norm.publisher_norm and imprint_norm.publisher_norm.value is not None:
+                stats['publishers_normalized'] += 1
+
+        out_lines.append(json.dumps(enriched_record))
+
+    return out_lines, stats
+
+
 def process_m1_to_m2(
     input_path: Path,
     output_path: Path,
     place_alias_path: Optional[Path] = None,
     publisher_alias_path: Optional[Path] = None,
-    agent_alias_path: Optional[Path] = None
+    agent_alias_path: Optional[Path] = None,
+    workers: int = 1,
+    chunk_size: int = 500,
 ) -> dict:
     """Process M1 JSONL and output M1+M2 enriched JSONL.
 
+    With ``workers > 1`` the input is normalized in chunks across a process
+    pool; output order and statistics are identical to the serial run.
+
     Args:
         input_path: Path to M1 canonical JSONL file
         output_path: Path to output M1+M2 JSONL file
         place_alias_path: Optional path to place alias map JSON
         publisher_alias_path: Optional path to publisher alias map JSON
         agent_alias_path: Optional path to agent alias map JSON
+        workers: Number of normalizer processes (1 = in-process)
+        chunk_size: Lines per unit of work
 
     Returns:
         Statistics dictionary with counts
     """
     # Load alias maps if provided
-    place_alias_map = load_alias_map(place_alias_path)
-    publisher_alias_map = load_alias_map(publisher_alias_path)
-    agent_alias_map = load_alias_map(agent_alias_path)
+    alias_maps = (
+        load_alias_map(place_alias_path),
+        load_alias_map(publisher_alias_path),
+        load_alias_map(agent_alias_path),
+    )
 
-    stats = {
-        'total_records': 0,
-        'enriched_records': 0,
-        'agents_normalized': 0,
-        'total_imprints': 0,
-        'dates_normalized': 0,
-        'places_normalized': 0,
-        'publishers_normalized': 0
-    }
+    stats = _empty_stats()
 
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -68,34 +136,19 @@ def process_m1_to_m2(
     with open(input_path, 'r', encoding='utf-8') as infile, \
          open(output_path, 'w', encoding='utf-8') as outfile:
 
-        for line in infile:
-            stats['total_records'] += 1
-
-            # Parse M1 record
-            m1_record = json.loads(line.strip())
-
-            # Enrich with M2
-            m2_enrichment = enrich_m2(m1_record, place_alias_map, publisher_alias_map, agent_alias_map)
-
-            # Append M2 to M1 record (non-destructive)
-            enriched_record = m1_record.copy()
-            enriched_record['m2'] = m2_enrichment.model_dump()
-
-            # Update stats
-            stats['enriched_records'] += 1
-            stats['total_imprints'] += len(m2_enrichment.imprints_norm)
-            stats['agents_normalized'] += len(m2_enrichment.agents_norm)
-
-            for imprint_norm in m2_enrichment.imprints_norm:
-                if imprint_norm.date_norm and imprint_norm.date_norm.start is not None:
-                    stats['dates_normalized'] += 1
-                if imprint_norm.place_norm and imprint_norm.place_norm.value is not None:
-                    stats['places_normalized'] += 1
-                if imprint_norm.publisher_norm and imprint_norm.publisher_norm.value is not None:
-                    stats['publishers_normalized'] += 1
-
-            # Write enriched record
-            outfile.write(json.dumps(enriched_record) + '\n')
+        results = ordered_chunk_map(
+            normalize_line_chunk,
+            chunked(infile, chunk_size),
+            workers=workers,
+            initializer=_init_alias_maps,
+            initargs=alias_maps,
+        )
+        for out_lines, chunk_stats in results:
+            # Write enriched records
+            for line in out_lines:
+                outfile.write(line + '\n')
+            for key, value in chunk_stats.items():
+                stats[key] += value
 
     return stats
 
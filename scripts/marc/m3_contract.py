@@ -40,6 +40,9 @@ class M3Tables:
     # Network / enrichment tables (added by the network + wikipedia work)
     NETWORK_AGENTS = "network_agents"
     NETWORK_EDGES = "network_edges"
+    # Precomputed /network/map figures (build_network_map_stats)
+    NETWORK_AGENT_DEGREES = "network_agent_degrees"
+    NETWORK_MAP_STATS = "network_map_stats"
     RECORD_SCOPE_FLAGS = "record_scope_flags"
     WIKIPEDIA_CACHE = "wikipedia_cache"
     WIKIPEDIA_CONNECTIONS = "wikipedia_connections"
@@ -47,6 +50,15 @@ class M3Tables:
     # FTS5 virtual tables
     TITLES_FTS = "titles_fts"
     SUBJECTS_FTS = "subjects_fts"
+    # Trigram substring indexes (CONTAINS filters)
+    IMPRINTS_FTS = "imprints_fts"
+    AGENTS_FTS = "agents_fts"
+    AGENT_ALIASES_FTS = "agent_aliases_fts"
+
+    # Materialized full-collection facet summary (scripts/marc/m3_facets.py)
+    FACET_COUNTS = "facet_counts"
+    FACET_DECADE_COUNTS = "facet_decade_counts"
+    FACET_SUMMARY_META = "facet_summary_meta"
 
 
 class M3Columns:
@@ -287,6 +299,8 @@ class M3NetworkColumns:
         CONNECTION_COUNT = "connection_count"
         NODE_TYPE = "node_type"  # issue #27 (publisher nodes)
         COMMUNITY = "community"  # issue #28 (category-coloring facet)
+        ACTIVE_START = "active_start"  # precomputed map time-slider span
+        ACTIVE_END = "active_end"
 
     class NetworkEdges:
         SOURCE_AGENT_NORM = "source_agent_norm"
@@ -297,6 +311,18 @@ class M3NetworkColumns:
         BIDIRECTIONAL = "bidirectional"
         EVIDENCE = "evidence"
 
+    class NetworkAgentDegrees:
+        CONNECTION_TYPE = "connection_type"
+        CONFIDENCE_STEP = "confidence_step"
+        AGENT_NORM = "agent_norm"
+        DEGREE = "degree"
+
+    class NetworkMapStats:
+        ID = "id"
+        GENERATION = "generation"
+        DIRTY = "dirty"
+        BUILT_AT = "built_at"
+
     class RecordScopeFlags:
         ID = "id"
         RECORD_ID = "record_id"
@@ -335,6 +361,30 @@ class M3NetworkColumns:
         CREATED_AT = "created_at"
 
 
+class M3FacetColumns:
+    """Columns of the materialized facet summary (scripts/marc/m3_facets.py)."""
+
+    class FacetCounts:
+        FACET = "facet"
+        VALUE = "value"
+        RECORD_COUNT = "record_count"
+        DISPLAY = "display"
+        YEAR_MIN = "year_min"
+        YEAR_MAX = "year_max"
+
+    class FacetDecadeCounts:
+        FACET = "facet"
+        VALUE = "value"
+        DECADE = "decade"
+        RECORD_COUNT = "record_count"
+
+    class FacetSummaryMeta:
+        ID = "id"
+        GENERATION = "generation"
+        DIRTY = "dirty"
+        REFRESHED_AT = "refreshed_at"
+
+
 class M3Aliases:
     """Common table aliases used in M4 query builder."""
     RECORDS = "r"
@@ -383,9 +433,14 @@ EXPECTED_SCHEMA = {
     M3Tables.AGENT_ALIASES: _get_class_string_attrs(M3Columns.AgentAliases),
     M3Tables.NETWORK_AGENTS: _get_class_string_attrs(M3NetworkColumns.NetworkAgents),
     M3Tables.NETWORK_EDGES: _get_class_string_attrs(M3NetworkColumns.NetworkEdges),
+    M3Tables.NETWORK_AGENT_DEGREES: _get_class_string_attrs(M3NetworkColumns.NetworkAgentDegrees),
+    M3Tables.NETWORK_MAP_STATS: _get_class_string_attrs(M3NetworkColumns.NetworkMapStats),
     M3Tables.RECORD_SCOPE_FLAGS: _get_class_string_attrs(M3NetworkColumns.RecordScopeFlags),
     M3Tables.WIKIPEDIA_CACHE: _get_class_string_attrs(M3NetworkColumns.WikipediaCache),
     M3Tables.WIKIPEDIA_CONNECTIONS: _get_class_string_attrs(M3NetworkColumns.WikipediaConnections),
+    M3Tables.FACET_COUNTS: _get_class_string_attrs(M3FacetColumns.FacetCounts),
+    M3Tables.FACET_DECADE_COUNTS: _get_class_string_attrs(M3FacetColumns.FacetDecadeCounts),
+    M3Tables.FACET_SUMMARY_META: _get_class_string_attrs(M3FacetColumns.FacetSummaryMeta),
 }
 
 
@@ -0,0 +1,289 @@
+"""Materialized full-collection facet summary for the M3 database.
+
+Full-collection aggregations (collection overview, full-collection
+``execute_aggregation_full_collection``, the network place map and topic
+constellation) used to GROUP BY over the whole of imprints/subjects/agents
+on every call, although the answer only changes when the database does.
+``refresh_facet_summary`` materializes those counts into ``facet_counts``
+and ``facet_decade_counts`` (see m3_schema.sql); readers take them from
+there while the summary is current and fall back to the live GROUP BY
+otherwise.
+
+Staleness is detected two ways, both recorded in ``facet_summary_meta``:
+- ``generation``: the ``PRAGMA user_version`` the summary was built at
+  (writers bump it via ``scripts.utils.db_generation``)
+- ``dirty``: set by triggers on every write to a summarized column, so
+  corrections that do not bump the generation (QA fixes) are caught too
+
+Writers that change norms (M3 build/update, the metadata feedback loop)
+refresh the summary before committing; ``fix_32_add_facet_summary``
+rebuilds it by hand after other fixes.
+
+An index delta touches a handful of records, so ``update_index`` does not
+rebuild every facet: it records the facet values of the changed records
+before and after the change (``track_facet_values``) and recomputes only
+those rows. Column-keyed facets are answered from their indexes; decade,
+century, topic and subject_root are keyed on expressions and still scan
+their source table, but aggregate only the tracked values.
+
+Usage:
+    bump_db_generation(conn)
+    refresh_facet_summary(conn)
+    conn.commit()
+
+    # delta: old values, change, new values
+    track_facet_values(conn, mms_ids)
+    ...
+    track_facet_values(conn, mms_ids)
+    bump_db_generation(conn)
+    refresh_facet_summary(conn, tracked_only=True)
+    conn.commit()
+
+    rows = read_facet(conn, "place", limit=10)  # None when stale/missing
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence, Tuple
+
+# Tidy subject form shared with the network topic endpoints: strip trailing
+# periods/spaces (merging 'Bible.' with 'Bible') and render LCSH ' -- '
+# subdivisions as ' — ' for display.
+TIDY_SUBJECT_SQL = "replace(replace(rtrim(value, '. '), ' -- ', ' — '), '. — ', ' — ')"
+
+# LCSH root of a tidy heading (text before the first ' — ', trailing
+# periods/spaces stripped); the SQL twin of network._topic_root
+_SUBJECT_ROOT_SQL = (
+    "rtrim(CASE WHEN instr(subj, ' — ') > 0 "
+    "THEN substr(subj, 1, instr(subj, ' — ') - 1) ELSE subj END, '. ')"
+)
+
+# Facets whose values are years / decade starts / century numbers
+DATE_FACETS = ("year", "decade", "century")
+
+# Per facet: (source, key, filter, extra columns). The summary row of a
+# value is COUNT(DISTINCT record_id) over the source rows whose key is that
+# value; extra fills display / year_min / year_max.
+_FACET_SPECS = {
+    "place": (
+        "imprints i", "i.place_norm", "i.place_norm IS NOT NULL AND i.place_norm != ''",
+        """(SELECT i2.place_display FROM imprints i2
+            WHERE i2.place_norm = i.place_norm AND i2.place_display IS NOT NULL LIMIT 1),
+           MIN(i.date_start), MAX(i.date_start)""",
+    ),
+    "publisher": (
+        "imprints", "publisher_norm", "publisher_norm IS NOT NULL AND publisher_norm != ''",
+        "NULL, NULL, NULL",
+    ),
+    "country": (
+        "imprints", "country_name", "country_name IS NOT NULL AND country_name != ''",
+        "NULL, NULL, NULL",
+    ),
+    "language": ("languages", "code", None, "NULL, NULL, NULL"),
+    "year": ("imprints", "date_start", "date_start IS NOT NULL", "NULL, NULL, NULL"),
+    "decade": ("imprints", "date_start / 10 * 10", "date_start IS NOT NULL", "NULL, NULL, NULL"),
+    "century": (
+        "imprints", "(date_start - 1) / 100 + 1", "date_start IS NOT NULL", "NULL, NULL, NULL",
+    ),
+    "subject": ("subjects", "value", None, "NULL, NULL, NULL"),
+    "topic": (
+        "subjects", TIDY_SUBJECT_SQL, "value IS NOT NULL AND TRIM(value) != ''",
+        "MAX(value_he), NULL, NULL",
+    ),
+    "subject_root": (
+        f"""(SELECT record_id, {TIDY_SUBJECT_SQL} AS subj FROM subjects
+             WHERE value IS NOT NULL AND TRIM(value) != '')""",
+        _SUBJECT_ROOT_SQL, None, "NULL, NULL, NULL",
+    ),
+    "agent": ("agents", "agent_norm", None, "NULL, NULL, NULL"),
+    "role": ("agents", "role_norm", None, "NULL, NULL, NULL"),
+}
+
+# Per-decade counts (facet_decade_counts): (source, key, filter, decade,
+# record id column)
+_DECADE_SPECS = {
+    "place": (
+        "imprints", "place_norm", "place_norm IS NOT NULL AND date_start IS NOT NULL",
+        "(date_start / 10) * 10", "record_id",
+    ),
+    "topic": (
+        "subjects s JOIN imprints i ON i.record_id = s.record_id",
+        TIDY_SUBJECT_SQL,
+        "i.date_start IS NOT NULL AND s.value IS NOT NULL AND TRIM(s.value) != ''",
+        "(i.date_start / 10) * 10", "s.record_id",
+    ),
+}
+
+# Incremental refresh: facet values touched by a write (see track_facet_values).
+# value is TEXT like facet_counts.value, so tracked years/decades compare
+# equal to the stored ones.
+_TRACKED_VALUES = "temp.facet_refresh_values"
+
+
+def _where(*conditions: Optional[str]) -> str:
+    present = [c for c in conditions if c]
+    return f"WHERE {' AND '.join(present)}" if present else ""
+
+
+def _tracked_scope(facet: str, key: str) -> str:
+    return f"{key} IN (SELECT value FROM {_TRACKED_VALUES} WHERE facet = '{facet}')"
+
+
+def _facet_count_sql(facet: str, tracked_only: bool = False) -> str:
+    source, key, condition, extra = _FACET_SPECS[facet]
+    scope = _tracked_scope(facet, key) if tracked_only else None
+    return (
+        f"SELECT '{facet}', {key}, COUNT(DISTINCT record_id), {extra} "
+        f"FROM {source} {_where(condition, scope)} GROUP BY {key}"
+    )
+
+
+def _decade_count_sql(facet: str, tracked_only: bool = False) -> str:
+    source, key, condition, decade, record_id = _DECADE_SPECS[facet]
+    scope = _tracked_scope(facet, key) if tracked_only else None
+    return (
+        f"SELECT '{facet}', {key}, {decade}, COUNT(DISTINCT {record_id}) "
+        f"FROM {source} {_where(condition, scope)} GROUP BY {key}, {decade}"
+    )
+
+
+FACET_COUNT_SQL = {facet: _facet_count_sql(facet) for facet in _FACET_SPECS}
+
+FACET_SUMMARY_FACETS = tuple(FACET_COUNT_SQL)
+
+
+def facet_summary_state(conn: sqlite3.Connection) -> Optional[Tuple[int, bool]]:
+    """(generation, dirty) of the summary, or None if the tables are absent."""
+    try:
+        row = conn.execute(
+            "SELECT generation, dirty FROM facet_summary_meta WHERE id = 1"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    if row is None:
+        return None
+    return row[0], bool(row[1])
+
+
+def facet_summary_current(conn: sqlite3.Connection) -> bool:
+    """True if the summary exists, is clean and matches the DB generation."""
+    state = facet_summary_state(conn)
+    if state is None:
+        return False
+    generation, dirty = state
+    return not dirty and generation == conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def track_facet_values(conn: sqlite3.Connection, mms_ids: Sequence[str]) -> None:
+    """Remember the facet values of these records' current rows.
+
+    Call it before changing or deleting the records (their old values) and
+    again afterwards (their new values); ``refresh_facet_summary(conn,
+    tracked_only=True)`` then recomputes just those values. The values are
+    kept in a temp table, so they belong to this connection and roll back
+    with the caller's transaction.
+    """
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {_TRACKED_VALUES} "
+        "(facet TEXT, value TEXT, PRIMARY KEY (facet, value)) WITHOUT ROWID"
+    )
+    conn.execute("CREATE TABLE IF NOT EXISTS temp.facet_refresh_records (mms_id PRIMARY KEY)")
+    conn.executemany(
+        "INSERT OR IGNORE INTO temp.facet_refresh_records (mms_id) VALUES (?)",
+        [(mms_id,) for mms_id in mms_ids],
+    )
+    records = (
+        "record_id IN (SELECT r.id FROM records r "
+        "JOIN temp.facet_refresh_records t ON t.mms_id = r.mms_id)"
+    )
+    for facet, (source, key, condition, _extra) in _FACET_SPECS.items():
+        conn.execute(
+            f"INSERT OR IGNORE INTO {_TRACKED_VALUES} (facet, value) "
+            f"SELECT DISTINCT '{facet}', {key} FROM {source} {_where(condition, records)}"
+        )
+    conn.execute("DELETE FROM temp.facet_refresh_records")
+
+
+def refresh_facet_summary(conn: sqlite3.Connection, tracked_only: bool = False) -> Optional[int]:
+    """Rebuild the facet summary in the caller's transaction.
+
+    Stamps it with the current ``PRAGMA user_version``, so call this after
+    ``bump_db_generation`` and before the commit. Databases without the
+    summary tables (built before they existed) are left untouched.
+
+    Args:
+        conn: Connection holding the write transaction
+        tracked_only: Recompute only the values recorded by
+            ``track_facet_values`` (an index delta) instead of every facet
+            over the whole collection. Only valid if the summary was
+            current before the tracked records changed.
+
+    Returns:
+        The generation stamped, or None if the tables are absent.
+    """
+    if facet_summary_state(conn) is None:
+        return None
+    if tracked_only:
+        track_facet_values(conn, [])  # make sure the temp table exists
+        for table in ("facet_counts", "facet_decade_counts"):
+            conn.execute(
+                f"DELETE FROM {table} WHERE (facet, value) IN "
+                f"(SELECT facet, value FROM {_TRACKED_VALUES})"
+            )
+    else:
+        conn.execute("DELETE FROM facet_counts")
+        conn.execute("DELETE FROM facet_decade_counts")
+    for facet in _FACET_SPECS:
+        conn.execute(
+            "INSERT INTO facet_counts "
+            "(facet, value, record_count, display, year_min, year_max) "
+            + _facet_count_sql(facet, tracked_only)
+        )
+    for facet in _DECADE_SPECS:
+        conn.execute(
+            "INSERT INTO facet_decade_counts (facet, value, decade, record_count) "
+            + _decade_count_sql(facet, tracked_only)
+        )
+    if tracked_only:
+        conn.execute(f"DELETE FROM {_TRACKED_VALUES}")
+    generation = conn.execute("PRAGMA user_version").fetchone()[0]
+    conn.execute(
+        "UPDATE facet_summary_meta SET generation = ?, dirty = 0, refreshed_at = ? WHERE id = 1",
+        (generation, datetime.now(timezone.utc).isoformat()),
+    )
+    return generation
+
+
+def read_facet(
+    conn: sqlite3.Connection, facet: str, limit: Optional[int] = None
+) -> Optional[List[Tuple[Any, int]]]:
+    """(value, record_count) pairs of one summarized facet.
+
+    Date facets come back as ints in ascending order, the others by
+    descending count (ties by value).
+
+    Returns:
+        The rows, or None if the summary is missing or stale (the caller
+        then runs its live query).
+
+    Raises:
+        ValueError: If the facet is not summarized.
+    """
+    if facet not in FACET_COUNT_SQL:
+        raise ValueError(
+            f"Unknown summary facet {facet!r}. Supported: {list(FACET_SUMMARY_FACETS)}"
+        )
+    if not facet_summary_current(conn):
+        return None
+    order = (
+        "CAST(value AS INTEGER)" if facet in DATE_FACETS else "record_count DESC, value"
+    )
+    sql = f"SELECT value, record_count FROM facet_counts WHERE facet = ? ORDER BY {order}"
+    params: list = [facet]
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    rows = conn.execute(sql, params).fetchall()
+    if facet in DATE_FACETS:
+        return [(int(value), count) for value, count in rows]
+    return [(value, count) for value, count in rows]
@@ -2,7 +2,9 @@
 
 This script creates a queryable SQLite database from enriched canonical records.
 The database supports fielded queries on both M1 raw values and M2 normalized values.
-Optionally enriches authority URIs with Wikidata metadata.
+Optionally enriches authority URIs with Wikidata metadata. An existing database
+can also be updated in place from a delta of changed/deleted records
+(``update_index``).
 """
 
 import asyncio
@@ -11,7 +13,10 @@ import sqlite3
 import sys
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, List, Set, Tuple
+
+from scripts.marc.m3_facets import facet_summary_current, refresh_facet_summary, track_facet_values
+from scripts.utils.db_generation import bump_db_generation
 
 # Load MARC country code mapping
 COUNTRY_CODE_MAP = None
@@ -58,24 +63,102 @@ def collect_authority_uris(conn: sqlite3.Connection) -> Set[str]:
     return uris
 
 
+ENRICHMENT_CONCURRENCY = 8
+ENRICHMENT_WRITE_BATCH = 50
+
+_AUTHORITY_INSERT_SQL = """
+    INSERT OR REPLACE INTO authority_enrichment (
+        authority_uri, nli_id, wikidata_id, viaf_id, isni_id, loc_id,
+        label, description, person_info, place_info,
+        image_url, wikipedia_url, source, confidence,
+        fetched_at, expires_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def filter_unenriched_uris(conn: sqlite3.Connection, uris: Set[str]) -> Set[str]:
+    """Return the URIs that have no authority_enrichment row yet.
+
+    The URIs are loaded into a temp table and diffed in a single query
+    instead of one lookup per URI.
+    """
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS _enrich_candidates (uri TEXT PRIMARY KEY)")
+    conn.execute("DELETE FROM _enrich_candidates")
+    conn.executemany(
+        "INSERT OR IGNORE INTO _enrich_candidates (uri) VALUES (?)",
+        ((uri,) for uri in uris)
+    )
+    cursor = conn.execute("""
+        SELECT uri FROM _enrich_candidates
+        EXCEPT
+        SELECT authority_uri FROM authority_enrichment
+    """)
+    pending = {row[0] for row in cursor}
+    conn.execute("DROP TABLE _enrich_candidates")
+    return pending
+
+
+def _authority_enrichment_row(uri: str, result) -> tuple:
+    """Build the authority_enrichment row for an enrichment result."""
+    fetched_at = datetime.now(timezone.utc).isoformat()
+    expires_at = (datetime.now(timezone.utc) + timedelta(days=DEFAULT_ENRICHMENT_TTL_DAYS)).isoformat()
+
+    # Extract NLI ID from URI
+    nli_id = None
+    if "/authorities/" in uri:
+        part = uri.split("/authorities/")[-1]
+        if part.endswith(".jsonld"):
+            nli_id = part[:-7]
+        else:
+            nli_id = part.split(".")[0]
+
+    # Serialize person/place info
+    person_info_json = None
+    place_info_json = None
+    if result.person_info:
+        person_info_json = json.dumps(result.person_info.model_dump())
+    if result.place_info:
+        place_info_json = json.dumps(result.place_info.model_dump())
+
+    return (
+        uri, nli_id, result.wikidata_id, result.viaf_id,
+        result.isni_id, result.loc_id, result.label, result.description,
+        person_info_json, place_info_json, result.image_url,
+        result.wikipedia_url, result.sources_used[0].value if result.sources_used else 'unknown',
+        result.confidence, fetched_at, expires_at
+    )
+
+
 async def enrich_authority_uris(
     conn: sqlite3.Connection,
     uris: Set[str],
     enrichment_service=None,
-    rate_limit_delay: float = 1.0
+    rate_limit_delay: float = 1.0,
+    concurrency: int = ENRICHMENT_CONCURRENCY,
+    write_batch: int = ENRICHMENT_WRITE_BATCH
 ) -> Dict[str, int]:
     """Enrich authority URIs with Wikidata metadata.
 
+    URIs already in ``authority_enrichment`` are skipped up front. The rest
+    are enriched by up to ``concurrency`` workers sharing one pooled HTTP
+    client. A token bucket starts at most one lookup per
+    ``rate_limit_delay`` seconds on average, so throughput is bounded by the
+    remote rate limit rather than by request latency. Results are written
+    in transactions of ``write_batch`` rows.
+
     Args:
         conn: SQLite connection
         uris: Set of authority URIs to enrich
         enrichment_service: Optional EnrichmentService instance (created if None)
-        rate_limit_delay: Delay between requests in seconds
+        rate_limit_delay: Average delay between lookup starts in seconds (0 = unlimited)
+        concurrency: Maximum lookups in flight
+        write_batch: Rows per write transaction
 
     Returns:
         Statistics dict with counts
     """
     from scripts.enrichment.enrichment_service import EnrichmentService
+    from scripts.enrichment.http_pool import TokenBucket, shared_http_client
     from scripts.enrichment.models import EntityType
 
     stats = {
@@ -89,94 +172,118 @@ async def enrich_authority_uris(
     if not uris:
         return stats
 
+    pending = filter_unenriched_uris(conn, uris)
+    stats['cached'] = len(uris) - len(pending)
+    if not pending:
+        return stats
+
     # Create enrichment service if not provided
-    if enrichment_service is None:
+    owns_service = enrichment_service is None
+    if owns_service:
         cache_path = Path("data/enrichment/cache.db")
         enrichment_service = EnrichmentService(cache_db_path=cache_path)
 
-    print(f"\nEnriching {len(uris)} unique authority URIs...")
-
-    for i, uri in enumerate(uris):
-        try:
-            # Progress indicator
-            if (i + 1) % 10 == 0 or i == 0:
-                print(f"  Enriching {i + 1}/{len(uris)} URIs...")
-
-            # Check if already in authority_enrichment table
-            cursor = conn.execute(
-                "SELECT id FROM authority_enrichment WHERE authority_uri = ?",
-                (uri,)
-            )
-            if cursor.fetchone():
-                stats['cached'] += 1
-                continue
-
-            # Enrich via EnrichmentService
-            # Agents are the most common entity type for authority URIs
-            result = await enrichment_service.enrich_entity(
-                entity_type=EntityType.AGENT,
-                entity_value=uri,  # Use URI as value (service will extract ID)
-                nli_authority_uri=uri,
-            )
+    print(f"\nEnriching {len(pending)} unique authority URIs "
+          f"({stats['cached']} already enriched)...")
+
+    workers = max(1, min(concurrency, len(pending)))
+    bucket = TokenBucket(1.0 / rate_limit_delay, capacity=workers) if rate_limit_delay > 0 else None
+    queue: asyncio.Queue = asyncio.Queue()
+    for uri in sorted(pending):
+        queue.put_nowait(uri)
+    rows: List[tuple] = []
+    done = 0
+
+    def flush_rows():
+        if rows:
+            with conn:
+                conn.executemany(_AUTHORITY_INSERT_SQL, rows)
+            rows.clear()
+
+    async def worker():
+        nonlocal done
+        while True:
+            try:
+                uri = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                if bucket is not None:
+                    await bucket.acquire()
+                # Agents are the most common entity type for authority URIs
+                result = await enrichment_service.enrich_entity(
+                    entity_type=EntityType.AGENT,
+                    entity_value=uri,  # Use URI as value (service will extract ID)
+                    nli_authority_uri=uri,
+                )
+                if result and result.wikidata_id:
+                    rows.append(_authority_enrichment_row(uri, result))
+                    stats['enriched'] += 1
+                    if len(rows) >= write_batch:
+                        flush_rows()
+                else:
+                    stats['no_wikidata'] += 1
+            except Exception as e:
+                print(f"    Error enriching {uri[:60]}...: {e}")
+                stats['failed'] += 1
+
+            done += 1
+            if done % 50 == 0 or done == 1:
+                print(f"  Enriched {done}/{len(pending)} URIs...")
+
+    try:
+        async with shared_http_client(max_connections=workers):
+            await asyncio.gather(*(worker() for _ in range(workers)))
+    finally:
+        flush_rows()
+        if owns_service:
+            enrichment_service.close()
+    return stats
 
-            if result and result.wikidata_id:
-                # Insert into authority_enrichment table
-                fetched_at = datetime.now(timezone.utc).isoformat()
-                expires_at = (datetime.now(timezone.utc) + timedelta(days=DEFAULT_ENRICHMENT_TTL_DAYS)).isoformat()
-
-                # Extract NLI ID from URI
-                nli_id = None
-                if "/authorities/" in uri:
-                    part = uri.split("/authorities/")[-1]
-                    if part.endswith(".jsonld"):
-                        nli_id = part[:-7]
-                    else:
-                        nli_id = part.split(".")[0]
-
-                # Serialize person/place info
-                person_info_json = None
-                place_info_json = None
-                if result.person_info:
-                    person_info_json = json.dumps(result.person_info.model_dump())
-                if result.place_info:
-                    place_info_json = json.dumps(result.place_info.model_dump())
-
-                conn.execute("""
-                    INSERT OR REPLACE INTO authority_enrichment (
-                        authority_uri, nli_id, wikidata_id, viaf_id, isni_id, loc_id,
-                        label, description, person_info, place_info,
-                        image_url, wikipedia_url, source, confidence,
-                        fetched_at, expires_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    uri, nli_id, result.wikidata_id, result.viaf_id,
-                    result.isni_id, result.loc_id, result.label, result.description,
-                    person_info_json, place_info_json, result.image_url,
-                    result.wikipedia_url, result.sources_used[0].value if result.sources_used else 'unknown',
-                    result.confidence, fetched_at, expires_at
-                ))
-                conn.commit()
-                stats['enriched'] += 1
-            else:
-                stats['no_wikidata'] += 1
 
-            # Rate limiting
-            await asyncio.sleep(rate_limit_delay)
+def split_schema_statements(schema_sql: str) -> Tuple[List[str], List[str]]:
+    """Split the M3 schema into table DDL and post-load DDL.
 
-        except Exception as e:
-            print(f"    Error enriching {uri[:60]}...: {e}")
-            stats['failed'] += 1
+    Statements are split with ``sqlite3.complete_statement`` so trigger
+    bodies stay intact. ``CREATE INDEX`` and ``CREATE TRIGGER`` statements
+    go to the second list so a bulk load can create them after the data is
+    in; every statement keeps its exact text, so ``sqlite_master`` ends up
+    identical to a plain ``executescript`` of the schema.
 
-    enrichment_service.close()
-    return stats
+    Returns:
+        (table_statements, deferred_statements)
+    """
+    tables: List[str] = []
+    deferred: List[str] = []
+    buffer = ""
+    for line in schema_sql.splitlines(keepends=True):
+        buffer += line
+        if not sqlite3.complete_statement(buffer):
+            continue
+        # Drop the comment lines that precede the statement itself
+        lines = buffer.strip().splitlines()
+        buffer = ""
+        while lines and (not lines[0].strip() or lines[0].lstrip().startswith("--")):
+            lines.pop(0)
+        statement = "\n".join(lines)
+        if statement.upper().startswith(("CREATE INDEX", "CREATE UNIQUE INDEX", "CREATE TRIGGER")):
+            deferred.append(statement)
+        else:
+            tables.append(statement)
+    return tables, deferred
 
 
-def create_database(db_path: Path, schema_path: Path) -> sqlite3.Connection:
+def create_database(
+    db_path: Path, schema_path: Path, defer_indexes: bool = False
+) -> sqlite3.Connection:
     """Create SQLite database with M3 schema.
 
     Args:
         db_path: Path to SQLite database file
         schema_path: Path to SQL schema file
+        defer_indexes: Create only tables; the caller runs the statements
+            from ``split_schema_statements`` (indexes and FTS triggers)
+            after loading, see ``finish_bulk_load``
 
     Returns:
         Database connection
@@ -192,73 +299,130 @@ def create_database(db_path: Path, schema_path: Path) -> sqlite3.Connection:
     with open(schema_path, 'r', encoding='utf-8') as f:
         schema_sql = f.read()
 
-    conn.executescript(schema_sql)
+    if defer_indexes:
+        tables, _ = split_schema_statements(schema_sql)
+        for statement in tables:
+            conn.execute(statement)
+    else:
+        conn.executescript(schema_sql)
     conn.commit()
 
     return conn
 
 
-def index_record(conn: sqlite3.Connection, record: dict, source_file: str, line_number: int) -> dict:
-    """Index a single M1+M2 record into SQLite.
+# Rebuilds the FTS tables from their source tables in one statement each
+# (same repopulation as fix_20_rebuild_fts). subjects_fts is contentless
+# and the trigram agent tables store derived keys, so those are filled
+# directly rather than with the 'rebuild' command.
+FTS_REPOPULATE_SQL = """
+INSERT INTO titles_fts(titles_fts) VALUES ('rebuild');
+INSERT INTO subjects_fts(rowid, mms_id, value)
+SELECT s.id, r.mms_id, s.value || ' ' || COALESCE(s.value_he, '')
+FROM subjects s JOIN records r ON s.record_id = r.id;
+INSERT INTO imprints_fts(imprints_fts) VALUES ('rebuild');
+INSERT INTO agents_fts(rowid, agent_key, agent_raw)
+SELECT id, REPLACE(agent_norm, ',', ''), agent_raw FROM agents;
+INSERT INTO agent_aliases_fts(rowid, alias_key)
+SELECT id, REPLACE(alias_form_lower, ',', '') FROM agent_aliases;
+"""
+
+
+def begin_bulk_load(conn: sqlite3.Connection) -> None:
+    """Apply loading pragmas for a from-scratch build.
+
+    The database file is discarded on failure anyway, so fsyncs buy
+    nothing during the load. The journal is kept in memory rather than
+    turned OFF because batch savepoints still need to roll back.
+    """
+    conn.execute("PRAGMA journal_mode = MEMORY")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -200000")
+
+
+def finish_bulk_load(conn: sqlite3.Connection, deferred_statements: List[str]) -> None:
+    """Create deferred indexes, repopulate FTS, then restore normal pragmas."""
+    for statement in deferred_statements:
+        if statement.upper().startswith("CREATE TRIGGER"):
+            continue
+        conn.execute(statement)
+    conn.executescript(FTS_REPOPULATE_SQL)
+    # Triggers last, so the repopulation above is not doubled by them
+    for statement in deferred_statements:
+        if statement.upper().startswith("CREATE TRIGGER"):
+            conn.execute(statement)
+    conn.commit()
+    conn.execute("PRAGMA journal_mode = DELETE")
+    conn.execute("PRAGMA synchronous = FULL")
+
+
+# INSERT statements for the child tables of a record, in the order
+# index_record has always written them (row ids follow this order).
+CHILD_INSERT_SQL = {
+    'titles': "INSERT INTO titles (record_id, title_type, value, source) VALUES (?, ?, ?, ?)",
+    'imprints': """
+        INSERT INTO imprints (
+            record_id, occurrence,
+            date_raw, place_raw, publisher_raw, manufacturer_raw, source_tags,
+            date_start, date_end, date_label, date_confidence, date_method,
+            place_norm, place_display, place_confidence, place_method,
+            publisher_norm, publisher_display, publisher_confidence, publisher_method,
+            country_code, country_name
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    'subjects': """
+        INSERT INTO subjects (record_id, value, source_tag, scheme, heading_lang, authority_uri, parts, source)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    'agents': """
+        INSERT INTO agents (
+            record_id, agent_index,
+            agent_raw, agent_type, role_raw, role_source, authority_uri,
+            agent_norm, agent_confidence, agent_method, agent_notes,
+            role_norm, role_confidence, role_method,
+            provenance_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    'languages': "INSERT INTO languages (record_id, code, source) VALUES (?, ?, ?)",
+    'notes': "INSERT INTO notes (record_id, tag, value, source) VALUES (?, ?, ?, ?)",
+    'physical_descriptions': "INSERT INTO physical_descriptions (record_id, value, source) VALUES (?, ?, ?)",
+}
+
+def build_child_rows(record: dict, record_id: int) -> Dict[str, List[tuple]]:
+    """Build the child-table rows for one M1+M2 record.
 
     Args:
-        conn: SQLite connection
         record: M1+M2 record (dict)
-        source_file: Source JSONL filename
-        line_number: Line number in source file
+        record_id: ``records.id`` the rows belong to
 
     Returns:
-        Statistics dict with counts
+        Dict mapping child table name to its parameter tuples, matching
+        ``CHILD_INSERT_SQL``
     """
-    stats = {
-        'titles': 0,
-        'imprints': 0,
-        'subjects': 0,
-        'agents': 0,
-        'languages': 0,
-        'notes': 0,
-        'physical_descriptions': 0
-    }
-
-    cursor = conn.cursor()
-
-    # Insert record
+    rows: Dict[str, List[tuple]] = {table: [] for table in CHILD_INSERT_SQL}
     mms_id = record['source']['control_number']['value']
-    created_at = datetime.now(timezone.utc).isoformat()
 
-    cursor.execute(
-        "INSERT INTO records (mms_id, source_file, created_at, jsonl_line_number) VALUES (?, ?, ?, ?)",
-        (mms_id, source_file, created_at, line_number)
-    )
-    record_id = cursor.lastrowid
-
-    # Insert main title
+    # Main title
     if record.get('title'):
         title_data = record['title']
-        cursor.execute(
-            "INSERT INTO titles (record_id, title_type, value, source) VALUES (?, ?, ?, ?)",
+        rows['titles'].append(
             (record_id, 'main', title_data['value'], json.dumps(title_data['source']))
         )
-        stats['titles'] += 1
 
-    # Insert uniform title
+    # Uniform title
     if record.get('uniform_title'):
         uniform_title_data = record['uniform_title']
-        cursor.execute(
-            "INSERT INTO titles (record_id, title_type, value, source) VALUES (?, ?, ?, ?)",
+        rows['titles'].append(
             (record_id, 'uniform', uniform_title_data['value'], json.dumps(uniform_title_data['source']))
         )
-        stats['titles'] += 1
 
-    # Insert variant titles
+    # Variant titles
     for variant_title in record.get('variant_titles', []):
-        cursor.execute(
-            "INSERT INTO titles (record_id, title_type, value, source) VALUES (?, ?, ?, ?)",
+        rows['titles'].append(
             (record_id, 'variant', variant_title['value'], json.dumps(variant_title['source']))
         )
-        stats['titles'] += 1
 
-    # Insert imprints (M1 + M2)
+    # Imprints (M1 + M2)
     m2_data = record.get('m2', {})
     imprints_norm = m2_data.get('imprints_norm', [])
     m1_imprint_count = len(record.get('imprints', []))
@@ -333,16 +497,7 @@ def index_record(conn: sqlite3.Connection, record: dict, source_file: str, line_
                 # Store the clean code in the database
                 country_code = clean_code if clean_code else country_code
 
-        cursor.execute("""
-            INSERT INTO imprints (
-                record_id, occurrence,
-                date_raw, place_raw, publisher_raw, manufacturer_raw, source_tags,
-                date_start, date_end, date_label, date_confidence, date_method,
-                place_norm, place_display, place_confidence, place_method,
-                publisher_norm, publisher_display, publisher_confidence, publisher_method,
-                country_code, country_name
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        rows['imprints'].append((
             record_id, i,
             date_raw, place_raw, publisher_raw, manufacturer_raw, source_tags,
             date_start, date_end, date_label, date_confidence, date_method,
@@ -350,18 +505,14 @@ def index_record(conn: sqlite3.Connection, record: dict, source_file: str, line_
             publisher_norm, publisher_display, publisher_confidence, publisher_method,
             country_code, country_name
         ))
-        stats['imprints'] += 1
 
-    # Insert subjects
+    # Subjects
     for subject in record.get('subjects', []):
         scheme = subject.get('scheme', {}).get('value') if subject.get('scheme') else None
         heading_lang = subject.get('heading_lang', {}).get('value') if subject.get('heading_lang') else None
         authority_uri = subject.get('authority_uri', {}).get('value') if subject.get('authority_uri') else None
 
-        cursor.execute("""
-            INSERT INTO subjects (record_id, value, source_tag, scheme, heading_lang, authority_uri, parts, source)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        rows['subjects'].append((
             record_id,
             subject['value'],
             subject['source_tag'],
@@ -371,9 +522,8 @@ def index_record(conn: sqlite3.Connection, record: dict, source_file: str, line_
             json.dumps(subject['parts']),
             json.dumps(subject['source'])
         ))
-        stats['subjects'] += 1
 
-    # Insert agents (Stage 4: M1 + M2 fields)
+    # Agents (Stage 4: M1 + M2 fields)
     agents_m1 = record.get('agents', [])
     agents_m2 = m2_data.get('agents_norm', [])
 
@@ -384,7 +534,7 @@ def index_record(conn: sqlite3.Connection, record: dict, source_file: str, line_
             idx, agent_norm_obj, role_norm_obj = agent_tuple
             agents_m2_lookup[idx] = (agent_norm_obj, role_norm_obj)
 
-    # Insert each agent with M1 + M2 data
+    # Each agent with M1 + M2 data
     for idx, agent_m1 in enumerate(agents_m1):
         agent_index = agent_m1.get('agent_index')
         if agent_index is None:
@@ -427,15 +577,7 @@ def index_record(conn: sqlite3.Connection, record: dict, source_file: str, line_
             role_confidence = 0.5
             role_method = 'fallback'
 
-        cursor.execute("""
-            INSERT INTO agents (
-                record_id, agent_index,
-                agent_raw, agent_type, role_raw, role_source, authority_uri,
-                agent_norm, agent_confidence, agent_method, agent_notes,
-                role_norm, role_confidence, role_method,
-                provenance_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        rows['agents'].append((
             record_id,
             agent_index,
             agent_raw,
@@ -452,63 +594,306 @@ def index_record(conn: sqlite3.Connection, record: dict, source_file: str, line_
             role_method,
             json.dumps(provenance)
         ))
-        stats['agents'] += 1
 
-    # Insert languages
+    # Languages
     for lang in record.get('languages', []):
-        cursor.execute("""
-            INSERT INTO languages (record_id, code, source)
-            VALUES (?, ?, ?)
-        """, (
-            record_id,
-            lang['value'],  # Changed from lang['code'] to lang['value']
-            json.dumps(lang['source'])
-        ))
-        stats['languages'] += 1
+        rows['languages'].append((record_id, lang['value'], json.dumps(lang['source'])))
 
-    # Insert notes
+    # Notes
     for note in record.get('notes', []):
-        cursor.execute("""
-            INSERT INTO notes (record_id, tag, value, source)
-            VALUES (?, ?, ?, ?)
-        """, (
-            record_id,
-            note['tag'],
-            note['value'],
-            json.dumps(note['source'])
-        ))
-        stats['notes'] += 1
+        rows['notes'].append((record_id, note['tag'], note['value'], json.dumps(note['source'])))
 
-    # Insert physical descriptions
+    # Physical descriptions
     for phys_desc in record.get('physical_description', []):
-        cursor.execute("""
-            INSERT INTO physical_descriptions (record_id, value, source)
-            VALUES (?, ?, ?)
-        """, (
-            record_id,
-            phys_desc['value'],
-            json.dumps(phys_desc['source'])
-        ))
-        stats['physical_descriptions'] += 1
+        rows['physical_descriptions'].append(
+            (record_id, phys_desc['value'], json.dumps(phys_desc['source']))
+        )
+
+    return rows
+
+
+def index_record(conn: sqlite3.Connection, record: dict, source_file: str, line_number: int) -> dict:
+    """Index a single M1+M2 record into SQLite.
+
+    Args:
+        conn: SQLite connection
+        record: M1+M2 record (dict)
+        source_file: Source JSONL filename
+        line_number: Line number in source file
+
+    Returns:
+        Statistics dict with counts
+    """
+    cursor = conn.cursor()
+
+    # Insert record
+    mms_id = record['source']['control_number']['value']
+    created_at = datetime.now(timezone.utc).isoformat()
+
+    cursor.execute(
+        "INSERT INTO records (mms_id, source_file, created_at, jsonl_line_number) VALUES (?, ?, ?, ?)",
+        (mms_id, source_file, created_at, line_number)
+    )
+    record_id = cursor.lastrowid
+
+    return _insert_child_rows(cursor, build_child_rows(record, record_id))
+
+
+def _insert_child_rows(cursor: sqlite3.Cursor, rows: Dict[str, List[tuple]]) -> dict:
+    """Insert rows from ``build_child_rows``; returns per-table row counts."""
+    for table, table_rows in rows.items():
+        if table_rows:
+            cursor.executemany(CHILD_INSERT_SQL[table], table_rows)
+
+    # Per-table row counts (stats keys are the child table names)
+    return {table: len(table_rows) for table, table_rows in rows.items()}
+
+
+def _delete_child_rows(cursor: sqlite3.Cursor, record_id: int) -> None:
+    """Delete a record's child rows; the FTS delete triggers keep FTS in sync."""
+    for table in CHILD_INSERT_SQL:
+        cursor.execute(f"DELETE FROM {table} WHERE record_id = ?", (record_id,))
+
+
+def upsert_record(conn: sqlite3.Connection, record: dict, source_file: str, line_number: int) -> str:
+    """Insert a record, or replace the rows of an already indexed one.
+
+    An existing record keeps its ``records.id`` (tables such as
+    ``record_scope_flags`` reference it); only its child rows are rewritten.
+
+    Returns:
+        'inserted' or 'updated'
+    """
+    mms_id = record['source']['control_number']['value']
+    row = conn.execute("SELECT id FROM records WHERE mms_id = ?", (mms_id,)).fetchone()
+    if row is None:
+        index_record(conn, record, source_file, line_number)
+        return 'inserted'
+
+    record_id = row[0]
+    cursor = conn.cursor()
+    _delete_child_rows(cursor, record_id)
+    cursor.execute(
+        "UPDATE records SET source_file = ?, created_at = ?, jsonl_line_number = ? WHERE id = ?",
+        (source_file, datetime.now(timezone.utc).isoformat(), line_number, record_id)
+    )
+    _insert_child_rows(cursor, build_child_rows(record, record_id))
+    return 'updated'
+
+
+def delete_record(conn: sqlite3.Connection, mms_id: str) -> bool:
+    """Delete a record and its child rows. Returns False if it was not indexed."""
+    row = conn.execute("SELECT id FROM records WHERE mms_id = ?", (mms_id,)).fetchone()
+    if row is None:
+        return False
+    cursor = conn.cursor()
+    _delete_child_rows(cursor, row[0])
+    cursor.execute("DELETE FROM records WHERE id = ?", (row[0],))
+    return True
+
+
+def update_index(delta_jsonl: Path, db_path: Path) -> dict:
+    """Apply a delta of changed and deleted records to an existing index.
+
+    Each line of *delta_jsonl* is either a full M1+M2 record (inserted, or
+    replacing the indexed record with the same MMS ID) or a deletion marker
+    ``{"mms_id": "...", "deleted": true}``. Only the affected ``records``
+    rows and their child rows are touched; the FTS tables follow through
+    the schema triggers. Authority, enrichment and network tables are left
+    as they are. Each line is applied atomically, the whole delta in one
+    transaction.
+
+    The facet summary is refreshed for the facet values of the delta's
+    records only (their rows before and after the change), unless it was
+    already stale, in which case it is rebuilt in full.
+
+    Args:
+        delta_jsonl: Path to the delta JSONL file
+        db_path: Path to the existing SQLite database
+
+    Returns:
+        Statistics dict
+    """
+    stats = {
+        'inserted': 0,
+        'updated': 0,
+        'deleted': 0,
+        'not_found': 0,
+        'errors': []
+    }
+
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA foreign_keys = ON")
+    incremental_facets = facet_summary_current(conn)
+    delta_mms_ids: List[str] = []
+
+    print(f"Applying delta {delta_jsonl} to {db_path}")
+
+    with open(delta_jsonl, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            conn.execute("SAVEPOINT delta_line")
+            try:
+                entry = json.loads(line)
+                if entry.get('deleted'):
+                    mms_id = entry.get('mms_id') or entry['source']['control_number']['value']
+                else:
+                    mms_id = entry['source']['control_number']['value']
+                if incremental_facets:
+                    # Facet values of the rows about to be replaced/deleted
+                    track_facet_values(conn, [mms_id])
+                if entry.get('deleted'):
+                    if delete_record(conn, mms_id):
+                        stats['deleted'] += 1
+                    else:
+                        stats['not_found'] += 1
+                else:
+                    outcome = upsert_record(conn, entry, delta_jsonl.name, line_number)
+                    stats[outcome] += 1
+                    delta_mms_ids.append(mms_id)
+                conn.execute("RELEASE delta_line")
+            except Exception as e:
+                conn.execute("ROLLBACK TO delta_line")
+                conn.execute("RELEASE delta_line")
+                error_msg = f"Line {line_number}: {str(e)}"
+                stats['errors'].append(error_msg)
+                print(f"  ERROR: {error_msg}")
+
+    # Invalidate results cached against the previous content
+    bump_db_generation(conn)
+    if incremental_facets:
+        track_facet_values(conn, delta_mms_ids)  # values of the new rows
+    refresh_facet_summary(conn, tracked_only=incremental_facets)
+    conn.commit()
+    conn.close()
 
     return stats
 
 
+# Records buffered per executemany batch in bulk mode
+BULK_BATCH_RECORDS = 5000
+
+_RECORDS_INSERT_SQL = (
+    "INSERT INTO records (id, mms_id, source_file, created_at, jsonl_line_number) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def _write_record_batch(conn: sqlite3.Connection, batch: List[tuple]) -> None:
+    """Insert a batch of (records_row, child_rows) with one executemany per table."""
+    conn.executemany(_RECORDS_INSERT_SQL, [records_row for records_row, _ in batch])
+    for table, sql in CHILD_INSERT_SQL.items():
+        rows = [row for _, child_rows in batch for row in child_rows[table]]
+        if rows:
+            conn.executemany(sql, rows)
+
+
+def _flush_record_batch(conn: sqlite3.Connection, batch: List[tuple], stats: dict) -> None:
+    """Write a batch inside a savepoint, replaying record-by-record on failure.
+
+    A constraint violation in one record must not drop the whole batch, so
+    on error the batch is rolled back and each record is retried in its
+    own savepoint; the failing ones are reported like in the serial path.
+    """
+    try:
+        conn.execute("SAVEPOINT bulk_batch")
+        _write_record_batch(conn, batch)
+        conn.execute("RELEASE bulk_batch")
+        written = batch
+    except sqlite3.DatabaseError:
+        conn.execute("ROLLBACK TO bulk_batch")
+        conn.execute("RELEASE bulk_batch")
+        written = []
+        for item in batch:
+            try:
+                conn.execute("SAVEPOINT bulk_record")
+                _write_record_batch(conn, [item])
+                conn.execute("RELEASE bulk_record")
+                written.append(item)
+            except sqlite3.DatabaseError as e:
+                conn.execute("ROLLBACK TO bulk_record")
+                conn.execute("RELEASE bulk_record")
+                error_msg = f"Line {item[0][4]}: {str(e)}"
+                stats['errors'].append(error_msg)
+                print(f"  ERROR: {error_msg}")
+
+    for _, child_rows in written:
+        stats['total_records'] += 1
+        for table, rows in child_rows.items():
+            stats[table] += len(rows)
+
+
+def _bulk_index_jsonl(
+    conn: sqlite3.Connection, jsonl_path: Path, stats: dict, batch_records: int
+) -> None:
+    """Load a fresh database from JSONL with batched executemany inserts.
+
+    Record ids are assigned here (the database is new, so they are the same
+    1..N the AUTOINCREMENT column would hand out), which lets child rows be
+    built before their parent row is inserted.
+    """
+    batch: List[tuple] = []
+    seen_mms_ids: Set[str] = set()
+    next_id = 1
+
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            try:
+                record = json.loads(line.strip())
+                mms_id = record['source']['control_number']['value']
+                if mms_id in seen_mms_ids:
+                    raise sqlite3.IntegrityError("UNIQUE constraint failed: records.mms_id")
+                child_rows = build_child_rows(record, next_id)
+            except Exception as e:
+                error_msg = f"Line {line_number}: {str(e)}"
+                stats['errors'].append(error_msg)
+                print(f"  ERROR: {error_msg}")
+                continue
+
+            created_at = datetime.now(timezone.utc).isoformat()
+            batch.append(
+                ((next_id, mms_id, jsonl_path.name, created_at, line_number), child_rows)
+            )
+            seen_mms_ids.add(mms_id)
+            next_id += 1
+
+            if len(batch) >= batch_records:
+                _flush_record_batch(conn, batch, stats)
+                conn.commit()
+                batch = []
+                print(f"  Indexed {stats['total_records']} records...")
+
+    if batch:
+        _flush_record_batch(conn, batch, stats)
+    conn.commit()
+
+
 def build_index(
     jsonl_path: Path,
     db_path: Path,
     schema_path: Path,
     enrich: bool = False,
-    rate_limit_delay: float = 1.0
+    rate_limit_delay: float = 1.0,
+    bulk: bool = True,
+    batch_records: int = BULK_BATCH_RECORDS
 ) -> dict:
     """Build SQLite index from M1+M2 JSONL.
 
+    In bulk mode (default) rows are inserted with ``executemany`` in large
+    transactions under loading pragmas, B-tree indexes are created after the
+    load and the FTS tables are repopulated in one pass instead of through
+    per-row triggers. The resulting schema is identical to the
+    record-by-record path (``bulk=False``).
+
     Args:
         jsonl_path: Path to M1+M2 JSONL file
         db_path: Path to output SQLite database
         schema_path: Path to SQL schema file
         enrich: Whether to enrich authority URIs with Wikidata metadata
         rate_limit_delay: Delay between enrichment requests in seconds
+        bulk: Use the bulk-load path
+        batch_records: Records per executemany batch in bulk mode
 
     Returns:
         Statistics dict
@@ -528,39 +913,55 @@ def build_index(
 
     # Create database
     print(f"Creating database: {db_path}")
-    conn = create_database(db_path, schema_path)
+    if bulk:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            _, deferred_statements = split_schema_statements(f.read())
+        conn = create_database(db_path, schema_path, defer_indexes=True)
+        begin_bulk_load(conn)
+    else:
+        conn = create_database(db_path, schema_path)
 
     # Process JSONL
     print(f"Indexing records from: {jsonl_path}")
 
-    with open(jsonl_path, 'r', encoding='utf-8') as f:
-        for line_number, line in enumerate(f, 1):
-            try:
-                record = json.loads(line.strip())
-
-                # Index record
-                record_stats = index_record(
-                    conn,
-                    record,
-                    jsonl_path.name,
-                    line_number
-                )
-
-                # Update totals
-                stats['total_records'] += 1
-                for key in record_stats:
-                    stats[key] += record_stats[key]
-
-                # Progress indicator
-                if stats['total_records'] % 500 == 0:
-                    print(f"  Indexed {stats['total_records']} records...")
-
-            except Exception as e:
-                error_msg = f"Line {line_number}: {str(e)}"
-                stats['errors'].append(error_msg)
-                print(f"  ERROR: {error_msg}")
-
-    # Commit after indexing
+    if bulk:
+        _bulk_index_jsonl(conn, jsonl_path, stats, batch_records)
+        print("  Creating indexes and FTS tables...")
+        finish_bulk_load(conn, deferred_statements)
+    else:
+        with open(jsonl_path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line.strip())
+
+                    # Index record
+                    record_stats = index_record(
+                        conn,
+                        record,
+                        jsonl_path.name,
+                        line_number
+                    )
+
+                    # Update totals
+                    stats['total_records'] += 1
+                    for key in record_stats:
+                        stats[key] += record_stats[key]
+
+                    # Progress indicator
+                    if stats['total_records'] % 500 == 0:
+                        print(f"  Indexed {stats['total_records']} records...")
+
+                except Exception as e:
+                    error_msg = f"Line {line_number}: {str(e)}"
+                    stats['errors'].append(error_msg)
+                    print(f"  ERROR: {error_msg}")
+
+        # Commit after indexing
+        conn.commit()
+
+    # Materialize the full-collection facet counts
+    print("  Building facet summary...")
+    refresh_facet_summary(conn)
     conn.commit()
 
     # Optionally enrich authority URIs
@@ -631,10 +1032,27 @@ def print_report(stats: dict, db_path: Path):
 
 def main():
     """Main CLI entry point."""
+    if len(sys.argv) == 4 and sys.argv[1] == "--update":
+        delta_path = Path(sys.argv[2])
+        db_path = Path(sys.argv[3])
+        if not delta_path.exists() or not db_path.exists():
+            print(f"Error: delta ({delta_path}) and database ({db_path}) must both exist")
+            sys.exit(1)
+        stats = update_index(delta_path, db_path)
+        print(f"\nInserted: {stats['inserted']}  Updated: {stats['updated']}  "
+              f"Deleted: {stats['deleted']}  Not found: {stats['not_found']}")
+        if stats['errors']:
+            print(f"\nWARNING: Update completed with {len(stats['errors'])} errors")
+            sys.exit(1)
+        return
+
     if len(sys.argv) < 4:
-        print("Usage: python -m scripts.marc.m3_index <m1m2_jsonl> <output_db> <schema_sql> [--enrich]")
+        print("Usage: python -m scripts.marc.m3_index <m1m2_jsonl> <output_db> <schema_sql> [--enrich] [--no-bulk]")
         print("\nOptions:")
         print("  --enrich    Enrich authority URIs with Wikidata metadata (requires network)")
+        print("  --no-bulk   Index record by record instead of the bulk-load path")
+        print("\nIncremental update from a delta (changed records + deletion markers):")
+        print("  python -m scripts.marc.m3_index --update <delta_m1m2_jsonl> <existing_db>")
         print("\nExample:")
         print("  python -m scripts.marc.m3_index \\")
         print("    data/canonical/m1m2_enriched.jsonl \\")
@@ -647,8 +1065,9 @@ def main():
     db_path = Path(sys.argv[2])
     schema_path = Path(sys.argv[3])
 
-    # Check for --enrich flag
+    # Check for --enrich / --no-bulk flags
     enrich = "--enrich" in sys.argv
+    bulk = "--no-bulk" not in sys.argv
 
     if not jsonl_path.exists():
         print(f"Error: JSONL file not found: {jsonl_path}")
@@ -662,7 +1081,7 @@ def main():
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Build index
-    stats = build_index(jsonl_path, db_path, schema_path, enrich=enrich)
+    stats = build_index(jsonl_path, db_path, schema_path, enrich=enrich, bulk=bulk)
 
     # Print report
     print_report(stats, db_path)
@@ -30,6 +30,8 @@ CREATE TABLE titles (
 CREATE INDEX idx_titles_record_id ON titles(record_id);
 CREATE INDEX idx_titles_type ON titles(title_type);
 CREATE INDEX idx_titles_value ON titles(value);
+-- Expression index matching the query layer's case-insensitive EQUALS/IN
+CREATE INDEX idx_titles_value_key ON titles(LOWER(value));
 
 -- ==============================================================================
 -- IMPRINT TABLES (M1 + M2)
@@ -81,6 +83,11 @@ CREATE INDEX idx_imprints_publisher_norm ON imprints(publisher_norm);
 CREATE INDEX idx_imprints_date_confidence ON imprints(date_confidence);
 CREATE INDEX idx_imprints_country_code ON imprints(country_code);
 CREATE INDEX idx_imprints_country_name ON imprints(country_name);
+-- Expression indexes matching the query layer's LOWER(col) predicates
+-- (scripts/query/db_adapter.py build_where_clause)
+CREATE INDEX idx_imprints_publisher_key ON imprints(LOWER(publisher_norm));
+CREATE INDEX idx_imprints_place_key ON imprints(LOWER(place_norm));
+CREATE INDEX idx_imprints_country_key ON imprints(LOWER(country_name));
 
 -- ==============================================================================
 -- SUBJECT TABLES
@@ -103,6 +110,7 @@ CREATE TABLE subjects (
 
 CREATE INDEX idx_subjects_record_id ON subjects(record_id);
 CREATE INDEX idx_subjects_value ON subjects(value);
+CREATE INDEX idx_subjects_value_key ON subjects(LOWER(value));
 CREATE INDEX idx_subjects_tag ON subjects(source_tag);
 CREATE INDEX idx_subjects_scheme ON subjects(scheme);
 CREATE INDEX idx_subjects_authority_uri ON subjects(authority_uri);
@@ -147,6 +155,8 @@ CREATE INDEX idx_agents_role_norm ON agents(role_norm);
 CREATE INDEX idx_agents_agent_role ON agents(agent_norm, role_norm);  -- Composite for "printer X" queries
 CREATE INDEX idx_agents_type ON agents(agent_type);
 CREATE INDEX idx_agents_authority_uri ON agents(authority_uri);
+-- Comma-insensitive agent key used by agent_norm EQUALS/IN filters
+CREATE INDEX idx_agents_agent_norm_key ON agents(LOWER(REPLACE(agent_norm, ',', '')));
 
 -- ==============================================================================
 -- LANGUAGE TABLE
@@ -255,6 +265,148 @@ CREATE TRIGGER subjects_fts_update AFTER UPDATE ON subjects BEGIN
     FROM records r WHERE r.id = NEW.record_id;
 END;
 
+-- Trigram substring indexes for CONTAINS filters on imprint and agent
+-- names (LIKE '%x%' on these columns is answered from the index instead
+-- of a table scan; see scripts/query/db_adapter.py).
+CREATE VIRTUAL TABLE imprints_fts USING fts5(
+    publisher_norm,
+    place_norm,
+    country_name,
+    content=imprints,
+    content_rowid=id,
+    tokenize='trigram'
+);
+
+CREATE TRIGGER imprints_fts_insert AFTER INSERT ON imprints BEGIN
+    INSERT INTO imprints_fts(rowid, publisher_norm, place_norm, country_name)
+    VALUES (new.id, new.publisher_norm, new.place_norm, new.country_name);
+END;
+
+CREATE TRIGGER imprints_fts_delete AFTER DELETE ON imprints BEGIN
+    INSERT INTO imprints_fts(imprints_fts, rowid, publisher_norm, place_norm, country_name)
+    VALUES ('delete', old.id, old.publisher_norm, old.place_norm, old.country_name);
+END;
+
+CREATE TRIGGER imprints_fts_update AFTER UPDATE ON imprints BEGIN
+    INSERT INTO imprints_fts(imprints_fts, rowid, publisher_norm, place_norm, country_name)
+    VALUES ('delete', old.id, old.publisher_norm, old.place_norm, old.country_name);
+    INSERT INTO imprints_fts(rowid, publisher_norm, place_norm, country_name)
+    VALUES (new.id, new.publisher_norm, new.place_norm, new.country_name);
+END;
+
+-- agent_key is the comma-free form the agent_norm filters compare against
+CREATE VIRTUAL TABLE agents_fts USING fts5(
+    agent_key,
+    agent_raw,
+    tokenize='trigram'
+);
+
+CREATE TRIGGER agents_fts_insert AFTER INSERT ON agents BEGIN
+    INSERT INTO agents_fts(rowid, agent_key, agent_raw)
+    VALUES (new.id, REPLACE(new.agent_norm, ',', ''), new.agent_raw);
+END;
+
+CREATE TRIGGER agents_fts_delete AFTER DELETE ON agents BEGIN
+    DELETE FROM agents_fts WHERE rowid = old.id;
+END;
+
+CREATE TRIGGER agents_fts_update AFTER UPDATE ON agents BEGIN
+    DELETE FROM agents_fts WHERE rowid = old.id;
+    INSERT INTO agents_fts(rowid, agent_key, agent_raw)
+    VALUES (new.id, REPLACE(new.agent_norm, ',', ''), new.agent_raw);
+END;
+
+-- ==============================================================================
+-- FACET SUMMARY (materialized full-collection aggregates)
+-- ==============================================================================
+
+-- Distinct-record counts per facet value over the whole collection,
+-- rebuilt by scripts/marc/m3_facets.refresh_facet_summary. Facets: place,
+-- publisher, country, language, decade, century, year, subject, topic
+-- (tidy heading), subject_root, agent, role. display/year_min/year_max
+-- are only filled where a reader needs them (place, topic).
+CREATE TABLE facet_counts (
+    facet TEXT NOT NULL,
+    value TEXT NOT NULL,
+    record_count INTEGER NOT NULL,
+    display TEXT,
+    year_min INTEGER,
+    year_max INTEGER,
+    PRIMARY KEY (facet, value)
+) WITHOUT ROWID;
+
+CREATE INDEX idx_facet_counts_rank ON facet_counts(facet, record_count DESC);
+
+-- Per-decade counts for the facets drawn on a time axis (place, topic)
+CREATE TABLE facet_decade_counts (
+    facet TEXT NOT NULL,
+    value TEXT NOT NULL,
+    decade INTEGER NOT NULL,
+    record_count INTEGER NOT NULL,
+    PRIMARY KEY (facet, value, decade)
+) WITHOUT ROWID;
+
+-- Single row: the generation (PRAGMA user_version) the summary was built
+-- at, and a dirty flag set by any write to a summarized column. Readers
+-- use the summary only while dirty = 0 and the generation is current.
+CREATE TABLE facet_summary_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generation INTEGER NOT NULL,
+    dirty INTEGER NOT NULL,
+    refreshed_at TEXT
+);
+
+INSERT INTO facet_summary_meta (id, generation, dirty) VALUES (1, 0, 1);
+
+CREATE TRIGGER facet_dirty_imprints_insert AFTER INSERT ON imprints BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_imprints_delete AFTER DELETE ON imprints BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_imprints_update
+AFTER UPDATE OF place_norm, place_display, publisher_norm, country_name, date_start ON imprints BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_subjects_insert AFTER INSERT ON subjects BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_subjects_delete AFTER DELETE ON subjects BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_subjects_update AFTER UPDATE OF value, value_he ON subjects BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_agents_insert AFTER INSERT ON agents BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_agents_delete AFTER DELETE ON agents BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_agents_update AFTER UPDATE OF agent_norm, role_norm ON agents BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_languages_insert AFTER INSERT ON languages BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_languages_delete AFTER DELETE ON languages BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
+CREATE TRIGGER facet_dirty_languages_update AFTER UPDATE OF code ON languages BEGIN
+    UPDATE facet_summary_meta SET dirty = 1 WHERE dirty = 0;
+END;
+
 -- ==============================================================================
 -- AUTHORITY ENRICHMENT TABLE (Wikidata/VIAF/NLI)
 -- ==============================================================================
@@ -399,3 +551,26 @@ CREATE INDEX IF NOT EXISTS idx_agent_alias_authority ON agent_aliases(authority_
 CREATE UNIQUE INDEX IF NOT EXISTS idx_agent_alias_form_lower ON agent_aliases(alias_form_lower);
 CREATE INDEX IF NOT EXISTS idx_agent_alias_type ON agent_aliases(alias_type);
 CREATE INDEX IF NOT EXISTS idx_agent_alias_script ON agent_aliases(script);
+CREATE INDEX IF NOT EXISTS idx_agent_alias_form_key
+    ON agent_aliases(LOWER(REPLACE(alias_form_lower, ',', '')));
+
+-- Trigram substring index over the comma-free alias key (CONTAINS filters)
+CREATE VIRTUAL TABLE IF NOT EXISTS agent_aliases_fts USING fts5(
+    alias_key,
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS agent_aliases_fts_insert AFTER INSERT ON agent_aliases BEGIN
+    INSERT INTO agent_aliases_fts(rowid, alias_key)
+    VALUES (new.id, REPLACE(new.alias_form_lower, ',', ''));
+END;
+
+CREATE TRIGGER IF NOT EXISTS agent_aliases_fts_delete AFTER DELETE ON agent_aliases BEGIN
+    DELETE FROM agent_aliases_fts WHERE rowid = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS agent_aliases_fts_update AFTER UPDATE ON agent_aliases BEGIN
+    DELETE FROM agent_aliases_fts WHERE rowid = old.id;
+    INSERT INTO agent_aliases_fts(rowid, alias_key)
+    VALUES (new.id, REPLACE(new.alias_form_lower, ',', ''));
+END;
@@ -0,0 +1,69 @@
+"""Ordered, bounded process-pool helpers for the M1/M2 pipeline stages.
+
+Both stages are pure per-record CPU work, so the input is cut into chunks
+that are mapped over a process pool. Results are yielded strictly in
+input order, which keeps the JSONL output and the accumulated statistics
+identical to a serial run. At most ``max_pending`` chunks are in flight
+at once, so memory stays bounded for arbitrarily large inputs.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split *items* into lists of at most *size* elements."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def ordered_chunk_map(
+    fn: Callable[[List[T]], R],
+    chunks: Iterable[List[T]],
+    workers: int = 1,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+    max_pending: Optional[int] = None,
+) -> Iterator[R]:
+    """Apply *fn* to each chunk, yielding results in input order.
+
+    With ``workers <= 1`` everything runs in-process (the initializer is
+    still called once), so the serial and parallel paths share one code
+    path. *fn* and *initializer* must be module-level functions so they
+    can be pickled for the worker processes.
+
+    Args:
+        fn: Function applied to each chunk
+        chunks: Iterable of chunks (consumed lazily)
+        workers: Number of worker processes
+        initializer: Optional per-worker setup function
+        initargs: Arguments for *initializer*
+        max_pending: Maximum chunks in flight (default: ``workers * 2``)
+    """
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for chunk in chunks:
+            yield fn(chunk)
+        return
+
+    limit = max_pending or workers * 2
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as pool:
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(fn, chunk))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -4,19 +4,23 @@ This module implements M1: MARC XML → Canonical JSONL
 """
 
 import json
+import sys
 import traceback
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from collections import Counter
+from xml.sax import make_parser
+from xml.sax.handler import feature_namespaces
 
 import pymarc
-from pymarc import parse_xml_to_array
 
 from .models import (
     CanonicalRecord, ImprintData, AgentData, SubjectData, NoteData,
     SourcedValue, SourceMetadata, ExtractionReport
 )
+from .parallel import chunked, ordered_chunk_map
 
 # Default directory for per-run error logs (project hard rule: on MARC
 # parse failure, log the error to data/runs/ and stop).
@@ -766,20 +770,246 @@ def parse_marc_record(record: pymarc.Record, source_file: Optional[str] = None)
     return canonical
 
 
+# Number of example record IDs kept for records_missing_title/imprints.
+MISSING_EXAMPLES_LIMIT = 10
+
+# Record failures printed with a full traceback (per run); later ones get
+# a one-line message.
+FAILURE_TRACEBACK_LIMIT = 3
+
+
+class ExtractionStats:
+    """Incremental accumulator for ExtractionReport statistics.
+
+    Records are added one at a time as they are parsed, so the report can
+    be built without holding the canonical records in memory. Only the
+    first ``MISSING_EXAMPLES_LIMIT`` missing-field examples are retained.
+    """
+
+    def __init__(self) -> None:
+        self.successful = 0
+        self.failed_records: List[str] = []
+        self.with_title = 0
+        self.with_imprints = 0
+        self.with_languages = 0
+        self.with_language_fixed = 0
+        self.with_subjects = 0
+        self.with_agents = 0
+        self.with_notes = 0
+        self.missing_title: List[str] = []
+        self.missing_imprints: List[str] = []
+        self.field_usage: Counter = Counter()
+
+    def add_record(self, canonical: CanonicalRecord) -> None:
+        """Fold one successfully extracted record into the stats."""
+        self.successful += 1
+        record_id = canonical.source.control_number.value
+
+        if canonical.title:
+            self.with_title += 1
+        elif len(self.missing_title) < MISSING_EXAMPLES_LIMIT:
+            self.missing_title.append(record_id)
+
+        if canonical.imprints:
+            self.with_imprints += 1
+        elif len(self.missing_imprints) < MISSING_EXAMPLES_LIMIT:
+            self.missing_imprints.append(record_id)
+
+        if canonical.languages:
+            self.with_languages += 1
+        if canonical.language_fixed:
+            self.with_language_fixed += 1
+        if canonical.subjects:
+            self.with_subjects += 1
+        if canonical.agents:
+            self.with_agents += 1
+        if canonical.notes:
+            self.with_notes += 1
+
+        # Count field$subfield usage from embedded sources
+        usage = self.field_usage
+        usage.update(canonical.source.control_number.source)
+
+        if canonical.title:
+            usage.update(canonical.title.source)
+
+        for imprint in canonical.imprints:
+            for value in (imprint.place, imprint.publisher, imprint.date, imprint.manufacturer):
+                if value:
+                    usage.update(value.source)
+
+        for lang in canonical.languages:
+            usage.update(lang.source)
+
+        if canonical.language_fixed:
+            usage.update(canonical.language_fixed.source)
+
+        for subj in canonical.subjects:
+            usage.update(subj.source)
+
+        for agent in canonical.agents:
+            usage.update(agent.name.source)
+            if agent.dates:
+                usage.update(agent.dates.source)
+            if agent.function:
+                usage.update(agent.function.source)
+
+        for note in canonical.notes:
+            usage.update(note.source)
+
+    def add_failure(self, record_id: str) -> None:
+        """Record a per-record extraction failure."""
+        self.failed_records.append(record_id)
+
+    def merge(self, other: "ExtractionStats") -> None:
+        """Fold the stats of a later chunk into this one (order-preserving)."""
+        self.successful += other.successful
+        self.failed_records.extend(other.failed_records)
+        self.with_title += other.with_title
+        self.with_imprints += other.with_imprints
+        self.with_languages += other.with_languages
+        self.with_language_fixed += other.with_language_fixed
+        self.with_subjects += other.with_subjects
+        self.with_agents += other.with_agents
+        self.with_notes += other.with_notes
+        room = MISSING_EXAMPLES_LIMIT - len(self.missing_title)
+        self.missing_title.extend(other.missing_title[:max(room, 0)])
+        room = MISSING_EXAMPLES_LIMIT - len(self.missing_imprints)
+        self.missing_imprints.extend(other.missing_imprints[:max(room, 0)])
+        self.field_usage.update(other.field_usage)
+
+    def to_report(self, source_file: str) -> ExtractionReport:
+        """Build the ExtractionReport from the accumulated stats."""
+        return ExtractionReport(
+            source_file=source_file,
+            total_records=self.successful + len(self.failed_records),
+            successful_extractions=self.successful,
+            failed_extractions=len(self.failed_records),
+            records_with_title=self.with_title,
+            records_with_imprints=self.with_imprints,
+            records_with_languages=self.with_languages,
+            records_with_language_fixed=self.with_language_fixed,
+            records_with_subjects=self.with_subjects,
+            records_with_agents=self.with_agents,
+            records_with_notes=self.with_notes,
+            records_missing_title=self.missing_title[:MISSING_EXAMPLES_LIMIT],
+            records_missing_imprints=self.missing_imprints[:MISSING_EXAMPLES_LIMIT],
+            field_usage_counts=dict(self.field_usage),
+        )
+
+
+class _StreamingRecordHandler(pymarc.XmlHandler):
+    """pymarc SAX handler that buffers only the records completed so far.
+
+    The base handler accumulates every record in ``self.records``; here
+    the buffer is drained by ``iter_marc_xml_records`` after every fed
+    block, so the parser's memory use does not grow with file size.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ready: List[pymarc.Record] = []
+
+    def process_record(self, record: pymarc.Record) -> None:
+        self.ready.append(record)
+
+
+def iter_marc_xml_records(
+    marc_xml_path: Path, read_size: int = 1 << 16
+) -> Iterator[pymarc.Record]:
+    """Yield records from a MARC XML file one at a time.
+
+    The file is fed to an incremental SAX parser in *read_size* blocks.
+    Exceptions from the XML parser (malformed file) propagate to the caller.
+    """
+    handler = _StreamingRecordHandler()
+    parser = make_parser()
+    parser.setContentHandler(handler)
+    parser.setFeature(feature_namespaces, 1)
+
+    with open(marc_xml_path, 'rb') as f:
+        while True:
+            block = f.read(read_size)
+            if not block:
+                break
+            parser.feed(block)
+            if handler.ready:
+                yield from handler.ready
+                handler.ready = []
+    parser.close()
+    yield from handler.ready
+    handler.ready = []
+
+
+def parse_record_chunk(
+    records: List[pymarc.Record], source_file: Optional[str] = None
+) -> Tuple[List[str], ExtractionStats, List[Tuple[str, str, Optional[str]]]]:
+    """Parse a chunk of records into JSONL lines plus their stats.
+
+    This is the unit of work for both the serial and the ``workers > 1``
+    paths of ``parse_marc_xml_file``. Per-record failures are counted in
+    the returned stats rather than raised, and returned as
+    ``(record_id, message, traceback)`` for the caller to report; only the
+    first ``FAILURE_TRACEBACK_LIMIT`` carry a traceback, since the caller
+    prints that many per run.
+    """
+    stats = ExtractionStats()
+    lines: List[str] = []
+    failures: List[Tuple[str, str, Optional[str]]] = []
+    for record in records:
+        try:
+            canonical = parse_marc_record(record, source_file=source_file)
+            if canonical:
+                lines.append(canonical.model_dump_json())
+                stats.add_record(canonical)
+        except Exception as e:
+            # Record failed extraction
+            record_id_obj = extract_record_id(record) if record else None
+            record_id = record_id_obj.value if record_id_obj else "unknown"
+            stats.add_failure(record_id)
+            tb = traceback.format_exc() if len(failures) < FAILURE_TRACEBACK_LIMIT else None
+            failures.append((record_id, f"{type(e).__name__}: {str(e)}", tb))
+    return lines, stats, failures
+
+
+def _report_record_failures(
+    failures: List[Tuple[str, str, Optional[str]]], already_failed: int
+) -> None:
+    """Print a chunk's record failures; full traceback for the run's first few."""
+    for n, (record_id, message, tb) in enumerate(failures, start=already_failed + 1):
+        if n <= FAILURE_TRACEBACK_LIMIT and tb:
+            print(f"\nFailed to parse record {record_id}:")
+            print(tb, end="", file=sys.stderr)
+        else:
+            print(f"Failed to parse record {record_id}: {message}")
+
+
 def parse_marc_xml_file(
     marc_xml_path: Path,
     output_path: Path,
     report_path: Optional[Path] = None,
     runs_dir: Optional[Path] = None,
+    workers: int = 1,
+    chunk_size: int = 250,
 ) -> ExtractionReport:
     """Parse MARC XML file and output canonical JSONL.
 
+    Records are streamed in chunks: each chunk is parsed, written to the
+    JSONL and folded into the report stats before later chunks are read,
+    so peak memory is independent of the number of records in the file.
+    With ``workers > 1`` chunks are parsed in a process pool; output order
+    and report totals are identical to the serial run. Output goes to a
+    ``.partial`` file that replaces *output_path* only once the whole file
+    has parsed.
+
     Args:
         marc_xml_path: Path to input MARC XML file
         output_path: Path to output JSONL file (one record per line)
         report_path: Optional path for extraction report JSON
         runs_dir: Directory for parse-failure error logs
             (default: ``data/runs``)
+        workers: Number of parser processes (1 = in-process)
+        chunk_size: Records per unit of work
 
     Returns:
         ExtractionReport with extraction statistics
@@ -789,160 +1019,43 @@ def parse_marc_xml_file(
             is also written to a timestamped log under *runs_dir* — the
             pipeline must stop rather than proceed with zero records.
     """
-    canonical_records = []
-    failed_records = []
-    field_usage = Counter()
+    stats = ExtractionStats()
 
     # Extract source filename for traceability
     source_file = marc_xml_path.name
 
-    # Stats for report
-    stats = {
-        'with_title': 0,
-        'with_imprints': 0,
-        'with_languages': 0,
-        'with_language_fixed': 0,
-        'with_subjects': 0,
-        'with_agents': 0,
-        'with_notes': 0,
-        'missing_title': [],
-        'missing_imprints': []
-    }
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = output_path.with_name(output_path.name + ".partial")
 
-    # Parse MARC XML file.  A whole-file failure is fatal: log to
-    # data/runs/ and raise — never proceed with zero records.
-    try:
-        records = parse_xml_to_array(str(marc_xml_path))
-    except Exception as e:
-        log_path = _write_parse_failure_log(
-            marc_xml_path, e, runs_dir or DEFAULT_RUNS_DIR
-        )
-        raise MarcParseError(
-            f"Failed to parse MARC XML file '{marc_xml_path}': "
-            f"{type(e).__name__}: {e} (error log: {log_path})"
-        ) from e
+    chunks = chunked(iter_marc_xml_records(marc_xml_path), chunk_size)
+    results = ordered_chunk_map(
+        partial(parse_record_chunk, source_file=source_file), chunks, workers=workers
+    )
 
-    for record in records:
+    with open(partial_path, 'w', encoding='utf-8') as f:
+        # Parse MARC XML file.  A whole-file failure is fatal: log to
+        # data/runs/ and raise — never proceed with zero records.
         try:
-            canonical = parse_marc_record(record, source_file=source_file)
-
-            if canonical:
-                canonical_records.append(canonical)
-
-                # Update stats
-                if canonical.title:
-                    stats['with_title'] += 1
-                else:
-                    stats['missing_title'].append(canonical.source.control_number.value)
-
-                if canonical.imprints:
-                    stats['with_imprints'] += 1
-                else:
-                    stats['missing_imprints'].append(canonical.source.control_number.value)
-
-                if canonical.languages:
-                    stats['with_languages'] += 1
-                if canonical.language_fixed:
-                    stats['with_language_fixed'] += 1
-                if canonical.subjects:
-                    stats['with_subjects'] += 1
-                if canonical.agents:
-                    stats['with_agents'] += 1
-                if canonical.notes:
-                    stats['with_notes'] += 1
-
-                # Count field$subfield usage from embedded sources
-                # Control number
-                for source in canonical.source.control_number.source:
-                    field_usage[source] += 1
-
-                # Title
-                if canonical.title:
-                    for source in canonical.title.source:
-                        field_usage[source] += 1
-
-                # Imprints
-                for imprint in canonical.imprints:
-                    if imprint.place:
-                        for source in imprint.place.source:
-                            field_usage[source] += 1
-                    if imprint.publisher:
-                        for source in imprint.publisher.source:
-                            field_usage[source] += 1
-                    if imprint.date:
-                        for source in imprint.date.source:
-                            field_usage[source] += 1
-                    if imprint.manufacturer:
-                        for source in imprint.manufacturer.source:
-                            field_usage[source] += 1
-
-                # Languages
-                for lang in canonical.languages:
-                    for source in lang.source:
-                        field_usage[source] += 1
-
-                # Language fixed
-                if canonical.language_fixed:
-                    for source in canonical.language_fixed.source:
-                        field_usage[source] += 1
-
-                # Subjects
-                for subj in canonical.subjects:
-                    for source in subj.source:
-                        field_usage[source] += 1
-
-                # Agents
-                for agent in canonical.agents:
-                    for source in agent.name.source:
-                        field_usage[source] += 1
-                    if agent.dates:
-                        for source in agent.dates.source:
-                            field_usage[source] += 1
-                    if agent.function:
-                        for source in agent.function.source:
-                            field_usage[source] += 1
-
-                # Notes
-                for note in canonical.notes:
-                    for source in note.source:
-                        field_usage[source] += 1
-
+            for lines, chunk_stats, failures in results:
+                for line in lines:
+                    f.write(line + '\n')
+                _report_record_failures(failures, len(stats.failed_records))
+                stats.merge(chunk_stats)
         except Exception as e:
-            # Record failed extraction
-            record_id_obj = extract_record_id(record) if record else None
-            record_id = record_id_obj.value if record_id_obj else "unknown"
-            failed_records.append(record_id)
-            # Print full traceback for first 3 failures only
-            if len(failed_records) <= 3:
-                print(f"\nFailed to parse record {record_id}:")
-                traceback.print_exc()
-            else:
-                print(f"Failed to parse record {record_id}: {type(e).__name__}: {str(e)}")
-
-    # Write canonical records to JSONL
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for canonical in canonical_records:
-            json_line = canonical.model_dump_json()
-            f.write(json_line + '\n')
+            f.close()
+            partial_path.unlink(missing_ok=True)
+            log_path = _write_parse_failure_log(
+                marc_xml_path, e, runs_dir or DEFAULT_RUNS_DIR
+            )
+            raise MarcParseError(
+                f"Failed to parse MARC XML file '{marc_xml_path}': "
+                f"{type(e).__name__}: {e} (error log: {log_path})"
+            ) from e
+
+    partial_path.replace(output_path)
 
     # Build extraction report
-    report = ExtractionReport(
-        source_file=source_file,
-        total_records=len(canonical_records) + len(failed_records),
-        successful_extractions=len(canonical_records),
-        failed_extractions=len(failed_records),
-        records_with_title=stats['with_title'],
-        records_with_imprints=stats['with_imprints'],
-        records_with_languages=stats['with_languages'],
-        records_with_language_fixed=stats['with_language_fixed'],
-        records_with_subjects=stats['with_subjects'],
-        records_with_agents=stats['with_agents'],
-        records_with_notes=stats['with_notes'],
-        records_missing_title=stats['missing_title'][:10],  # Limit to 10 examples
-        records_missing_imprints=stats['missing_imprints'][:10],
-        field_usage_counts=dict(field_usage)
-    )
+    report = stats.to_report(source_file)
 
     # Write report if path provided
     if report_path:
@@ -13,6 +13,9 @@ Usage:
 
     # With Wikidata enrichment (requires network)
     python -m scripts.marc.rebuild_pipeline --enrich
+
+    # Parallel M1/M2 (output identical to the serial run)
+    python -m scripts.marc.rebuild_pipeline --full data/marc_source/records.xml --workers 8
 """
 
 import argparse
@@ -33,7 +36,7 @@ DEFAULT_DB_OUTPUT = Path("data/index/bibliographic.db")
 DEFAULT_SCHEMA = Path("scripts/marc/m3_schema.sql")
 
 
-def run_m1_parse(marc_xml: Path, output: Path, report: Path) -> bool:
+def run_m1_parse(marc_xml: Path, output: Path, report: Path, workers: int = 1) -> bool:
     """Run M1: Parse MARC XML to canonical JSONL."""
     print("\n" + "=" * 60)
     print("STAGE 1: M1 - Parse MARC XML")
@@ -45,6 +48,8 @@ def run_m1_parse(marc_xml: Path, output: Path, report: Path) -> bool:
 
     print(f"Input:  {marc_xml}")
     print(f"Output: {output}")
+    if workers > 1:
+        print(f"Workers: {workers}")
     print()
 
     from scripts.marc.parse import MarcParseError, parse_marc_xml_file
@@ -54,7 +59,8 @@ def run_m1_parse(marc_xml: Path, output: Path, report: Path) -> bool:
         report_obj = parse_marc_xml_file(
             marc_xml_path=marc_xml,
             output_path=output,
-            report_path=report
+            report_path=report,
+            workers=workers
         )
     except MarcParseError as exc:
         print(f"\nERROR: M1 parse failed — pipeline stopped: {exc}")
@@ -74,7 +80,8 @@ def run_m2_normalize(
     output_path: Path,
     place_alias: Path = None,
     publisher_alias: Path = None,
-    agent_alias: Path = None
+    agent_alias: Path = None,
+    workers: int = 1
 ) -> bool:
     """Run M2: Normalize dates, places, publishers, agents."""
     print("\n" + "=" * 60)
@@ -100,6 +107,8 @@ def run_m2_normalize(
         print(f"Publisher aliases: {publisher_alias_path}")
     if agent_alias_path:
         print(f"Agent aliases: {agent_alias_path}")
+    if workers > 1:
+        print(f"Workers: {workers}")
     print()
 
     from scripts.marc.m2_normalize import process_m1_to_m2
@@ -110,7 +119,8 @@ def run_m2_normalize(
         output_path=output_path,
         place_alias_path=place_alias_path,
         publisher_alias_path=publisher_alias_path,
-        agent_alias_path=agent_alias_path
+        agent_alias_path=agent_alias_path,
+        workers=workers
     )
     elapsed = time.time() - start
 
@@ -203,6 +213,9 @@ Examples:
   # With Wikidata enrichment
   python -m scripts.marc.rebuild_pipeline --enrich
 
+  # Parse and normalize across 8 processes
+  python -m scripts.marc.rebuild_pipeline --full data/marc_source/records.xml --workers 8
+
   # Custom paths
   python -m scripts.marc.rebuild_pipeline \\
     --m1-input data/canonical/records.jsonl \\
@@ -245,6 +258,13 @@ Examples:
         action="store_true",
         help="Enrich authority URIs with Wikidata metadata (requires network)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run M1 parse and M2 normalize in N processes (default: 1)"
+    )
     parser.add_argument(
         "--m2-only",
         action="store_true",
@@ -273,7 +293,7 @@ Examples:
 
     # Stage 1: M1 Parse (optional)
     if run_m1:
-        if not run_m1_parse(args.full, args.m1_input, DEFAULT_M1_REPORT):
+        if not run_m1_parse(args.full, args.m1_input, DEFAULT_M1_REPORT, workers=args.workers):
             print("\nERROR: M1 parsing failed")
             sys.exit(1)
 
@@ -284,7 +304,8 @@ Examples:
             args.m2_output,
             args.place_alias,
             DEFAULT_PUBLISHER_ALIAS,
-            DEFAULT_AGENT_ALIAS
+            DEFAULT_AGENT_ALIAS,
+            workers=args.workers
         ):
             print("\nERROR: M2 normalization failed")
             sys.exit(1)
@@ -22,6 +22,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from scripts.marc.m3_facets import refresh_facet_summary
+from scripts.utils.db_generation import bump_db_generation
+
 
 # ---------------------------------------------------------------------------
 # Errors
@@ -451,6 +454,9 @@ class FeedbackLoop:
                 (canonical_value, method_value, raw_value),
             )
             updated = cur.rowcount
+            if updated:
+                bump_db_generation(conn)
+                refresh_facet_summary(conn)
             conn.commit()
             return updated
         except Exception as exc:
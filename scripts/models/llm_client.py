@@ -1,7 +1,10 @@
 """Thin async wrapper around litellm for structured and streaming completions.
 
 Replaces direct OpenAI client calls throughout the codebase. All LLM calls
-go through this module, making model switching a config change.
+go through this module, making model switching a config change. When the
+LLM governor is enabled (``scripts.models.llm_governor``), every call is
+admitted through it first and rate-limited (429) calls are retried after
+its backoff.
 """
 
 from __future__ import annotations
@@ -14,6 +17,12 @@ from typing import Any, AsyncIterator, Optional, Type, TypeVar
 import litellm
 from pydantic import BaseModel
 
+from scripts.models.llm_governor import (
+    Permit,
+    estimate_tokens,
+    get_llm_governor,
+    is_rate_limit_error,
+)
 from scripts.utils.llm_logger import log_llm_call
 
 logger = logging.getLogger(__name__)
@@ -25,6 +34,10 @@ T = TypeVar("T", bound=BaseModel)
 # Compare endpoint clears and reads this between pipeline stages.
 _call_metrics: list[dict] = []
 
+# Rate-limited calls are retried this many times, each after re-queueing
+# behind the governor's backoff (only while the governor is enabled)
+RATE_LIMIT_RETRIES = 2
+
 
 @dataclass
 class LLMResult:
@@ -89,6 +102,50 @@ def _enforce_strict_objects(schema: dict) -> None:
                     _enforce_strict_objects(item)
 
 
+async def _acompletion(
+    model: str,
+    call_type: str,
+    messages: list[dict],
+    **kwargs: Any,
+) -> tuple[Any, Optional[Permit]]:
+    """litellm.acompletion, admitted through the governor when it is enabled.
+
+    Returns the response and the governor permit (None when disabled),
+    which the caller releases once the call is over -- for streams, after
+    the last chunk.
+    """
+    governor = get_llm_governor()
+    if governor is None:
+        return await litellm.acompletion(model=model, messages=messages, **kwargs), None
+    estimate = estimate_tokens(*(m["content"] for m in messages))
+    attempt = 0
+    while True:
+        permit = await governor.acquire(model, call_type, estimate)
+        try:
+            return await litellm.acompletion(model=model, messages=messages, **kwargs), permit
+        except Exception as exc:
+            rate_limited = is_rate_limit_error(exc)
+            permit.release(rate_limited=rate_limited)
+            if not rate_limited or attempt >= RATE_LIMIT_RETRIES:
+                raise
+            attempt += 1
+            logger.warning(
+                "LLM call %s on %s rate-limited; retry %d/%d after backoff",
+                call_type, model, attempt, RATE_LIMIT_RETRIES,
+            )
+        except BaseException:
+            permit.release()
+            raise
+
+
+def _release(permit: Optional[Permit], usage: Any) -> None:
+    """Release a governor permit, settling its estimate with the real usage."""
+    if permit is None:
+        return
+    total = getattr(usage, "total_tokens", None) if usage is not None else None
+    permit.release(used_tokens=total if isinstance(total, int) else None)
+
+
 async def structured_completion(
     model: str,
     system: str,
@@ -116,12 +173,12 @@ async def structured_completion(
     ]
 
     start = time.monotonic()
-    resp = await litellm.acompletion(
-        model=model,
-        messages=messages,
+    resp, permit = await _acompletion(
+        model, call_type, messages,
         response_format=pydantic_to_response_format(response_schema),
     )
     latency_ms = (time.monotonic() - start) * 1000
+    _release(permit, resp.usage)
 
     raw_content = resp.choices[0].message.content
     parsed = response_schema.model_validate_json(raw_content)
@@ -192,11 +249,11 @@ async def plain_completion(
         {"role": "user", "content": user},
     ]
 
-    resp = await litellm.acompletion(
-        model=model,
-        messages=messages,
+    resp, permit = await _acompletion(
+        model, call_type, messages,
         temperature=temperature,
     )
+    _release(permit, getattr(resp, "usage", None))
 
     content = resp.choices[0].message.content
 
@@ -233,9 +290,8 @@ async def streaming_completion(
         {"role": "user", "content": user},
     ]
 
-    response = await litellm.acompletion(
-        model=model,
-        messages=messages,
+    response, permit = await _acompletion(
+        model, call_type, messages,
         stream=True,
         # Issue #12: ask the provider for token usage (arrives as a final
         # chunk with empty choices) so streamed calls are cost-logged and
@@ -245,16 +301,20 @@ async def streaming_completion(
 
     usage = None
     full_text: list = []
-    async for chunk in response:
-        chunk_usage = getattr(chunk, "usage", None)
-        if chunk_usage:
-            usage = chunk_usage
-        if not chunk.choices:
-            continue  # the usage-only final chunk has no choices
-        delta = chunk.choices[0].delta.content
-        if delta:
-            full_text.append(delta)
-            yield delta
+    try:
+        async for chunk in response:
+            chunk_usage = getattr(chunk, "usage", None)
+            if chunk_usage:
+                usage = chunk_usage
+            if not chunk.choices:
+                continue  # the usage-only final chunk has no choices
+            delta = chunk.choices[0].delta.content
+            if delta:
+                full_text.append(delta)
+                yield delta
+    finally:
+        # The governor slot is held for the whole stream
+        _release(permit, usage)
 
     # Log cost + feed the token accumulator (quota accounting) exactly like
     # non-streaming calls. Never let logging break the stream's consumer.
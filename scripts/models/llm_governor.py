@@ -0,0 +1,426 @@
+"""Process-wide concurrency governor for LLM calls.
+
+Every stage (interpreter, narrator, meta extraction, network portraits,
+metadata agents, eval judges) calls the provider through ``llm_client``
+and shares the same rate limit. Unthrottled, a burst of background work
+turns into bursts of 429s that hit interactive chat just as hard. The
+governor admits each call through a per-model gate:
+
+- concurrency: at most ``max_concurrent`` calls in flight per model. A
+  share of the slots (``interactive_reserve``) is kept free for
+  interactive calls, so background work never takes the whole model
+- tokens per minute: a token bucket of ``tokens_per_minute`` capacity.
+  Each call reserves an estimate up front and settles it with the real
+  usage afterwards (0 disables the budget)
+- priority: waiters are served interactive first, then background, then
+  batch, FIFO within a class; a lower class never overtakes a higher one
+  waiting on the same model
+- backpressure: an interactive call that has waited ``interactive_max_wait_s``
+  fails with ``LLMBackpressureError`` instead of queueing without bound
+  (background and batch calls wait as long as it takes)
+- adaptive backoff: a 429 halves the model's effective concurrency and
+  pauses new admissions for an exponentially growing interval; every
+  ``limit`` successful calls add one slot back (AIMD)
+
+The priority class of a call comes from ``llm_priority()`` if the caller
+set one, else from its ``call_type`` (``CALL_TYPE_PRIORITIES``), else
+interactive. Queue waits, in-flight counts and 429s are kept per model and
+class and reported by ``stats()`` (``/health/extended``).
+
+State is guarded by a thread lock and waiters are woken on their own
+event loop, so callers that run ``asyncio.run`` on worker threads (the
+metadata agent harness) share the same budgets as the API loop.
+
+The governor is off until ``enable_llm_governor()`` is called (the API
+does this at startup, configured from ``LLM_*`` environment variables).
+
+Usage:
+    permit = await governor.acquire("gpt-4.1", "narrator", estimated_tokens=1200)
+    try:
+        resp = await litellm.acompletion(...)
+    except Exception as exc:
+        permit.release(rate_limited=is_rate_limit_error(exc))
+        raise
+    permit.release(used_tokens=resp.usage.total_tokens)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+class Priority(IntEnum):
+    """Admission classes; lower values are served first."""
+
+    INTERACTIVE = 0  # chat pipeline, network portraits
+    BACKGROUND = 1  # metadata agents, enrichment, normalization
+    BATCH = 2  # evaluation runs and judges
+
+
+# call_type -> priority for calls whose caller did not set llm_priority()
+CALL_TYPE_PRIORITIES: Dict[str, Priority] = {
+    "agent_explain_cluster": Priority.BACKGROUND,
+    "agent_propose_mapping": Priority.BACKGROUND,
+    "agent_suggest_investigation": Priority.BACKGROUND,
+    "place_normalization": Priority.BACKGROUND,
+    "wikipedia_relationship_extraction": Priority.BACKGROUND,
+    "eval_judge_interpreter": Priority.BATCH,
+    "eval_judge_narrator": Priority.BATCH,
+}
+
+# Expected completion size added to the prompt estimate (tokens)
+DEFAULT_OUTPUT_TOKENS = 512
+
+# Adaptive backoff bounds after a 429 (seconds)
+BACKOFF_INITIAL_S = 1.0
+BACKOFF_MAX_S = 60.0
+
+_priority_override: contextvars.ContextVar[Optional[Priority]] = contextvars.ContextVar(
+    "llm_priority", default=None
+)
+
+
+class LLMBackpressureError(RuntimeError):
+    """An interactive LLM call waited longer than its queue budget."""
+
+
+@contextlib.contextmanager
+def llm_priority(priority: Priority) -> Iterator[None]:
+    """Run the LLM calls made inside the block at *priority*."""
+    token = _priority_override.set(priority)
+    try:
+        yield
+    finally:
+        _priority_override.reset(token)
+
+
+def priority_for(call_type: str) -> Priority:
+    """Priority class of a call: llm_priority() override, call type, default."""
+    override = _priority_override.get()
+    if override is not None:
+        return override
+    return CALL_TYPE_PRIORITIES.get(call_type, Priority.INTERACTIVE)
+
+
+def estimate_tokens(*texts: str, output_tokens: int = DEFAULT_OUTPUT_TOKENS) -> int:
+    """Rough token estimate of a call (about 4 characters per token)."""
+    return sum(len(t) for t in texts) // 4 + output_tokens
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True for a provider 429 (litellm.RateLimitError or any status-429 error)."""
+    return (
+        getattr(exc, "status_code", None) == 429
+        or type(exc).__name__ == "RateLimitError"
+    )
+
+
+@dataclass
+class ModelLimits:
+    """Admission limits of one model."""
+
+    max_concurrent: int = 8
+    tokens_per_minute: int = 0  # 0 = no token budget
+    interactive_reserve: Optional[int] = None  # default: a quarter of the slots
+
+    def reserve(self) -> int:
+        if self.interactive_reserve is not None:
+            return self.interactive_reserve
+        return self.max_concurrent // 4
+
+
+@dataclass
+class _ClassStats:
+    calls: int = 0
+    waited: int = 0
+    wait_s_total: float = 0.0
+    wait_s_max: float = 0.0
+    rate_limited: int = 0
+    rejected: int = 0
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    tokens: int = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    granted: bool = field(default=False, compare=False)
+    abandoned: bool = field(default=False, compare=False)
+
+
+class _ModelGate:
+    """Admission state of one model (guarded by the governor's lock)."""
+
+    def __init__(self, limits: ModelLimits, now: float) -> None:
+        self.limits = limits
+        self.limit = float(limits.max_concurrent)  # effective, shrinks on 429
+        self.in_flight = 0
+        self.tokens = float(limits.tokens_per_minute)
+        self.refilled_at = now
+        self.paused_until = 0.0
+        self.backoff_s = 0.0
+        self.successes = 0
+        self.waiters: List[_Waiter] = []
+        self.queued: Dict[Priority, int] = {p: 0 for p in Priority}
+        self.stats: Dict[Priority, _ClassStats] = {p: _ClassStats() for p in Priority}
+        self.wake_at: Optional[float] = None
+
+    def refill(self, now: float) -> None:
+        tpm = self.limits.tokens_per_minute
+        if tpm > 0:
+            self.tokens = min(float(tpm), self.tokens + (now - self.refilled_at) * tpm / 60.0)
+        self.refilled_at = now
+
+    def blocked_for(self, priority: Priority, tokens: int, now: float) -> Optional[float]:
+        """None if a call may start now; else seconds until it might (0 = on release)."""
+        if now < self.paused_until:
+            return self.paused_until - now
+        limit = max(1, int(self.limit))
+        if priority != Priority.INTERACTIVE:
+            limit = max(1, limit - min(self.limits.reserve(), limit - 1))
+        if self.in_flight >= limit:
+            return 0.0
+        tpm = self.limits.tokens_per_minute
+        if tpm > 0:
+            self.refill(now)
+            need = min(tokens, tpm)
+            if self.tokens < need:
+                return (need - self.tokens) * 60.0 / tpm
+        return None
+
+    def admit(self, tokens: int) -> None:
+        self.in_flight += 1
+        if self.limits.tokens_per_minute > 0:
+            self.tokens -= tokens
+
+
+class Permit:
+    """A granted admission; release it exactly once when the call is over."""
+
+    def __init__(self, governor: "LLMGovernor", model: str, priority: Priority, tokens: int) -> None:
+        self.model = model
+        self.priority = priority
+        self.tokens = tokens
+        self._governor = governor
+        self._released = False
+
+    def release(self, used_tokens: Optional[int] = None, rate_limited: bool = False) -> None:
+        """Return the slot, settling the token estimate against *used_tokens*."""
+        if self._released:
+            return
+        self._released = True
+        self._governor._release(self, used_tokens, rate_limited)
+
+
+class LLMGovernor:
+    """Per-model admission control for LLM calls (see module docstring).
+
+    Args:
+        default_limits: Limits of models without an entry in *model_limits*.
+        model_limits: Per-model overrides, keyed by litellm model string.
+        interactive_max_wait_s: Queue budget of interactive calls (None =
+            unbounded).
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        default_limits: Optional[ModelLimits] = None,
+        model_limits: Optional[Dict[str, ModelLimits]] = None,
+        interactive_max_wait_s: Optional[float] = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.default_limits = default_limits or ModelLimits()
+        self.model_limits = dict(model_limits or {})
+        self.interactive_max_wait_s = interactive_max_wait_s
+        self._clock = clock
+        self._gates: Dict[str, _ModelGate] = {}
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def _gate(self, model: str) -> _ModelGate:
+        gate = self._gates.get(model)
+        if gate is None:
+            limits = self.model_limits.get(model, self.default_limits)
+            gate = self._gates[model] = _ModelGate(limits, self._clock())
+        return gate
+
+    async def acquire(
+        self, model: str, call_type: str = "unknown", estimated_tokens: int = DEFAULT_OUTPUT_TOKENS
+    ) -> Permit:
+        """Wait for an admission to call *model*.
+
+        Raises:
+            LLMBackpressureError: If an interactive call waited longer than
+                ``interactive_max_wait_s``.
+        """
+        priority = priority_for(call_type)
+        start = self._clock()
+        with self._lock:
+            gate = self._gate(model)
+            stats = gate.stats[priority]
+            stats.calls += 1
+            ahead = any(not w.abandoned and w.priority <= priority for w in gate.waiters)
+            if not ahead and gate.blocked_for(priority, estimated_tokens, start) is None:
+                gate.admit(estimated_tokens)
+                return Permit(self, model, priority, estimated_tokens)
+            waiter = _Waiter(
+                priority, next(self._seq), estimated_tokens,
+                asyncio.get_running_loop().create_future(),
+            )
+            heapq.heappush(gate.waiters, waiter)
+            gate.queued[priority] += 1
+            self._dispatch(model, gate)
+
+        timeout = self.interactive_max_wait_s if priority == Priority.INTERACTIVE else None
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except BaseException as exc:
+            with self._lock:
+                if not waiter.granted:
+                    waiter.abandoned = True
+                    gate.queued[priority] -= 1
+                    if isinstance(exc, asyncio.TimeoutError):
+                        stats.rejected += 1
+                    self._dispatch(model, gate)
+                    abandoned = True
+                else:
+                    abandoned = False
+            if not abandoned:
+                # Granted while we were being cancelled: hand the slot back
+                Permit(self, model, priority, estimated_tokens).release()
+            if isinstance(exc, asyncio.TimeoutError):
+                raise LLMBackpressureError(
+                    f"LLM queue for {model} is saturated: waited more than "
+                    f"{self.interactive_max_wait_s:.0f}s for an interactive slot"
+                ) from None
+            raise
+        waited = self._clock() - start
+        with self._lock:
+            stats.waited += 1
+            stats.wait_s_total += waited
+            stats.wait_s_max = max(stats.wait_s_max, waited)
+        return Permit(self, model, priority, estimated_tokens)
+
+    def _release(self, permit: Permit, used_tokens: Optional[int], rate_limited: bool) -> None:
+        now = self._clock()
+        with self._lock:
+            gate = self._gate(permit.model)
+            gate.in_flight -= 1
+            if used_tokens is not None and gate.limits.tokens_per_minute > 0:
+                gate.tokens -= used_tokens - permit.tokens
+            if rate_limited:
+                gate.stats[permit.priority].rate_limited += 1
+                gate.limit = max(1.0, gate.limit / 2)
+                gate.successes = 0
+                gate.backoff_s = min(BACKOFF_MAX_S, max(BACKOFF_INITIAL_S, gate.backoff_s * 2))
+                gate.paused_until = max(gate.paused_until, now + gate.backoff_s)
+            else:
+                gate.successes += 1
+                if gate.successes >= gate.limit:
+                    gate.successes = 0
+                    gate.backoff_s = 0.0
+                    gate.limit = min(float(gate.limits.max_concurrent), gate.limit + 1)
+            self._dispatch(permit.model, gate)
+
+    def _dispatch(self, model: str, gate: _ModelGate) -> None:
+        """Grant queued waiters in priority order while the gate allows (lock held)."""
+        now = self._clock()
+        while gate.waiters:
+            head = gate.waiters[0]
+            if head.abandoned:
+                heapq.heappop(gate.waiters)
+                continue
+            delay = gate.blocked_for(Priority(head.priority), head.tokens, now)
+            if delay is not None:
+                if delay > 0:
+                    self._schedule_wake(model, gate, head.future.get_loop(), now + delay)
+                return
+            heapq.heappop(gate.waiters)
+            gate.queued[Priority(head.priority)] -= 1
+            gate.admit(head.tokens)
+            head.granted = True
+            head.future.get_loop().call_soon_threadsafe(_resolve, head.future)
+
+    def _schedule_wake(
+        self, model: str, gate: _ModelGate, loop: asyncio.AbstractEventLoop, at: float
+    ) -> None:
+        if gate.wake_at is not None and gate.wake_at <= at:
+            return
+        gate.wake_at = at
+
+        def wake() -> None:
+            with self._lock:
+                if gate.wake_at == at:
+                    gate.wake_at = None
+                self._dispatch(model, gate)
+
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(loop.call_later, max(0.0, at - self._clock()), wake)
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        """Per-model limits, in-flight/queued counts and per-class wait metrics."""
+        with self._lock:
+            return {
+                model: {
+                    "max_concurrent": gate.limits.max_concurrent,
+                    "effective_limit": int(gate.limit),
+                    "in_flight": gate.in_flight,
+                    "tokens_per_minute": gate.limits.tokens_per_minute,
+                    "paused_for_s": round(max(0.0, gate.paused_until - self._clock()), 2),
+                    "classes": {
+                        p.name.lower(): {
+                            "queued": gate.queued[p],
+                            "calls": s.calls,
+                            "waited": s.waited,
+                            "avg_wait_ms": round(s.wait_s_total / s.waited * 1000, 1) if s.waited else 0.0,
+                            "max_wait_ms": round(s.wait_s_max * 1000, 1),
+                            "rate_limited": s.rate_limited,
+                            "rejected": s.rejected,
+                        }
+                        for p, s in gate.stats.items()
+                    },
+                }
+                for model, gate in self._gates.items()
+            }
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+# Module-level singleton, disabled until enable_llm_governor()
+_governor: Optional[LLMGovernor] = None
+
+
+def enable_llm_governor(
+    default_limits: Optional[ModelLimits] = None,
+    model_limits: Optional[Dict[str, ModelLimits]] = None,
+    interactive_max_wait_s: Optional[float] = 30.0,
+) -> LLMGovernor:
+    """Create (or replace) the process-wide LLM governor."""
+    global _governor
+    _governor = LLMGovernor(default_limits, model_limits, interactive_max_wait_s)
+    return _governor
+
+
+def disable_llm_governor() -> None:
+    """Let LLM calls through unthrottled (for testing and evals)."""
+    global _governor
+    _governor = None
+
+
+def get_llm_governor() -> Optional[LLMGovernor]:
+    """Return the active governor, or None if disabled."""
+    return _governor
@@ -668,7 +668,9 @@ def build_network_agents(
             has_wikipedia INTEGER DEFAULT 0,
             record_count INTEGER DEFAULT 0,
             connection_count INTEGER DEFAULT 0,
-            community TEXT
+            community TEXT,
+            active_start INTEGER,
+            active_end INTEGER
         )
     """)
 
@@ -898,6 +900,135 @@ def _recompute_connection_counts(conn: sqlite3.Connection) -> None:
     """)
 
 
+# Per-node imprint-year span for the map's time slider (issue #32). One
+# subquery covers both node kinds: people via agents→imprints, publishers via
+# imprints.publisher_norm (the `pub:` agent_norm minus its 4-char prefix).
+# Correlated on `na` (network_agents); /network/map falls back to it live
+# when the precomputed columns are missing or stale.
+ACTIVE_SPAN_SQL = """
+    (SELECT MIN(d) FROM (
+        SELECT i.date_start d FROM agents a JOIN imprints i ON i.record_id = a.record_id
+        WHERE a.agent_norm = na.agent_norm AND i.date_start IS NOT NULL
+        UNION ALL
+        SELECT i.date_start d FROM imprints i
+        WHERE i.publisher_norm = substr(na.agent_norm, 5) AND i.date_start IS NOT NULL
+    )) AS active_start,
+    (SELECT MAX(d) FROM (
+        SELECT i.date_start d FROM agents a JOIN imprints i ON i.record_id = a.record_id
+        WHERE a.agent_norm = na.agent_norm AND i.date_start IS NOT NULL
+        UNION ALL
+        SELECT i.date_start d FROM imprints i
+        WHERE i.publisher_norm = substr(na.agent_norm, 5) AND i.date_start IS NOT NULL
+    )) AS active_end"""
+
+# Degree counts are kept for min_confidence = step / MAP_CONFIDENCE_STEPS,
+# step 0..MAP_CONFIDENCE_STEPS (the map's confidence slider moves in 0.1s)
+MAP_CONFIDENCE_STEPS = 10
+
+# Any edge or node insert/delete after the stats were built marks them dirty;
+# /network/map then computes spans and degrees live until the next build
+_MAP_STATS_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS network_map_stats_dirty_{table}_{name}
+        AFTER {event} ON {table} BEGIN
+            UPDATE network_map_stats SET dirty = 1 WHERE dirty = 0;
+        END"""
+    for table, name, event in (
+        ("network_edges", "insert", "INSERT"),
+        ("network_edges", "delete", "DELETE"),
+        ("network_edges", "update", "UPDATE"),
+        ("network_agents", "insert", "INSERT"),
+        ("network_agents", "delete", "DELETE"),
+        # Active spans are derived from these columns; QA fixes rewrite
+        # them in place without bumping the DB generation
+        ("imprints", "update", "UPDATE OF date_start, publisher_norm"),
+        ("agents", "update", "UPDATE OF agent_norm"),
+    )
+]
+
+
+def build_network_map_stats(conn: sqlite3.Connection) -> int:
+    """Precompute the per-node figures /network/map used to derive per request.
+
+    - network_agents.active_start / active_end: the imprint-year span
+      (ACTIVE_SPAN_SQL), stored on the node
+    - network_agent_degrees: per connection type and confidence step, the
+      number of edge endpoints of each agent with confidence >= step / 10
+      (same counting as the map's live UNION ALL)
+    - network_map_stats: single row with the DB generation (PRAGMA
+      user_version) the stats were built at and the dirty flag the
+      triggers set (edge/node changes, and in-place updates of the
+      imprint/agent columns the spans are derived from)
+    - idx_network_edges_type_confidence: the map's edge query reads the
+      edges of the selected types at or above min_confidence, and their
+      endpoints, from this index alone
+
+    Run after every network rebuild (main does); network_edges /
+    network_agents are dropped and recreated by the build, so the dirty
+    triggers are (re)created here too. Returns the degree rows written.
+    """
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(network_agents)")}
+    for col in ("active_start", "active_end"):
+        if col not in cols:
+            conn.execute(f"ALTER TABLE network_agents ADD COLUMN {col} INTEGER")
+    spans = conn.execute(
+        f"SELECT {ACTIVE_SPAN_SQL}, na.agent_norm FROM network_agents na"
+    ).fetchall()
+    conn.executemany(
+        "UPDATE network_agents SET active_start = ?, active_end = ? WHERE agent_norm = ?",
+        spans,
+    )
+
+    conn.execute("DROP TABLE IF EXISTS network_agent_degrees")
+    conn.execute("""
+        CREATE TABLE network_agent_degrees (
+            connection_type TEXT NOT NULL,
+            confidence_step INTEGER NOT NULL,
+            agent_norm TEXT NOT NULL,
+            degree INTEGER NOT NULL,
+            PRIMARY KEY (connection_type, confidence_step, agent_norm)
+        ) WITHOUT ROWID
+    """)
+    conn.execute(
+        """INSERT INTO network_agent_degrees
+           WITH RECURSIVE steps(step) AS (
+               SELECT 0 UNION ALL SELECT step + 1 FROM steps WHERE step < ?
+           ),
+           ends AS (
+               SELECT source_agent_norm AS agent_norm, connection_type, confidence
+               FROM network_edges
+               UNION ALL
+               SELECT target_agent_norm, connection_type, confidence FROM network_edges
+           )
+           SELECT e.connection_type, s.step, e.agent_norm, COUNT(*)
+           FROM ends e JOIN steps s ON e.confidence >= CAST(s.step AS REAL) / ?
+           GROUP BY e.connection_type, s.step, e.agent_norm""",
+        (MAP_CONFIDENCE_STEPS, MAP_CONFIDENCE_STEPS),
+    )
+    degree_rows = conn.execute("SELECT changes()").fetchone()[0]
+
+    conn.execute(
+        """CREATE INDEX IF NOT EXISTS idx_network_edges_type_confidence
+           ON network_edges(connection_type, confidence, source_agent_norm, target_agent_norm)"""
+    )
+
+    conn.execute("DROP TABLE IF EXISTS network_map_stats")
+    conn.execute("""
+        CREATE TABLE network_map_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            generation INTEGER NOT NULL,
+            dirty INTEGER NOT NULL,
+            built_at TEXT
+        )
+    """)
+    for trigger in _MAP_STATS_TRIGGERS:
+        conn.execute(trigger)
+    conn.execute(
+        """INSERT INTO network_map_stats (id, generation, dirty, built_at)
+           VALUES (1, (SELECT user_version FROM pragma_user_version), 0, datetime('now'))"""
+    )
+    return degree_rows
+
+
 def main():
     parser = argparse.ArgumentParser(description="Build network tables")
     parser.add_argument("db_path", type=Path, help="Path to bibliographic.db")
@@ -936,6 +1067,10 @@ def main():
             len(community_stats["communities"]),
         )
 
+        # Precomputed spans and per-type degrees for /network/map
+        degree_rows = build_network_map_stats(conn)
+        logger.info("Built %d network map degree rows", degree_rows)
+
         conn.commit()
 
         # Final counts
@@ -0,0 +1,225 @@
+"""In-memory CSR adjacency over ``network_edges`` for path queries.
+
+``/network/path`` used to reload every edge of the requested types into a
+fresh adjacency dict on every request, walk it with a one-sided BFS and
+then issue one query per hop for the evidence. ``EdgeIndex`` keeps the
+whole edge table in compressed sparse row form instead, built once per
+database generation (``scripts.utils.db_generation``) and shared by all
+requests of the process:
+
+- agent norms are interned to dense integer ids
+- per connection type, ``offsets[u]:offsets[u + 1]`` slices the parallel
+  ``targets`` / ``confidences`` / ``rowids`` arrays for node u, holding
+  both directions of every edge, sorted by descending confidence so a
+  ``min_confidence`` cut stops at the first weaker edge
+- ``rowids`` point back at the ``network_edges`` rows, so the evidence of
+  a whole path is fetched in one query
+
+Usage:
+    index = edge_index_for(db_path)
+    chain = index.shortest_path(source, target, types, min_confidence=0.5, max_hops=8)
+    rowids = index.best_edges(chain, types, min_confidence=0.5)
+"""
+
+import logging
+import sqlite3
+import threading
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from scripts.utils.db_generation import db_generation
+from scripts.utils.sqlite_pool import read_connection
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _TypeAdjacency:
+    """CSR adjacency of one connection type (both edge directions)."""
+
+    offsets: array  # len(nodes) + 1
+    targets: array
+    confidences: array
+    rowids: array
+
+
+class EdgeIndex:
+    """Read-only CSR adjacency of all network edges, by connection type."""
+
+    def __init__(self, rows: Iterable[Tuple[int, str, str, str, float]]) -> None:
+        """Build from ``(rowid, source, target, connection_type, confidence)`` rows."""
+        self.ids: Dict[str, int] = {}
+        self.norms: List[str] = []
+        by_type: Dict[str, List[Tuple[int, int, float, int]]] = {}
+        for rowid, source, target, connection_type, confidence in rows:
+            a, b = self._intern(source), self._intern(target)
+            half_edges = by_type.setdefault(connection_type, [])
+            half_edges.append((a, b, confidence, rowid))
+            half_edges.append((b, a, confidence, rowid))
+        self.by_type: Dict[str, _TypeAdjacency] = {
+            connection_type: self._compress(half_edges)
+            for connection_type, half_edges in by_type.items()
+        }
+
+    def _intern(self, norm: str) -> int:
+        node = self.ids.get(norm)
+        if node is None:
+            node = self.ids[norm] = len(self.norms)
+            self.norms.append(norm)
+        return node
+
+    def _compress(self, half_edges: List[Tuple[int, int, float, int]]) -> _TypeAdjacency:
+        half_edges.sort(key=lambda e: (e[0], -e[2]))
+        offsets = array("q", [0]) * (len(self.norms) + 1)
+        for node, _, _, _ in half_edges:
+            offsets[node + 1] += 1
+        for node in range(len(self.norms)):
+            offsets[node + 1] += offsets[node]
+        return _TypeAdjacency(
+            offsets=offsets,
+            targets=array("q", (e[1] for e in half_edges)),
+            confidences=array("d", (e[2] for e in half_edges)),
+            rowids=array("q", (e[3] for e in half_edges)),
+        )
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(adj.rowids) for adj in self.by_type.values()) // 2
+
+    def _neighbors(
+        self, node: int, adjacencies: Sequence[_TypeAdjacency], min_confidence: float
+    ) -> Iterator[Tuple[int, float, int]]:
+        """(neighbor, confidence, rowid) of *node* over the given types."""
+        for adj in adjacencies:
+            for i in range(adj.offsets[node], adj.offsets[node + 1]):
+                confidence = adj.confidences[i]
+                if confidence < min_confidence:
+                    break
+                yield adj.targets[i], confidence, adj.rowids[i]
+
+    def _adjacencies(self, types: Iterable[str]) -> List[_TypeAdjacency]:
+        return [self.by_type[t] for t in dict.fromkeys(types) if t in self.by_type]
+
+    def shortest_path(
+        self,
+        source: str,
+        target: str,
+        types: Iterable[str],
+        min_confidence: float = 0.0,
+        max_hops: int = 8,
+    ) -> Optional[List[str]]:
+        """Fewest-hops path from *source* to *target*, or None.
+
+        Bidirectional BFS: a whole level of the smaller frontier is
+        expanded at a time, and the first level that meets the other side
+        yields the shortest route (the best meeting point of that level).
+        Edges of other types or below *min_confidence* are skipped while
+        walking. Paths longer than *max_hops* are not returned.
+        """
+        if source == target:
+            return [source]
+        s, t = self.ids.get(source), self.ids.get(target)
+        if s is None or t is None:
+            return None
+        adjacencies = self._adjacencies(types)
+
+        # parents[side][node] -> predecessor towards that side's root
+        parents: Tuple[Dict[int, int], Dict[int, int]] = ({s: -1}, {t: -1})
+        depths: Tuple[Dict[int, int], Dict[int, int]] = ({s: 0}, {t: 0})
+        frontiers = ([s], [t])
+        reached = [0, 0]
+        while frontiers[0] and frontiers[1] and reached[0] + reached[1] < max_hops:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            own_parents, other_depths = parents[side], depths[1 - side]
+            own_depths = depths[side]
+            best: Optional[Tuple[int, int, int]] = None  # (length, node, neighbor)
+            next_frontier: List[int] = []
+            for node in frontiers[side]:
+                for neighbor, _, _ in self._neighbors(node, adjacencies, min_confidence):
+                    if neighbor in other_depths:
+                        length = reached[side] + 1 + other_depths[neighbor]
+                        if best is None or length < best[0]:
+                            best = (length, node, neighbor)
+                    if neighbor not in own_parents:
+                        own_parents[neighbor] = node
+                        own_depths[neighbor] = reached[side] + 1
+                        next_frontier.append(neighbor)
+            if best is not None:
+                _, node, neighbor = best
+                forward = self._walk(parents[side], node)[::-1]
+                backward = self._walk(parents[1 - side], neighbor)
+                chain = forward + backward if side == 0 else (forward + backward)[::-1]
+                return [self.norms[n] for n in chain]
+            reached[side] += 1
+            frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+        return None
+
+    @staticmethod
+    def _walk(parents: Dict[int, int], node: int) -> List[int]:
+        """*node* followed by its predecessors up to the BFS root."""
+        chain = []
+        while node != -1:
+            chain.append(node)
+            node = parents[node]
+        return chain
+
+    def best_edges(
+        self, chain: Sequence[str], types: Iterable[str], min_confidence: float = 0.0
+    ) -> List[Optional[int]]:
+        """network_edges rowid of the strongest edge for each hop of *chain*."""
+        adjacencies = self._adjacencies(types)
+        rowids: List[Optional[int]] = []
+        for a, b in zip(chain, chain[1:]):
+            target = self.ids.get(b)
+            best: Optional[Tuple[float, int]] = None
+            node = self.ids.get(a)
+            if node is not None:
+                for neighbor, confidence, rowid in self._neighbors(node, adjacencies, min_confidence):
+                    if neighbor == target and (best is None or confidence > best[0]):
+                        best = (confidence, rowid)
+            rowids.append(best[1] if best else None)
+        return rowids
+
+
+def load_edge_index(conn: sqlite3.Connection) -> EdgeIndex:
+    """Build an EdgeIndex from the network_edges table on *conn*."""
+    return EdgeIndex(
+        conn.execute(
+            "SELECT rowid, source_agent_norm, target_agent_norm, connection_type, confidence "
+            "FROM network_edges"
+        )
+    )
+
+
+# One index per database file, replaced when its generation changes
+_indexes: Dict[str, Tuple[str, EdgeIndex]] = {}
+_lock = threading.Lock()
+
+
+def edge_index_for(db_path: Path) -> EdgeIndex:
+    """The (cached) EdgeIndex of a database file, rebuilt on a new generation."""
+    key = str(Path(db_path).resolve())
+    generation = db_generation(key)
+    cached = _indexes.get(key)
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+    with _lock:
+        cached = _indexes.get(key)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        conn = read_connection(key)
+        try:
+            index = load_edge_index(conn)
+        finally:
+            conn.close()
+        _indexes[key] = (generation, index)
+        logger.info("Network edge index built: %d nodes, %d edges", len(index.norms), index.edge_count)
+        return index
+
+
+def reset_edge_indexes() -> None:
+    """Drop all cached edge indexes (for testing)."""
+    with _lock:
+        _indexes.clear()
@@ -0,0 +1,245 @@
+"""fix_31: add the trigram FTS5 tables behind CONTAINS filters.
+
+CONTAINS filters on publisher, place, country and agent names compile to
+``LOWER(col) LIKE '%x%'``, which no B-tree index can answer, so every such
+query scanned imprints/agents (and agent_aliases for the alias branch).
+m3_schema.sql now declares three trigram-tokenized FTS5 tables that SQLite
+uses for LIKE directly:
+
+- ``imprints_fts``      -> external-content ``fts5(publisher_norm,
+  place_norm, country_name, content=imprints, content_rowid=id)``
+- ``agents_fts``        -> ``fts5(agent_key, agent_raw)`` where agent_key is
+  ``REPLACE(agent_norm, ',', '')`` (the form the agent_norm filters compare)
+- ``agent_aliases_fts`` -> ``fts5(alias_key)``, the comma-free alias form
+
+each with insert/update/delete triggers. The query layer only routes to a
+table it finds in sqlite_master, so databases built before this fix keep
+working (with LIKE scans) until it is applied; a fresh M3 build needs no fix.
+
+Safety: a battery of substring patterns is evaluated through the new tables
+and against plain LIKE scans of the base tables; ANY difference rolls the
+database back from the pre-fix backup.
+
+Usage:
+    poetry run python scripts/qa/fixes/fix_31_add_trigram_fts.py [--apply] \
+        [--db data/index/bibliographic.db]
+(default is dry-run: print what would change, touch nothing)
+"""
+import argparse
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+FIX_ID = "fix_31_add_trigram_fts"
+
+# (fts table, fts column, base table, base expression, LIKE pattern)
+SEARCH_BATTERY = [
+    ("imprints_fts", "publisher_norm", "imprints", "publisher_norm", "%bragadin%"),
+    ("imprints_fts", "publisher_norm", "imprints", "publisher_norm", "%press%"),
+    ("imprints_fts", "place_norm", "imprints", "place_norm", "%venice%"),
+    ("imprints_fts", "place_norm", "imprints", "place_norm", "%amsterdam%"),
+    ("imprints_fts", "place_norm", "imprints", "place_norm", "%ונציה%"),
+    ("imprints_fts", "country_name", "imprints", "country_name", "%italy%"),
+    ("agents_fts", "agent_key", "agents", "REPLACE(agent_norm, ',', '')", "%karo%"),
+    ("agents_fts", "agent_key", "agents", "REPLACE(agent_norm, ',', '')", "%maimonides%"),
+    ("agents_fts", "agent_raw", "agents", "agent_raw", "%bomberg%"),
+    ("agents_fts", "agent_raw", "agents", "agent_raw", "%יוסף%"),
+    ("agent_aliases_fts", "alias_key", "agent_aliases",
+     "REPLACE(alias_form_lower, ',', '')", "%moses%"),
+    ("agent_aliases_fts", "alias_key", "agent_aliases",
+     "REPLACE(alias_form_lower, ',', '')", "%משה%"),
+]
+
+NEW_SCHEMA_SQL = """
+DROP TRIGGER IF EXISTS imprints_fts_insert;
+DROP TRIGGER IF EXISTS imprints_fts_update;
+DROP TRIGGER IF EXISTS imprints_fts_delete;
+DROP TABLE IF EXISTS imprints_fts;
+
+CREATE VIRTUAL TABLE imprints_fts USING fts5(
+    publisher_norm,
+    place_norm,
+    country_name,
+    content=imprints,
+    content_rowid=id,
+    tokenize='trigram'
+);
+
+CREATE TRIGGER imprints_fts_insert AFTER INSERT ON imprints BEGIN
+    INSERT INTO imprints_fts(rowid, publisher_norm, place_norm, country_name)
+    VALUES (new.id, new.publisher_norm, new.place_norm, new.country_name);
+END;
+CREATE TRIGGER imprints_fts_delete AFTER DELETE ON imprints BEGIN
+    INSERT INTO imprints_fts(imprints_fts, rowid, publisher_norm, place_norm, country_name)
+    VALUES ('delete', old.id, old.publisher_norm, old.place_norm, old.country_name);
+END;
+CREATE TRIGGER imprints_fts_update AFTER UPDATE ON imprints BEGIN
+    INSERT INTO imprints_fts(imprints_fts, rowid, publisher_norm, place_norm, country_name)
+    VALUES ('delete', old.id, old.publisher_norm, old.place_norm, old.country_name);
+    INSERT INTO imprints_fts(rowid, publisher_norm, place_norm, country_name)
+    VALUES (new.id, new.publisher_norm, new.place_norm, new.country_name);
+END;
+
+DROP TRIGGER IF EXISTS agents_fts_insert;
+DROP TRIGGER IF EXISTS agents_fts_update;
+DROP TRIGGER IF EXISTS agents_fts_delete;
+DROP TABLE IF EXISTS agents_fts;
+
+CREATE VIRTUAL TABLE agents_fts USING fts5(
+    agent_key,
+    agent_raw,
+    tokenize='trigram'
+);
+
+CREATE TRIGGER agents_fts_insert AFTER INSERT ON agents BEGIN
+    INSERT INTO agents_fts(rowid, agent_key, agent_raw)
+    VALUES (new.id, REPLACE(new.agent_norm, ',', ''), new.agent_raw);
+END;
+CREATE TRIGGER agents_fts_delete AFTER DELETE ON agents BEGIN
+    DELETE FROM agents_fts WHERE rowid = old.id;
+END;
+CREATE TRIGGER agents_fts_update AFTER UPDATE ON agents BEGIN
+    DELETE FROM agents_fts WHERE rowid = old.id;
+    INSERT INTO agents_fts(rowid, agent_key, agent_raw)
+    VALUES (new.id, REPLACE(new.agent_norm, ',', ''), new.agent_raw);
+END;
+
+DROP TRIGGER IF EXISTS agent_aliases_fts_insert;
+DROP TRIGGER IF EXISTS agent_aliases_fts_update;
+DROP TRIGGER IF EXISTS agent_aliases_fts_delete;
+DROP TABLE IF EXISTS agent_aliases_fts;
+
+CREATE VIRTUAL TABLE agent_aliases_fts USING fts5(
+    alias_key,
+    tokenize='trigram'
+);
+
+CREATE TRIGGER agent_aliases_fts_insert AFTER INSERT ON agent_aliases BEGIN
+    INSERT INTO agent_aliases_fts(rowid, alias_key)
+    VALUES (new.id, REPLACE(new.alias_form_lower, ',', ''));
+END;
+CREATE TRIGGER agent_aliases_fts_delete AFTER DELETE ON agent_aliases BEGIN
+    DELETE FROM agent_aliases_fts WHERE rowid = old.id;
+END;
+CREATE TRIGGER agent_aliases_fts_update AFTER UPDATE ON agent_aliases BEGIN
+    DELETE FROM agent_aliases_fts WHERE rowid = old.id;
+    INSERT INTO agent_aliases_fts(rowid, alias_key)
+    VALUES (new.id, REPLACE(new.alias_form_lower, ',', ''));
+END;
+"""
+
+REPOPULATE_SQL = """
+INSERT INTO imprints_fts(imprints_fts) VALUES ('rebuild');
+INSERT INTO agents_fts(rowid, agent_key, agent_raw)
+SELECT id, REPLACE(agent_norm, ',', ''), agent_raw FROM agents;
+INSERT INTO agent_aliases_fts(rowid, alias_key)
+SELECT id, REPLACE(alias_form_lower, ',', '') FROM agent_aliases;
+"""
+
+
+def _scan_snapshot(conn: sqlite3.Connection) -> dict:
+    """Battery results from plain LIKE scans of the base tables."""
+    snap = {}
+    for _, fts_col, table, expr, pattern in SEARCH_BATTERY:
+        rows = conn.execute(
+            f"SELECT id FROM {table} WHERE LOWER({expr}) LIKE LOWER(?) ORDER BY id",
+            (pattern,),
+        ).fetchall()
+        snap[f"{fts_col} LIKE {pattern}"] = [r[0] for r in rows]
+    return snap
+
+
+def _fts_snapshot(conn: sqlite3.Connection) -> dict:
+    """Battery results answered from the trigram tables."""
+    snap = {}
+    for fts, fts_col, _, _, pattern in SEARCH_BATTERY:
+        rows = conn.execute(
+            f"SELECT rowid FROM {fts} WHERE {fts}.{fts_col} LIKE ? ORDER BY rowid",
+            (pattern,),
+        ).fetchall()
+        snap[f"{fts_col} LIKE {pattern}"] = [r[0] for r in rows]
+    return snap
+
+
+def add_trigram_fts(db_path: Path, apply: bool = False) -> dict:
+    """Create and populate the trigram FTS tables. Returns a report dict.
+
+    With apply=False (dry run) only the before-snapshot is taken. With
+    apply=True a ``.pre-fix31.bak`` backup is taken first; any battery
+    difference between the trigram tables and the base-table scans
+    restores it and raises.
+    """
+    db_path = Path(db_path)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        version = conn.execute("SELECT sqlite_version()").fetchone()[0]
+        major, minor = (int(x) for x in version.split(".")[:2])
+        if (major, minor) < (3, 34):
+            raise RuntimeError(
+                f"SQLite {version} lacks the FTS5 trigram tokenizer (need >= 3.34)"
+            )
+        before = _scan_snapshot(conn)
+    finally:
+        conn.close()
+
+    report = {
+        "fix_id": FIX_ID,
+        "sqlite_version": version,
+        "battery_queries": len(before),
+        "applied": False,
+        "verified": False,
+    }
+    if not apply:
+        print(f"[{FIX_ID}] DRY RUN — battery snapshot of {len(before)} patterns OK; "
+              f"sqlite {version} supports trigram FTS5. Use --apply.")
+        return report
+
+    backup = db_path.with_suffix(db_path.suffix + ".pre-fix31.bak")
+    src = sqlite3.connect(str(db_path))
+    try:
+        dst = sqlite3.connect(str(backup))
+        with dst:
+            src.backup(dst)
+        dst.close()
+    finally:
+        src.close()
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.executescript(NEW_SCHEMA_SQL)
+        conn.executescript(REPOPULATE_SQL)
+        conn.commit()
+        after = _fts_snapshot(conn)
+    finally:
+        conn.close()
+
+    if before != after:
+        diffs = [k for k in before if before[k] != after.get(k)]
+        shutil.copy(backup, db_path)
+        raise RuntimeError(
+            f"[{FIX_ID}] trigram results differ from LIKE scans for {diffs} — "
+            f"database RESTORED from {backup.name}"
+        )
+
+    report["applied"] = True
+    report["verified"] = True
+    print(f"[{FIX_ID}] applied and verified: {len(before)} battery patterns "
+          f"identical. Backup: {backup.name}")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db", type=Path, default=Path("data/index/bibliographic.db"))
+    parser.add_argument("--apply", action="store_true", help="actually add the tables (default: dry run)")
+    args = parser.parse_args()
+    try:
+        add_trigram_fts(args.db, apply=args.apply)
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""fix_32: add (or rebuild) the materialized full-collection facet summary.
+
+The collection overview, full-collection aggregations and the network
+place map / topic constellation re-ran GROUP BYs over the whole collection
+on every call. m3_schema.sql now declares ``facet_counts``,
+``facet_decade_counts`` and ``facet_summary_meta`` plus dirty-flag
+triggers on the summarized columns; ``scripts/marc/m3_facets.py`` fills
+them and the readers use them while they are current. A fresh M3 build
+needs no fix.
+
+On an existing database this fix creates the missing tables and triggers
+(statements taken from m3_schema.sql), bumps the DB generation and
+rebuilds the summary. Run it again after any fix script that rewrites
+norms: those writes only mark the summary dirty (readers then fall back
+to live queries) until it is rebuilt.
+
+Safety: every summarized facet is compared with its live GROUP BY after
+the rebuild; ANY difference rolls the database back from the pre-fix
+backup.
+
+Usage:
+    poetry run python scripts/qa/fixes/fix_32_add_facet_summary.py [--apply] \
+        [--db data/index/bibliographic.db]
+(default is dry-run: print what would change, touch nothing)
+"""
+import argparse
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+from scripts.marc.m3_facets import (
+    FACET_COUNT_SQL,
+    FACET_SUMMARY_FACETS,
+    facet_summary_state,
+    refresh_facet_summary,
+)
+from scripts.marc.m3_index import split_schema_statements
+from scripts.utils.db_generation import bump_db_generation
+
+FIX_ID = "fix_32_add_facet_summary"
+
+SCHEMA_PATH = Path(__file__).resolve().parents[2] / "marc" / "m3_schema.sql"
+
+SUMMARY_OBJECTS = ("facet_counts", "facet_decade_counts", "facet_summary_meta")
+
+
+def _summary_statements() -> list:
+    """The facet summary DDL (and meta row) from m3_schema.sql, in order."""
+    tables, deferred = split_schema_statements(SCHEMA_PATH.read_text(encoding="utf-8"))
+    return [s for s in tables + deferred if any(name in s for name in SUMMARY_OBJECTS)]
+
+
+def _live_snapshot(conn: sqlite3.Connection) -> dict:
+    """Every summarized facet computed live from the base tables."""
+    return {
+        facet: sorted((str(row[1]), row[2]) for row in conn.execute(sql).fetchall())
+        for facet, sql in FACET_COUNT_SQL.items()
+    }
+
+
+def _summary_snapshot(conn: sqlite3.Connection) -> dict:
+    return {
+        facet: sorted(conn.execute(
+            "SELECT value, record_count FROM facet_counts WHERE facet = ?", (facet,)
+        ).fetchall())
+        for facet in FACET_SUMMARY_FACETS
+    }
+
+
+def add_facet_summary(db_path: Path, apply: bool = False) -> dict:
+    """Create (if missing) and rebuild the facet summary. Returns a report dict.
+
+    With apply=False (dry run) only the live snapshot is taken. With
+    apply=True a ``.pre-fix32.bak`` backup is taken first; any difference
+    between the rebuilt summary and the live counts restores it and raises.
+    """
+    db_path = Path(db_path)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        present = facet_summary_state(conn) is not None
+        before = _live_snapshot(conn)
+    finally:
+        conn.close()
+
+    report = {
+        "fix_id": FIX_ID,
+        "tables_present": present,
+        "facet_values": {facet: len(rows) for facet, rows in before.items()},
+        "applied": False,
+        "verified": False,
+    }
+    if not apply:
+        action = "rebuild" if present else "create and build"
+        print(f"[{FIX_ID}] DRY RUN — would {action} the facet summary "
+              f"({sum(report['facet_values'].values())} facet values). Use --apply.")
+        return report
+
+    backup = db_path.with_suffix(db_path.suffix + ".pre-fix32.bak")
+    src = sqlite3.connect(str(db_path))
+    try:
+        dst = sqlite3.connect(str(backup))
+        with dst:
+            src.backup(dst)
+        dst.close()
+    finally:
+        src.close()
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        if not present:
+            for statement in _summary_statements():
+                conn.execute(statement)
+        bump_db_generation(conn)
+        report["generation"] = refresh_facet_summary(conn)
+        conn.commit()
+        after = _summary_snapshot(conn)
+    finally:
+        conn.close()
+
+    if before != after:
+        diffs = [facet for facet in before if before[facet] != after.get(facet)]
+        shutil.copy(backup, db_path)
+        raise RuntimeError(
+            f"[{FIX_ID}] summary differs from live counts for {diffs} — "
+            f"database RESTORED from {backup.name}"
+        )
+
+    report["applied"] = True
+    report["verified"] = True
+    print(f"[{FIX_ID}] applied and verified: {len(after)} facets identical to "
+          f"live counts (generation {report['generation']}). Backup: {backup.name}")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db", type=Path, default=Path("data/index/bibliographic.db"))
+    parser.add_argument("--apply", action="store_true", help="actually build the summary (default: dry run)")
+    args = parser.parse_args()
+    try:
+        add_facet_summary(args.db, apply=args.apply)
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
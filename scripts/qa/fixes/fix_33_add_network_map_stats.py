@@ -0,0 +1,154 @@
+"""fix_33: add (or rebuild) the precomputed /network/map figures.
+
+/network/map used to compute every node's imprint-year span (two
+correlated subqueries per node) and its edge count for the selected
+connection types (a UNION ALL over network_edges) on every request.
+``build_network_map_stats`` in scripts/network/build_network_tables.py now
+stores the spans on network_agents (active_start / active_end) and the
+per-type degrees per confidence step in ``network_agent_degrees``, with a
+``network_map_stats`` row (generation + dirty flag set by triggers) that
+tells the endpoint whether they are current, and adds the
+(connection_type, confidence) edge index the map's edge query scans. A
+fresh network build needs no fix.
+
+On an existing database this fix runs the same build step and bumps the
+DB generation first, so cached readers pick up the change. Run it again
+after any fix script that rewrites network edges/nodes or imprint dates:
+until then the map falls back to its live queries.
+
+Safety: every node's span and every (type, step) degree is compared with
+the live queries after the build; ANY difference rolls the database back
+from the pre-fix backup.
+
+Usage:
+    poetry run python scripts/qa/fixes/fix_33_add_network_map_stats.py [--apply] \
+        [--db data/index/bibliographic.db]
+(default is dry-run: print what would change, touch nothing)
+"""
+import argparse
+import shutil
+import sqlite3
+import sys
+from pathlib import Path
+
+from scripts.network.build_network_tables import (
+    ACTIVE_SPAN_SQL,
+    MAP_CONFIDENCE_STEPS,
+    build_network_map_stats,
+)
+from scripts.utils.db_generation import bump_db_generation
+
+FIX_ID = "fix_33_add_network_map_stats"
+
+
+def _live_snapshot(conn: sqlite3.Connection) -> dict:
+    """Spans and per-(type, step) degrees computed live from the base tables."""
+    spans = sorted(
+        conn.execute(f"SELECT na.agent_norm, {ACTIVE_SPAN_SQL} FROM network_agents na").fetchall()
+    )
+    degrees = []
+    for step in range(MAP_CONFIDENCE_STEPS + 1):
+        degrees += conn.execute(
+            """SELECT connection_type, ?, agent_norm, COUNT(*) FROM (
+                   SELECT source_agent_norm AS agent_norm, connection_type FROM network_edges
+                   WHERE confidence >= ?
+                   UNION ALL
+                   SELECT target_agent_norm, connection_type FROM network_edges
+                   WHERE confidence >= ?
+               ) GROUP BY connection_type, agent_norm""",
+            (step, step / MAP_CONFIDENCE_STEPS, step / MAP_CONFIDENCE_STEPS),
+        ).fetchall()
+    return {"spans": spans, "degrees": sorted(degrees)}
+
+
+def _stats_snapshot(conn: sqlite3.Connection) -> dict:
+    return {
+        "spans": sorted(conn.execute(
+            "SELECT agent_norm, active_start, active_end FROM network_agents"
+        ).fetchall()),
+        "degrees": sorted(conn.execute(
+            "SELECT connection_type, confidence_step, agent_norm, degree FROM network_agent_degrees"
+        ).fetchall()),
+    }
+
+
+def add_network_map_stats(db_path: Path, apply: bool = False) -> dict:
+    """Build the network map stats. Returns a report dict.
+
+    With apply=False (dry run) only the live snapshot is taken. With
+    apply=True a ``.pre-fix33.bak`` backup is taken first; any difference
+    between the stored figures and the live queries restores it and raises.
+    """
+    db_path = Path(db_path)
+    conn = sqlite3.connect(str(db_path))
+    try:
+        present = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'network_map_stats'"
+        ).fetchone() is not None
+        before = _live_snapshot(conn)
+    finally:
+        conn.close()
+
+    report = {
+        "fix_id": FIX_ID,
+        "tables_present": present,
+        "nodes": len(before["spans"]),
+        "degree_rows": len(before["degrees"]),
+        "applied": False,
+        "verified": False,
+    }
+    if not apply:
+        action = "rebuild" if present else "create and build"
+        print(f"[{FIX_ID}] DRY RUN — would {action} the network map stats "
+              f"({report['nodes']} nodes, {report['degree_rows']} degree rows). Use --apply.")
+        return report
+
+    backup = db_path.with_suffix(db_path.suffix + ".pre-fix33.bak")
+    src = sqlite3.connect(str(db_path))
+    try:
+        dst = sqlite3.connect(str(backup))
+        with dst:
+            src.backup(dst)
+        dst.close()
+    finally:
+        src.close()
+
+    conn = sqlite3.connect(str(db_path))
+    try:
+        report["generation"] = bump_db_generation(conn)
+        build_network_map_stats(conn)
+        conn.commit()
+        after = _stats_snapshot(conn)
+    finally:
+        conn.close()
+
+    if before != after:
+        diffs = [key for key in before if before[key] != after[key]]
+        shutil.copy(backup, db_path)
+        raise RuntimeError(
+            f"[{FIX_ID}] stored {diffs} differ from the live queries — "
+            f"database RESTORED from {backup.name}"
+        )
+
+    report["applied"] = True
+    report["verified"] = True
+    print(f"[{FIX_ID}] applied and verified: {report['nodes']} spans and "
+          f"{report['degree_rows']} degree rows identical to the live queries "
+          f"(generation {report['generation']}). Backup: {backup.name}")
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db", type=Path, default=Path("data/index/bibliographic.db"))
+    parser.add_argument("--apply", action="store_true", help="actually build the stats (default: dry run)")
+    args = parser.parse_args()
+    try:
+        add_network_map_stats(args.db, apply=args.apply)
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
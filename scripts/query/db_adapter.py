@@ -8,10 +8,11 @@ import logging
 import sqlite3
 import re
 from pathlib import Path
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Set
 
 from scripts.schemas import QueryPlan, FilterField, FilterOp
 from scripts.marc.m3_contract import M3Tables, M3Columns, M3Aliases, validate_schema
+from scripts.utils.sqlite_pool import read_connection
 
 logger = logging.getLogger(__name__)
 
@@ -82,8 +83,63 @@ def reset_agent_alias_cache() -> None:
     _agent_alias_tables_present = None
 
 
+# Trigram FTS5 tables backing CONTAINS filters (m3_schema.sql). Databases
+# built before they existed fall back to LIKE scans.
+TRIGRAM_TABLES = (M3Tables.IMPRINTS_FTS, M3Tables.AGENTS_FTS, M3Tables.AGENT_ALIASES_FTS)
+
+# The trigram index can only answer a LIKE pattern containing a run of at
+# least three literal characters; shorter patterns keep the LIKE scan.
+_TRIGRAM_RUN_RE = re.compile(r"[^%_]{3}")
+
+
+def trigram_tables(conn: sqlite3.Connection | None) -> Set[str]:
+    """Return the trigram FTS tables present in the database.
+
+    Not cached: the probe is a cheap sqlite_master lookup, and pooled
+    connections outlive rebuilds that add the tables. With no connection
+    the result is empty, so SQL built without one uses plain LIKE.
+    """
+    if conn is None:
+        return set()
+    placeholders = ",".join("?" * len(TRIGRAM_TABLES))
+    try:
+        rows = conn.execute(
+            f"SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+            TRIGRAM_TABLES,
+        ).fetchall()
+    except sqlite3.Error as exc:
+        logger.warning("Trigram table probe failed (%s); using LIKE scans", exc)
+        return set()
+    return {row[0] for row in rows}
+
+
+def trigram_searchable(pattern: str) -> bool:
+    """Whether a LIKE *pattern* can be answered from a trigram index."""
+    return _TRIGRAM_RUN_RE.search(pattern) is not None
+
+
+def _trigram_like(fts_table: str, fts_column: str, rowid_column: str, param_name: str) -> str:
+    """``rowid_column`` is a row whose *fts_column* is LIKE the parameter."""
+    return (
+        f"{rowid_column} IN (SELECT rowid FROM {fts_table} "
+        f"WHERE {fts_table}.{fts_column} LIKE :{param_name})"
+    )
+
+
+def _negate(condition: str, nullable_column: str | None = None) -> str:
+    """Negate a filter condition.
+
+    A trigram condition is a rowid membership test and never NULL, unlike
+    the ``LIKE`` it stands for; passing the column keeps rows whose value
+    is NULL out of the negated filter, as before.
+    """
+    if nullable_column is None:
+        return f"NOT ({condition})"
+    return f"({nullable_column} IS NOT NULL AND NOT ({condition}))"
+
+
 def get_connection(db_path: Path) -> sqlite3.Connection:
-    """Get database connection with row_factory for dict-like access.
+    """Get a pooled read-only connection with row_factory for dict-like access.
 
     On the first call per process, runs M3 schema validation and logs
     warnings for any mismatches. Validation never blocks queries.
@@ -92,13 +148,12 @@ def get_connection(db_path: Path) -> sqlite3.Connection:
         db_path: Path to SQLite database
 
     Returns:
-        Connection with row_factory configured
+        Connection with row_factory configured; ``close()`` returns it
+        to the pool
     """
     global _schema_validated
 
-    conn = sqlite3.connect(str(db_path))
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.row_factory = sqlite3.Row
+    conn = read_connection(db_path, row_factory=sqlite3.Row)
 
     if not _schema_validated:
         _schema_validated = True
@@ -209,6 +264,35 @@ def normalize_filter_value(field: FilterField, raw_value: str, op: FilterOp = No
         return raw_value
 
 
+def _alias_records_condition(alias_match: str, trigram: bool = False) -> str:
+    """Agent-norm alias branch: the joined agent's record has an agent
+    whose authority has an alias matching *alias_match*.
+
+    Written as an uncorrelated ``a.record_id IN (...)`` rather than a
+    correlated EXISTS on the record, so that both arms of the
+    ``direct OR alias`` condition constrain the agents table and SQLite
+    can answer each from an index (multi-index OR). With *trigram* the
+    alias key is matched through ``agent_aliases_fts``.
+    """
+    if trigram:
+        aliases = (
+            f"{M3Tables.AGENT_ALIASES_FTS} "
+            f"JOIN agent_aliases al ON al.id = {M3Tables.AGENT_ALIASES_FTS}.rowid"
+        )
+        alias_key = f"{M3Tables.AGENT_ALIASES_FTS}.alias_key"
+    else:
+        aliases = "agent_aliases al"
+        alias_key = "LOWER(REPLACE(al.alias_form_lower, ',', ''))"
+    return (
+        f"{M3Aliases.AGENTS}.{M3Columns.Agents.RECORD_ID} IN ("
+        f"SELECT a2.{M3Columns.Agents.RECORD_ID} FROM {aliases} "
+        f"JOIN agent_authorities aa ON al.authority_id = aa.id "
+        f"JOIN {M3Tables.AGENTS} a2 ON a2.{M3Columns.Agents.AUTHORITY_URI} = aa.authority_uri "
+        f"WHERE {alias_key} {alias_match}"
+        f")"
+    )
+
+
 def build_where_clause(
     plan: QueryPlan,
     conn: sqlite3.Connection | None = None,
@@ -223,7 +307,9 @@ def build_where_clause(
             AGENT_NORM handler checks whether the agent_aliases /
             agent_authorities tables exist and adds an alias-resolution
             EXISTS sub-query.  When ``None`` the alias branch is
-            included unconditionally (optimistic).
+            included unconditionally (optimistic).  The connection is
+            also probed for trigram FTS tables, which then answer
+            CONTAINS filters on publisher, place, country and agents.
 
     Returns:
         Tuple of (WHERE clause, parameters dict, needed JOIN tables)
@@ -235,6 +321,16 @@ def build_where_clause(
     params = {}
     needed_joins = set()  # Track which tables need to be joined
 
+    present_trigram_tables: Set[str] | None = None
+
+    def _use_trigram(fts_table: str, pattern: str) -> bool:
+        nonlocal present_trigram_tables
+        if not trigram_searchable(pattern):
+            return False
+        if present_trigram_tables is None:
+            present_trigram_tables = trigram_tables(conn)
+        return fts_table in present_trigram_tables
+
     def _in_values(filter) -> List[str]:
         """Values of an IN filter as a list.
 
@@ -248,6 +344,8 @@ def build_where_clause(
     for idx, filter in enumerate(plan.filters):
         # Generate unique parameter names for this filter
         param_prefix = f"filter_{idx}"
+        # Set when a trigram condition replaces a LIKE on a nullable column
+        null_column = None
 
         if filter.field == FilterField.PUBLISHER:
             needed_joins.add(M3Tables.IMPRINTS)
@@ -257,8 +355,18 @@ def build_where_clause(
                 params[param_name] = normalize_filter_value(filter.field, filter.value)
             elif filter.op == FilterOp.CONTAINS:
                 param_name = f"{param_prefix}_publisher"
-                condition = f"LOWER({M3Aliases.IMPRINTS}.{M3Columns.Imprints.PUBLISHER_NORM}) LIKE LOWER(:{param_name})"
                 params[param_name] = f"%{normalize_filter_value(filter.field, filter.value)}%"
+                if _use_trigram(M3Tables.IMPRINTS_FTS, params[param_name]):
+                    condition = _trigram_like(
+                        M3Tables.IMPRINTS_FTS, M3Columns.Imprints.PUBLISHER_NORM,
+                        f"{M3Aliases.IMPRINTS}.{M3Columns.Imprints.ID}", param_name,
+                    )
+                    null_column = f"{M3Aliases.IMPRINTS}.{M3Columns.Imprints.PUBLISHER_NORM}"
+                else:
+                    condition = (
+                        f"LOWER({M3Aliases.IMPRINTS}.{M3Columns.Imprints.PUBLISHER_NORM}) "
+                        f"LIKE LOWER(:{param_name})"
+                    )
             elif filter.op == FilterOp.IN:
                 # Issue #56 B5: exact membership over normalized values.
                 in_parts = []
@@ -274,7 +382,7 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for publisher")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.IMPRINT_PLACE:
@@ -285,8 +393,15 @@ def build_where_clause(
                 params[param_name] = normalize_filter_value(filter.field, filter.value)
             elif filter.op == FilterOp.CONTAINS:
                 param_name = f"{param_prefix}_place"
-                condition = f"LOWER({M3Aliases.IMPRINTS}.{M3Columns.Imprints.PLACE_NORM}) LIKE LOWER(:{param_name})"
                 params[param_name] = f"%{normalize_filter_value(filter.field, filter.value)}%"
+                if _use_trigram(M3Tables.IMPRINTS_FTS, params[param_name]):
+                    condition = _trigram_like(
+                        M3Tables.IMPRINTS_FTS, M3Columns.Imprints.PLACE_NORM,
+                        f"{M3Aliases.IMPRINTS}.{M3Columns.Imprints.ID}", param_name,
+                    )
+                    null_column = f"{M3Aliases.IMPRINTS}.{M3Columns.Imprints.PLACE_NORM}"
+                else:
+                    condition = f"LOWER({M3Aliases.IMPRINTS}.{M3Columns.Imprints.PLACE_NORM}) LIKE LOWER(:{param_name})"
             elif filter.op == FilterOp.IN:
                 # Issue #56 B5: exact membership over normalized values.
                 in_parts = []
@@ -302,7 +417,7 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for imprint_place")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.COUNTRY:
@@ -314,8 +429,18 @@ def build_where_clause(
                 params[param_name] = filter.value.lower().strip()
             elif filter.op == FilterOp.CONTAINS:
                 param_name = f"{param_prefix}_country"
-                condition = f"LOWER({M3Aliases.IMPRINTS}.{M3Columns.Imprints.COUNTRY_NAME}) LIKE LOWER(:{param_name})"
                 params[param_name] = f"%{filter.value.lower().strip()}%"
+                if _use_trigram(M3Tables.IMPRINTS_FTS, params[param_name]):
+                    condition = _trigram_like(
+                        M3Tables.IMPRINTS_FTS, M3Columns.Imprints.COUNTRY_NAME,
+                        f"{M3Aliases.IMPRINTS}.{M3Columns.Imprints.ID}", param_name,
+                    )
+                    null_column = f"{M3Aliases.IMPRINTS}.{M3Columns.Imprints.COUNTRY_NAME}"
+                else:
+                    condition = (
+                        f"LOWER({M3Aliases.IMPRINTS}.{M3Columns.Imprints.COUNTRY_NAME}) "
+                        f"LIKE LOWER(:{param_name})"
+                    )
             elif filter.op == FilterOp.IN:
                 # Issue #56 B5: exact membership over normalized values.
                 in_parts = []
@@ -331,7 +456,7 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for country")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.YEAR:
@@ -375,7 +500,7 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for year")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.LANGUAGE:
@@ -401,7 +526,7 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for language")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.TITLE:
@@ -441,7 +566,7 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for title")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.SUBJECT:
@@ -491,20 +616,26 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for subject")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.AGENT:
             needed_joins.add(M3Tables.AGENTS)
             if filter.op == FilterOp.CONTAINS:
                 param_name = f"{param_prefix}_agent"
-                condition = f"LOWER({M3Aliases.AGENTS}.{M3Columns.Agents.AGENT_RAW}) LIKE LOWER(:{param_name})"
                 params[param_name] = f"%{normalize_filter_value(filter.field, filter.value)}%"
+                if _use_trigram(M3Tables.AGENTS_FTS, params[param_name]):
+                    condition = _trigram_like(
+                        M3Tables.AGENTS_FTS, M3Columns.Agents.AGENT_RAW,
+                        f"{M3Aliases.AGENTS}.{M3Columns.Agents.ID}", param_name,
+                    )
+                else:
+                    condition = f"LOWER({M3Aliases.AGENTS}.{M3Columns.Agents.AGENT_RAW}) LIKE LOWER(:{param_name})"
             else:
                 raise ValueError(f"Unsupported operation {filter.op} for agent")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.AGENT_NORM:
@@ -528,15 +659,7 @@ def build_where_clause(
                 if include_alias:
                     alias_param = f"{param_prefix}_agent_norm_alias"
                     params[alias_param] = normalize_filter_value(filter.field, filter.value)
-                    alias_cond = (
-                        f"EXISTS ("
-                        f"SELECT 1 FROM agent_aliases al "
-                        f"JOIN agent_authorities aa ON al.authority_id = aa.id "
-                        f"JOIN {M3Tables.AGENTS} a2 ON a2.{M3Columns.Agents.AUTHORITY_URI} = aa.authority_uri "
-                        f"WHERE LOWER(REPLACE(al.alias_form_lower, ',', '')) = LOWER(:{alias_param}) "
-                        f"AND a2.{M3Columns.Agents.RECORD_ID} = {M3Aliases.RECORDS}.{M3Columns.Records.ID}"
-                        f")"
-                    )
+                    alias_cond = _alias_records_condition(f"= LOWER(:{alias_param})")
                     condition = f"({direct_cond} OR {alias_cond})"
                 else:
                     condition = direct_cond
@@ -544,21 +667,22 @@ def build_where_clause(
             elif filter.op == FilterOp.CONTAINS:
                 param_name = f"{param_prefix}_agent_norm"
                 agent_col = f"{M3Aliases.AGENTS}.{M3Columns.Agents.AGENT_NORM}"
-                direct_cond = f"LOWER(REPLACE({agent_col}, ',', '')) LIKE LOWER(:{param_name})"
                 params[param_name] = f"%{normalize_filter_value(filter.field, filter.value)}%"
+                if _use_trigram(M3Tables.AGENTS_FTS, params[param_name]):
+                    direct_cond = _trigram_like(
+                        M3Tables.AGENTS_FTS, "agent_key",
+                        f"{M3Aliases.AGENTS}.{M3Columns.Agents.ID}", param_name,
+                    )
+                else:
+                    direct_cond = f"LOWER(REPLACE({agent_col}, ',', '')) LIKE LOWER(:{param_name})"
 
                 if include_alias:
                     alias_param = f"{param_prefix}_agent_norm_alias"
                     params[alias_param] = f"%{normalize_filter_value(filter.field, filter.value)}%"
-                    alias_cond = (
-                        f"EXISTS ("
-                        f"SELECT 1 FROM agent_aliases al "
-                        f"JOIN agent_authorities aa ON al.authority_id = aa.id "
-                        f"JOIN {M3Tables.AGENTS} a2 ON a2.{M3Columns.Agents.AUTHORITY_URI} = aa.authority_uri "
-                        f"WHERE LOWER(REPLACE(al.alias_form_lower, ',', '')) LIKE LOWER(:{alias_param}) "
-                        f"AND a2.{M3Columns.Agents.RECORD_ID} = {M3Aliases.RECORDS}.{M3Columns.Records.ID}"
-                        f")"
-                    )
+                    if _use_trigram(M3Tables.AGENT_ALIASES_FTS, params[alias_param]):
+                        alias_cond = _alias_records_condition(f"LIKE :{alias_param}", trigram=True)
+                    else:
+                        alias_cond = _alias_records_condition(f"LIKE LOWER(:{alias_param})")
                     condition = f"({direct_cond} OR {alias_cond})"
                 else:
                     condition = direct_cond
@@ -582,15 +706,7 @@ def build_where_clause(
                     f" IN ({', '.join(direct_parts)})"
                 )
                 if include_alias:
-                    alias_cond = (
-                        f"EXISTS ("
-                        f"SELECT 1 FROM agent_aliases al "
-                        f"JOIN agent_authorities aa ON al.authority_id = aa.id "
-                        f"JOIN {M3Tables.AGENTS} a2 ON a2.{M3Columns.Agents.AUTHORITY_URI} = aa.authority_uri "
-                        f"WHERE LOWER(REPLACE(al.alias_form_lower, ',', '')) IN ({', '.join(alias_parts)}) "
-                        f"AND a2.{M3Columns.Agents.RECORD_ID} = {M3Aliases.RECORDS}.{M3Columns.Records.ID}"
-                        f")"
-                    )
+                    alias_cond = _alias_records_condition(f"IN ({', '.join(alias_parts)})")
                     condition = f"({direct_cond} OR {alias_cond})"
                 else:
                     condition = direct_cond
@@ -599,7 +715,7 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for agent_norm")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.AGENT_ROLE:
@@ -629,7 +745,7 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for agent_role")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.AGENT_TYPE:
@@ -659,7 +775,7 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for agent_type")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
         elif filter.field == FilterField.PHYSICAL_DESC:
@@ -693,7 +809,7 @@ def build_where_clause(
                 raise ValueError(f"Unsupported operation {filter.op} for physical_desc")
 
             if filter.negate:
-                condition = f"NOT ({condition})"
+                condition = _negate(condition, null_column)
             conditions.append(condition)
 
     where_clause = " AND ".join(conditions)
@@ -766,6 +882,11 @@ def build_select_columns(needed_joins: List[str]) -> str:
 def build_join_clauses(needed_joins: List[str]) -> str:
     """Build JOIN clauses based on needed tables.
 
+    Titles, subjects and agents are inner-joined: every filter on them
+    rejects NULL-padded rows anyway, but SQLite cannot see that through
+    the ``LOWER(...)`` expressions, so a LEFT JOIN would pin records as
+    the outer loop and keep the filter's expression index unused.
+
     Args:
         needed_joins: List of tables that need to be joined
 
@@ -789,19 +910,19 @@ def build_join_clauses(needed_joins: List[str]) -> str:
 
     if M3Tables.TITLES in needed_joins:
         joins.append(
-            f"LEFT JOIN {M3Tables.TITLES} {M3Aliases.TITLES}"
+            f"JOIN {M3Tables.TITLES} {M3Aliases.TITLES}"
             f" ON {M3Aliases.RECORDS}.{M3Columns.Records.ID} = {M3Aliases.TITLES}.{M3Columns.Titles.RECORD_ID}"
         )
 
     if M3Tables.SUBJECTS in needed_joins:
         joins.append(
-            f"LEFT JOIN {M3Tables.SUBJECTS} {M3Aliases.SUBJECTS}"
+            f"JOIN {M3Tables.SUBJECTS} {M3Aliases.SUBJECTS}"
             f" ON {M3Aliases.RECORDS}.{M3Columns.Records.ID} = {M3Aliases.SUBJECTS}.{M3Columns.Subjects.RECORD_ID}"
         )
 
     if M3Tables.AGENTS in needed_joins:
         joins.append(
-            f"LEFT JOIN {M3Tables.AGENTS} {M3Aliases.AGENTS}"
+            f"JOIN {M3Tables.AGENTS} {M3Aliases.AGENTS}"
             f" ON {M3Aliases.RECORDS}.{M3Columns.Records.ID} = {M3Aliases.AGENTS}.{M3Columns.Agents.RECORD_ID}"
         )
 
@@ -514,13 +514,13 @@ def execute_plan(
     Returns:
         CandidateSet with candidates and evidence
     """
-    # Build SQL from plan
-    sql, params = build_full_query(plan)
-
     # Connect to database
     conn = get_connection(db_path)
 
     try:
+        # Build SQL from plan (the connection selects trigram/alias paths)
+        sql, params = build_full_query(plan, conn=conn)
+
         # Execute query
         rows = fetch_candidates(conn, sql, params)
 
@@ -540,7 +540,7 @@ def execute_plan(
                 )
 
                 # Execute retry
-                sql, params = build_full_query(new_plan)
+                sql, params = build_full_query(new_plan, conn=conn)
                 rows = fetch_candidates(conn, sql, params)
 
                 # Use retried plan for evidence
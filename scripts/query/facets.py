@@ -0,0 +1,142 @@
+"""Single-pass facet engine over a candidate record set.
+
+Facets over a result set used to be computed with one GROUP BY query per
+field, each re-binding the full candidate MMS ID list as ``IN (?, ?, ...)``
+and re-resolving ``records.id``. Here the candidate set is bound once (one
+``json_each`` parameter) and materialized as a CTE of record ids; the
+imprint rows of those records are materialized once more and every
+imprint facet (place, publisher, country, decade, century) is grouped
+from that shared scan, with languages grouped in the same statement.
+
+Each facet keeps its full value -> distinct-record-count map, so callers
+get top-k slices and the exact number of distinct values.
+
+Pooled read connections are ``query_only`` (no TEMP tables), which is why
+the materialization is a ``MATERIALIZED`` CTE rather than a temp table.
+
+Usage:
+    facets = compute_facets(conn, mms_ids, fields=("place", "decade"))
+    facets["place"].top(10)          # [("paris", 42), ...]
+    facets["place"].distinct_values  # exact number of places
+"""
+
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+FacetKey = Union[str, int]
+
+FACET_FIELDS = ("place", "publisher", "country", "language", "decade", "century")
+
+# Per-field GROUP BY arm over the materialized imprint scan (``imp``)
+_IMPRINT_ARMS = {
+    "place": (
+        "SELECT 'place', place_norm, COUNT(DISTINCT record_id) FROM imp "
+        "WHERE place_norm IS NOT NULL AND place_norm != '' GROUP BY place_norm"
+    ),
+    "publisher": (
+        "SELECT 'publisher', publisher_norm, COUNT(DISTINCT record_id) FROM imp "
+        "WHERE publisher_norm IS NOT NULL AND publisher_norm != '' GROUP BY publisher_norm"
+    ),
+    "country": (
+        "SELECT 'country', country_name, COUNT(DISTINCT record_id) FROM imp "
+        "WHERE country_name IS NOT NULL AND country_name != '' GROUP BY country_name"
+    ),
+    "decade": (
+        "SELECT 'decade', date_start / 10 * 10, COUNT(DISTINCT record_id) FROM imp "
+        "WHERE date_start IS NOT NULL AND (:max_year IS NULL OR date_start <= :max_year) "
+        "GROUP BY date_start / 10 * 10"
+    ),
+    "century": (
+        "SELECT 'century', (date_start - 1) / 100 + 1, COUNT(DISTINCT record_id) FROM imp "
+        "WHERE date_start IS NOT NULL AND (:max_year IS NULL OR date_start <= :max_year) "
+        "GROUP BY (date_start - 1) / 100 + 1"
+    ),
+}
+
+_LANGUAGE_ARM = (
+    "SELECT 'language', code, COUNT(DISTINCT record_id) FROM languages "
+    "WHERE record_id IN (SELECT id FROM cand) GROUP BY code"
+)
+
+
+def decade_label(decade: int) -> str:
+    """'1550s' for decade bucket 1550."""
+    return f"{decade}s"
+
+
+def century_label(century: int) -> str:
+    """'16th century' for century number 16 (labels as the SQL facets had them)."""
+    return f"{century}th century"
+
+
+@dataclass
+class Facet:
+    """Distinct-record counts for every value of one facet field.
+
+    Keys are the facet value (decades and centuries as ints).
+    """
+
+    field: str
+    counts: Dict[FacetKey, int] = field(default_factory=dict)
+
+    @property
+    def distinct_values(self) -> int:
+        return len(self.counts)
+
+    def top(self, k: Optional[int] = None) -> List[Tuple[FacetKey, int]]:
+        """Values by descending count (ties by value), at most *k*."""
+        ranked = sorted(self.counts.items(), key=lambda kv: (-kv[1], str(kv[0])))
+        return ranked if k is None else ranked[:k]
+
+    def ordered(self, k: Optional[int] = None) -> List[Tuple[FacetKey, int]]:
+        """Values in ascending key order (decades, centuries), at most *k*."""
+        ranked = sorted(self.counts.items())
+        return ranked if k is None else ranked[:k]
+
+
+def compute_facets(
+    conn: sqlite3.Connection,
+    mms_ids: Iterable[str],
+    fields: Sequence[str] = FACET_FIELDS,
+    max_year: Optional[int] = None,
+) -> Dict[str, Facet]:
+    """Compute the requested facets over *mms_ids* in one statement.
+
+    Args:
+        conn: Connection to the bibliographic database.
+        mms_ids: Candidate MMS IDs.
+        fields: Facets to compute (subset of ``FACET_FIELDS``).
+        max_year: Ignore imprint dates after this year for decade/century.
+
+    Returns:
+        Dict of field -> Facet (every requested field present).
+
+    Raises:
+        ValueError: If a field is not a supported facet.
+    """
+    unknown = [f for f in fields if f not in FACET_FIELDS]
+    if unknown:
+        raise ValueError(f"Unsupported facet field(s): {unknown}. Supported: {list(FACET_FIELDS)}")
+
+    facets = {f: Facet(f) for f in fields}
+    mms_ids = list(mms_ids)
+    if not mms_ids or not fields:
+        return facets
+
+    arms = [_IMPRINT_ARMS[f] for f in fields if f in _IMPRINT_ARMS]
+    if "language" in fields:
+        arms.append(_LANGUAGE_ARM)
+    sql = (
+        "WITH cand(id) AS MATERIALIZED ("
+        "SELECT id FROM records WHERE mms_id IN (SELECT value FROM json_each(:mms_ids))"
+        "), imp AS MATERIALIZED ("
+        "SELECT record_id, place_norm, publisher_norm, country_name, date_start "
+        "FROM imprints WHERE record_id IN (SELECT id FROM cand)"
+        ")\n" + "\nUNION ALL\n".join(arms)
+    )
+    rows = conn.execute(sql, {"mms_ids": json.dumps(mms_ids), "max_year": max_year}).fetchall()
+    for facet_field, value, count in rows:
+        facets[facet_field].counts[value] = count
+    return facets
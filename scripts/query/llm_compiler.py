@@ -1,7 +1,8 @@
 """LLM-based Query Compiler - Natural Language → QueryPlan.
 
 Uses litellm via structured_completion for structured output.
-Implements JSONL caching to minimize API calls and cost.
+Caches plans in memory (QueryPlanCache), backed by an append-only JSONL log
+that is indexed once per process, to minimize API calls and cost.
 
 NOTE: This compiler is deprecated in favour of the scholar pipeline
 (scripts/chat/interpreter.py). It remains functional for the legacy
@@ -10,8 +11,11 @@ CLI path and subject-hint retry logic.
 
 import asyncio
 import json
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 from datetime import datetime, timezone
 
 import litellm
@@ -40,6 +44,12 @@ class QueryPlanLLM(BaseModel):
 
 # Cache configuration
 CACHE_PATH = Path("data/query_plan_cache.jsonl")
+CACHE_MAX_ENTRIES = 5000
+CACHE_TTL_SECONDS: Optional[float] = None  # None = entries never expire
+# Bump whenever SYSTEM_PROMPT or QueryPlanLLM changes; cached plans from an
+# older prompt version are then ignored. Entries written before versioning
+# are treated as "1".
+PROMPT_VERSION = "1"
 
 # System prompt for QueryPlan generation
 SYSTEM_PROMPT = """You are a query parser for a bibliographic rare books database.
@@ -387,6 +397,7 @@ def write_cache_entry(query_text: str, plan: QueryPlan, model: str) -> None:
         "query_text": query_text,
         "plan": plan.model_dump(),
         "model": model,
+        "prompt_version": PROMPT_VERSION,
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
@@ -394,6 +405,150 @@ def write_cache_entry(query_text: str, plan: QueryPlan, model: str) -> None:
         f.write(json.dumps(entry, ensure_ascii=False) + '\n')
 
 
+def normalize_query_key(query_text: str) -> str:
+    """Normalize query text for cache lookup (casefold, collapse whitespace)."""
+    return " ".join(query_text.casefold().split())
+
+
+def _iter_cache_log(path: Path) -> Iterator[dict]:
+    """Yield well-formed entries from a cache log, oldest first."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(entry, dict) and "query_text" in entry and "plan" in entry:
+                    yield entry
+
+
+class QueryPlanCache:
+    """In-memory LRU/TTL cache of compiled plans backed by the JSONL log.
+
+    The log is read once when the cache is created. Lookups are then plain
+    dict operations keyed by (normalized query, model, prompt version), so
+    their cost does not depend on how large the log is. New plans are
+    appended to the log. The log is rewritten with only the live entries
+    once superseded or evicted lines outnumber them.
+    """
+
+    COMPACT_MIN_LINES = 1000
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = CACHE_TTL_SECONDS,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str, str], dict]" = OrderedDict()
+        self._log_lines = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _key(self, query_text: str, model: str, prompt_version: str) -> Tuple[str, str, str]:
+        return (normalize_query_key(query_text), model, prompt_version)
+
+    def _expired(self, entry: dict) -> bool:
+        if self.ttl_seconds is None:
+            return False
+        try:
+            written = datetime.fromisoformat(entry["timestamp"].replace("Z", "+00:00"))
+        except (KeyError, AttributeError, ValueError):
+            return True
+        age = (datetime.now(timezone.utc) - written).total_seconds()
+        return age > self.ttl_seconds
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        for entry in _iter_cache_log(self.path):
+            self._log_lines += 1
+            key = self._key(
+                entry["query_text"],
+                entry.get("model", ""),
+                entry.get("prompt_version", "1"),
+            )
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, query_text: str, model: str) -> Optional[dict]:
+        """Return the cached plan dict for a query, or None."""
+        key = self._key(query_text, model, PROMPT_VERSION)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry["plan"]
+
+    def put(self, query_text: str, plan: QueryPlan, model: str) -> None:
+        """Cache a plan in memory and append it to the log."""
+        entry = {
+            "query_text": query_text,
+            "plan": plan.model_dump(),
+            "model": model,
+            "prompt_version": PROMPT_VERSION,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        key = self._key(query_text, model, PROMPT_VERSION)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        write_cache_entry(query_text, plan, model)
+        with self._lock:
+            self._log_lines += 1
+            if self._log_lines > max(2 * len(self._entries), self.COMPACT_MIN_LINES):
+                self._compact()
+
+    def _compact(self) -> None:
+        """Rewrite the log with the live entries only (caller holds the lock)."""
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        os.replace(tmp_path, self.path)
+        self._log_lines = len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+_plan_cache: Optional[QueryPlanCache] = None
+_plan_cache_lock = threading.Lock()
+
+
+def get_plan_cache() -> QueryPlanCache:
+    """Return the process-wide plan cache for CACHE_PATH (built on first use)."""
+    global _plan_cache
+    with _plan_cache_lock:
+        if _plan_cache is None or _plan_cache.path != CACHE_PATH:
+            _plan_cache = QueryPlanCache(CACHE_PATH)
+        return _plan_cache
+
+
+def reset_plan_cache() -> None:
+    """Drop the in-memory plan cache; the next lookup re-reads the log."""
+    global _plan_cache
+    with _plan_cache_lock:
+        _plan_cache = None
+
+
 def compile_query_llm(
     query_text: str,
     limit: Optional[int] = None,
@@ -415,10 +570,13 @@ def compile_query_llm(
         QueryCompilationError: If API call fails or response is invalid.
     """
     # Check cache first
-    cache = load_cache()
-    if query_text in cache:
+    cache = get_plan_cache()
+    cached = cache.get(query_text, model)
+    if cached is not None:
         try:
-            cached_plan = QueryPlan(**cache[query_text]["plan"])
+            cached_plan = QueryPlan(**cached)
+            # Cache keys are normalized; report the query as asked
+            cached_plan.query_text = query_text
             # Update limit if provided
             if limit:
                 cached_plan.limit = limit
@@ -459,7 +617,7 @@ def compile_query_llm(
 
     # Write to cache
     try:
-        write_cache_entry(query_text, plan, model)
+        cache.put(query_text, plan, model)
     except Exception:
         # Cache write failure shouldn't block query execution
         pass
@@ -35,6 +35,9 @@ class FacetCounts(BaseModel):
     by_language: Dict[str, int] = Field(default_factory=dict)
     by_publisher: Dict[str, int] = Field(default_factory=dict)
     by_century: Dict[str, int] = Field(default_factory=dict)
+    by_country: Dict[str, int] = Field(default_factory=dict)
+    # Exact number of distinct values per facet (the by_* maps are top-k)
+    distinct_values: Dict[str, int] = Field(default_factory=dict)
 
 
 class QueryOptions(BaseModel):
@@ -18,10 +18,9 @@ Usage:
 """
 
 import os
-import sqlite3
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from scripts.schemas import QueryPlan, FilterField
 from scripts.query.models import (
@@ -33,7 +32,9 @@ from scripts.query.models import (
 from scripts.query.compile import compile_query
 from scripts.query.execute import execute_plan
 from scripts.query.db_adapter import build_full_query
+from scripts.query.facets import century_label, compute_facets, decade_label
 from scripts.utils.logger import LoggerManager
+from scripts.utils.sqlite_pool import read_connection
 
 logger = LoggerManager.get_logger(__name__)
 
@@ -300,7 +301,8 @@ class QueryService:
     ) -> FacetCounts:
         """Compute facet counts for result set.
 
-        Aggregates results by place, year, language, publisher, and century.
+        Aggregates results by place, year, language, publisher, century
+        and country in a single pass (see scripts.query.facets).
 
         Args:
             candidate_ids: List of MMS IDs to aggregate
@@ -314,126 +316,30 @@ class QueryService:
 
         limit = options.facet_limit
 
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.row_factory = sqlite3.Row
+        conn = read_connection(self.db_path)
 
         try:
-            facets = FacetCounts()
-            placeholders = ",".join("?" * len(candidate_ids))
-
-            # By place
-            facets.by_place = self._run_facet_query(
-                conn,
-                f"""
-                SELECT place_norm as value, COUNT(DISTINCT record_id) as count
-                FROM imprints
-                WHERE record_id IN (SELECT id FROM records WHERE mms_id IN ({placeholders}))
-                  AND place_norm IS NOT NULL AND place_norm != ''
-                GROUP BY place_norm
-                ORDER BY count DESC
-                LIMIT ?
-                """,
-                [*candidate_ids, limit],
-            )
-
-            # By publisher
-            facets.by_publisher = self._run_facet_query(
-                conn,
-                f"""
-                SELECT publisher_norm as value, COUNT(DISTINCT record_id) as count
-                FROM imprints
-                WHERE record_id IN (SELECT id FROM records WHERE mms_id IN ({placeholders}))
-                  AND publisher_norm IS NOT NULL AND publisher_norm != ''
-                GROUP BY publisher_norm
-                ORDER BY count DESC
-                LIMIT ?
-                """,
-                [*candidate_ids, limit],
-            )
-
-            # By language
-            facets.by_language = self._run_facet_query(
-                conn,
-                f"""
-                SELECT l.code as value, COUNT(DISTINCT l.record_id) as count
-                FROM languages l
-                JOIN records r ON l.record_id = r.id
-                WHERE r.mms_id IN ({placeholders})
-                GROUP BY l.code
-                ORDER BY count DESC
-                LIMIT ?
-                """,
-                [*candidate_ids, limit],
-            )
-
-            # By year (decade buckets)
-            facets.by_year = self._run_facet_query(
-                conn,
-                f"""
-                SELECT
-                    CAST((date_start / 10 * 10) AS TEXT) || 's' as value,
-                    COUNT(DISTINCT record_id) as count
-                FROM imprints
-                WHERE record_id IN (SELECT id FROM records WHERE mms_id IN ({placeholders}))
-                  AND date_start IS NOT NULL
-                  AND date_start <= 2100
-                GROUP BY date_start / 10 * 10
-                ORDER BY date_start / 10 * 10 ASC
-                LIMIT ?
-                """,
-                [*candidate_ids, limit],
-            )
-
-            # By century
-            facets.by_century = self._run_facet_query(
-                conn,
-                f"""
-                SELECT
-                    CASE
-                        WHEN (date_start - 1) / 100 + 1 = 15 THEN '15th century'
-                        WHEN (date_start - 1) / 100 + 1 = 16 THEN '16th century'
-                        WHEN (date_start - 1) / 100 + 1 = 17 THEN '17th century'
-                        WHEN (date_start - 1) / 100 + 1 = 18 THEN '18th century'
-                        WHEN (date_start - 1) / 100 + 1 = 19 THEN '19th century'
-                        ELSE CAST((date_start - 1) / 100 + 1 AS TEXT) || 'th century'
-                    END as value,
-                    COUNT(DISTINCT record_id) as count
-                FROM imprints
-                WHERE record_id IN (SELECT id FROM records WHERE mms_id IN ({placeholders}))
-                  AND date_start IS NOT NULL
-                  AND date_start <= 2100
-                GROUP BY (date_start - 1) / 100 + 1
-                ORDER BY (date_start - 1) / 100 + 1 ASC
-                LIMIT ?
-                """,
-                [*candidate_ids, limit],
-            )
-
-            return facets
-
+            facets = compute_facets(conn, candidate_ids, max_year=2100)
+        except Exception as e:
+            logger.warning(f"Facet query failed: {e}")
+            return FacetCounts()
         finally:
             conn.close()
 
-    def _run_facet_query(
-        self,
-        conn: sqlite3.Connection,
-        query: str,
-        params: List,
-    ) -> Dict[str, int]:
-        """Execute a facet aggregation query.
-
-        Args:
-            conn: Database connection
-            query: SQL query
-            params: Query parameters
-
-        Returns:
-            Dict mapping facet values to counts
-        """
-        try:
-            cursor = conn.execute(query, params)
-            return {row["value"]: row["count"] for row in cursor.fetchall()}
-        except Exception as e:
-            logger.warning(f"Facet query failed: {e}")
-            return {}
+        return FacetCounts(
+            by_place=dict(facets["place"].top(limit)),
+            by_publisher=dict(facets["publisher"].top(limit)),
+            by_language=dict(facets["language"].top(limit)),
+            by_country=dict(facets["country"].top(limit)),
+            by_year={
+                decade_label(decade): count
+                for decade, count in facets["decade"].ordered(limit)
+            },
+            by_century={
+                century_label(century): count
+                for century, count in facets["century"].ordered(limit)
+            },
+            distinct_values={
+                field: facet.distinct_values for field, facet in facets.items()
+            },
+        )
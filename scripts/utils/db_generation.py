@@ -0,0 +1,52 @@
+"""Generation stamps for the bibliographic SQLite database.
+
+A generation stamp changes whenever the database content may have
+changed, so results derived from the database (e.g. cached executor step
+results) can be keyed on it and never served stale.
+
+The stamp combines ``PRAGMA user_version`` (read straight from the file
+header, no connection needed) with the size and mtime of the database
+file and its WAL. Writers that know they changed content -- the M3
+indexer and the metadata feedback loop -- also call
+``bump_db_generation`` so the stamp changes even on filesystems with
+coarse mtime resolution.
+"""
+import sqlite3
+from pathlib import Path
+from typing import Tuple
+
+# Offset of the 4-byte big-endian user_version in the SQLite file header
+_USER_VERSION_OFFSET = 60
+
+
+def _stat_stamp(path: Path) -> Tuple[int, int]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def db_generation(db_path: str | Path) -> str:
+    """Return the current generation stamp of a SQLite database file."""
+    db_path = Path(db_path)
+    user_version = 0
+    try:
+        with open(db_path, "rb") as f:
+            f.seek(_USER_VERSION_OFFSET)
+            user_version = int.from_bytes(f.read(4), "big")
+    except FileNotFoundError:
+        pass
+    db_mtime, db_size = _stat_stamp(db_path)
+    wal_mtime, wal_size = _stat_stamp(db_path.with_name(db_path.name + "-wal"))
+    return f"{user_version}:{db_mtime}:{db_size}:{wal_mtime}:{wal_size}"
+
+
+def bump_db_generation(conn: sqlite3.Connection) -> int:
+    """Increment ``PRAGMA user_version`` on *conn*; returns the new value.
+
+    The pragma is transactional, so call this before the writer's commit.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0] + 1
+    conn.execute(f"PRAGMA user_version = {int(version)}")
+    return version
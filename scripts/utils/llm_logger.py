@@ -8,6 +8,13 @@ This module provides centralized logging for all OpenAI API calls, capturing:
 
 Logs are written as structured JSON to enable analysis and debugging.
 
+``log_call`` does no file I/O itself (it is called from async code on the
+event loop). Entries are queued to a background writer thread that appends
+them to the JSONL log in batches and rotates the file by size and age. The
+same thread stores one cost row per call in an indexed SQLite table next to
+the log (``logs/llm_calls.db``), so ``get_session_costs`` and
+``get_summary`` are indexed queries, not a scan of the whole log.
+
 Usage:
     from scripts.utils.llm_logger import LLMLogger
 
@@ -24,11 +31,15 @@ Usage:
     )
 """
 
+import atexit
 import json
+import queue
+import sqlite3
 import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from scripts.utils.logger import LoggerManager
 from scripts.utils.redaction import redact_secrets
@@ -51,6 +62,225 @@ from scripts.utils.redaction import redact_secrets
 # Default log file path
 DEFAULT_LLM_LOG_PATH = Path("logs/llm_calls.jsonl")
 
+# Background writer: entries per batch and max delay before a batch is written
+WRITE_BATCH_SIZE = 200
+WRITE_INTERVAL_S = 1.0
+
+# Rotate the JSONL log past this size or age; keep this many rotated files
+# (cost rows stay in the SQLite store regardless)
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_MAX_AGE_S = 24 * 3600
+DEFAULT_BACKUP_COUNT = 14
+
+COST_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_calls (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    session_id TEXT,
+    call_type TEXT NOT NULL,
+    model TEXT NOT NULL,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    cost_usd REAL NOT NULL DEFAULT 0.0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_session ON llm_calls(session_id, ts);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_ts ON llm_calls(ts, call_type);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_type ON llm_calls(call_type, ts);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_model ON llm_calls(model, ts);
+CREATE TABLE IF NOT EXISTS llm_calls_meta (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    backfilled INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+_INSERT_COST_SQL = (
+    "INSERT INTO llm_calls (ts, session_id, call_type, model, "
+    "input_tokens, output_tokens, total_tokens, cost_usd) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _entry_ts(entry: Dict[str, Any]) -> float:
+    """Epoch seconds of a log entry's ISO timestamp."""
+    return datetime.fromisoformat(
+        entry.get("timestamp", "").replace("Z", "+00:00")
+    ).timestamp()
+
+
+def _cost_row(entry: Dict[str, Any]) -> tuple:
+    usage = entry.get("usage", {})
+    return (
+        _entry_ts(entry),
+        entry.get("session_id"),
+        entry.get("call_type", "unknown"),
+        entry.get("model", ""),
+        usage.get("input_tokens", 0),
+        usage.get("output_tokens", 0),
+        usage.get("total_tokens", 0),
+        entry.get("cost_usd", 0.0),
+    )
+
+
+def _backfill_rows(log_path: Path) -> List[tuple]:
+    """Cost rows of every entry in the JSONL log and its rotated files."""
+    paths = sorted(log_path.parent.glob(f"{log_path.stem}.*{log_path.suffix}"))
+    if log_path.exists():
+        paths.append(log_path)
+    rows = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        rows.append(_cost_row(json.loads(line)))
+                    except (json.JSONDecodeError, ValueError, AttributeError):
+                        continue
+    return rows
+
+
+def _open_cost_store(log_path: Path, cost_db_path: Path) -> sqlite3.Connection:
+    """Open the cost store, creating and backfilling it on first use.
+
+    The backfill from the JSONL logs runs once per store, under an
+    IMMEDIATE transaction, so worker processes that open a new store at the
+    same time do not import the logs twice. Both the writer thread and the
+    read path (``get_summary`` before anything was logged) call this.
+    """
+    conn = sqlite3.connect(
+        str(cost_db_path), timeout=30, check_same_thread=False, isolation_level=None
+    )
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(COST_SCHEMA)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT 1 FROM llm_calls_meta WHERE id = 1").fetchone() is None:
+                # A store that already has rows predates the marker and was
+                # backfilled when it was created
+                if not conn.execute("SELECT EXISTS (SELECT 1 FROM llm_calls)").fetchone()[0]:
+                    conn.executemany(_INSERT_COST_SQL, _backfill_rows(log_path))
+                conn.execute("INSERT INTO llm_calls_meta (id, backfilled) VALUES (1, 1)")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    except BaseException:
+        conn.close()
+        raise
+    conn.isolation_level = ""  # back to implicit transactions for batched inserts
+    return conn
+
+
+class _LogWriter(threading.Thread):
+    """Background thread that persists queued LLM log entries.
+
+    Entries are written in batches (up to ``WRITE_BATCH_SIZE``, or whatever
+    arrived within ``WRITE_INTERVAL_S``): one append to the JSONL log and
+    one ``executemany`` into the cost store per batch. A new cost store is
+    backfilled from any existing JSONL logs before the first batch
+    (``_open_cost_store``).
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        cost_db_path: Path,
+        max_bytes: int,
+        max_age_s: float,
+        backup_count: int,
+        logger: Any,
+    ):
+        super().__init__(name="llm-log-writer", daemon=True)
+        self.log_path = log_path
+        self.cost_db_path = cost_db_path
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.backup_count = backup_count
+        self.logger = logger
+        self.queue: "queue.Queue[Any]" = queue.Queue()
+        self._file_started: Optional[float] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # -- thread side ---------------------------------------------------------
+
+    def run(self) -> None:
+        try:
+            self._conn = _open_cost_store(self.log_path, self.cost_db_path)
+        except Exception as e:
+            self.logger.warning(f"LLM cost store unavailable: {e}")
+        stop = False
+        while not stop:
+            batch: List[Dict[str, Any]] = []
+            waiters: List[threading.Event] = []
+            item = self.queue.get()
+            deadline = time.monotonic() + WRITE_INTERVAL_S
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    # flush() marker: write what we have now
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or waiters or len(batch) >= WRITE_BATCH_SIZE:
+                    break
+                try:
+                    item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(batch)
+            for event in waiters:
+                event.set()
+        if self._conn is not None:
+            self._conn.close()
+
+    def _insert(self, rows: List[tuple]) -> None:
+        with self._conn:
+            self._conn.executemany(_INSERT_COST_SQL, rows)
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            self._maybe_rotate()
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(e, ensure_ascii=False) + "\n" for e in batch))
+        except Exception as e:
+            self.logger.warning(f"Failed to write LLM log: {e}")
+        if self._conn is not None:
+            try:
+                self._insert([_cost_row(e) for e in batch])
+            except Exception as e:
+                self.logger.warning(f"Failed to record LLM costs: {e}")
+
+    def _maybe_rotate(self) -> None:
+        try:
+            size = self.log_path.stat().st_size
+        except FileNotFoundError:
+            self._file_started = None
+            return
+        if self._file_started is None:
+            self._file_started = self._first_entry_ts()
+        if size < self.max_bytes and time.time() - self._file_started < self.max_age_s:
+            return
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        self.log_path.rename(
+            self.log_path.with_name(f"{self.log_path.stem}.{stamp}{self.log_path.suffix}")
+        )
+        self._file_started = None
+        rotated = sorted(self.log_path.parent.glob(f"{self.log_path.stem}.*{self.log_path.suffix}"))
+        for old in rotated[:max(0, len(rotated) - self.backup_count)]:
+            old.unlink(missing_ok=True)
+
+    def _first_entry_ts(self) -> float:
+        """Timestamp of the first entry in the current log (now if unreadable)."""
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                return _entry_ts(json.loads(f.readline()))
+        except (OSError, json.JSONDecodeError, ValueError, AttributeError):
+            return time.time()
+
 
 class LLMLogger:
     """Centralized logger for LLM API calls.
@@ -60,6 +290,7 @@ class LLMLogger:
 
     Attributes:
         log_path: Path to the JSONL log file
+        cost_db_path: Path to the SQLite cost store
         logger: Python logger instance for structured logging
         log_full_prompts: Whether to log full prompts or just previews
     """
@@ -69,6 +300,10 @@ class LLMLogger:
         log_path: Optional[Path] = None,
         log_full_prompts: bool = False,
         preview_length: int = 500,
+        cost_db_path: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age_s: float = DEFAULT_MAX_AGE_S,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
     ):
         """Initialize LLM logger.
 
@@ -78,10 +313,21 @@ class LLMLogger:
                 log previews only. Defaults to False so full user/system prompts
                 are not persisted to disk by default (DL-2); opt in for debugging.
             preview_length: Max characters for prompt previews when log_full_prompts=False
+            cost_db_path: SQLite cost store. Defaults to the log path with a .db suffix
+            max_bytes: Rotate the JSONL log once it reaches this size
+            max_age_s: Rotate the JSONL log once its first entry is this old
+            backup_count: Number of rotated JSONL files to keep
         """
         self.log_path = log_path or DEFAULT_LLM_LOG_PATH
+        self.cost_db_path = cost_db_path or self.log_path.with_suffix(".db")
         self.log_full_prompts = log_full_prompts
         self.preview_length = preview_length
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.backup_count = backup_count
+        self._writer: Optional[_LogWriter] = None
+        self._writer_lock = threading.Lock()
+        self._store_ready = False
 
         # Ensure log directory exists
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -163,7 +409,7 @@ class LLMLogger:
             extra_metadata: Optional additional metadata to include
 
         Returns:
-            The log entry dict that was written
+            The log entry dict (queued to the background writer)
         """
         timestamp = datetime.now(timezone.utc).isoformat()
 
@@ -221,12 +467,8 @@ class LLMLogger:
         if extra_metadata:
             log_entry["metadata"] = extra_metadata
 
-        # Write to JSONL file
-        try:
-            with open(self.log_path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(log_entry, ensure_ascii=False) + "\n")
-        except Exception as e:
-            self.logger.warning(f"Failed to write LLM log: {e}")
+        # Hand off to the background writer (JSONL log + cost store)
+        self._get_writer().queue.put(log_entry)
 
         # Also log summary to console
         self.logger.info(
@@ -237,6 +479,64 @@ class LLMLogger:
 
         return log_entry
 
+    def _get_writer(self) -> _LogWriter:
+        """Start the background writer on first use."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = _LogWriter(
+                    self.log_path,
+                    self.cost_db_path,
+                    self.max_bytes,
+                    self.max_age_s,
+                    self.backup_count,
+                    self.logger,
+                )
+                self._writer.start()
+                atexit.register(self.close)
+            return self._writer
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Block until every entry logged so far has been written.
+
+        Returns:
+            False if the writer did not catch up within *timeout* seconds
+        """
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return True
+        done = threading.Event()
+        writer.queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Write pending entries and stop the background writer."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None and writer.is_alive():
+            writer.queue.put(None)
+            writer.join(timeout)
+
+    def _query(self, sql: str, params: tuple) -> List[tuple]:
+        """Run a read query against the cost store (after pending writes).
+
+        Opens (and on first use backfills) the store itself, so totals are
+        right even in a process that has not logged anything yet.
+        """
+        self.flush()
+        try:
+            if self._store_ready:
+                conn = sqlite3.connect(str(self.cost_db_path))
+            else:
+                conn = _open_cost_store(self.log_path, self.cost_db_path)
+                self._store_ready = True
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"LLM cost store unavailable: {e}")
+            return []
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
     def get_session_costs(self, session_id: str) -> Dict[str, Any]:
         """Get total costs for a session.
 
@@ -246,24 +546,12 @@ class LLMLogger:
         Returns:
             Dict with total_cost, total_tokens, and call_count
         """
-        if not self.log_path.exists():
-            return {"total_cost": 0, "total_tokens": 0, "call_count": 0}
-
-        total_cost = 0.0
-        total_tokens = 0
-        call_count = 0
-
-        with open(self.log_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        entry = json.loads(line)
-                        if entry.get("session_id") == session_id:
-                            total_cost += entry.get("cost_usd", 0)
-                            total_tokens += entry.get("usage", {}).get("total_tokens", 0)
-                            call_count += 1
-                    except json.JSONDecodeError:
-                        continue
+        rows = self._query(
+            "SELECT COALESCE(SUM(cost_usd), 0), COALESCE(SUM(total_tokens), 0), COUNT(*) "
+            "FROM llm_calls WHERE session_id = ?",
+            (session_id,),
+        )
+        total_cost, total_tokens, call_count = rows[0] if rows else (0.0, 0, 0)
 
         return {
             "session_id": session_id,
@@ -281,55 +569,19 @@ class LLMLogger:
         Returns:
             Dict with total_cost, total_tokens, call_count, and by_type breakdown
         """
-        if not self.log_path.exists():
-            return {
-                "total_cost": 0,
-                "total_tokens": 0,
-                "call_count": 0,
-                "by_type": {},
-            }
-
         cutoff = datetime.now(timezone.utc).timestamp() - (hours * 3600)
-        total_cost = 0.0
-        total_tokens = 0
-        call_count = 0
-        by_type: Dict[str, Dict[str, Any]] = {}
-
-        with open(self.log_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        entry = json.loads(line)
-                        # Parse timestamp
-                        ts = datetime.fromisoformat(
-                            entry.get("timestamp", "").replace("Z", "+00:00")
-                        ).timestamp()
-
-                        if ts >= cutoff:
-                            cost = entry.get("cost_usd", 0)
-                            tokens = entry.get("usage", {}).get("total_tokens", 0)
-                            call_type = entry.get("call_type", "unknown")
-
-                            total_cost += cost
-                            total_tokens += tokens
-                            call_count += 1
-
-                            if call_type not in by_type:
-                                by_type[call_type] = {
-                                    "cost": 0,
-                                    "tokens": 0,
-                                    "count": 0,
-                                }
-                            by_type[call_type]["cost"] += cost
-                            by_type[call_type]["tokens"] += tokens
-                            by_type[call_type]["count"] += 1
-
-                    except (json.JSONDecodeError, ValueError):
-                        continue
-
-        # Round costs
-        for call_type in by_type:
-            by_type[call_type]["cost"] = round(by_type[call_type]["cost"], 6)
+        rows = self._query(
+            "SELECT call_type, SUM(cost_usd), SUM(total_tokens), COUNT(*) "
+            "FROM llm_calls WHERE ts >= ? GROUP BY call_type",
+            (cutoff,),
+        )
+        by_type: Dict[str, Dict[str, Any]] = {
+            call_type: {"cost": round(cost, 6), "tokens": tokens, "count": count}
+            for call_type, cost, tokens, count in rows
+        }
+        total_cost = sum(cost for _, cost, _, _ in rows)
+        total_tokens = sum(tokens for _, _, tokens, _ in rows)
+        call_count = sum(count for _, _, _, count in rows)
 
         return {
             "period_hours": hours,
@@ -356,6 +608,12 @@ def get_llm_logger() -> LLMLogger:
     return _llm_logger
 
 
+def close_llm_logger() -> None:
+    """Flush and stop the global logger's background writer (on shutdown)."""
+    if _llm_logger is not None:
+        _llm_logger.close()
+
+
 # =============================================================================
 # Thread-safe token accumulator for per-request token tracking
 # =============================================================================
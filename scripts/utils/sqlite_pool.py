@@ -0,0 +1,192 @@
+"""Pooled read-only SQLite connections for the request paths.
+
+Query execution, the scholar-pipeline executor, aggregation, cross
+reference and the network API all read ``bibliographic.db`` and used to
+open (and close) a fresh connection for every step. ``read_connection``
+hands out connections from a small per-database pool instead, so
+connection setup and page-cache warmup are paid once per worker.
+
+Pooled connections are opened with a ``mode=ro`` URI and tuned for reads
+(``query_only``, ``mmap_size``, ``cache_size``, ``temp_store=MEMORY``).
+Calling ``close()`` on one returns it to its pool, so call sites keep the
+usual ``try: ... finally: conn.close()`` shape. If the database file is
+replaced (e.g. a full M3 rebuild), idle connections to the old file are
+discarded.
+
+Paths that do not exist yet and ``:memory:`` get a plain connection,
+exactly as ``sqlite3.connect`` would give them.
+"""
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IDLE = 8
+# Distinct database files with a live pool (oldest pool is closed beyond this)
+MAX_POOLS = 8
+MMAP_SIZE = 256 * 1024 * 1024
+# Negative cache_size is in KiB
+CACHE_SIZE_KIB = 64 * 1024
+
+RowFactory = Optional[Callable]
+
+
+class PooledConnection(sqlite3.Connection):
+    """Connection whose ``close()`` returns it to the pool it came from."""
+
+    _pool: Optional["ReadConnectionPool"] = None
+    _file_id: Tuple[int, int] = (0, 0)
+
+    def close(self) -> None:
+        pool = self._pool
+        if pool is None:
+            super().close()
+        else:
+            pool.release(self)
+
+    def discard(self) -> None:
+        """Close the underlying connection for good."""
+        self._pool = None
+        super().close()
+
+
+def _file_id(path: Path) -> Tuple[int, int]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return (0, 0)
+    return (st.st_dev, st.st_ino)
+
+
+class ReadConnectionPool:
+    """Thread-safe pool of read-only connections to one database file.
+
+    Args:
+        db_path: Path of an existing SQLite database.
+        max_idle: Idle connections kept for reuse; extra ones are closed.
+    """
+
+    def __init__(self, db_path: Path, max_idle: int = DEFAULT_MAX_IDLE) -> None:
+        self.db_path = Path(db_path).resolve()
+        self.max_idle = max_idle
+        self.opened = 0
+        self.reused = 0
+        self._idle: List[PooledConnection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self, row_factory: RowFactory = None) -> PooledConnection:
+        """Check out a connection (opening one if none is idle)."""
+        file_id = _file_id(self.db_path)
+        conn = None
+        with self._lock:
+            while self._idle:
+                candidate = self._idle.pop()
+                if candidate._file_id == file_id:
+                    conn = candidate
+                    self.reused += 1
+                    break
+                candidate.discard()
+        if conn is None:
+            conn = self._open(file_id)
+        conn.row_factory = row_factory
+        return conn
+
+    def release(self, conn: PooledConnection) -> None:
+        """Return *conn* to the pool, or close it if the pool is full."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+        except sqlite3.Error:
+            conn.discard()
+            return
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.discard()
+
+    def close(self) -> None:
+        """Close all idle connections; checked-out ones close on release."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.discard()
+
+    def stats(self) -> dict:
+        return {"opened": self.opened, "reused": self.reused, "idle": len(self._idle)}
+
+    def _open(self, file_id: Tuple[int, int]) -> PooledConnection:
+        conn = sqlite3.connect(
+            f"{self.db_path.as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            factory=PooledConnection,
+        )
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute(f"PRAGMA mmap_size = {int(MMAP_SIZE)}")
+        conn.execute(f"PRAGMA cache_size = -{int(CACHE_SIZE_KIB)}")
+        conn._file_id = file_id
+        conn._pool = self
+        with self._lock:
+            self.opened += 1
+        return conn
+
+
+_pools: "OrderedDict[Path, ReadConnectionPool]" = OrderedDict()
+_pools_lock = threading.Lock()
+
+
+def get_read_pool(db_path: str | Path) -> ReadConnectionPool:
+    """Return the process-wide pool for *db_path*, creating it if needed."""
+    key = Path(db_path).resolve()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ReadConnectionPool(key)
+            _pools[key] = pool
+            while len(_pools) > MAX_POOLS:
+                _, old = _pools.popitem(last=False)
+                old.close()
+        else:
+            _pools.move_to_end(key)
+        return pool
+
+
+def read_connection(
+    db_path: str | Path,
+    row_factory: RowFactory = None,
+) -> sqlite3.Connection:
+    """Get a read-only connection to *db_path*; ``close()`` returns it.
+
+    Args:
+        db_path: Path to the SQLite database.
+        row_factory: Row factory for this checkout (e.g. ``sqlite3.Row``).
+
+    Returns:
+        A pooled read-only connection, or a plain one for ``:memory:`` and
+        paths that do not exist.
+    """
+    if str(db_path) == ":memory:" or not Path(db_path).is_file():
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.row_factory = row_factory
+        return conn
+    return get_read_pool(db_path).acquire(row_factory)
+
+
+def close_read_pools() -> None:
+    """Close every pool (API shutdown, tests)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -317,6 +317,47 @@ def test_map_nodes_carry_active_imprint_span(client):
     assert data["meta"]["year_max"] is not None
 
 
+def test_map_precomputed_stats_match_live(client, mock_db):
+    """Stored spans/degrees (build_network_map_stats) serve the same map as
+    the live queries, and an edge write falls back to live."""
+    from scripts.network.build_network_tables import build_network_map_stats
+
+    def nodes(url):
+        return sorted(
+            (n["agent_norm"], n["filtered_count"], n["active_start"], n["active_end"])
+            for n in client.get(url).json()["nodes"]
+        )
+
+    def edges(url):
+        return sorted(
+            (e["source"], e["target"], e["type"], e["confidence"])
+            for e in client.get(url).json()["edges"]
+        )
+
+    urls = ["/network/map", "/network/map?connection_types=same_record&min_confidence=0.8"]
+    live = [nodes(url) for url in urls]
+    live_edges = [edges(url) for url in urls]
+    assert live_edges[0]
+
+    conn = sqlite3.connect(str(mock_db))
+    build_network_map_stats(conn)
+    conn.commit()
+    assert [nodes(url) for url in urls] == live
+    # Same edges through idx_network_edges_type_confidence
+    assert [edges(url) for url in urls] == live_edges
+
+    conn.execute(
+        "INSERT INTO network_edges VALUES "
+        "('smith, john', 'ego, far', 'same_record', 0.9, NULL, 1, 'mms:9')"
+    )
+    conn.commit()
+    assert conn.execute("SELECT dirty FROM network_map_stats").fetchone()[0] == 1
+    conn.close()
+    before = {norm: count for norm, count, _, _ in live[1]}
+    after = {norm: count for norm, count, _, _ in nodes(urls[1])}
+    assert after["smith, john"] == before["smith, john"] + 1
+
+
 def test_map_nodes_and_meta_carry_community(client):
     """Issue #28: nodes expose their community and meta lists the palette order."""
     resp = client.get("/network/map")
@@ -0,0 +1,73 @@
+"""Tests for the bounded blocking-work offload lanes."""
+import asyncio
+import inspect
+import threading
+
+import pytest
+
+from app.api.offload import offload_stats, offloaded, run_blocking, shutdown_offload
+
+
+@pytest.fixture(autouse=True)
+def lanes(monkeypatch):
+    monkeypatch.setenv("OFFLOAD_AGGREGATE_WORKERS", "1")
+    shutdown_offload()
+    yield
+    shutdown_offload()
+
+
+def test_run_blocking_runs_off_the_event_loop_thread():
+    async def main():
+        loop_thread = threading.get_ident()
+        worker_thread = await run_blocking("lookup", threading.get_ident)
+        return loop_thread, worker_thread
+
+    loop_thread, worker_thread = asyncio.run(main())
+
+    assert worker_thread != loop_thread
+
+
+def test_exceptions_propagate_and_are_counted():
+    def boom():
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        asyncio.run(run_blocking("lookup", boom))
+
+    assert offload_stats()["lookup"]["failed"] == 1
+
+
+def test_lane_limit_queues_excess_work():
+    release = threading.Event()
+
+    async def main():
+        first = asyncio.ensure_future(run_blocking("aggregate", release.wait, 5))
+        second = asyncio.ensure_future(run_blocking("aggregate", release.wait, 5))
+        await asyncio.sleep(0.05)
+        stats = offload_stats()["aggregate"]
+        release.set()
+        await asyncio.gather(first, second)
+        return stats
+
+    stats = asyncio.run(main())
+
+    assert stats["max_workers"] == 1
+    assert stats["running"] == 1
+    assert stats["queued"] == 1
+    assert offload_stats()["aggregate"]["completed"] == 2
+    assert offload_stats()["aggregate"]["peak_queued"] >= 1
+
+
+def test_offloaded_keeps_handler_signature():
+    @offloaded("lookup")
+    def handler(agent_norm: str, limit: int = 10) -> dict:
+        return {"agent_norm": agent_norm, "limit": limit}
+
+    assert inspect.iscoroutinefunction(handler)
+    assert list(inspect.signature(handler).parameters) == ["agent_norm", "limit"]
+    assert asyncio.run(handler("karo", limit=3)) == {"agent_norm": "karo", "limit": 3}
+
+
+def test_unknown_lane_rejected():
+    with pytest.raises(ValueError):
+        offloaded("bogus")
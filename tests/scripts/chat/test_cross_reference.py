@@ -727,3 +727,129 @@ def test_agent_node_fields(teacher_student_db):
     assert len(node.students) == 2  # Hottinger and Wasmuth
     assert "Synagoga Judaica" in node.notable_works
     assert node.record_count >= 1  # At least 1 record in the DB
+
+
+# =============================================================================
+# Generation-keyed graph cache
+# =============================================================================
+
+
+@pytest.fixture
+def graph_db_path(tmp_path):
+    """File-backed database (the cache only applies to database files)."""
+    from scripts.chat import cross_reference
+
+    path = tmp_path / "bib.db"
+    conn = sqlite3.connect(str(path))
+    _create_schema(conn)
+    r1 = _insert_record(conn, "990001001")
+    _insert_agent(conn, r1, "buxtorf, johannes", "author", "nli:000001001")
+    _insert_enrichment(conn, "nli:000001001", "Q61067", "Johannes Buxtorf", {
+        "birth_year": 1564, "death_year": 1629, "teachers": ["Abraham Scultetus"],
+    })
+    conn.commit()
+    conn.close()
+    cross_reference._reset_graph_cache()
+    yield path
+    cross_reference.disable_agent_graph_snapshot()
+    cross_reference._reset_graph_cache()
+
+
+def _write(path, fn) -> None:
+    """Apply a write and bump the generation like the M3 writers do."""
+    from scripts.utils.db_generation import bump_db_generation
+
+    conn = sqlite3.connect(str(path))
+    fn(conn)
+    bump_db_generation(conn)
+    conn.commit()
+    conn.close()
+
+
+def test_graph_cached_until_generation_changes(graph_db_path):
+    graph = build_agent_graph(graph_db_path)
+    assert build_agent_graph(graph_db_path) is graph
+    assert set(graph) == {"buxtorf, johannes"}
+
+    def add_scultetus(conn):
+        rid = _insert_record(conn, "990001002")
+        _insert_agent(conn, rid, "scultetus, abraham", "author", "nli:000002001")
+        _insert_enrichment(conn, "nli:000002001", "Q62182", "Abraham Scultetus",
+                           {"students": ["Johannes Buxtorf"]})
+
+    _write(graph_db_path, add_scultetus)
+
+    rebuilt = build_agent_graph(graph_db_path)
+    assert rebuilt is not graph
+    assert set(rebuilt) == {"buxtorf, johannes", "scultetus, abraham"}
+
+
+def test_unrelated_write_keeps_parsed_graph(graph_db_path):
+    graph = build_agent_graph(graph_db_path)
+
+    _write(graph_db_path, lambda conn: _insert_record(conn, "990009999"))
+
+    assert build_agent_graph(graph_db_path) is graph
+
+
+def test_graph_loaded_from_snapshot(graph_db_path, tmp_path, monkeypatch):
+    from scripts.chat import cross_reference
+
+    cross_reference.enable_agent_graph_snapshot(tmp_path / "graph.json")
+    graph = build_agent_graph(graph_db_path)
+
+    # A fresh worker (empty in-memory cache) must not re-parse the rows
+    cross_reference._reset_graph_cache()
+    monkeypatch.setattr(cross_reference, "_graph_from_rows", lambda rows: pytest.fail("re-parsed"))
+    loaded = build_agent_graph(graph_db_path)
+
+    assert loaded is not graph
+    assert loaded == graph
+    assert cross_reference.warm_agent_graph(graph_db_path) == 1
+
+
+# =============================================================================
+# Name index
+# =============================================================================
+
+
+def _linear_match(name, graph):
+    """The original scan-based matcher the name index replaces."""
+    name_lower = name.lower()
+    if name_lower in graph:
+        return name_lower
+    for agent_norm, node in graph.items():
+        if node.label.lower() == name_lower:
+            return agent_norm
+    name_parts = name_lower.split()
+    for agent_norm in graph:
+        if all(part in agent_norm for part in name_parts):
+            return agent_norm
+    for agent_norm in graph:
+        if agent_norm.split(", ")[0].lower() in name_lower:
+            return agent_norm
+    return None
+
+
+def test_name_index_matches_linear_scan():
+    from scripts.chat.cross_reference import _AgentGraph, _match_name_in_graph
+
+    norms = [
+        "buxtorf, johannes", "buxtorf, johannes, 1599-1664", "scultetus, abraham",
+        "hottinger, johann heinrich", "wasmuth, matthias", "karo, joseph ben ephraim",
+        "ibn ezra, abraham", "abravanel, isaac", "מאיר בן ברוך", "de rossi, azariah",
+    ]
+    graph = _AgentGraph(
+        (norm, AgentNode(label=norm.split(", ")[-1].title() + " X", agent_norm=norm))
+        for norm in norms
+    )
+    names = [
+        "Johannes Buxtorf", "buxtorf, johannes", "Abraham X", "Abraham",
+        "Johann Heinrich Hottinger", "J. H. Hottinger", "Joseph Karo", "Rabbi Karo",
+        "Abraham ibn Ezra", "Isaac Abravanel", "Azariah de' Rossi", "מאיר",
+        "ba", "z", "", "  ", "Unknown Person", "Matthias Wasmuth the Elder",
+    ]
+
+    for name in names:
+        assert _match_name_in_graph(name, graph) == _linear_match(name, graph), name
+        assert _match_name_in_graph(name, dict(graph)) == _linear_match(name, graph), name
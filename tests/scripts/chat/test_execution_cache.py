@@ -0,0 +1,171 @@
+"""Tests for the executor result cache (keyed by step params + DB generation)."""
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from scripts.chat.execution_cache import (
+    disable_execution_cache,
+    enable_execution_cache,
+)
+from scripts.chat.plan_models import (
+    ExecutionStep,
+    InterpretationPlan,
+    ResolveAgentParams,
+    RetrieveParams,
+    SessionContext,
+    StepAction,
+)
+from scripts.schemas.query_plan import Filter, FilterField, FilterOp
+from scripts.utils.db_generation import bump_db_generation, db_generation
+from tests.scripts.chat import test_executor
+
+# Reuse the executor tests' sample database fixture
+test_db = test_executor.test_db
+
+
+def _karo_plan(label: str = "Retrieve Karo works") -> InterpretationPlan:
+    return InterpretationPlan(
+        intents=["entity_exploration"],
+        reasoning="Test",
+        execution_steps=[
+            ExecutionStep(
+                action=StepAction.RESOLVE_AGENT,
+                params=ResolveAgentParams(name="Joseph Karo"),
+                label="Resolve Karo",
+            ),
+            ExecutionStep(
+                action=StepAction.RETRIEVE,
+                params=RetrieveParams(
+                    filters=[Filter(field=FilterField.AGENT_NORM, op=FilterOp.CONTAINS, value="$step_0")],
+                ),
+                label=label,
+                depends_on=[0],
+            ),
+        ],
+        directives=[],
+        confidence=0.9,
+    )
+
+
+@pytest.fixture
+def cache():
+    cache = enable_execution_cache()
+    yield cache
+    disable_execution_cache()
+
+
+def _count_step_runs():
+    from scripts.chat import executor
+    return patch.object(executor, "_execute_step", wraps=executor._execute_step)
+
+
+def test_db_generation_changes_on_bump(tmp_path):
+    db = tmp_path / "g.db"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE t (x)")
+    conn.commit()
+    before = db_generation(db)
+
+    bump_db_generation(conn)
+    conn.commit()
+    conn.close()
+
+    assert db_generation(db) != before
+    assert db_generation(db).startswith("1:")
+
+
+def test_repeated_plan_skips_sql(cache, test_db):
+    from scripts.chat.executor import execute_plan
+
+    first = execute_plan(_karo_plan(), test_db)
+    with _count_step_runs() as spy, \
+            patch("scripts.chat.executor._collect_grounding") as grounding_spy:
+        second = execute_plan(_karo_plan(label="Karo, again"), test_db)
+
+    assert spy.call_count == 0
+    assert grounding_spy.call_count == 0
+    assert second.steps_completed[1].label == "Karo, again"
+    assert second.steps_completed[1].data == first.steps_completed[1].data
+    assert second.grounding == first.grounding
+
+
+def test_follow_up_reuses_shared_prefix(cache, test_db):
+    from scripts.chat.executor import execute_plan
+
+    execute_plan(_karo_plan(), test_db)
+    follow_up = _karo_plan()
+    follow_up.execution_steps[1].params.filters.append(
+        Filter(field=FilterField.IMPRINT_PLACE, op=FilterOp.EQUALS, value="venice")
+    )
+    with _count_step_runs() as spy:
+        execute_plan(follow_up, test_db)
+
+    # Only the changed retrieve step runs; the resolve step is a hit
+    assert [c.args[1] for c in spy.call_args_list] == [1]
+
+
+def test_db_write_invalidates(cache, test_db):
+    from scripts.chat.executor import execute_plan
+
+    execute_plan(_karo_plan(), test_db)
+    conn = sqlite3.connect(test_db)
+    bump_db_generation(conn)
+    conn.commit()
+    conn.close()
+
+    with _count_step_runs() as spy:
+        execute_plan(_karo_plan(), test_db)
+
+    assert spy.call_count == 2
+
+
+def test_previous_results_scope_keyed_by_record_ids(cache, test_db):
+    from scripts.chat.executor import execute_plan
+
+    plan = InterpretationPlan(
+        intents=["follow_up"],
+        reasoning="Test",
+        execution_steps=[
+            ExecutionStep(
+                action=StepAction.RETRIEVE,
+                params=RetrieveParams(filters=[], scope="$previous_results"),
+                label="Narrow",
+            ),
+        ],
+        directives=[],
+        confidence=0.9,
+    )
+    ctx_a = SessionContext(session_id="s", previous_record_ids=["990001234"])
+    ctx_b = SessionContext(session_id="s", previous_record_ids=["990005678"])
+
+    with _count_step_runs() as spy:
+        execute_plan(plan, test_db, session_context=ctx_a)
+        execute_plan(plan, test_db, session_context=ctx_b)
+        execute_plan(plan, test_db, session_context=ctx_a)
+
+    assert spy.call_count == 2
+
+
+def test_disk_store_shared_between_instances(tmp_path, test_db):
+    from scripts.chat.executor import execute_plan
+
+    disk = tmp_path / "exec_cache.db"
+    writer = enable_execution_cache(disk_path=disk)
+    try:
+        first = execute_plan(_karo_plan(), test_db)
+    finally:
+        disable_execution_cache()
+
+    # A fresh process-wide cache (as in another worker) starts empty in memory
+    reader = enable_execution_cache(disk_path=disk)
+    try:
+        with _count_step_runs() as spy:
+            second = execute_plan(_karo_plan(), test_db)
+        assert spy.call_count == 0
+        assert second.steps_completed[0].data == first.steps_completed[0].data
+        assert second.grounding == first.grounding
+    finally:
+        disable_execution_cache()
+    assert writer.stats()["misses"] > 0
+    assert reader.stats()["hits"] > 0
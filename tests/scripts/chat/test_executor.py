@@ -928,17 +928,29 @@ def test_session_context_passed_through():
     assert result.session_context.previous_record_ids == ["990001", "990002"]
 
 
-def test_resolve_scope_full_collection():
-    """_resolve_scope returns None for 'full_collection'."""
-    from scripts.chat.executor import _resolve_scope
+def _scope_conn() -> sqlite3.Connection:
+    """In-memory records table for resolving scopes to records.id bitmaps."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE records (id INTEGER PRIMARY KEY, mms_id TEXT UNIQUE);
+        INSERT INTO records VALUES (1, '990001'), (2, '990002'), (3, '990003'),
+                                   (10, '990010'), (20, '990020');
+    """)
+    return conn
+
+
+def test_scope_bitmap_full_collection():
+    """_scope_bitmap returns None for 'full_collection'."""
+    from scripts.chat.executor import _scope_bitmap
 
-    result = _resolve_scope("full_collection", {}, None)
-    assert result is None
+    conn = _scope_conn()
+    assert _scope_bitmap(conn, "full_collection", {}, None) is None
+    conn.close()
 
 
-def test_resolve_scope_step_ref():
-    """_resolve_scope with $step_N returns mms_ids from the referenced step."""
-    from scripts.chat.executor import _resolve_scope
+def test_scope_bitmap_step_ref():
+    """_scope_bitmap with $step_N covers the records of the referenced step."""
+    from scripts.chat.executor import _scope_bitmap
 
     record_set = RecordSet(
         mms_ids=["990001", "990002", "990003"],
@@ -955,29 +967,36 @@ def test_resolve_scope_step_ref():
             record_count=3,
         )
     }
-    result = _resolve_scope("$step_0", step_results, None)
-    assert result == ["990001", "990002", "990003"]
+    conn = _scope_conn()
+    result = _scope_bitmap(conn, "$step_0", step_results, None)
+    assert sorted(result) == [1, 2, 3]
+    conn.close()
 
 
-def test_resolve_scope_previous_results():
-    """_resolve_scope with $previous_results uses session context."""
+def test_scope_bitmap_previous_results():
+    """_scope_bitmap with $previous_results uses session context."""
     from scripts.chat.plan_models import SessionContext
-    from scripts.chat.executor import _resolve_scope
+    from scripts.chat.executor import _scope_bitmap
 
     ctx = SessionContext(
         session_id="sess-1",
         previous_record_ids=["990010", "990020"],
     )
-    result = _resolve_scope("$previous_results", {}, ctx)
-    assert result == ["990010", "990020"]
+    conn = _scope_conn()
+    result = _scope_bitmap(conn, "$previous_results", {}, ctx)
+    assert sorted(result) == [10, 20]
+    conn.close()
 
 
-def test_resolve_scope_previous_results_no_context():
-    """_resolve_scope with $previous_results but no context returns empty."""
-    from scripts.chat.executor import _resolve_scope
+def test_scope_bitmap_previous_results_no_context():
+    """_scope_bitmap with $previous_results but no context returns empty."""
+    from scripts.chat.executor import _scope_bitmap
 
-    result = _resolve_scope("$previous_results", {}, None)
-    assert result == []
+    conn = _scope_conn()
+    result = _scope_bitmap(conn, "$previous_results", {}, None)
+    assert result is not None
+    assert not result
+    conn.close()
 
 
 # =============================================================================
@@ -1356,7 +1375,7 @@ class TestMultiValueFilterNormalization:
             mms_ids = _run_filter_query(
                 conn,
                 [Filter(field=FilterField.LANGUAGE, op=FilterOp.EQUALS, value="heb")],
-                scope_ids=None,
+                scope_bitmap=None,
                 multi_value_map={0: ["heb", "lat"]},
             )
             assert set(mms_ids) == {"990001111", "990002222"}
@@ -1688,3 +1707,139 @@ class TestUnresolvedProbeSelectivityCeiling:
             params, test_db, self._failed_resolve("Jacob ibn Habib"), None)
         assert rs.mms_ids == []
         assert rs.relaxations, "the rejection / resolution failure must be explained"
+
+
+class TestParallelSteps:
+    """Independent branches run concurrently with sequential-run results."""
+
+    @staticmethod
+    def _comparison_plan(depends=True):
+        def retrieve(ref, label, dep):
+            return ExecutionStep(
+                action=StepAction.RETRIEVE,
+                params=RetrieveParams(filters=[
+                    Filter(field=FilterField.AGENT_NORM, op=FilterOp.EQUALS, value=ref),
+                ]),
+                label=label,
+                depends_on=[dep] if depends else [],
+            )
+
+        return InterpretationPlan(
+            intents=["comparison"],
+            reasoning="t",
+            confidence=0.9,
+            execution_steps=[
+                ExecutionStep(
+                    action=StepAction.RESOLVE_AGENT,
+                    params=ResolveAgentParams(name="Joseph Karo"),
+                    label="Resolve Karo",
+                ),
+                ExecutionStep(
+                    action=StepAction.RESOLVE_AGENT,
+                    params=ResolveAgentParams(name="Daniel Bomberg"),
+                    label="Resolve Bomberg",
+                ),
+                retrieve("$step_0", "Karo works", 0),
+                retrieve("$step_1", "Bomberg works", 1),
+                ExecutionStep(
+                    action=StepAction.FIND_CONNECTIONS,
+                    params=FindConnectionsParams(agents=["$step_0", "$step_1"]),
+                    label="Connections",
+                    depends_on=[0, 1],
+                ),
+            ],
+            directives=[],
+        )
+
+    def test_parallel_matches_sequential(self, test_db):
+        from scripts.chat.executor import execute_plan
+
+        plan = self._comparison_plan()
+        sequential = execute_plan(plan, test_db, max_parallel_steps=1)
+        parallel = execute_plan(plan, test_db, max_parallel_steps=4)
+
+        assert [s.label for s in parallel.steps_completed] == [
+            s.label for s in sequential.steps_completed
+        ]
+        assert [s.model_dump() for s in parallel.steps_completed] == [
+            s.model_dump() for s in sequential.steps_completed
+        ]
+        assert parallel.grounding.model_dump() == sequential.grounding.model_dump()
+
+    def test_step_ref_without_depends_on_waits_for_referenced_step(self, test_db):
+        from scripts.chat.executor import execute_plan
+
+        result = execute_plan(self._comparison_plan(depends=False), test_db)
+
+        karo_works = result.steps_completed[2]
+        assert karo_works.status != "error", karo_works.error_message
+        assert karo_works.data.mms_ids
+
+    def test_failing_step_is_isolated(self, test_db, monkeypatch):
+        from scripts.chat import executor
+
+        real_resolve = executor._handle_resolve_agent
+
+        def flaky_resolve(params, *args):
+            if params.name == "Daniel Bomberg":
+                raise sqlite3.OperationalError("database is locked")
+            return real_resolve(params, *args)
+
+        monkeypatch.setattr(executor, "_handle_resolve_agent", flaky_resolve)
+        result = executor.execute_plan(self._comparison_plan(), test_db)
+
+        statuses = [s.status for s in result.steps_completed]
+        assert statuses[1] == "error"
+        assert statuses[0] != "error" and statuses[2] != "error"
+        assert result.steps_completed[2].data.mms_ids
+
+
+class TestBitmapScopes:
+    """Scopes are bound as one records.id bitmap, whatever their size."""
+
+    def test_previous_results_scope_beyond_variable_limit(self, test_db):
+        from scripts.chat.executor import execute_plan
+        from scripts.chat.plan_models import SessionContext
+
+        ctx = SessionContext(
+            session_id="sess-1",
+            previous_record_ids=["990001234"] + [f"MISSING{i}" for i in range(40_000)],
+        )
+        plan = InterpretationPlan(
+            intents=["retrieval"],
+            reasoning="t",
+            confidence=0.9,
+            execution_steps=[
+                ExecutionStep(
+                    action=StepAction.AGGREGATE,
+                    params=AggregateParams(field="place", scope="$previous_results"),
+                    label="places",
+                ),
+            ],
+            directives=[],
+        )
+        result = execute_plan(plan, test_db, session_context=ctx)
+
+        step = result.steps_completed[0]
+        assert step.status != "error", step.error_message
+        assert step.data.total_records == 1
+
+    def test_step_scope_bitmap_is_reused(self, test_db):
+        from scripts.chat.executor import _get_conn, _scope_bitmap
+
+        records = RecordSet(
+            mms_ids=["990001234", "990005678"], total_count=2, filters_applied=[],
+        )
+        step_results = {
+            0: StepResult(step_index=0, action="retrieve", label="a", status="ok", data=records),
+        }
+        conn = _get_conn(test_db)
+        try:
+            first = _scope_bitmap(conn, "$step_0", step_results, None)
+            second = _scope_bitmap(conn, "$step_0+$step_0", step_results, None)
+        finally:
+            conn.close()
+
+        assert len(first) == 2
+        assert second == first
+        assert records._bitmap is first
@@ -0,0 +1,158 @@
+"""Tests for the interpretation cache in front of the interpreter LLM call."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from scripts.chat.interpretation_cache import (
+    InterpretationCache,
+    canonicalize_query,
+    disable_interpretation_cache,
+    enable_interpretation_cache,
+    prompt_fingerprint,
+)
+from scripts.chat.models import Message
+from scripts.chat.plan_models import InterpretationPlan, SessionContext
+
+
+def _make_plan(**overrides) -> InterpretationPlan:
+    defaults = dict(
+        intents=["retrieval"],
+        reasoning="Test plan",
+        execution_steps=[],
+        directives=[],
+        confidence=0.95,
+        clarification=None,
+    )
+    defaults.update(overrides)
+    return InterpretationPlan(**defaults)
+
+
+@pytest.fixture
+def cache():
+    cache = enable_interpretation_cache()
+    yield cache
+    disable_interpretation_cache()
+
+
+class TestCanonicalizeQuery:
+
+    def test_case_punctuation_whitespace(self):
+        assert canonicalize_query("Books printed in Venice") == "books printed in venice"
+        assert canonicalize_query("  books, printed in VENICE?! ") == "books printed in venice"
+
+    def test_hebrew_niqqud_stripped(self):
+        assert canonicalize_query("סֵפֶר בְּרֵאשִׁית") == canonicalize_query("ספר בראשית")
+
+    def test_hebrew_maqaf_is_punctuation(self):
+        assert canonicalize_query("בית־הספר") == "בית הספר"
+
+
+class TestInterpretationCache:
+
+    def test_exact_hit_returns_copy(self):
+        cache = InterpretationCache()
+        fp = prompt_fingerprint("prompt", "gpt-4.1")
+        cache.put("Books printed in Venice", fp, _make_plan(reasoning="venice"))
+
+        first = cache.get("books printed in venice?", fp)
+        first.reasoning = "mutated"
+        second = cache.get("BOOKS PRINTED IN VENICE", fp)
+
+        assert second.reasoning == "venice"
+        assert cache.stats() == {"hits": 2, "similar_hits": 0, "misses": 0, "entries": 1}
+
+    def test_prompt_or_model_change_invalidates(self):
+        cache = InterpretationCache()
+        cache.put("books from Venice", prompt_fingerprint("prompt", "gpt-4.1"), _make_plan())
+
+        assert cache.get("books from Venice", prompt_fingerprint("prompt v2", "gpt-4.1")) is None
+        assert cache.get("books from Venice", prompt_fingerprint("prompt", "gpt-4.1-mini")) is None
+
+    def test_lru_eviction(self):
+        cache = InterpretationCache(max_entries=2)
+        for q in ("a query", "b query", "c query"):
+            cache.put(q, "fp", _make_plan())
+
+        assert cache.get("a query", "fp") is None
+        assert cache.get("c query", "fp") is not None
+        assert len(cache) == 2
+
+    def test_similarity_lookup(self):
+        cache = InterpretationCache(similarity_threshold=0.85)
+        cache.put("books printed in venice in the 16th century", "fp", _make_plan(reasoning="v"))
+
+        near = cache.get("books printed in venice in 16th century", "fp")
+        far = cache.get("books printed in amsterdam", "fp")
+
+        assert near is not None and near.reasoning == "v"
+        assert far is None
+        assert cache.similar_hits == 1
+
+    def test_similarity_disabled_by_default(self):
+        cache = InterpretationCache()
+        cache.put("books printed in venice in the 16th century", "fp", _make_plan())
+
+        assert cache.get("books printed in venice in 16th century", "fp") is None
+
+
+class TestInterpretWithCache:
+
+    def test_repeated_query_skips_llm(self, cache):
+        from scripts.chat.interpreter import interpret
+
+        with patch("scripts.chat.interpreter._call_llm", return_value=_make_plan()) as mock_llm:
+            asyncio.run(interpret("Books printed in Venice", model="gpt-4.1"))
+            asyncio.run(interpret("books printed in venice?", model="gpt-4.1"))
+
+        assert mock_llm.call_count == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_first_turn_context_is_cacheable(self, cache):
+        from scripts.chat.interpreter import interpret
+
+        ctx = SessionContext(
+            session_id="s1",
+            previous_messages=[Message(role="user", content="books from Venice")],
+        )
+        with patch("scripts.chat.interpreter._call_llm", return_value=_make_plan()) as mock_llm:
+            asyncio.run(interpret("books from Venice", ctx, model="gpt-4.1"))
+            asyncio.run(interpret("books from Venice", None, model="gpt-4.1"))
+
+        assert mock_llm.call_count == 1
+
+    def test_follow_up_turn_not_cached(self, cache):
+        from scripts.chat.interpreter import interpret
+
+        ctx = SessionContext(
+            session_id="s1",
+            previous_messages=[
+                Message(role="user", content="books by Karo"),
+                Message(role="assistant", content="Found 3 works..."),
+            ],
+            previous_record_ids=["990001"],
+        )
+        with patch("scripts.chat.interpreter._call_llm", return_value=_make_plan()) as mock_llm:
+            asyncio.run(interpret("only from Venice", ctx, model="gpt-4.1"))
+            asyncio.run(interpret("only from Venice", ctx, model="gpt-4.1"))
+
+        assert mock_llm.call_count == 2
+        assert len(cache) == 0
+
+    def test_invalid_plan_not_cached(self, cache):
+        from scripts.chat.interpreter import interpret
+        from scripts.chat.plan_models import ExecutionStep, RetrieveParams, StepAction
+
+        bad_plan = _make_plan(execution_steps=[
+            ExecutionStep(
+                action=StepAction.RETRIEVE,
+                params=RetrieveParams(filters=[]),
+                label="S0",
+                depends_on=[5],
+            ),
+        ])
+        with patch("scripts.chat.interpreter._call_llm", return_value=bad_plan):
+            with pytest.raises(ValueError):
+                asyncio.run(interpret("books from Venice", model="gpt-4.1"))
+
+        assert len(cache) == 0
@@ -0,0 +1,64 @@
+"""Tests for the records.id bitmap used for executor scopes."""
+import sqlite3
+
+import pytest
+
+from scripts.chat.record_bitmap import (
+    RecordBitmap,
+    bitmap_for_mms_ids,
+    mms_ids_for_bitmap,
+    scope_condition,
+)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE records (id INTEGER PRIMARY KEY, mms_id TEXT UNIQUE)")
+    conn.executemany(
+        "INSERT INTO records (id, mms_id) VALUES (?, ?)",
+        [(i, f"99{i:06d}") for i in range(1, 5001)],
+    )
+    yield conn
+    conn.close()
+
+
+def test_set_operations():
+    a = RecordBitmap.from_ids([1, 3, 5, 700])
+    b = RecordBitmap.from_ids([3, 4, 700])
+
+    assert list(a & b) == [3, 700]
+    assert list(a | b) == [1, 3, 4, 5, 700]
+    assert list(a - b) == [1, 5]
+    assert len(a) == 4
+    assert 700 in a and 4 not in a
+    assert not RecordBitmap()
+
+
+def test_bytes_round_trip():
+    bitmap = RecordBitmap.from_ids([0, 9, 10_000])
+
+    assert RecordBitmap.from_bytes(bitmap.to_bytes()) == bitmap
+
+
+def test_negative_ids_rejected():
+    with pytest.raises(ValueError):
+        RecordBitmap.from_ids([-1])
+
+
+def test_mms_id_round_trip_drops_unknown_ids(conn):
+    bitmap = bitmap_for_mms_ids(conn, ["99000002", "99000010", "not-a-record"])
+
+    assert list(bitmap) == [2, 10]
+    assert mms_ids_for_bitmap(conn, bitmap) == ["99000002", "99000010"]
+
+
+def test_scope_condition_binds_one_parameter_for_large_scopes(conn):
+    bitmap = RecordBitmap.from_ids(range(1, 5001, 2))
+
+    row = conn.execute(
+        f"SELECT COUNT(*) FROM records r WHERE {scope_condition('r.id')}",
+        (bitmap.to_json(),),
+    ).fetchone()
+
+    assert row[0] == 2500
@@ -376,3 +376,81 @@ def test_restored_messages_carry_db_id(store):
     restored = store.get_session(session.session_id)
 
     assert [m.db_id for m in restored.messages] == [first_id, second_id]
+
+
+def test_slim_session_load_skips_messages(store):
+    """Existence checks and slim loads do not hydrate the history."""
+    session = store.create_session(user_id="user123")
+    store.add_message(session.session_id, Message(role="user", content="q"))
+
+    slim = store.get_session(session.session_id, include_messages=False)
+
+    assert slim.user_id == "user123"
+    assert slim.messages == []
+    assert store.session_exists(session.session_id)
+    assert not store.session_exists("nonexistent")
+
+
+def test_get_recent_messages(store):
+    """Only the last N messages, in order, optionally before a timestamp."""
+    session = store.create_session()
+    base = datetime.now(timezone.utc)
+    for i in range(8):
+        store.add_message(
+            session.session_id,
+            Message(role="user", content=f"m{i}", timestamp=base + timedelta(seconds=i)),
+        )
+
+    recent = store.get_recent_messages(session.session_id, 3)
+    before = store.get_recent_messages(
+        session.session_id, 3, before=base + timedelta(seconds=5)
+    )
+
+    assert [m.content for m in recent] == ["m5", "m6", "m7"]
+    assert [m.content for m in before] == ["m2", "m3", "m4"]
+    assert all(m.db_id is not None for m in recent)
+
+
+def test_write_behind_groups_commits(store):
+    """Queued messages are committed in order and resolve to their row ids."""
+    import asyncio
+
+    store.enable_write_behind()
+    session = store.create_session()
+    old_updated_at = store.get_session(session.session_id).updated_at
+
+    futures = [
+        store.queue_message(session.session_id, Message(role="user", content=f"m{i}"))
+        for i in range(5)
+    ]
+    last_id = asyncio.run(
+        store.add_message_async(session.session_id, Message(role="assistant", content="a"))
+    )
+
+    row_ids = [f.result(timeout=5) for f in futures]
+    restored = store.get_session(session.session_id)
+    assert [m.db_id for m in restored.messages] == row_ids + [last_id]
+    assert [m.content for m in restored.messages] == ["m0", "m1", "m2", "m3", "m4", "a"]
+    assert restored.updated_at > old_updated_at
+
+
+def test_write_behind_rejects_unknown_session(store):
+    """A missing session fails at queue time, not in the writer thread."""
+    store.enable_write_behind()
+
+    with pytest.raises(ValueError, match="not found"):
+        store.queue_message("nonexistent", Message(role="user", content="q"))
+
+
+def test_close_commits_queued_messages(temp_db):
+    """Closing the store drains the write-behind queue."""
+    store = SessionStore(temp_db)
+    store.enable_write_behind()
+    session = store.create_session()
+    for i in range(3):
+        store.queue_message(session.session_id, Message(role="user", content=f"m{i}"))
+    store.close()
+
+    reopened = SessionStore(temp_db)
+    assert len(reopened.get_session(session.session_id).messages) == 3
+    reopened.close()
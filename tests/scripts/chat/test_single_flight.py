@@ -0,0 +1,290 @@
+"""Tests for single-flight coalescing of identical in-flight pipeline work."""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from scripts.chat.models import Message
+from scripts.chat.plan_models import InterpretationPlan, SessionContext
+from scripts.chat.single_flight import (
+    SingleFlight,
+    context_fingerprint,
+    disable_single_flight,
+    enable_single_flight,
+)
+
+
+def _make_plan() -> InterpretationPlan:
+    return InterpretationPlan(
+        intents=["retrieval"],
+        reasoning="Test plan",
+        execution_steps=[],
+        directives=[],
+        confidence=0.95,
+        clarification=None,
+    )
+
+
+@pytest.fixture
+def flight():
+    flight = enable_single_flight()
+    yield flight
+    disable_single_flight()
+
+
+class TestSingleFlight:
+
+    def test_concurrent_callers_share_one_call(self):
+        group = SingleFlight()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def main():
+            return await asyncio.gather(*(group.run("k", compute) for _ in range(5)))
+
+        results = asyncio.run(main())
+        assert len(calls) == 1
+        assert [r for r, _ in results] == ["result"] * 5
+        assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+        assert len(group) == 0
+
+    def test_not_a_cache(self):
+        group = SingleFlight()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return len(calls)
+
+        async def main():
+            return [await group.run("k", compute), await group.run("k", compute)]
+
+        assert asyncio.run(main()) == [(1, False), (2, False)]
+
+    def test_exception_reaches_every_caller(self):
+        group = SingleFlight()
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def main():
+            return await asyncio.gather(
+                group.run("k", compute), group.run("k", compute), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_stream_fans_out_and_replays_for_late_joiners(self):
+        group = SingleFlight()
+
+        async def compute(publish):
+            for chunk in ("a", "b", "c"):
+                await publish(chunk)
+                await asyncio.sleep(0.01)
+            return "abc"
+
+        async def main():
+            early, late = [], []
+
+            async def on_early(chunk):
+                early.append(chunk)
+
+            async def on_late(chunk):
+                late.append(chunk)
+
+            first = asyncio.ensure_future(group.stream("k", compute, on_early))
+            await asyncio.sleep(0.015)  # "a" and "b" already published
+            second = await group.stream("k", compute, on_late)
+            return await first, second, early, late
+
+        first, second, early, late = asyncio.run(main())
+        assert first == ("abc", False)
+        assert second == ("abc", True)
+        assert early == late == ["a", "b", "c"]
+
+    def test_leaving_caller_does_not_cancel_others(self):
+        group = SingleFlight()
+        calls = []
+
+        async def compute(publish):
+            calls.append(1)
+            for chunk in ("a", "b"):
+                await publish(chunk)
+                await asyncio.sleep(0.01)
+            return "ab"
+
+        async def main():
+            received = []
+
+            async def broken(chunk):
+                raise ConnectionError("client went away")
+
+            async def ok(chunk):
+                received.append(chunk)
+
+            results = await asyncio.gather(
+                group.stream("k", compute, broken),
+                group.stream("k", compute, ok),
+                return_exceptions=True,
+            )
+            return results, received
+
+        (failed, succeeded), received = asyncio.run(main())
+        assert isinstance(failed, ConnectionError)
+        assert succeeded == ("ab", True)
+        assert received == ["a", "b"]
+        assert len(calls) == 1
+
+    def test_last_caller_leaving_cancels_the_work(self):
+        group = SingleFlight()
+        cancelled = []
+
+        async def compute():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+
+        async def main():
+            caller = asyncio.ensure_future(group.run("k", compute))
+            await asyncio.sleep(0.01)
+            caller.cancel()
+            await asyncio.sleep(0.01)
+
+        asyncio.run(main())
+        assert cancelled == [1]
+        assert len(group) == 0
+
+
+class TestContextFingerprint:
+
+    def test_context_free_turns_have_no_fingerprint(self):
+        ctx = SessionContext(
+            session_id="s1", previous_messages=[Message(role="user", content="books")]
+        )
+        assert context_fingerprint("books", ctx) == ""
+        assert context_fingerprint("books", None) == ""
+
+    def test_follow_up_fingerprint_ignores_session_id(self):
+        messages = [
+            Message(role="user", content="books in Venice"),
+            Message(role="assistant", content="Found 3."),
+            Message(role="user", content="only Hebrew"),
+        ]
+        a = SessionContext(session_id="s1", previous_messages=messages)
+        b = SessionContext(session_id="s2", previous_messages=messages)
+        c = SessionContext(session_id="s3", previous_messages=messages, previous_record_ids=["1"])
+        assert context_fingerprint("only Hebrew", a) == context_fingerprint("only Hebrew", b)
+        assert context_fingerprint("only Hebrew", a) != context_fingerprint("only Hebrew", c)
+
+
+class TestInterpretCoalescing:
+
+    def test_identical_concurrent_queries_make_one_llm_call(self, flight):
+        from scripts.chat.interpreter import interpret
+
+        async def slow_llm(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _make_plan()
+
+        async def main():
+            return await asyncio.gather(
+                interpret("Books printed in Venice", model="test-model"),
+                interpret("books printed in venice?", model="test-model"),
+                interpret("Books printed in Venice", model="test-model"),
+            )
+
+        with patch("scripts.chat.interpreter._call_llm", side_effect=slow_llm) as mock_llm:
+            plans = asyncio.run(main())
+
+        assert mock_llm.call_count == 1
+        assert len({id(p) for p in plans}) == 3  # followers get their own copy
+        assert flight.stats()["followers"] == 2
+
+    def test_different_contexts_are_not_coalesced(self, flight):
+        from scripts.chat.interpreter import interpret
+
+        async def slow_llm(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return _make_plan()
+
+        follow_up = SessionContext(
+            session_id="s1",
+            previous_messages=[
+                Message(role="user", content="books in Venice"),
+                Message(role="assistant", content="Found 3."),
+            ],
+        )
+
+        async def main():
+            return await asyncio.gather(
+                interpret("only Hebrew", model="test-model"),
+                interpret("only Hebrew", follow_up, model="test-model"),
+            )
+
+        with patch("scripts.chat.interpreter._call_llm", side_effect=slow_llm) as mock_llm:
+            asyncio.run(main())
+
+        assert mock_llm.call_count == 2
+
+
+class TestNarrateCoalescing:
+
+    def test_streamed_narration_fans_out_to_every_caller(self, flight):
+        from scripts.chat.narrator import StreamingMetaLLM, narrate_streaming
+        from scripts.chat.plan_models import ExecutionResult, GroundingData
+
+        def exec_result(session_id):
+            return ExecutionResult(
+                steps_completed=[],
+                directives=[],
+                grounding=GroundingData(),
+                original_query="Books printed in Venice",
+                session_context=SessionContext(session_id=session_id),
+            )
+
+        streams = []
+
+        async def fake_stream(**kwargs):
+            streams.append(1)
+            for chunk in ("Venice ", "printed ", "many books."):
+                yield chunk
+                await asyncio.sleep(0.01)
+
+        async def fake_meta(**kwargs):
+            return type("R", (), {"parsed": StreamingMetaLLM(confidence=0.8)})()
+
+        async def main():
+            received = {"s1": [], "s2": []}
+
+            def collector(session_id):
+                async def collect(chunk):
+                    received[session_id].append(chunk)
+                return collect
+
+            responses = await asyncio.gather(*(
+                narrate_streaming(
+                    "Books printed in Venice", exec_result(sid), collector(sid),
+                    model="test-model",
+                )
+                for sid in received
+            ))
+            return responses, received
+
+        with (
+            patch("scripts.chat.narrator.streaming_completion", new=fake_stream),
+            patch("scripts.chat.narrator.structured_completion", new=fake_meta),
+        ):
+            responses, received = asyncio.run(main())
+
+        assert len(streams) == 1
+        assert received["s1"] == received["s2"] == ["Venice ", "printed ", "many books."]
+        assert [r.narrative for r in responses] == ["Venice printed many books."] * 2
+        assert responses[0] is not responses[1]
@@ -0,0 +1,50 @@
+"""Tests for the shared enrichment HTTP client and token bucket."""
+
+import asyncio
+import time
+
+import pytest
+
+from scripts.enrichment.http_pool import TokenBucket, http_client, shared_http_client
+
+
+def test_http_client_reuses_shared_client():
+    async def run():
+        async with shared_http_client() as shared:
+            async def inner():
+                async with http_client() as client:
+                    return client
+
+            seen = await asyncio.gather(inner(), inner())
+            assert all(client is shared for client in seen)
+
+        # Outside the block a temporary client is used and closed
+        async with http_client() as client:
+            assert client is not shared
+        assert client.is_closed
+        assert shared.is_closed
+
+    asyncio.run(run())
+
+
+def test_token_bucket_burst_then_rate():
+    async def run():
+        bucket = TokenBucket(rate=50.0, capacity=2)
+        start = time.monotonic()
+        for _ in range(2):
+            await bucket.acquire()
+        burst = time.monotonic() - start
+        for _ in range(5):
+            await bucket.acquire()
+        return burst, time.monotonic() - start
+
+    burst, total = asyncio.run(run())
+
+    assert burst < 0.02
+    # 5 further tokens at 50/s take about 0.1s
+    assert total >= 0.09
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
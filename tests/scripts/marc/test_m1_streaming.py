@@ -0,0 +1,120 @@
+"""Tests for the streaming M1 parser (parse_marc_xml_file)."""
+
+import json
+from pathlib import Path
+
+import pymarc
+import pytest
+from pymarc import Record, Field, Subfield
+
+import scripts.marc.parse as parse_module
+from scripts.marc.parse import (
+    FAILURE_TRACEBACK_LIMIT,
+    MISSING_EXAMPLES_LIMIT,
+    MarcParseError,
+    iter_marc_xml_records,
+    parse_marc_xml_file,
+)
+
+
+def _write_marc_xml(path: Path, count: int) -> None:
+    """Write *count* synthetic records; every 3rd lacks a title."""
+    writer = pymarc.XMLWriter(open(path, 'wb'))
+    for i in range(count):
+        record = Record()
+        record.add_field(Field(tag='001', data=f'99{i:06d}'))
+        if i % 3:
+            record.add_field(Field(
+                tag='245', indicators=['0', '0'],
+                subfields=[Subfield(code='a', value=f'Title {i}')],
+            ))
+        record.add_field(Field(
+            tag='260', indicators=[' ', ' '],
+            subfields=[
+                Subfield(code='a', value='Venetiis'),
+                Subfield(code='b', value='Aldus'),
+                Subfield(code='c', value='1650'),
+            ],
+        ))
+        writer.write(record)
+    writer.close()
+
+
+def test_iter_parse_yields_records_in_order(tmp_path):
+    xml_path = tmp_path / "in.xml"
+    _write_marc_xml(xml_path, 5)
+
+    seen = [r['001'].data for r in iter_marc_xml_records(xml_path, read_size=256)]
+
+    assert seen == [f'99{i:06d}' for i in range(5)]
+
+
+def test_streaming_output_and_report(tmp_path):
+    xml_path = tmp_path / "in.xml"
+    out = tmp_path / "records.jsonl"
+    _write_marc_xml(xml_path, 40)
+
+    report = parse_marc_xml_file(xml_path, out)
+
+    lines = out.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 40
+    ids = [json.loads(line)['source']['control_number']['value'] for line in lines]
+    assert ids == [f'99{i:06d}' for i in range(40)]
+
+    assert report.total_records == 40
+    assert report.successful_extractions == 40
+    assert report.records_with_imprints == 40
+    assert report.records_with_title == 26
+    # Examples are capped, not accumulated for every record
+    assert len(report.records_missing_title) == MISSING_EXAMPLES_LIMIT
+    assert report.field_usage_counts['260[0]$b'] == 40
+    assert report.field_usage_counts['245$a'] == 26
+
+    # The temporary partial file is promoted, not left behind
+    assert not (tmp_path / "records.jsonl.partial").exists()
+
+
+def test_truncated_file_leaves_no_output(tmp_path):
+    xml_path = tmp_path / "in.xml"
+    _write_marc_xml(xml_path, 10)
+    data = xml_path.read_bytes()
+    xml_path.write_bytes(data[: len(data) // 2])
+    out = tmp_path / "records.jsonl"
+
+    with pytest.raises(MarcParseError):
+        parse_marc_xml_file(xml_path, out, runs_dir=tmp_path / "runs")
+
+    assert not out.exists()
+    assert not (tmp_path / "records.jsonl.partial").exists()
+
+
+def test_workers_output_identical_to_serial(tmp_path):
+    xml_path = tmp_path / "in.xml"
+    _write_marc_xml(xml_path, 60)
+
+    serial = parse_marc_xml_file(xml_path, tmp_path / "serial.jsonl", chunk_size=7)
+    parallel = parse_marc_xml_file(
+        xml_path, tmp_path / "parallel.jsonl", workers=2, chunk_size=7
+    )
+
+    assert (tmp_path / "serial.jsonl").read_bytes() == (tmp_path / "parallel.jsonl").read_bytes()
+    assert serial.model_dump_json() == parallel.model_dump_json()
+
+
+def test_failure_tracebacks_limited_per_run(tmp_path, monkeypatch, capsys):
+    xml_path = tmp_path / "in.xml"
+    _write_marc_xml(xml_path, 12)
+
+    def fail(record, source_file=None):
+        raise ValueError("bad record")
+
+    monkeypatch.setattr(parse_module, "parse_marc_record", fail)
+
+    report = parse_marc_xml_file(xml_path, tmp_path / "records.jsonl", chunk_size=2)
+
+    assert report.failed_extractions == 12
+    captured = capsys.readouterr()
+    # Counted across chunks, not per chunk
+    assert captured.err.count("Traceback") == FAILURE_TRACEBACK_LIMIT
+    assert captured.out.count("Failed to parse record 99000000:\n") == 1
+    assert captured.out.count(": ValueError: bad record") == 12 - FAILURE_TRACEBACK_LIMIT
@@ -11,6 +11,7 @@ import pytest
 from scripts.marc.normalize import (
     normalize_date, normalize_place, normalize_publisher, enrich_m2, parse_hebrew_year
 )
+from scripts.marc.m2_normalize import process_m1_to_m2
 
 
 class TestDateNormalization:
@@ -689,5 +690,39 @@ class TestDirectDateFixes:
         assert result.method == "open_start_range"
 
 
+class TestProcessM1ToM2:
+    """Test the JSONL driver, serial and multiprocess."""
+
+    @staticmethod
+    def _write_m1(path: Path, count: int) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            for i in range(count):
+                record = {
+                    "source": {"control_number": {"value": f"99{i:06d}", "source": ["001"]}},
+                    "imprints": [{
+                        "place": {"value": "Venetiis", "source": ["260[0]$a"]},
+                        "publisher": {"value": "Apud Aldum", "source": ["260[0]$b"]},
+                        "date": {"value": f"[{1500 + i}]", "source": ["260[0]$c"]},
+                        "source_tags": ["260"],
+                    }],
+                    "agents": [],
+                }
+                f.write(json.dumps(record) + '\n')
+
+    def test_workers_output_identical_to_serial(self, tmp_path):
+        m1_path = tmp_path / "m1.jsonl"
+        self._write_m1(m1_path, 45)
+
+        serial = process_m1_to_m2(m1_path, tmp_path / "serial.jsonl", chunk_size=8)
+        parallel = process_m1_to_m2(
+            m1_path, tmp_path / "parallel.jsonl", workers=2, chunk_size=8
+        )
+
+        assert serial == parallel
+        assert serial['total_records'] == 45
+        assert serial['dates_normalized'] == 45
+        assert (tmp_path / "serial.jsonl").read_bytes() == (tmp_path / "parallel.jsonl").read_bytes()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
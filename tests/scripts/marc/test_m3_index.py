@@ -3,13 +3,21 @@
 Tests the full M3 pipeline: schema creation, indexing, and query functions.
 """
 
+import asyncio
 import json
 import sqlite3
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
-from scripts.marc.m3_index import create_database, index_record, build_index
+from scripts.marc.m3_facets import (
+    facet_summary_current, facet_summary_state, read_facet, refresh_facet_summary
+)
+from scripts.marc.m3_index import (
+    create_database, index_record, build_index, split_schema_statements, update_index,
+    enrich_authority_uris
+)
 from scripts.marc.m3_query import (
     query_by_publisher_and_date_range,
     query_by_place_and_date_range,
@@ -512,5 +520,360 @@ class TestFullDatasetIndexing:
         conn.close()
 
 
+def _synthetic_m1m2_record(i: int) -> dict:
+    """Minimal M1+M2 record with a title, imprint, subject and agent."""
+    return {
+        "source": {"control_number": {"value": f"99{i:06d}", "source": ["001"]}},
+        "title": {"value": f"Liber {i}", "source": ["245$a"]},
+        "imprints": [{
+            "place": {"value": "Venetiis", "source": ["260[0]$a"]},
+            "publisher": {"value": "Aldus", "source": ["260[0]$b"]},
+            "date": {"value": "1650", "source": ["260[0]$c"]},
+            "source_tags": ["260"],
+        }],
+        "subjects": [{
+            "value": "Bibles", "source": ["650[0]$a"], "parts": {"a": "Bibles"},
+            "source_tag": "650",
+        }],
+        "agents": [{
+            "name": {"value": "Manutius, Aldus", "source": ["100[0]$a"]},
+            "entry_role": "main", "source_tags": ["100"], "agent_index": 0,
+        }],
+        "notes": [{"tag": "500", "value": "Note", "source": ["500[0]$a"]}],
+        "m2": {"imprints_norm": [{
+            "date_norm": {"start": 1650, "end": 1650, "label": "1650",
+                          "confidence": 0.99, "method": "year_exact"},
+        }]},
+    }
+
+
+class TestBulkLoad:
+    """Bulk-load path must produce the same database as record-by-record."""
+
+    SCHEMA_PATH = Path(__file__).parent.parent.parent.parent / "scripts" / "marc" / "m3_schema.sql"
+
+    def test_split_schema_statements_defers_indexes_and_triggers(self):
+        tables, deferred = split_schema_statements(self.SCHEMA_PATH.read_text(encoding='utf-8'))
+
+        assert any(s.startswith("CREATE TABLE records") for s in tables)
+        assert any(s.startswith("CREATE VIRTUAL TABLE titles_fts") for s in tables)
+        assert all(s.startswith(("CREATE INDEX", "CREATE UNIQUE INDEX", "CREATE TRIGGER")) for s in deferred)
+        assert any(s.startswith("CREATE TRIGGER subjects_fts_update") for s in deferred)
+        # Trigger bodies are kept whole
+        assert all(s.rstrip(";").rstrip().endswith("END") for s in deferred if s.startswith("CREATE TRIGGER"))
+
+    def test_bulk_matches_serial(self, tmp_path):
+        jsonl_path = tmp_path / "m1m2.jsonl"
+        with open(jsonl_path, 'w', encoding='utf-8') as f:
+            for i in range(12):
+                f.write(json.dumps(_synthetic_m1m2_record(i)) + '\n')
+            # Duplicate MMS ID is reported, not fatal
+            f.write(json.dumps(_synthetic_m1m2_record(3)) + '\n')
+
+        serial = build_index(jsonl_path, tmp_path / "serial.db", self.SCHEMA_PATH, bulk=False)
+        bulk = build_index(jsonl_path, tmp_path / "bulk.db", self.SCHEMA_PATH, batch_records=5)
+
+        assert serial == bulk
+        assert bulk['total_records'] == 12
+        assert len(bulk['errors']) == 1
+
+        serial_conn = sqlite3.connect(str(tmp_path / "serial.db"))
+        bulk_conn = sqlite3.connect(str(tmp_path / "bulk.db"))
+        schema_sql = "SELECT type, name, tbl_name, sql FROM sqlite_master ORDER BY type, name"
+        assert serial_conn.execute(schema_sql).fetchall() == bulk_conn.execute(schema_sql).fetchall()
+
+        for table in ("titles", "imprints", "subjects", "agents", "notes"):
+            rows_sql = f"SELECT * FROM {table} ORDER BY id"
+            assert serial_conn.execute(rows_sql).fetchall() == bulk_conn.execute(rows_sql).fetchall()
+
+        # FTS repopulated in one pass matches the trigger-maintained index
+        for fts_sql in (
+            "SELECT rowid FROM titles_fts WHERE titles_fts MATCH 'Liber' ORDER BY rowid",
+            "SELECT rowid, mms_id FROM subjects_fts WHERE subjects_fts MATCH 'Bibles' ORDER BY rowid",
+        ):
+            assert serial_conn.execute(fts_sql).fetchall() == bulk_conn.execute(fts_sql).fetchall()
+        assert len(bulk_conn.execute(fts_sql).fetchall()) == 12
+
+        # Triggers are live again after the load
+        bulk_conn.execute("UPDATE titles SET value = 'Renamed' WHERE id = 1")
+        assert bulk_conn.execute(
+            "SELECT rowid FROM titles_fts WHERE titles_fts MATCH 'Renamed'"
+        ).fetchall() == [(1,)]
+        serial_conn.close()
+        bulk_conn.close()
+
+
+class TestUpdateIndex:
+    """Incremental delta updates of an existing index."""
+
+    SCHEMA_PATH = TestBulkLoad.SCHEMA_PATH
+
+    @pytest.fixture
+    def base_db(self, tmp_path):
+        jsonl_path = tmp_path / "m1m2.jsonl"
+        with open(jsonl_path, 'w', encoding='utf-8') as f:
+            for i in range(6):
+                f.write(json.dumps(_synthetic_m1m2_record(i)) + '\n')
+        db_path = tmp_path / "index.db"
+        build_index(jsonl_path, db_path, self.SCHEMA_PATH)
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("""
+            INSERT INTO authority_enrichment (authority_uri, source, fetched_at, expires_at)
+            VALUES ('https://example.org/a/1', 'wikidata', 'now', 'later')
+        """)
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def test_delta_upserts_and_deletes(self, base_db, tmp_path):
+        changed = _synthetic_m1m2_record(2)
+        changed['title']['value'] = "Opera omnia"
+        changed['subjects'][0]['value'] = "Incunabula"
+        delta_path = tmp_path / "delta.jsonl"
+        with open(delta_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(changed) + '\n')
+            f.write(json.dumps({"mms_id": "99000005", "deleted": True}) + '\n')
+            f.write(json.dumps(_synthetic_m1m2_record(40)) + '\n')
+            f.write(json.dumps({"mms_id": "99999999", "deleted": True}) + '\n')
+
+        conn = sqlite3.connect(str(base_db))
+        old_id = conn.execute("SELECT id FROM records WHERE mms_id = '99000002'").fetchone()[0]
+        conn.close()
+
+        stats = update_index(delta_path, base_db)
+
+        assert stats == {'inserted': 1, 'updated': 1, 'deleted': 1, 'not_found': 1, 'errors': []}
+
+        conn = sqlite3.connect(str(base_db))
+        # Updated record keeps its id; its child rows were replaced
+        assert conn.execute(
+            "SELECT id FROM records WHERE mms_id = '99000002'"
+        ).fetchone()[0] == old_id
+        assert conn.execute(
+            "SELECT value FROM titles WHERE record_id = ?", (old_id,)
+        ).fetchall() == [("Opera omnia",)]
+        assert conn.execute("SELECT COUNT(*) FROM records").fetchone()[0] == 6
+        assert conn.execute("SELECT COUNT(*) FROM records WHERE mms_id = '99000005'").fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM titles").fetchone()[0] == 6
+
+        # FTS stays consistent with the content tables
+        assert conn.execute(
+            "SELECT rowid FROM titles_fts WHERE titles_fts MATCH 'Opera'"
+        ).fetchall() != []
+        assert conn.execute(
+            "SELECT COUNT(*) FROM titles_fts WHERE titles_fts MATCH 'Liber'"
+        ).fetchone()[0] == 5
+        # subjects_fts is contentless: resolve matches through the rowid
+        assert conn.execute(
+            "SELECT r.mms_id FROM subjects_fts f"
+            " JOIN subjects s ON s.id = f.rowid"
+            " JOIN records r ON r.id = s.record_id"
+            " WHERE subjects_fts MATCH 'Incunabula'"
+        ).fetchall() == [("99000002",)]
+        assert conn.execute(
+            "SELECT COUNT(*) FROM subjects_fts WHERE subjects_fts MATCH 'Bibles'"
+        ).fetchone()[0] == 5
+
+        # Unrelated tables untouched
+        assert conn.execute("SELECT COUNT(*) FROM authority_enrichment").fetchone()[0] == 1
+        conn.close()
+
+    def test_bad_delta_line_is_rolled_back(self, base_db, tmp_path):
+        broken = _synthetic_m1m2_record(1)
+        broken['agents'][0]['agent_type'] = 'nonsense'  # violates CHECK
+        delta_path = tmp_path / "delta.jsonl"
+        delta_path.write_text(json.dumps(broken) + '\n', encoding='utf-8')
+
+        stats = update_index(delta_path, base_db)
+
+        assert len(stats['errors']) == 1
+        conn = sqlite3.connect(str(base_db))
+        # The original rows survive the failed replacement
+        assert conn.execute(
+            "SELECT COUNT(*) FROM agents a JOIN records r ON a.record_id = r.id WHERE r.mms_id = '99000001'"
+        ).fetchone()[0] == 1
+        conn.close()
+
+
+class _FakeEnrichmentService:
+    """Stands in for EnrichmentService; records peak concurrency."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = []
+        self.closed = False
+
+    async def enrich_entity(self, entity_type, entity_value, nli_authority_uri=None):
+        self.calls.append(nli_authority_uri)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if nli_authority_uri.endswith("bad"):
+            raise RuntimeError("boom")
+        if nli_authority_uri.endswith("none"):
+            return None
+        return SimpleNamespace(
+            wikidata_id="Q" + nli_authority_uri.rsplit("/", 1)[-1],
+            viaf_id=None, isni_id=None, loc_id=None,
+            label="Label", description=None,
+            person_info=None, place_info=None,
+            image_url=None, wikipedia_url=None,
+            sources_used=[], confidence=0.9,
+        )
+
+    def close(self):
+        self.closed = True
+
+
+class TestEnrichAuthorityUris:
+    """Concurrent authority enrichment."""
+
+    def test_prefilter_concurrency_and_batched_writes(self, test_db):
+        base = "https://example.org/authorities/"
+        uris = {f"{base}{i}" for i in range(10)} | {f"{base}bad", f"{base}none"}
+        conn = sqlite3.connect(str(test_db))
+        conn.execute("""
+            INSERT INTO authority_enrichment (authority_uri, source, fetched_at, expires_at)
+            VALUES (?, 'wikidata', 'now', 'later')
+        """, (f"{base}0",))
+        conn.commit()
+        service = _FakeEnrichmentService()
+
+        stats = asyncio.run(enrich_authority_uris(
+            conn, uris, enrichment_service=service,
+            rate_limit_delay=0, concurrency=4, write_batch=3
+        ))
+
+        assert stats == {'total': 12, 'enriched': 9, 'cached': 1, 'failed': 1, 'no_wikidata': 1}
+        # Already-enriched URI never reaches the service
+        assert f"{base}0" not in service.calls
+        assert len(service.calls) == 11
+        assert service.peak > 1
+        # Caller-owned service is left open
+        assert not service.closed
+        assert conn.execute("SELECT COUNT(*) FROM authority_enrichment").fetchone()[0] == 10
+        assert conn.execute(
+            "SELECT nli_id, wikidata_id FROM authority_enrichment WHERE authority_uri = ?",
+            (f"{base}7",)
+        ).fetchone() == ("7", "Q7")
+        conn.close()
+
+
+class TestFacetSummary:
+    """Materialized full-collection facet counts (scripts/marc/m3_facets.py)."""
+
+    SCHEMA_PATH = TestBulkLoad.SCHEMA_PATH
+
+    LIVE_SQL = {
+        "subject": "SELECT value, COUNT(DISTINCT record_id) FROM subjects GROUP BY value",
+        "agent": "SELECT agent_norm, COUNT(DISTINCT record_id) FROM agents GROUP BY agent_norm",
+        "decade": "SELECT date_start / 10 * 10, COUNT(DISTINCT record_id) FROM imprints "
+                  "WHERE date_start IS NOT NULL GROUP BY 1",
+    }
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        jsonl_path = tmp_path / "m1m2.jsonl"
+        with open(jsonl_path, 'w', encoding='utf-8') as f:
+            for i in range(8):
+                f.write(json.dumps(_synthetic_m1m2_record(i)) + '\n')
+        db_path = tmp_path / "index.db"
+        build_index(jsonl_path, db_path, self.SCHEMA_PATH)
+        return db_path
+
+    def _assert_matches_live(self, conn):
+        for facet, sql in self.LIVE_SQL.items():
+            assert sorted(read_facet(conn, facet)) == sorted(conn.execute(sql).fetchall()), facet
+
+    def test_build_leaves_summary_current(self, db_path):
+        conn = sqlite3.connect(str(db_path))
+
+        assert facet_summary_current(conn)
+        self._assert_matches_live(conn)
+        assert read_facet(conn, "subject") == [("Bibles", 8)]
+        conn.close()
+
+    def test_update_index_refreshes_with_new_generation(self, db_path, tmp_path):
+        changed = _synthetic_m1m2_record(2)
+        changed['subjects'][0]['value'] = "Incunabula"
+        delta_path = tmp_path / "delta.jsonl"
+        delta_path.write_text(json.dumps(changed) + '\n', encoding='utf-8')
+
+        update_index(delta_path, db_path)
+
+        conn = sqlite3.connect(str(db_path))
+        assert facet_summary_state(conn) == (1, False)
+        assert facet_summary_current(conn)
+        assert read_facet(conn, "subject") == [("Bibles", 7), ("Incunabula", 1)]
+        self._assert_matches_live(conn)
+        conn.close()
+
+    def test_untracked_write_marks_summary_stale(self, db_path):
+        conn = sqlite3.connect(str(db_path))
+        # A QA-style fix that neither bumps the generation nor refreshes
+        conn.execute("UPDATE subjects SET value = 'Psalters' WHERE id = 1")
+        conn.commit()
+
+        assert not facet_summary_current(conn)
+        assert read_facet(conn, "subject") is None
+
+        refresh_facet_summary(conn)
+        conn.commit()
+        assert read_facet(conn, "subject") == [("Bibles", 7), ("Psalters", 1)]
+        conn.close()
+
+    def test_update_index_refreshes_only_touched_values(self, db_path, tmp_path):
+        conn = sqlite3.connect(str(db_path))
+        # Plant a marker on a value the delta does not touch
+        conn.execute("UPDATE facet_counts SET record_count = 99 WHERE facet = 'subject' AND value = 'Bibles'")
+        conn.commit()
+        conn.close()
+        changed = _synthetic_m1m2_record(8)
+        changed['subjects'][0]['value'] = "Incunabula"
+        delta_path = tmp_path / "delta.jsonl"
+        delta_path.write_text(json.dumps(changed) + '\n', encoding='utf-8')
+
+        update_index(delta_path, db_path)
+
+        conn = sqlite3.connect(str(db_path))
+        assert facet_summary_current(conn)
+        assert read_facet(conn, "subject") == [("Bibles", 99), ("Incunabula", 1)]
+        # The record's agent and year were touched, so those are recomputed
+        assert read_facet(conn, "agent") == [("manutius, aldus", 9)]
+        assert read_facet(conn, "year") == [(1650, 9)]
+        conn.close()
+
+    def test_update_index_matches_full_refresh(self, db_path, tmp_path):
+        changed = _synthetic_m1m2_record(2)
+        changed['subjects'][0]['value'] = "Incunabula"
+        changed['m2']['imprints_norm'][0]['date_norm']['start'] = 1701
+        added = _synthetic_m1m2_record(9)
+        added['agents'][0]['name']['value'] = "Elzevir, Louis"
+        delta_path = tmp_path / "delta.jsonl"
+        delta_path.write_text(
+            json.dumps(changed) + '\n' + json.dumps(added) + '\n'
+            + json.dumps({"mms_id": "99000009", "deleted": True}) + '\n'
+            + json.dumps({"mms_id": "99000003", "deleted": True}) + '\n',
+            encoding='utf-8',
+        )
+
+        update_index(delta_path, db_path)
+
+        conn = sqlite3.connect(str(db_path))
+        assert facet_summary_current(conn)
+        self._assert_matches_live(conn)
+        # Values whose last record went away drop out of the summary
+        assert ("elzevir, louis",) not in conn.execute("SELECT value FROM facet_counts").fetchall()
+        incremental = sorted(conn.execute("SELECT * FROM facet_counts").fetchall())
+        decades = sorted(conn.execute("SELECT * FROM facet_decade_counts").fetchall())
+        refresh_facet_summary(conn)
+        assert sorted(conn.execute("SELECT * FROM facet_counts").fetchall()) == incremental
+        assert sorted(conn.execute("SELECT * FROM facet_decade_counts").fetchall()) == decades
+        conn.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
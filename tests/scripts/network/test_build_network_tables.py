@@ -9,6 +9,7 @@ from scripts.network.build_network_tables import (
     build_network_agents,
     _build_same_place_period_edges,
     assign_communities,
+    build_network_map_stats,
 )
 
 
@@ -419,3 +420,71 @@ def test_assign_communities_respects_min_nodes():
     assert _community_of(conn, "a3") is None
     assert stats["communities"] == ["Kabbalists"]
     conn.close()
+
+
+def test_build_network_map_stats_degrees_and_spans():
+    """Spans land on the nodes; degrees count both endpoints per confidence step."""
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE network_agents (agent_norm TEXT PRIMARY KEY, display_name TEXT);
+        CREATE TABLE network_edges (
+            source_agent_norm TEXT, target_agent_norm TEXT, connection_type TEXT,
+            confidence REAL, relationship TEXT, bidirectional INTEGER, evidence TEXT
+        );
+        CREATE TABLE agents (id INTEGER PRIMARY KEY, record_id INTEGER, agent_norm TEXT);
+        CREATE TABLE imprints (
+            id INTEGER PRIMARY KEY, record_id INTEGER, date_start INTEGER, publisher_norm TEXT
+        );
+        INSERT INTO network_agents VALUES ('a', 'A'), ('b', 'B'), ('pub:elz', 'Elzevir');
+        INSERT INTO network_edges VALUES
+            ('a', 'b', 'same_record', 0.9, NULL, 1, NULL),
+            ('a', 'pub:elz', 'printed_by', 0.5, NULL, 0, NULL),
+            ('b', 'a', 'teacher_student', 0.3, NULL, 0, NULL);
+        INSERT INTO agents VALUES (1, 10, 'a'), (2, 11, 'a');
+        INSERT INTO imprints VALUES (1, 10, 1550, 'elz'), (2, 11, 1602, NULL);
+    """)
+
+    build_network_map_stats(conn)
+
+    spans = dict((r[0], r[1:]) for r in conn.execute(
+        "SELECT agent_norm, active_start, active_end FROM network_agents"
+    ))
+    assert spans == {"a": (1550, 1602), "b": (None, None), "pub:elz": (1550, 1550)}
+
+    def degrees(step):
+        return dict(((r[0], r[1]), r[2]) for r in conn.execute(
+            "SELECT agent_norm, connection_type, degree FROM network_agent_degrees "
+            "WHERE confidence_step = ?", (step,)
+        ))
+    assert degrees(0) == {
+        ("a", "same_record"): 1, ("b", "same_record"): 1,
+        ("a", "printed_by"): 1, ("pub:elz", "printed_by"): 1,
+        ("a", "teacher_student"): 1, ("b", "teacher_student"): 1,
+    }
+    assert degrees(5) == {
+        ("a", "same_record"): 1, ("b", "same_record"): 1,
+        ("a", "printed_by"): 1, ("pub:elz", "printed_by"): 1,
+    }
+    assert degrees(10) == {}
+    assert conn.execute("SELECT dirty FROM network_map_stats").fetchone()[0] == 0
+    # The map's edge query reads type, confidence and endpoints from one index
+    assert [r[2] for r in conn.execute(
+        "PRAGMA index_info(idx_network_edges_type_confidence)"
+    )] == ["connection_type", "confidence", "source_agent_norm", "target_agent_norm"]
+
+    conn.execute("DELETE FROM network_edges WHERE connection_type = 'printed_by'")
+    assert conn.execute("SELECT dirty FROM network_map_stats").fetchone()[0] == 1
+
+    # In-place norm/date fixes (no generation bump) also make the spans stale
+    for fix in (
+        "UPDATE imprints SET date_start = 1551 WHERE id = 1",
+        "UPDATE imprints SET publisher_norm = 'elzevir' WHERE id = 1",
+        "UPDATE agents SET agent_norm = 'b' WHERE id = 2",
+    ):
+        conn.execute("UPDATE network_map_stats SET dirty = 0")
+        conn.execute(fix)
+        assert conn.execute("SELECT dirty FROM network_map_stats").fetchone()[0] == 1, fix
+    conn.execute("UPDATE network_map_stats SET dirty = 0")
+    conn.execute("UPDATE imprints SET record_id = 12 WHERE id = 2")
+    assert conn.execute("SELECT dirty FROM network_map_stats").fetchone()[0] == 0
+    conn.close()
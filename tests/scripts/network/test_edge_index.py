@@ -0,0 +1,113 @@
+"""The CSR edge index behind /network/path: bidirectional BFS must find
+fewest-hops routes exactly like a plain BFS, honoring edge types,
+min_confidence and max_hops."""
+import random
+import sqlite3
+from collections import defaultdict, deque
+
+import pytest
+
+from scripts.network.edge_index import EdgeIndex, edge_index_for, reset_edge_indexes
+from scripts.utils.db_generation import bump_db_generation
+
+TYPES = ("same_record", "teacher_student", "printed_by")
+
+
+def _random_rows(seed: int, nodes: int = 80, edges: int = 140):
+    rng = random.Random(seed)
+    rows = []
+    for rowid in range(1, edges + 1):
+        a, b = rng.sample(range(nodes), 2)
+        rows.append((rowid, f"n{a}", f"n{b}", rng.choice(TYPES), round(rng.random(), 2)))
+    return rows
+
+
+def _bfs_hops(rows, source, target, types, min_confidence, max_hops):
+    """Reference: one-sided BFS over a rebuilt adjacency (the old endpoint)."""
+    adj = defaultdict(set)
+    for _, s, t, ctype, confidence in rows:
+        if ctype in types and confidence >= min_confidence:
+            adj[s].add(t)
+            adj[t].add(s)
+    depth = {source: 0}
+    q = deque([source])
+    while q:
+        cur = q.popleft()
+        if cur == target:
+            return depth[cur]
+        if depth[cur] >= max_hops:
+            continue
+        for nb in adj[cur]:
+            if nb not in depth:
+                depth[nb] = depth[cur] + 1
+                q.append(nb)
+    return None
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_shortest_path_matches_plain_bfs(seed):
+    rows = _random_rows(seed)
+    index = EdgeIndex(rows)
+    allowed = {(s, t, ctype): c for _, s, t, ctype, c in rows}
+    rng = random.Random(seed)
+    for _ in range(150):
+        source, target = f"n{rng.randrange(80)}", f"n{rng.randrange(80)}"
+        types = rng.sample(TYPES, rng.randint(1, 3))
+        min_confidence = rng.choice([0.0, 0.3, 0.6])
+        max_hops = rng.randint(1, 12)
+        if source not in index.ids or target not in index.ids:
+            continue
+
+        chain = index.shortest_path(source, target, types, min_confidence, max_hops)
+        expected = _bfs_hops(rows, source, target, types, min_confidence, max_hops)
+
+        if expected is None:
+            assert chain is None
+            continue
+        assert chain[0] == source and chain[-1] == target
+        assert len(chain) - 1 == expected
+        for a, b in zip(chain, chain[1:]):
+            assert any(
+                allowed.get(pair, -1) >= min_confidence
+                for ctype in types for pair in ((a, b, ctype), (b, a, ctype))
+            )
+
+
+def test_best_edges_picks_strongest_active_edge():
+    index = EdgeIndex([
+        (1, "a", "b", "same_record", 0.6),
+        (2, "b", "a", "teacher_student", 0.9),
+        (3, "b", "c", "same_record", 0.4),
+        (4, "a", "c", "wikilink", 1.0),
+    ])
+
+    assert index.shortest_path("a", "c", ["same_record", "teacher_student"]) == ["a", "b", "c"]
+    assert index.best_edges(["a", "b", "c"], ["same_record", "teacher_student"]) == [2, 3]
+    assert index.best_edges(["a", "b", "c"], ["same_record"], min_confidence=0.5) == [1, None]
+    assert index.shortest_path("a", "c", ["same_record"], min_confidence=0.5) is None
+    assert index.shortest_path("a", "c", ["same_record", "wikilink"], max_hops=1) == ["a", "c"]
+
+
+def test_index_rebuilt_on_new_generation(tmp_path):
+    db_path = tmp_path / "net.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("""CREATE TABLE network_edges (
+        source_agent_norm TEXT, target_agent_norm TEXT, connection_type TEXT,
+        confidence REAL, relationship TEXT, bidirectional INTEGER, evidence TEXT)""")
+    conn.execute("INSERT INTO network_edges VALUES ('a', 'b', 'same_record', 0.9, NULL, 1, 'x')")
+    conn.commit()
+    reset_edge_indexes()
+    try:
+        first = edge_index_for(db_path)
+        assert edge_index_for(db_path) is first
+
+        conn.execute("INSERT INTO network_edges VALUES ('b', 'c', 'same_record', 0.9, NULL, 1, 'y')")
+        bump_db_generation(conn)
+        conn.commit()
+
+        second = edge_index_for(db_path)
+        assert second is not first
+        assert second.shortest_path("a", "c", ["same_record"]) == ["a", "b", "c"]
+    finally:
+        conn.close()
+        reset_edge_indexes()
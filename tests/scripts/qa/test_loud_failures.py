@@ -228,6 +228,68 @@ class TestNarratorMetaHonesty:
         assert resp.confidence is None
         assert "meta_extraction_failed" in resp.metadata.get("confidence_reason", "")
 
+    def test_meta_extraction_overlaps_the_stream(self):
+        """The meta call starts once its 500-char prefix has streamed, not after."""
+        from scripts.chat.narrator import (
+            STREAMING_META_PREFIX_CHARS, StreamingMetaLLM, narrate_streaming,
+        )
+        from scripts.chat.plan_models import ExecutionResult, GroundingData
+
+        exec_result = ExecutionResult(
+            steps_completed=[],
+            directives=[],
+            grounding=GroundingData(),
+            original_query="q",
+        )
+        chunks = [str(i) * 100 for i in range(10)]
+        streamed: list[str] = []
+        meta_calls: list[tuple[int, str]] = []
+
+        async def fake_stream(**kwargs):
+            for chunk in chunks:
+                yield chunk
+                await asyncio.sleep(0)
+
+        async def fake_meta(**kwargs):
+            meta_calls.append((len(streamed), kwargs["user"]))
+            return type("R", (), {"parsed": StreamingMetaLLM(confidence=0.6)})()
+
+        async def collect(chunk: str) -> None:
+            streamed.append(chunk)
+
+        with (
+            patch("scripts.chat.narrator.streaming_completion", new=fake_stream),
+            patch("scripts.chat.narrator.structured_completion", new=fake_meta),
+        ):
+            resp = asyncio.run(narrate_streaming("q", exec_result, collect, model="test-model"))
+
+        assert resp.narrative == "".join(chunks)
+        assert resp.confidence == 0.6
+        assert len(meta_calls) == 1
+        chunks_sent, user_prompt = meta_calls[0]
+        assert chunks_sent < len(chunks)
+        assert user_prompt.endswith("".join(chunks)[:STREAMING_META_PREFIX_CHARS])
+
+    def test_meta_prompt_follows_prefix_length(self):
+        """The prompt's prefix and its label both come from STREAMING_META_PREFIX_CHARS."""
+        from scripts.chat.narrator import StreamingMetaLLM, _extract_streaming_meta
+
+        narrative = "".join(str(i % 10) for i in range(1000))
+        prompts: list[str] = []
+
+        async def fake_meta(**kwargs):
+            prompts.append(kwargs["user"])
+            return type("R", (), {"parsed": StreamingMetaLLM(confidence=0.6)})()
+
+        with (
+            patch("scripts.chat.narrator.STREAMING_META_PREFIX_CHARS", 200),
+            patch("scripts.chat.narrator.structured_completion", new=fake_meta),
+        ):
+            asyncio.run(_extract_streaming_meta("q", narrative))
+
+        assert "(first 200 chars): " in prompts[0]
+        assert prompts[0].endswith("(first 200 chars): " + narrative[:200])
+
 
 # =========================================================================
 # Fix 4: correction apply surfaces DB errors (never collapsed into 0 rows)
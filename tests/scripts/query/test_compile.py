@@ -16,6 +16,7 @@ from scripts.query.compile import (
     compute_plan_hash,
 )
 from scripts.query.exceptions import QueryCompilationError
+from scripts.query.llm_compiler import reset_plan_cache
 from scripts.schemas import QueryPlan, Filter, FilterField, FilterOp
 
 
@@ -45,14 +46,19 @@ def _make_mock_llm_result(plan: QueryPlan):
 class TestCompileQuery:
     """Tests for compile_query function (now LLM-based via litellm)."""
 
+    @pytest.fixture(autouse=True)
+    def cache_file(self, tmp_path):
+        """Point the plan cache at an empty per-test log."""
+        cache_file = tmp_path / "cache.jsonl"
+        with patch('scripts.query.llm_compiler.CACHE_PATH', cache_file):
+            reset_plan_cache()
+            yield cache_file
+        reset_plan_cache()
+
     @patch('scripts.query.llm_compiler.structured_completion', new_callable=AsyncMock)
-    @patch('scripts.query.llm_compiler.load_cache')
     @patch('scripts.query.llm_compiler.write_cache_entry')
-    def test_compile_query_basic(self, mock_write_cache, mock_load_cache, mock_structured, tmp_path):
+    def test_compile_query_basic(self, mock_write_cache, mock_structured, tmp_path):
         """Should compile query using LLM."""
-        # Mock empty cache
-        mock_load_cache.return_value = {}
-
         # Mock LLM response
         plan_data = QueryPlan(
             query_text="books published by Oxford",
@@ -71,10 +77,9 @@ class TestCompileQuery:
         assert plan.filters[0].field == FilterField.PUBLISHER
         assert plan.filters[0].value == "oxford"
 
-    @patch('scripts.query.llm_compiler.load_cache')
-    def test_compile_query_with_cache(self, mock_load_cache):
+    def test_compile_query_with_cache(self, cache_file):
         """Should use cached result when available."""
-        # Mock cache with existing entry
+        # Cache log with existing entry
         cached_plan_data = {
             "query_text": "cached query",
             "filters": [
@@ -82,15 +87,12 @@ class TestCompileQuery:
             ],
             "version": "1.0"
         }
-
-        mock_load_cache.return_value = {
-            "cached query": {
-                "query_text": "cached query",
-                "plan": cached_plan_data,
-                "model": "gpt-4o",
-                "timestamp": "2024-01-01T00:00:00Z"
-            }
-        }
+        cache_file.write_text(json.dumps({
+            "query_text": "cached query",
+            "plan": cached_plan_data,
+            "model": "gpt-4o",
+            "timestamp": "2024-01-01T00:00:00Z"
+        }) + '\n')
 
         plan = compile_query("cached query", api_key="test-key")
 
@@ -98,12 +100,10 @@ class TestCompileQuery:
         assert len(plan.filters) == 1
         assert plan.debug.get("cache_hit") is True
 
-    @patch('scripts.query.llm_compiler.load_cache')
     @patch('scripts.query.llm_compiler.call_model', new_callable=AsyncMock)
-    def test_compile_query_missing_api_key(self, mock_call_model, mock_load_cache):
+    def test_compile_query_missing_api_key(self, mock_call_model):
         """Should raise error if LLM auth fails."""
         import litellm
-        mock_load_cache.return_value = {}  # Empty cache, no cache hit
         mock_call_model.side_effect = litellm.AuthenticationError(
             message="No API key",
             llm_provider="openai",
@@ -113,12 +113,9 @@ class TestCompileQuery:
             compile_query("test query")
 
     @patch('scripts.query.llm_compiler.structured_completion', new_callable=AsyncMock)
-    @patch('scripts.query.llm_compiler.load_cache')
     @patch('scripts.query.llm_compiler.write_cache_entry')
-    def test_compile_query_with_limit(self, mock_write_cache, mock_load_cache, mock_structured):
+    def test_compile_query_with_limit(self, mock_write_cache, mock_structured):
         """Should apply limit parameter to plan."""
-        mock_load_cache.return_value = {}
-
         plan_data = QueryPlan(query_text="test", filters=[])
         mock_structured.return_value = _make_mock_llm_result(plan_data)
 
@@ -265,17 +262,15 @@ class TestBackwardCompatibility:
         assert callable(compute_plan_hash)
 
     @patch('scripts.query.llm_compiler.structured_completion', new_callable=AsyncMock)
-    @patch('scripts.query.llm_compiler.load_cache')
     @patch('scripts.query.llm_compiler.write_cache_entry')
-    def test_compile_query_signature(self, mock_write_cache, mock_load_cache, mock_structured):
+    def test_compile_query_signature(self, mock_write_cache, mock_structured, tmp_path):
         """Should accept same parameters as before (with api_key added)."""
-        mock_load_cache.return_value = {}
-
         plan_data = QueryPlan(query_text="test query", filters=[])
         mock_structured.return_value = _make_mock_llm_result(plan_data)
 
-        # Should accept query_text and limit
-        plan = compile_query("test query", limit=100, api_key="test-key")
+        with patch('scripts.query.llm_compiler.CACHE_PATH', tmp_path / "cache.jsonl"):
+            # Should accept query_text and limit
+            plan = compile_query("test query", limit=100, api_key="test-key")
 
         assert plan.query_text == "test query"
         assert plan.limit == 100
@@ -3,6 +3,8 @@
 Validates SQL generation, filter value normalization, and JOIN logic.
 """
 
+import sqlite3
+from pathlib import Path
 
 import pytest
 
@@ -13,6 +15,7 @@ from scripts.query.db_adapter import (
     build_select_columns,
     build_join_clauses,
     build_full_query,
+    trigram_searchable,
 )
 
 
@@ -262,7 +265,13 @@ class TestBuildJoinClauses:
         joins = build_join_clauses(["imprints", "languages", "titles"])
         assert "JOIN imprints i" in joins
         assert "LEFT JOIN languages l" in joins
-        assert "LEFT JOIN titles t" in joins
+        assert "JOIN titles t" in joins
+
+    def test_expression_filtered_tables_inner_joined(self):
+        """Titles/subjects/agents are inner-joined so their filter indexes drive the query."""
+        joins = build_join_clauses(["titles", "subjects", "agents"])
+        assert "LEFT JOIN" not in joins
+        assert "JOIN agents a ON r.id = a.record_id" in joins
 
 
 class TestBuildFullQuery:
@@ -367,3 +376,142 @@ class TestPhysicalDescFilter:
         )
         where_clause, _, _ = build_where_clause(plan)
         assert where_clause.strip().startswith("NOT (")
+
+
+SCHEMA_PATH = Path(__file__).parent.parent.parent.parent / "scripts" / "marc" / "m3_schema.sql"
+
+
+class TestFilterIndexUse:
+    """EQUALS/IN filters are answered from an index, not a records scan."""
+
+    @pytest.fixture
+    def conn(self):
+        conn = sqlite3.connect(":memory:")
+        conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+        yield conn
+        conn.close()
+
+    @pytest.mark.parametrize("field,op,value,index", [
+        (FilterField.PUBLISHER, FilterOp.EQUALS, "Elzevir", "idx_imprints_publisher_key"),
+        (FilterField.PUBLISHER, FilterOp.IN, ["elzevir", "plantin"], "idx_imprints_publisher_key"),
+        (FilterField.IMPRINT_PLACE, FilterOp.EQUALS, "Venice", "idx_imprints_place_key"),
+        (FilterField.IMPRINT_PLACE, FilterOp.IN, ["venice", "amsterdam"], "idx_imprints_place_key"),
+        (FilterField.COUNTRY, FilterOp.EQUALS, "italy", "idx_imprints_country_key"),
+        (FilterField.TITLE, FilterOp.EQUALS, "Sefer ha-Zohar", "idx_titles_value_key"),
+        (FilterField.SUBJECT, FilterOp.IN, ["kabbalah", "talmud"], "idx_subjects_value_key"),
+        (FilterField.AGENT_NORM, FilterOp.EQUALS, "Karo, Joseph", "idx_agents_agent_norm_key"),
+        (FilterField.AGENT_NORM, FilterOp.IN, ["karo joseph", "bomberg daniel"], "idx_agent_alias_form_key"),
+    ])
+    def test_explain_uses_index(self, conn, field, op, value, index):
+        plan = QueryPlan(query_text="test", filters=[Filter(field=field, op=op, value=value)])
+        sql, params = build_full_query(plan, conn=conn)
+
+        details = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+        assert any(index in d for d in details), details
+        assert not any(d.startswith("SCAN r") for d in details), details
+
+
+class TestTrigramContains:
+    """CONTAINS filters use the trigram FTS tables and match the LIKE scan."""
+
+    @pytest.fixture
+    def conn(self):
+        conn = sqlite3.connect(":memory:")
+        conn.row_factory = sqlite3.Row
+        conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+        conn.executescript("""
+            INSERT INTO records (id, mms_id, source_file, created_at) VALUES
+                (1, '990001', 't', 'now'), (2, '990002', 't', 'now'),
+                (3, '990003', 't', 'now'), (4, '990004', 't', 'now');
+            INSERT INTO imprints (record_id, occurrence, publisher_norm, place_norm,
+                                  country_name, source_tags) VALUES
+                (1, 0, 'bragadin press', 'venice', 'italy', '[]'),
+                (2, 0, 'elzevir', 'amsterdam', 'netherlands', '[]'),
+                (3, 0, 'דפוס ונציה', 'ונציה', NULL, '[]'),
+                (4, 0, NULL, NULL, NULL, '[]');
+            INSERT INTO agents (record_id, agent_index, agent_raw, agent_type, agent_norm,
+                                agent_confidence, agent_method, role_norm, role_confidence,
+                                role_method, authority_uri, provenance_json) VALUES
+                (1, 0, 'Karo, Joseph', 'personal', 'karo, joseph', 1, 'base_clean',
+                 'author', 1, 'relator_code', 'uri:karo', '[]'),
+                (2, 0, 'Bomberg, Daniel', 'personal', 'bomberg, daniel', 1, 'base_clean',
+                 'printer', 1, 'relator_code', NULL, '[]'),
+                (3, 0, 'יוסף קארו', 'personal', 'יוסף קארו', 1, 'base_clean',
+                 'author', 1, 'relator_code', 'uri:karo', '[]');
+            INSERT INTO agent_authorities (id, canonical_name, canonical_name_lower, agent_type,
+                                           authority_uri, created_at, updated_at) VALUES
+                (1, 'Karo, Joseph', 'karo, joseph', 'personal', 'uri:karo', 'now', 'now');
+            INSERT INTO agent_aliases (authority_id, alias_form, alias_form_lower, alias_type,
+                                       created_at) VALUES
+                (1, 'Caro, Yosef', 'caro, yosef', 'variant_spelling', 'now');
+        """)
+        yield conn
+        conn.close()
+
+    @staticmethod
+    def _mms_ids(conn, plan, use_conn):
+        sql, params = build_full_query(plan, conn=conn if use_conn else None)
+        return sorted(row["mms_id"] for row in conn.execute(sql, params))
+
+    def test_trigram_searchable(self):
+        assert trigram_searchable("%venice%")
+        assert trigram_searchable("%ven%i_e%")
+        assert not trigram_searchable("%ve%")
+        assert not trigram_searchable("%ונ%")
+        assert not trigram_searchable("%v_e%")
+
+    def test_contains_routed_through_fts(self, conn):
+        plan = QueryPlan(query_text="test", filters=[
+            Filter(field=FilterField.PUBLISHER, op=FilterOp.CONTAINS, value="bragadin"),
+            Filter(field=FilterField.AGENT_NORM, op=FilterOp.CONTAINS, value="caro"),
+        ])
+        sql, _ = build_full_query(plan, conn=conn)
+
+        assert "imprints_fts.publisher_norm LIKE" in sql
+        assert "agents_fts.agent_key LIKE" in sql
+        assert "agent_aliases_fts.alias_key LIKE" in sql
+
+    def test_short_pattern_falls_back_to_like(self, conn):
+        plan = QueryPlan(query_text="test", filters=[
+            Filter(field=FilterField.IMPRINT_PLACE, op=FilterOp.CONTAINS, value="ve"),
+        ])
+        sql, _ = build_full_query(plan, conn=conn)
+
+        assert "imprints_fts" not in sql
+        assert "LIKE LOWER(" in sql
+
+    @pytest.mark.parametrize("field,value,negate", [
+        (FilterField.PUBLISHER, "bragadin", False),
+        (FilterField.PUBLISHER, "bragadin", True),
+        (FilterField.PUBLISHER, "ונציה", False),
+        (FilterField.IMPRINT_PLACE, "ונצ", True),
+        (FilterField.IMPRINT_PLACE, "ונ", False),
+        (FilterField.COUNTRY, "ital", True),
+        (FilterField.AGENT, "bomberg", False),
+        (FilterField.AGENT_NORM, "karo joseph", False),
+        (FilterField.AGENT_NORM, "caro", False),
+        (FilterField.AGENT_NORM, "קארו", True),
+    ])
+    def test_results_match_like_scan(self, conn, field, value, negate):
+        plan = QueryPlan(query_text="test", filters=[
+            Filter(field=field, op=FilterOp.CONTAINS, value=value, negate=negate),
+        ])
+
+        assert self._mms_ids(conn, plan, True) == self._mms_ids(conn, plan, False)
+
+    def test_fts_follows_base_table_updates(self, conn):
+        conn.execute("UPDATE imprints SET publisher_norm = 'plantin' WHERE record_id = 1")
+        conn.execute("DELETE FROM agents WHERE record_id = 2")
+        plans = [
+            QueryPlan(query_text="test", filters=[
+                Filter(field=FilterField.PUBLISHER, op=FilterOp.CONTAINS, value=value),
+            ])
+            for value in ("bragadin", "plantin")
+        ] + [
+            QueryPlan(query_text="test", filters=[
+                Filter(field=FilterField.AGENT, op=FilterOp.CONTAINS, value="bomberg"),
+            ])
+        ]
+
+        assert [self._mms_ids(conn, plan, True) for plan in plans] == [[], ["990001"], []]
@@ -0,0 +1,109 @@
+"""Tests for the single-pass facet engine."""
+
+import sqlite3
+
+import pytest
+
+from scripts.query.facets import (
+    FACET_FIELDS,
+    Facet,
+    century_label,
+    compute_facets,
+    decade_label,
+)
+
+# Per-field GROUP BY queries the engine replaces (reference results)
+_REFERENCE = {
+    "place": "SELECT place_norm, COUNT(DISTINCT record_id) FROM imprints "
+             "WHERE record_id IN ({ids}) AND place_norm IS NOT NULL AND place_norm != '' "
+             "GROUP BY place_norm",
+    "publisher": "SELECT publisher_norm, COUNT(DISTINCT record_id) FROM imprints "
+                 "WHERE record_id IN ({ids}) AND publisher_norm IS NOT NULL "
+                 "AND publisher_norm != '' GROUP BY publisher_norm",
+    "country": "SELECT country_name, COUNT(DISTINCT record_id) FROM imprints "
+               "WHERE record_id IN ({ids}) AND country_name IS NOT NULL "
+               "AND country_name != '' GROUP BY country_name",
+    "language": "SELECT code, COUNT(DISTINCT record_id) FROM languages "
+                "WHERE record_id IN ({ids}) GROUP BY code",
+    "decade": "SELECT date_start / 10 * 10, COUNT(DISTINCT record_id) FROM imprints "
+              "WHERE record_id IN ({ids}) AND date_start IS NOT NULL GROUP BY 1",
+    "century": "SELECT (date_start - 1) / 100 + 1, COUNT(DISTINCT record_id) FROM imprints "
+               "WHERE record_id IN ({ids}) AND date_start IS NOT NULL GROUP BY 1",
+}
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE records (id INTEGER PRIMARY KEY, mms_id TEXT UNIQUE NOT NULL);
+        CREATE TABLE imprints (
+            id INTEGER PRIMARY KEY, record_id INTEGER NOT NULL,
+            place_norm TEXT, publisher_norm TEXT, country_name TEXT, date_start INTEGER
+        );
+        CREATE TABLE languages (id INTEGER PRIMARY KEY, record_id INTEGER NOT NULL, code TEXT);
+    """)
+    places = ["venice", "amsterdam", "paris", None, ""]
+    publishers = ["bomberg", "proops", None]
+    for i in range(1, 61):
+        conn.execute("INSERT INTO records VALUES (?, ?)", (i, f"99{i:04d}"))
+        conn.execute(
+            "INSERT INTO imprints (record_id, place_norm, publisher_norm, country_name, date_start) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (i, places[i % 5], publishers[i % 3], "italy" if i % 2 else "netherlands",
+             1480 + i * 7 if i % 11 else None),
+        )
+        if i % 4 == 0:
+            # Second imprint for the same record must not double-count it
+            conn.execute(
+                "INSERT INTO imprints (record_id, place_norm, publisher_norm, date_start) "
+                "VALUES (?, ?, ?, ?)",
+                (i, places[i % 5], "bomberg", 1480 + i * 7),
+            )
+        conn.execute("INSERT INTO languages (record_id, code) VALUES (?, ?)",
+                     (i, "heb" if i % 3 else "lat"))
+    yield conn
+    conn.close()
+
+
+def test_matches_per_field_group_by(conn):
+    mms_ids = [f"99{i:04d}" for i in range(1, 61) if i % 7]
+    ids = ",".join(str(i) for i in range(1, 61) if i % 7)
+
+    facets = compute_facets(conn, mms_ids)
+
+    assert set(facets) == set(FACET_FIELDS)
+    for name, sql in _REFERENCE.items():
+        expected = dict(conn.execute(sql.format(ids=ids)).fetchall())
+        assert facets[name].counts == expected, name
+        assert facets[name].distinct_values == len(expected)
+
+
+def test_subset_of_fields_and_unknown_ids(conn):
+    facets = compute_facets(conn, ["990001", "990002", "missing"], fields=("language",))
+
+    assert list(facets) == ["language"]
+    assert facets["language"].counts == {"heb": 2}
+
+
+def test_max_year_caps_date_facets(conn):
+    facets = compute_facets(conn, [f"99{i:04d}" for i in range(1, 61)],
+                            fields=("decade", "place"), max_year=1600)
+
+    assert max(facets["decade"].counts) <= 1600
+    assert facets["place"].distinct_values == 3
+
+
+def test_empty_candidates_and_unknown_field(conn):
+    assert compute_facets(conn, [], fields=("place",))["place"].counts == {}
+    with pytest.raises(ValueError):
+        compute_facets(conn, ["990001"], fields=("subject",))
+
+
+def test_top_and_ordered():
+    facet = Facet("place", {"paris": 3, "venice": 5, "amsterdam": 3, "basel": 1})
+
+    assert facet.top(3) == [("venice", 5), ("amsterdam", 3), ("paris", 3)]
+    assert Facet("decade", {1550: 2, 1520: 4}).ordered() == [(1520, 4), (1550, 2)]
+    assert decade_label(1550) == "1550s"
+    assert century_label(16) == "16th century"
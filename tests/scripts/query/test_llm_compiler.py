@@ -7,9 +7,13 @@ import pytest
 import json
 from unittest.mock import Mock, patch, AsyncMock
 
+from scripts.query import llm_compiler
 from scripts.query.llm_compiler import (
+    QueryPlanCache,
     build_user_prompt,
     load_cache,
+    normalize_query_key,
+    reset_plan_cache,
     write_cache_entry,
     compile_query_llm,
 )
@@ -17,6 +21,14 @@ from scripts.schemas import QueryPlan, Filter, FilterField, FilterOp
 from scripts.query.exceptions import QueryCompilationError
 
 
+@pytest.fixture(autouse=True)
+def fresh_plan_cache():
+    """Each test starts without an in-memory plan cache."""
+    reset_plan_cache()
+    yield
+    reset_plan_cache()
+
+
 class TestBuildUserPrompt:
     """Tests for user prompt builder."""
 
@@ -114,6 +126,87 @@ class TestCacheOperations:
             assert cache_file.exists()
 
 
+class TestQueryPlanCache:
+    """Tests for the in-memory plan cache over the JSONL log."""
+
+    def _entry(self, query_text, **extra):
+        entry = {
+            "query_text": query_text,
+            "plan": {"query_text": query_text, "filters": []},
+            "model": "gpt-4o",
+            "timestamp": "2024-01-01T00:00:00Z",
+        }
+        entry.update(extra)
+        return json.dumps(entry) + '\n'
+
+    def test_normalized_key_and_counters(self, tmp_path):
+        """Lookups ignore case/whitespace and are counted."""
+        cache_file = tmp_path / "cache.jsonl"
+        cache_file.write_text(self._entry("Books  by Aldus"))
+
+        cache = QueryPlanCache(cache_file)
+
+        assert normalize_query_key("  books BY   aldus ") == "books by aldus"
+        assert cache.get("books by ALDUS", "gpt-4o") is not None
+        assert cache.get("books by aldus", "gpt-4o-mini") is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    def test_prompt_version_invalidates(self, tmp_path):
+        """Entries from another prompt version are not served."""
+        cache_file = tmp_path / "cache.jsonl"
+        cache_file.write_text(self._entry("old", prompt_version="0") + self._entry("current"))
+
+        cache = QueryPlanCache(cache_file)
+
+        assert cache.get("old", "gpt-4o") is None
+        assert cache.get("current", "gpt-4o") is not None
+
+    def test_lru_and_ttl_eviction(self, tmp_path):
+        """Least recently used entries are evicted; expired entries are misses."""
+        cache_file = tmp_path / "cache.jsonl"
+        cache_file.write_text("".join(self._entry(q) for q in ["a", "b", "c"]))
+
+        cache = QueryPlanCache(cache_file, max_entries=2)
+        assert cache.get("a", "gpt-4o") is None
+        assert cache.get("b", "gpt-4o") is not None
+
+        with patch('scripts.query.llm_compiler.CACHE_PATH', cache_file):
+            cache.put("d", QueryPlan(query_text="d", filters=[]), "gpt-4o")
+        assert cache.get("c", "gpt-4o") is None
+        assert cache.get("b", "gpt-4o") is not None
+
+        expiring = QueryPlanCache(cache_file, ttl_seconds=3600)
+        assert expiring.get("b", "gpt-4o") is None
+        assert expiring.get("d", "gpt-4o") is not None
+
+    def test_log_is_compacted(self, tmp_path):
+        """Superseded lines are dropped once they dominate the log."""
+        cache_file = tmp_path / "cache.jsonl"
+        cache = QueryPlanCache(cache_file)
+        cache.COMPACT_MIN_LINES = 4
+        plan = QueryPlan(query_text="same", filters=[])
+
+        with patch('scripts.query.llm_compiler.CACHE_PATH', cache_file):
+            for _ in range(5):
+                cache.put("same", plan, "gpt-4o")
+
+        assert len(cache_file.read_text().splitlines()) < 5
+        assert QueryPlanCache(cache_file).get("same", "gpt-4o") is not None
+
+    def test_log_read_once(self, tmp_path):
+        """compile_query_llm does not re-read the log on each query."""
+        cache_file = tmp_path / "cache.jsonl"
+        cache_file.write_text(self._entry("cached query"))
+
+        with patch('scripts.query.llm_compiler.CACHE_PATH', cache_file), \
+                patch('scripts.query.llm_compiler._iter_cache_log',
+                      wraps=llm_compiler._iter_cache_log) as spy:
+            for _ in range(3):
+                assert compile_query_llm("Cached  Query").debug["cache_hit"] is True
+
+        assert spy.call_count == 1
+
+
 def _make_mock_llm_result(plan: QueryPlan):
     """Build a mock LLMResult returned by structured_completion."""
     from scripts.query.llm_compiler import QueryPlanLLM
@@ -195,17 +288,17 @@ class TestCompileQueryLLM:
 
             assert plan.limit == 50  # Should override cached limit
 
-    @patch('scripts.query.llm_compiler.load_cache')
-    def test_missing_api_key_no_longer_checked(self, mock_load_cache):
+    def test_missing_api_key_no_longer_checked(self, tmp_path):
         """With litellm, API key is handled by the provider, not by us.
 
         The function should proceed to call the LLM (which will fail
         at the litellm level if no key is configured). We mock call_model
         to avoid an actual API call.
         """
-        mock_load_cache.return_value = {}  # Empty cache, no cache hit
+        # Empty cache, no cache hit
         # Mock call_model to simulate a litellm auth error
-        with patch('scripts.query.llm_compiler.call_model', new_callable=AsyncMock) as mock_cm:
+        with patch('scripts.query.llm_compiler.CACHE_PATH', tmp_path / "cache.jsonl"), \
+                patch('scripts.query.llm_compiler.call_model', new_callable=AsyncMock) as mock_cm:
             import litellm
             mock_cm.side_effect = litellm.AuthenticationError(
                 message="No API key",
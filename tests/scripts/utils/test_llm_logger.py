@@ -125,6 +125,7 @@ class TestLLMLogger:
         )
 
         # Verify file was written
+        logger.flush()
         assert temp_log_path.exists()
 
         # Read and parse the log entry
@@ -154,6 +155,7 @@ class TestLLMLogger:
             response=mock_response,
         )
 
+        logger.flush()
         with open(temp_log_path) as f:
             entry = json.loads(f.readline())
 
@@ -180,6 +182,7 @@ class TestLLMLogger:
             response=mock_response,
         )
 
+        logger.flush()
         with open(temp_log_path) as f:
             entry = json.loads(f.readline())
 
@@ -202,6 +205,7 @@ class TestLLMLogger:
             session_id="session-123",
         )
 
+        logger.flush()
         with open(temp_log_path) as f:
             entry = json.loads(f.readline())
 
@@ -221,6 +225,7 @@ class TestLLMLogger:
             extra_metadata={"query_text": "test query", "filter_count": 3},
         )
 
+        logger.flush()
         with open(temp_log_path) as f:
             entry = json.loads(f.readline())
 
@@ -241,6 +246,7 @@ class TestLLMLogger:
             response=mock_response_no_usage,
         )
 
+        logger.flush()
         with open(temp_log_path) as f:
             entry = json.loads(f.readline())
 
@@ -368,6 +374,148 @@ class TestGetSummary:
         assert result["by_type"]["query_compilation"]["count"] == 1
 
 
+class TestBackgroundWriter:
+    """Tests for the batched writer, log rotation and the cost store."""
+
+    @patch("litellm.completion_cost", return_value=0.0075)
+    def test_log_call_does_not_touch_the_file(self, mock_cc, temp_log_path, mock_response):
+        """log_call only queues; the writer thread does the file I/O."""
+        logger = LLMLogger(log_path=temp_log_path)
+
+        with patch("builtins.open", side_effect=AssertionError("file I/O in log_call")):
+            logger.log_call(
+                call_type="test_call",
+                model="gpt-4o",
+                system_prompt="test",
+                user_prompt="test",
+                response=mock_response,
+            )
+
+        assert logger.flush()
+        assert len(temp_log_path.read_text().splitlines()) == 1
+
+    @patch("litellm.completion_cost", return_value=0.0075)
+    def test_cost_rows_in_indexed_store(self, mock_cc, temp_log_path, mock_response):
+        """Every call gets a cost row; lookups use the session/type indexes."""
+        import sqlite3
+
+        logger = LLMLogger(log_path=temp_log_path)
+        for session_id in ("s1", "s1", "s2"):
+            logger.log_call(
+                call_type="narrator",
+                model="gpt-4o",
+                system_prompt="test",
+                user_prompt="test",
+                response=mock_response,
+                session_id=session_id,
+            )
+        logger.close()
+
+        conn = sqlite3.connect(logger.cost_db_path)
+        rows = conn.execute(
+            "SELECT session_id, call_type, model, total_tokens, cost_usd FROM llm_calls"
+        ).fetchall()
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT SUM(cost_usd) FROM llm_calls WHERE session_id = ?",
+            ("s1",),
+        ).fetchall()
+        conn.close()
+
+        assert sorted(rows) == [
+            ("s1", "narrator", "gpt-4o", 1500, 0.0075),
+            ("s1", "narrator", "gpt-4o", 1500, 0.0075),
+            ("s2", "narrator", "gpt-4o", 1500, 0.0075),
+        ]
+        assert "idx_llm_calls_session" in str(plan)
+
+    def test_new_store_is_backfilled_from_existing_log(self, temp_log_path):
+        """Calls logged before the cost store existed still count."""
+        entry = {
+            "timestamp": "2026-01-01T00:00:00+00:00",
+            "call_type": "narrator",
+            "model": "gpt-4o",
+            "session_id": "old-session",
+            "usage": {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+            "cost_usd": 0.01,
+        }
+        temp_log_path.write_text(json.dumps(entry) + "\n" + json.dumps(entry) + "\n")
+        logger = LLMLogger(log_path=temp_log_path)
+
+        # Read path only: nothing logged in this process yet
+        result = logger.get_session_costs("old-session")
+
+        assert result["call_count"] == 2
+        assert result["total_tokens"] == 30
+        assert result["total_cost"] == 0.02
+
+    @patch("litellm.completion_cost", return_value=0.0075)
+    def test_backfill_runs_once_per_store(self, mock_cc, temp_log_path, mock_response):
+        """A second logger (another worker) opening the store does not re-import the log."""
+        entry = {
+            "timestamp": "2026-01-01T00:00:00+00:00",
+            "call_type": "narrator",
+            "model": "gpt-4o",
+            "session_id": "s1",
+            "usage": {"total_tokens": 15},
+            "cost_usd": 0.01,
+        }
+        temp_log_path.write_text(json.dumps(entry) + "\n")
+        first = LLMLogger(log_path=temp_log_path)
+        first.log_call(
+            call_type="narrator",
+            model="gpt-4o",
+            system_prompt="test",
+            user_prompt="test",
+            response=mock_response,
+            session_id="s1",
+        )
+        first.close()
+
+        second = LLMLogger(log_path=temp_log_path)
+
+        assert second.get_session_costs("s1")["call_count"] == 2
+
+    @patch("litellm.completion_cost", return_value=0.0075)
+    def test_rotates_by_size_and_keeps_backup_count(self, mock_cc, temp_log_path, mock_response):
+        """A full log is renamed aside; only backup_count rotated files are kept."""
+        logger = LLMLogger(log_path=temp_log_path, max_bytes=1, backup_count=2)
+
+        for i in range(5):
+            logger.log_call(
+                call_type=f"call{i}",
+                model="gpt-4o",
+                system_prompt="test",
+                user_prompt="test",
+                response=mock_response,
+            )
+            logger.flush()
+
+        rotated = list(temp_log_path.parent.glob("test_llm_calls.*.jsonl"))
+        assert len(rotated) == 2
+        assert json.loads(temp_log_path.read_text())["call_type"] == "call4"
+        # Cost rows outlive rotated log files
+        assert logger.get_summary(hours=24)["call_count"] == 5
+
+    @patch("litellm.completion_cost", return_value=0.0075)
+    def test_rotates_by_age(self, mock_cc, temp_log_path, mock_response):
+        """A log whose first entry is older than max_age_s is rotated."""
+        old = {"timestamp": "2020-01-01T00:00:00+00:00", "call_type": "old", "model": "m"}
+        temp_log_path.write_text(json.dumps(old) + "\n")
+        logger = LLMLogger(log_path=temp_log_path, max_age_s=3600)
+
+        logger.log_call(
+            call_type="new",
+            model="gpt-4o",
+            system_prompt="test",
+            user_prompt="test",
+            response=mock_response,
+        )
+        logger.flush()
+
+        assert json.loads(temp_log_path.read_text())["call_type"] == "new"
+        assert len(list(temp_log_path.parent.glob("test_llm_calls.*.jsonl"))) == 1
+
+
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
 
@@ -414,6 +562,7 @@ class TestLLMLoggerPrivacyDefaults:
             response=mock_response,
         )
 
+        logger.flush()
         with open(temp_log_path) as f:
             entry = json.loads(f.readline())
 
@@ -435,6 +584,7 @@ class TestLLMLoggerPrivacyDefaults:
             response=mock_response,
         )
 
+        logger.flush()
         with open(temp_log_path) as f:
             entry = json.loads(f.readline())
 
@@ -0,0 +1,97 @@
+"""Tests for the pooled read-only SQLite connection provider."""
+import sqlite3
+
+import pytest
+
+from scripts.utils.sqlite_pool import (
+    close_read_pools,
+    get_read_pool,
+    read_connection,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "bib.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE records (id INTEGER PRIMARY KEY, mms_id TEXT)")
+    conn.execute("INSERT INTO records (mms_id) VALUES ('990001')")
+    conn.commit()
+    conn.close()
+    yield path
+    close_read_pools()
+
+
+def test_close_returns_connection_to_pool(db):
+    first = read_connection(db)
+    first.close()
+    second = read_connection(db)
+    second.close()
+
+    assert second is first
+    assert get_read_pool(db).stats() == {"opened": 1, "reused": 1, "idle": 1}
+
+
+def test_read_pragmas_and_read_only(db):
+    conn = read_connection(db)
+    try:
+        assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] < 0
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO records (mms_id) VALUES ('x')")
+    finally:
+        conn.close()
+
+
+def test_row_factory_is_per_checkout(db):
+    conn = read_connection(db, row_factory=sqlite3.Row)
+    assert conn.execute("SELECT mms_id FROM records").fetchone()["mms_id"] == "990001"
+    conn.close()
+
+    conn = read_connection(db)
+    assert conn.execute("SELECT mms_id FROM records").fetchone() == ("990001",)
+    conn.close()
+
+
+def test_sees_writes_from_other_connections(db):
+    reader = read_connection(db)
+    reader.close()
+
+    writer = sqlite3.connect(db)
+    writer.execute("INSERT INTO records (mms_id) VALUES ('990002')")
+    writer.commit()
+    writer.close()
+
+    reader = read_connection(db)
+    try:
+        assert reader.execute("SELECT COUNT(*) FROM records").fetchone()[0] == 2
+    finally:
+        reader.close()
+
+
+def test_replaced_file_discards_idle_connections(db, tmp_path):
+    read_connection(db).close()
+
+    rebuilt = tmp_path / "rebuilt.db"
+    conn = sqlite3.connect(rebuilt)
+    conn.execute("CREATE TABLE records (id INTEGER PRIMARY KEY, mms_id TEXT)")
+    conn.commit()
+    conn.close()
+    rebuilt.replace(db)
+
+    reader = read_connection(db)
+    try:
+        assert reader.execute("SELECT COUNT(*) FROM records").fetchone()[0] == 0
+    finally:
+        reader.close()
+    assert get_read_pool(db).stats()["opened"] == 2
+
+
+def test_missing_path_falls_back_to_plain_connection(tmp_path):
+    conn = read_connection(tmp_path / "new.db")
+    try:
+        conn.execute("CREATE TABLE t (x)")
+    finally:
+        conn.close()
+    assert (tmp_path / "new.db").exists()
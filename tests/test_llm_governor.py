@@ -0,0 +1,163 @@
+"""Tests for the LLM concurrency governor (no real API calls)."""
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from scripts.models.llm_governor import (
+    LLMBackpressureError,
+    LLMGovernor,
+    ModelLimits,
+    Priority,
+    disable_llm_governor,
+    enable_llm_governor,
+    llm_priority,
+    priority_for,
+)
+
+
+class _Answer(BaseModel):
+    answer: str
+
+
+@pytest.fixture
+def governor():
+    governor = enable_llm_governor(ModelLimits(max_concurrent=2))
+    yield governor
+    disable_llm_governor()
+
+
+def test_priority_from_call_type_and_override():
+    assert priority_for("narrator") == Priority.INTERACTIVE
+    assert priority_for("agent_propose_mapping") == Priority.BACKGROUND
+    assert priority_for("eval_judge_narrator") == Priority.BATCH
+    with llm_priority(Priority.BATCH):
+        assert priority_for("narrator") == Priority.BATCH
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_per_model():
+    gov = LLMGovernor(ModelLimits(max_concurrent=2))
+    running = peak = 0
+
+    async def call(model):
+        nonlocal running, peak
+        permit = await gov.acquire(model, "narrator")
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        permit.release()
+
+    await asyncio.gather(*(call("gpt-4.1") for _ in range(6)))
+    assert peak == 2
+    stats = gov.stats()["gpt-4.1"]
+    assert stats["in_flight"] == 0
+    assert stats["classes"]["interactive"]["waited"] == 4
+
+
+@pytest.mark.asyncio
+async def test_interactive_served_before_queued_batch():
+    gov = LLMGovernor(ModelLimits(max_concurrent=1))
+    order = []
+    held = await gov.acquire("m", "narrator")
+
+    async def call(call_type):
+        permit = await gov.acquire("m", call_type)
+        order.append(call_type)
+        permit.release()
+
+    batch = asyncio.ensure_future(call("eval_judge_narrator"))
+    await asyncio.sleep(0)
+    interactive = asyncio.ensure_future(call("narrator"))
+    await asyncio.sleep(0)
+    held.release()
+    await asyncio.gather(batch, interactive)
+    assert order == ["narrator", "eval_judge_narrator"]
+
+
+@pytest.mark.asyncio
+async def test_background_leaves_reserved_slots_for_interactive():
+    gov = LLMGovernor(ModelLimits(max_concurrent=4, interactive_reserve=1))
+    background = [await gov.acquire("m", "agent_propose_mapping") for _ in range(3)]
+
+    fourth = asyncio.ensure_future(gov.acquire("m", "agent_propose_mapping"))
+    await asyncio.sleep(0.01)
+    assert not fourth.done()
+
+    interactive = await asyncio.wait_for(gov.acquire("m", "narrator"), 0.1)
+    interactive.release()
+    background[0].release()
+    (await asyncio.wait_for(fourth, 0.1)).release()
+    for permit in background[1:]:
+        permit.release()
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_halves_limit_and_pauses():
+    gov = LLMGovernor(ModelLimits(max_concurrent=8))
+    permit = await gov.acquire("m", "narrator")
+    with patch("scripts.models.llm_governor.BACKOFF_INITIAL_S", 0.05):
+        permit.release(rate_limited=True)
+        stats = gov.stats()["m"]
+        assert stats["effective_limit"] == 4
+        assert stats["paused_for_s"] > 0
+        assert stats["classes"]["interactive"]["rate_limited"] == 1
+
+        start = time.monotonic()
+        (await asyncio.wait_for(gov.acquire("m", "narrator"), 1)).release()
+        assert time.monotonic() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_interactive_backpressure_after_max_wait():
+    gov = LLMGovernor(ModelLimits(max_concurrent=1), interactive_max_wait_s=0.05)
+    held = await gov.acquire("m", "narrator")
+    with pytest.raises(LLMBackpressureError):
+        await gov.acquire("m", "narrator")
+    stats = gov.stats()["m"]["classes"]["interactive"]
+    assert stats["rejected"] == 1 and stats["queued"] == 0
+    held.release()
+    (await gov.acquire("m", "narrator")).release()
+
+
+@pytest.mark.asyncio
+async def test_token_budget_delays_until_refill():
+    gov = LLMGovernor(ModelLimits(max_concurrent=8, tokens_per_minute=6000))  # 100/s
+    (await gov.acquire("m", "narrator", estimated_tokens=6000)).release()
+    start = time.monotonic()
+    (await asyncio.wait_for(gov.acquire("m", "narrator", estimated_tokens=10), 1)).release()
+    assert time.monotonic() - start >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_structured_completion_retries_rate_limited_call(governor):
+    from scripts.models.llm_client import structured_completion
+
+    class RateLimitError(Exception):
+        status_code = 429
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock()]
+    mock_response.choices[0].message.content = json.dumps({"answer": "ok"})
+    mock_response.usage.prompt_tokens = 10
+    mock_response.usage.completion_tokens = 5
+
+    with patch("scripts.models.llm_client.litellm") as mock_litellm, \
+         patch("scripts.models.llm_client.log_llm_call"), \
+         patch("scripts.models.llm_governor.BACKOFF_INITIAL_S", 0.01):
+        mock_litellm.acompletion = AsyncMock(side_effect=[RateLimitError("slow down"), mock_response])
+        mock_litellm.completion_cost.return_value = 0.0
+        result = await structured_completion(
+            model="gpt-4.1", system="s", user="u", response_schema=_Answer,
+            call_type="narrator",
+        )
+
+    assert result.parsed.answer == "ok"
+    assert mock_litellm.acompletion.call_count == 2
+    stats = governor.stats()["gpt-4.1"]
+    assert stats["in_flight"] == 0
+    assert stats["classes"]["interactive"]["rate_limited"] == 1